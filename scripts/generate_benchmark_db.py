@@ -0,0 +1,64 @@
+"""Build a benchmark database: demo seed plus scale-factor synthetic data.
+
+Usage:
+    cd /path/to/innovation-factory
+    uv sync --group bench
+    .venv/bin/python scripts/generate_benchmark_db.py --scale 0.1 \\
+        --database-url sqlite:////tmp/innovation_factory_bench.db
+
+Scale factor 1 is production sizing (10k households x 1 year hourly, 500
+stations x 3 years, 50k placements x 365 days, 100k BSH customers). Tables are
+dropped and re-created first.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+# Add project src to path so imports work
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="SQLAlchemy URL, e.g. postgresql+psycopg://...")
+    parser.add_argument("--scale", type=float, default=0.01, help="scale factor (1 = production sizing)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None, help="last generated day (default today)")
+    parser.add_argument("--projects", default="", help="comma-separated project slugs (default: all)")
+    parser.add_argument("--batch-size", type=int, default=None, help="rows per COPY/INSERT batch")
+    args = parser.parse_args()
+
+    from innovation_factory.backend.bulk import bulk_options
+    from innovation_factory.backend.projects.registry import PROJECTS, load_all_models
+    from innovation_factory.backend.seed import seed_database
+
+    load_all_models()
+    slugs = {s.strip() for s in args.projects.split(",") if s.strip()}
+    projects = [p for p in PROJECTS if not slugs or p.slug in slugs]
+
+    engine = create_engine(args.database_url)
+    print(f"Re-creating tables on {engine.url.render_as_string(hide_password=True)}...")
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    def progress(table: str, loaded: int) -> None:
+        print(f"      {table}: {loaded} rows", end="\r", flush=True)
+
+    options = {"progress": progress}
+    if args.batch_size:
+        options["batch_size"] = args.batch_size
+
+    started = time.perf_counter()
+    with Session(engine) as session, bulk_options(**options):
+        seed_database(session, projects, scale=args.scale, seed=args.seed, end=args.end_date)
+    print(f"\nDone in {time.perf_counter() - started:.1f}s (scale {args.scale:g}, seed {args.seed}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""Concurrent load test of the chat endpoints against a stub serving endpoint.
+
+Usage:
+    cd /path/to/innovation-factory
+    .venv/bin/python scripts/loadtest_chat.py --clients 200 --profile agent
+
+By default this starts the stub serving endpoint
+(``innovation_factory.backend.serving_stub``) and the app under uvicorn on a
+throwaway SQLite database, with the Databricks SDK and every agent endpoint
+setting pointed at the stub. ``--base-url`` targets an already running app
+instead (start it with ``DATABRICKS_HOST`` pointing at a stub yourself).
+
+Each client opens one chat request at a time, cycling through the scenarios.
+Reported per scenario: time to first SSE event (first token), total stream
+time and errors. For the app worker that answers ``/api/debug/*``: event loop
+lag and connection pool waits during the run (histogram deltas). The load
+generator's own loop lag is reported too; if it is high, the client side is
+the bottleneck and the numbers are not trustworthy.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# Add project src to path so imports work
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+import httpx  # noqa: E402
+
+from innovation_factory.backend.loop_lag import LoopLagMonitor  # noqa: E402
+
+# Endpoint names the app is configured with when it is started by this script
+STUB_ENDPOINTS = {
+    "ADTECH_MAS_ENDPOINT_NAME": "adtech-mas",
+    "ADTECH_ISSUE_RESOLUTION_KA_ENDPOINT": "adtech-issue-resolution-ka",
+    "MAC_MAS_ENDPOINT_NAME": "mac-mas",
+    "IDEA_GENERATOR_ENDPOINT": "idea-generator",
+}
+
+QUESTIONS = [
+    "Why is the heat pump not heating since yesterday?",
+    "The display shows error E15, what should I do?",
+    "Which campaigns are under-delivering this week?",
+    "Why is Station HU-BP-001 underperforming vs last month?",
+]
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    body: dict
+
+
+@dataclass
+class Sample:
+    scenario: str
+    status: int
+    first_event_s: float | None
+    total_s: float
+    events: int
+    error: str | None = None
+
+
+@dataclass
+class Scenario:
+    name: str
+    ticket_id: int | None = None
+
+    async def prepare(self, client: httpx.AsyncClient, question: str) -> Request:
+        """Build the measured request; unmeasured setup calls (e.g. new sessions) happen here."""
+        projects = "/api/projects"
+        if self.name == "vh":
+            return Request("POST", f"{projects}/vi-home-one/chat/tickets/{self.ticket_id}/chat", {"content": question})
+        if self.name == "bsh":
+            return Request("POST", f"{projects}/bsh-home-connect/tickets/{self.ticket_id}/chat", {"message": question})
+        if self.name == "at-ka":
+            return Request("POST", f"{projects}/adtech-intelligence/chat", {"message": question})
+        if self.name == "at-mas":
+            return Request("POST", f"{projects}/adtech-intelligence/mas-chat", {"message": question})
+        if self.name == "mac":
+            return Request("POST", f"{projects}/mol-asm-cockpit/chat/send", {"message": question})
+        if self.name == "ideas":
+            # The generator is called on the second message (the description)
+            response = await client.post("/api/ideas/sessions")
+            response.raise_for_status()
+            path = f"/api/ideas/sessions/{response.json()['id']}/chat"
+            (await client.post(path, json={"content": "Load Test GmbH"})).raise_for_status()
+            return Request("POST", path, {"content": question})
+        raise ValueError(f"unknown scenario '{self.name}'")
+
+
+async def create_ticket(client: httpx.AsyncClient, project: str) -> int:
+    """A fresh ticket to chat on (the demo seed has none)."""
+    ticket = {"title": "Load test", "description": "Ticket created by scripts/loadtest_chat.py"}
+    if project == "vh":
+        response = await client.post("/api/projects/vi-home-one/tickets", params={"household_id": 1}, json=ticket)
+    else:
+        base = "/api/projects/bsh-home-connect"
+        devices = (await client.get(f"{base}/devices")).raise_for_status().json()
+        registration = (await client.post(
+            f"{base}/customers/me/devices", json={"device_id": devices[0]["id"], "serial_number": "LOADTEST-0001"}
+        )).raise_for_status().json()
+        response = await client.post(f"{base}/tickets", json={**ticket, "customer_device_id": registration["id"]})
+    return response.raise_for_status().json()["id"]
+
+
+SCENARIOS = ("vh", "bsh", "at-ka", "at-mas", "mac", "ideas")
+
+
+def percentile(samples: list[float], q: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1]
+
+
+async def run_request(client: httpx.AsyncClient, scenario: Scenario, request: Request) -> Sample:
+    start = time.perf_counter()
+    first_event: float | None = None
+    events = 0
+    try:
+        async with client.stream(request.method, request.path, json=request.body) as response:
+            if response.headers.get("content-type", "").startswith("text/event-stream"):
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        events += 1
+                        if first_event is None:
+                            first_event = time.perf_counter() - start
+            else:
+                # Non-streaming chat (e.g. mol-asm-cockpit): the whole body is the first "token"
+                await response.aread()
+                first_event = time.perf_counter() - start
+                events = 1
+        error = None if response.status_code < 400 else f"HTTP {response.status_code}"
+        status = response.status_code
+    except httpx.HTTPError as e:
+        error, status = f"{type(e).__name__}: {e}", 0
+    return Sample(scenario.name, status, first_event, time.perf_counter() - start, events, error)
+
+
+async def client_loop(
+    client: httpx.AsyncClient, index: int, scenarios: list[Scenario], requests: int, delay: float,
+    samples: list[Sample],
+) -> None:
+    await asyncio.sleep(delay)
+    for n in range(requests):
+        scenario = scenarios[(index + n) % len(scenarios)]
+        question = QUESTIONS[(index + n) % len(QUESTIONS)]
+        try:
+            request = await scenario.prepare(client, question)
+        except httpx.HTTPError as e:
+            samples.append(Sample(scenario.name, 0, None, 0.0, 0, f"setup failed: {e}"))
+            continue
+        samples.append(await run_request(client, scenario, request))
+
+
+# ---------------------------------------------------------------------------
+# Server-side stats
+# ---------------------------------------------------------------------------
+
+async def _get_json(client: httpx.AsyncClient, path: str) -> dict:
+    try:
+        response = await client.get(path)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError:
+        return {}
+
+
+def _histogram_delta(before: dict, after: dict) -> dict:
+    """``after - before`` of two cumulative ``Histogram.snapshot()`` dicts."""
+    buckets = {le: n - before.get("buckets", {}).get(le, 0) for le, n in after.get("buckets", {}).items()}
+    return {"buckets": buckets, "count": after.get("count", 0) - before.get("count", 0)}
+
+
+def _histogram_quantile(hist: dict, q: float) -> float | None:
+    """Upper bound of the bucket holding the q-quantile (as ``Histogram.quantile``)."""
+    total = hist["count"]
+    if total <= 0:
+        return None
+    for le, cumulative in hist["buckets"].items():
+        if cumulative >= q * total:
+            return float(le)
+    return None
+
+
+async def server_stats(client: httpx.AsyncClient) -> dict:
+    return {
+        "loop": await _get_json(client, "/api/debug/loop"),
+        "pool": await _get_json(client, "/api/debug/pool"),
+    }
+
+
+def summarize_server(before: dict, after: dict) -> dict:
+    summary: dict = {}
+    if after["loop"]:
+        lag = _histogram_delta(before["loop"].get("lag_seconds", {}), after["loop"]["lag_seconds"])
+        summary["loop_lag"] = {
+            "samples": lag["count"],
+            "p50_s": _histogram_quantile(lag, 0.5),
+            # Bucket bounds overstate; the lag never exceeded the recorded maximum
+            "p99_s": min(_histogram_quantile(lag, 0.99) or 0.0, after["loop"]["max_lag_seconds"]),
+            "max_s_since_start": after["loop"]["max_lag_seconds"],
+        }
+    for engine, stats in after["pool"].get("engines", {}).items():
+        previous = before["pool"].get("engines", {}).get(engine, {})
+        wait = _histogram_delta(previous.get("wait_seconds", {}), stats["wait_seconds"])
+        if not wait["count"]:
+            continue  # not instrumented (SQLite, PGlite) or unused
+        summary[f"pool_{engine}"] = {
+            "checkouts": wait["count"],
+            "wait_p99_s": _histogram_quantile(wait, 0.99),
+            "timeouts": stats["timeouts"] - previous.get("timeouts", 0),
+        }
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Processes
+# ---------------------------------------------------------------------------
+
+def _start(args: list[str], env: dict) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, *args], env=env, cwd=project_root)
+
+
+def _wait_until_up(url: str, timeout: float, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{' '.join(process.args)} exited with {process.returncode}")  # type: ignore[arg-type]
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+
+
+def start_processes(args) -> list[subprocess.Popen]:
+    env = {**os.environ, "PYTHONPATH": os.path.join(project_root, "src")}
+    stub = _start([
+        "-m", "innovation_factory.backend.serving_stub", "--port", str(args.stub_port), "--profile", args.profile,
+    ], env)
+    _wait_until_up(f"http://127.0.0.1:{args.stub_port}/stub/stats", 30, stub)
+
+    database_url = args.database_url or "sqlite:///" + str(Path(tempfile.mkdtemp(prefix="loadtest-")) / "app.db")
+    app_env = {
+        **env,
+        **{name: os.environ.get(name, value) for name, value in STUB_ENDPOINTS.items()},
+        "DATABRICKS_HOST": f"http://127.0.0.1:{args.stub_port}",
+        "DATABRICKS_TOKEN": "stub",
+        "DATABASE_URL": database_url,
+    }
+    app = _start([
+        "-m", "uvicorn", "innovation_factory.backend.app:app",
+        "--port", str(args.app_port), "--workers", str(args.workers), "--log-level", "warning",
+    ], app_env)
+    processes = [stub, app]
+    try:
+        # First start seeds the database
+        _wait_until_up(f"http://127.0.0.1:{args.app_port}/api/version", 600, app)
+    except Exception:
+        stop_processes(processes)
+        raise
+    return processes
+
+
+def stop_processes(processes: list[subprocess.Popen]) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+def report(samples: list[Sample], elapsed: float) -> dict:
+    scenarios: dict[str, dict] = {}
+    for name in sorted({s.scenario for s in samples}):
+        group = [s for s in samples if s.scenario == name]
+        ok = [s for s in group if s.error is None]
+        first = [s.first_event_s for s in ok if s.first_event_s is not None]
+        total = [s.total_s for s in ok]
+        scenarios[name] = {
+            "requests": len(group),
+            "errors": len(group) - len(ok),
+            "first_token_p50_s": percentile(first, 50),
+            "first_token_p95_s": percentile(first, 95),
+            "first_token_p99_s": percentile(first, 99),
+            "stream_p50_s": percentile(total, 50),
+            "stream_p95_s": percentile(total, 95),
+            "stream_p99_s": percentile(total, 99),
+            "events_per_stream": round(sum(s.events for s in ok) / len(ok), 1) if ok else 0,
+            "sample_error": next((s.error for s in group if s.error), None),
+        }
+    return {"elapsed_s": round(elapsed, 2), "throughput_rps": round(len(samples) / elapsed, 2), "scenarios": scenarios}
+
+
+def print_report(result: dict) -> None:
+    print(f"\n{'scenario':<8} {'n':>5} {'err':>4}  {'first token ms p50/p95/p99':>27}  {'stream ms p50/p95/p99':>23}  events")
+    for name, s in result["scenarios"].items():
+        first = "/".join(_ms(s[f"first_token_{p}_s"]) for p in ("p50", "p95", "p99"))
+        total = "/".join(_ms(s[f"stream_{p}_s"]) for p in ("p50", "p95", "p99"))
+        print(f"{name:<8} {s['requests']:>5} {s['errors']:>4}  {first:>27}  {total:>23}  {s['events_per_stream']:>6}")
+        if s["sample_error"]:
+            print(f"         e.g. {s['sample_error']}")
+    print(f"\n{result['elapsed_s']}s, {result['throughput_rps']} requests/s")
+    server = result["server"]
+    if "loop_lag" in server:
+        lag = server["loop_lag"]
+        print(
+            f"server loop lag: p50 <= {_ms(lag['p50_s'])}ms, p99 <= {_ms(lag['p99_s'])}ms "
+            f"({lag['samples']} samples; max since start {_ms(lag['max_s_since_start'])}ms)"
+        )
+    for key, pool in server.items():
+        if key.startswith("pool_"):
+            print(
+                f"{key.replace('_', ' ')}: {pool['checkouts']} checkouts, wait p99 <= {_ms(pool['wait_p99_s'])}ms, "
+                f"{pool['timeouts']} timeouts"
+            )
+    if not any(k.startswith("pool_") for k in server):
+        print("pool waits: not instrumented for this database (pooled PostgreSQL only)")
+    client_lag = result["client_loop_lag"]
+    print(f"load generator loop lag: p99 <= {_ms(client_lag['lag_p99_seconds'])}ms, max {_ms(client_lag['max_lag_seconds'])}ms")
+    if result.get("stub"):
+        print(f"stub: {json.dumps(result['stub'])}")
+
+
+async def run(args) -> dict:
+    scenarios = [Scenario(name) for name in args.scenarios.split(",")]
+    for scenario in scenarios:
+        if scenario.name not in SCENARIOS:
+            raise SystemExit(f"unknown scenario '{scenario.name}' (choose from {', '.join(SCENARIOS)})")
+
+    client_monitor = LoopLagMonitor(interval=0.05)
+    lag_task = asyncio.create_task(client_monitor.run())
+    limits = httpx.Limits(max_connections=args.clients + 10, max_keepalive_connections=args.clients + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        for scenario in scenarios:
+            if scenario.name in ("vh", "bsh"):
+                given = args.vh_ticket if scenario.name == "vh" else args.bsh_ticket
+                scenario.ticket_id = given or await create_ticket(client, scenario.name)
+        before = await server_stats(client)
+        samples: list[Sample] = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            client_loop(client, i, scenarios, args.requests, args.ramp * i / args.clients, samples)
+            for i in range(args.clients)
+        ))
+        elapsed = time.perf_counter() - started
+        after = await server_stats(client)
+        stub = await _get_json(client, f"http://127.0.0.1:{args.stub_port}/stub/stats") if args.start else {}
+    lag_task.cancel()
+
+    result = report(samples, elapsed)
+    result["server"] = summarize_server(before, after)
+    result["client_loop_lag"] = client_monitor.stats()
+    result["stub"] = stub
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=None, help="target a running app instead of starting one")
+    parser.add_argument("--clients", type=int, default=100, help="concurrent SSE clients")
+    parser.add_argument("--requests", type=int, default=3, help="chat requests per client")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which clients start")
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-request timeout in seconds")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"comma-separated: {', '.join(SCENARIOS)}")
+    parser.add_argument("--vh-ticket", type=int, default=None, help="vi-home-one ticket to chat on (default: new)")
+    parser.add_argument("--bsh-ticket", type=int, default=None, help="bsh-home-connect ticket to chat on (default: new)")
+    parser.add_argument("--profile", default="agent", help="stub latency profile (see serving_stub.PROFILES)")
+    parser.add_argument("--stub-port", type=int, default=8765)
+    parser.add_argument("--app-port", type=int, default=8766)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers of the started app")
+    parser.add_argument("--database-url", default=None, help="database of the started app (default: temp SQLite)")
+    parser.add_argument("--output", type=Path, default=None, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    args.start = args.base_url is None
+    processes = []
+    if args.start:
+        print(f"Starting stub ({args.profile}) and app ({args.workers} worker(s))...", flush=True)
+        processes = start_processes(args)
+        args.base_url = f"http://127.0.0.1:{args.app_port}"
+
+    try:
+        print(f"Running {args.clients} clients x {args.requests} requests against {args.base_url}...", flush=True)
+        result = asyncio.run(run(args))
+    finally:
+        stop_processes(processes)
+
+    print_report(result)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
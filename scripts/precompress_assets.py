@@ -0,0 +1,46 @@
+"""Write maximum-compression .gz / .br sidecar files for the built SPA bundle.
+
+Usage:
+    cd /path/to/innovation-factory
+    .venv/bin/python scripts/precompress_assets.py [--dist src/innovation_factory/__dist__]
+
+Run after the frontend build. The app compresses at startup with fast settings
+when sidecars are missing; with them, workers start faster and clients get
+smaller responses. Brotli sidecars need the optional ``brotli`` package.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project src to path so imports work
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+from innovation_factory.backend.static import available_encodings, precompress  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dist",
+        type=Path,
+        default=Path(project_root) / "src" / "innovation_factory" / "__dist__",
+        help="built bundle directory",
+    )
+    args = parser.parse_args()
+
+    if not args.dist.is_dir():
+        sys.exit(f"{args.dist} does not exist; build the frontend first")
+    start = time.perf_counter()
+    written = precompress(args.dist)
+    print(
+        f"Wrote {written} {'/'.join(available_encodings())} sidecar files in "
+        f"{time.perf_counter() - start:.1f}s to {args.dist}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -45,29 +45,10 @@ def main():
     # Import all models so SQLModel.metadata knows about them
     print("\n3. Importing all database models...")
     from innovation_factory.backend.models import Project  # noqa: F401
-    from innovation_factory.backend.projects.vi_home_one.models import (  # noqa: F401
-        VhNeighborhood, VhHousehold, VhEnergyDevice, VhEnergyReading,
-        VhConsumptionBreakdown, VhEnergyProvider, VhMaintenanceAlert,
-        VhTicket, VhTicketMedia, VhChatSession, VhChatMessage, VhKnowledgeArticle,
-    )
-    from innovation_factory.backend.projects.bsh_home_connect.models import (  # noqa: F401
-        BshCustomer, BshTechnician, BshDevice, BshCustomerDevice,
-        BshTicket, BshTicketNote, BshTicketMedia, BshKnowledgeArticle,
-        BshDocument, BshChatSession, BshChatMessage,
-    )
-    from innovation_factory.backend.projects.adtech_intelligence.models import (  # noqa: F401
-        AtAdvertiser, AtCampaign, AtAdInventory, AtPlacement,
-        AtPerformanceMetric, AtAnomalyRule, AtAnomaly, AtIssue,
-        AtCustomerContract, AtChatSession, AtChatMessage,
-    )
-    from innovation_factory.backend.projects.mol_asm_cockpit.models import (  # noqa: F401
-        MacRegion, MacStation, MacFuelSale, MacNonfuelSale,
-        MacLoyaltyMetric, MacWorkforceShift, MacInventory,
-        MacCompetitorPrice, MacPriceHistory, MacAnomalyAlert,
-        MacIssue, MacCustomerProfile, MacCustomerContract,
-        MacChatSession, MacChatMessage,
-    )
-    print("   All models imported (including MOL ASM Cockpit).")
+    from innovation_factory.backend.projects.registry import PROJECTS, load_all_models
+
+    load_all_models()
+    print(f"   All models imported ({len(PROJECTS)} projects).")
 
     # Build the SQLAlchemy engine with Lakebase credential injection
     print(f"\n4. Creating database engine for {PGHOST}/{PGDATABASE}...")
@@ -112,24 +93,16 @@ def main():
 
     # Seed the data
     print("\n6. Seeding data...")
-    from innovation_factory.backend.seed import _seed_projects
-    from innovation_factory.backend.projects.vi_home_one.seed import seed_vh_data
-    from innovation_factory.backend.projects.bsh_home_connect.seed import seed_bsh_data
-    from innovation_factory.backend.projects.adtech_intelligence.seed import seed_at_data
-    from innovation_factory.backend.projects.mol_asm_cockpit.seed import seed_mac_data
+    from innovation_factory.backend.bulk import bulk_options
+    from innovation_factory.backend.seed import SEED_SCALE, seed_database
 
-    with Session(engine) as session:
-        print("   Seeding projects...")
-        _seed_projects(session)
-        print("   Seeding ViHome data...")
-        seed_vh_data(session)
-        print("   Seeding BSH data...")
-        seed_bsh_data(session)
-        print("   Seeding MOL ASM Cockpit data...")
-        seed_mac_data(session)
-        print("   Seeding AdTech data...")
-        seed_at_data(session)
-        session.commit()
+    def progress(table: str, loaded: int) -> None:
+        print(f"      {table}: {loaded} rows", end="\r", flush=True)
+
+    # Bulk rows go through COPY on the seeding session's connection
+    # SEED_SCALE > 0 appends scale-factor synthetic data (needs the bench group)
+    with Session(engine) as session, bulk_options(progress=progress):
+        seed_database(session, list(PROJECTS), scale=SEED_SCALE or None)
         print("\n   Seeding completed successfully!")
 
     # Verify
@@ -0,0 +1,229 @@
+"""Timing spans and per-endpoint metrics of serving-endpoint (agent) calls.
+
+Every MAS/KA/LLM invocation runs inside ``agent_call``, which yields an
+``AgentCallSpan`` that the pooled serving client and the response readers fill
+in: queue wait for an endpoint slot, upstream time (request sent until the
+body is read, over all attempts), time to the first streamed text, response
+bytes, extracted text length, and the error class if the call failed. When the
+block exits the span is
+
+- logged as one line (and as ``extra={"agent_call": ...}`` for structured handlers),
+- folded into per-endpoint histograms that ``route_metrics`` publishes next to
+  the route metrics (``agent_call_duration_seconds`` and friends at
+  ``/api/metrics``, merged across workers),
+- added to the current request's ``sql_stats`` collector, so ``/api/debug/sql``
+  and the ``Server-Timing`` header show agent time next to DB time, and
+- if it took at least ``AGENT_SLOW_CALL_SECONDS``, kept among the last
+  ``AGENT_SLOW_SAMPLES`` slow calls at ``/api/debug/agents`` together with the
+  shape of its request and response (structure, roles and item types; text is
+  reduced to its length).
+"""
+import os
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+import httpx
+
+from . import sql_stats
+from .logger import logger
+from .metrics import DEFAULT_BUCKETS, Histogram
+
+AGENT_SLOW_CALL_SECONDS = float(os.getenv("AGENT_SLOW_CALL_SECONDS", "10"))
+AGENT_SLOW_SAMPLES = int(os.getenv("AGENT_SLOW_SAMPLES", "50"))
+
+# Agent answers take seconds to minutes
+DURATION_BUCKETS: tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0,
+)
+SIZE_BUCKETS: tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Values of these keys are structure (roles, item types), not content
+_STRUCTURAL_KEYS = frozenset({"role", "type", "object", "finish_reason", "status", "name"})
+_SHAPE_DEPTH = 5
+_SHAPE_ITEMS = 8
+
+
+def shape(value: Any, depth: int = 0) -> Any:
+    """The structure of a JSON value with text replaced by its length."""
+    if isinstance(value, dict):
+        if depth >= _SHAPE_DEPTH:
+            return f"dict({len(value)})"
+        return {
+            k: v if k in _STRUCTURAL_KEYS and isinstance(v, str) else shape(v, depth + 1)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        if depth >= _SHAPE_DEPTH:
+            return f"list({len(value)})"
+        items = [shape(v, depth + 1) for v in value[:_SHAPE_ITEMS]]
+        if len(value) > _SHAPE_ITEMS:
+            items.append(f"... {len(value) - _SHAPE_ITEMS} more")
+        return items
+    if isinstance(value, str):
+        return f"str({len(value)})"
+    return type(value).__name__
+
+
+def error_class(error: BaseException) -> str:
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}"
+    if isinstance(error, GeneratorExit) or type(error).__name__ == "CancelledError":
+        return "cancelled"
+    return type(error).__name__
+
+
+@dataclass
+class AgentCallSpan:
+    """Timings and sizes of one serving-endpoint invocation."""
+
+    endpoint: str
+    kind: str  # "invoke" or "stream"
+    request_shape: Any = None
+    response_shape: Any = None
+    queue_wait: float = 0.0
+    upstream: float = 0.0
+    first_text: float | None = None
+    duration: float = 0.0
+    attempts: int = 0
+    status: int | None = None
+    response_bytes: int = 0
+    text_chars: int = 0
+    error: str | None = None
+    events: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add_text(self, text: str) -> None:
+        """Count streamed text; the first non-empty chunk marks time to first text."""
+        if text and self.first_text is None:
+            self.first_text = time.perf_counter() - self.started
+        self.text_chars += len(text)
+
+    def as_dict(self) -> dict:
+        return {
+            "endpoint": self.endpoint,
+            "kind": self.kind,
+            "duration_ms": round(self.duration * 1000, 1),
+            "queue_wait_ms": round(self.queue_wait * 1000, 1),
+            "upstream_ms": round(self.upstream * 1000, 1),
+            "first_text_ms": None if self.first_text is None else round(self.first_text * 1000, 1),
+            "attempts": self.attempts,
+            "status": self.status,
+            "response_bytes": self.response_bytes,
+            "text_chars": self.text_chars,
+            "error": self.error,
+        }
+
+
+class AgentMetrics:
+    """Per-endpoint agent call aggregates of this worker, plus slow-call samples."""
+
+    def __init__(self, slow_seconds: float = AGENT_SLOW_CALL_SECONDS, samples: int = AGENT_SLOW_SAMPLES) -> None:
+        self.slow_seconds = slow_seconds
+        self.calls: dict[tuple[str, str, str], int] = defaultdict(int)
+        self.duration: dict[str, Histogram] = defaultdict(lambda: Histogram(DURATION_BUCKETS))
+        self.upstream: dict[str, Histogram] = defaultdict(lambda: Histogram(DURATION_BUCKETS))
+        self.first_text: dict[str, Histogram] = defaultdict(lambda: Histogram(DURATION_BUCKETS))
+        self.queue_wait: dict[str, Histogram] = defaultdict(lambda: Histogram(DEFAULT_BUCKETS))
+        self.response_bytes: dict[str, Histogram] = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+        self.text_chars: dict[str, Histogram] = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+        self.slow: deque[dict] = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def record(self, span: AgentCallSpan) -> None:
+        endpoint = span.endpoint
+        with self._lock:
+            self.calls[(endpoint, span.kind, span.error or "ok")] += 1
+        self.duration[endpoint].observe(span.duration)
+        self.upstream[endpoint].observe(span.upstream)
+        self.queue_wait[endpoint].observe(span.queue_wait)
+        self.response_bytes[endpoint].observe(span.response_bytes)
+        self.text_chars[endpoint].observe(span.text_chars)
+        if span.first_text is not None:
+            self.first_text[endpoint].observe(span.first_text)
+        if span.duration >= self.slow_seconds:
+            sample = {
+                "at": datetime.now(timezone.utc).isoformat(),
+                **span.as_dict(),
+                "request": span.request_shape,
+                "response": span.response_shape if span.kind == "invoke" else {"events": dict(span.events)},
+            }
+            with self._lock:
+                self.slow.append(sample)
+
+    def histograms(self) -> dict[str, dict[str, Histogram]]:
+        return {
+            "duration": self.duration,
+            "upstream": self.upstream,
+            "first_text": self.first_text,
+            "queue_wait": self.queue_wait,
+            "response_bytes": self.response_bytes,
+            "text_chars": self.text_chars,
+        }
+
+    def snapshot(self) -> dict:
+        """Counters and histograms for cross-worker aggregation (see ``route_metrics``)."""
+        with self._lock:
+            calls = [[endpoint, kind, outcome, n] for (endpoint, kind, outcome), n in self.calls.items()]
+        return {
+            "calls": calls,
+            **{name: {e: h.snapshot() for e, h in list(hists.items())} for name, hists in self.histograms().items()},
+        }
+
+    def stats(self) -> dict:
+        """Per-endpoint summary and slow samples of this worker."""
+        with self._lock:
+            calls = dict(self.calls)
+            slow = list(self.slow)
+        endpoints: dict[str, dict] = {}
+        for (endpoint, kind, outcome), n in sorted(calls.items()):
+            row = endpoints.setdefault(endpoint, {"calls": 0, "outcomes": {}})
+            row["calls"] += n
+            row["outcomes"][outcome] = row["outcomes"].get(outcome, 0) + n
+        for endpoint, row in endpoints.items():
+            ok = row["outcomes"].get("ok", 0)
+            row["error_rate"] = round(1 - ok / row["calls"], 4)
+            for name, hist in (
+                ("duration", self.duration[endpoint]),
+                ("upstream", self.upstream[endpoint]),
+                ("first_text", self.first_text[endpoint]),
+                ("queue_wait", self.queue_wait[endpoint]),
+            ):
+                # Bucket upper bounds, like /api/debug/loop
+                row[f"{name}_p50_seconds"] = hist.quantile(0.5)
+                row[f"{name}_p95_seconds"] = hist.quantile(0.95)
+            size = self.response_bytes[endpoint]
+            row["avg_response_bytes"] = round(size.sum / size.count) if size.count else None
+        return {"slow_call_seconds": self.slow_seconds, "endpoints": endpoints, "slow_calls": slow}
+
+
+registry = AgentMetrics()
+
+
+@contextmanager
+def agent_call(endpoint: str, kind: str, request: Any = None) -> Iterator[AgentCallSpan]:
+    """Time the serving-endpoint call inside the block and record its span."""
+    span = AgentCallSpan(endpoint=endpoint, kind=kind, request_shape=shape(request))
+    try:
+        yield span
+    except BaseException as e:
+        span.error = error_class(e)
+        raise
+    finally:
+        span.duration = time.perf_counter() - span.started
+        registry.record(span)
+        request_stats = sql_stats.current()
+        if request_stats is not None:
+            request_stats.record_agent_call(span.duration)
+        fields = span.as_dict()
+        logger.info(
+            f"Agent call {endpoint} ({kind}): {fields['duration_ms']:.0f} ms "
+            f"(queue {fields['queue_wait_ms']:.0f} ms, upstream {fields['upstream_ms']:.0f} ms, "
+            f"first text {fields['first_text_ms']} ms), {span.attempts} attempt(s), "
+            f"{span.response_bytes} B, {span.text_chars} chars" + (f", error {span.error}" if span.error else ""),
+            extra={"agent_call": fields},
+        )
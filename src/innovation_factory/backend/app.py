@@ -1,12 +1,23 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+# Imported first so the profiler's origin is the start of the app import
+from .profiling import startup_profiler
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
 from .._metadata import app_name, dist_dir
 from .config import AppConfig
-from .router import api
+
+with startup_profiler.phase("import:api"):
+    from .router import api
 from .runtime import Runtime
+from .jobs import jobs
+from .services.serving_client import serving
+from . import loop_lag
+from .route_metrics import RouteMetricsMiddleware, flush_periodically
+from .sql_stats import SQLStatsMiddleware
+from .static import SpaStaticFiles
 from .utils import add_not_found_handler
 from .logger import logger
 
@@ -18,29 +29,53 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting app with configuration:\n{config}")
 
     runtime = Runtime(config)
-    runtime.validate_db()
-    runtime.initialize_models()
+    with startup_profiler.phase("lifespan:validate_db"):
+        runtime.validate_db()
+    with startup_profiler.phase("lifespan:initialize_models"):
+        runtime.initialize_models()
+    with startup_profiler.phase("lifespan:static_assets"):
+        ui.load()
 
     # Auto-seed if database is empty (works in dev and production)
     from .seed import check_and_seed_if_empty
     try:
-        check_and_seed_if_empty(runtime)
+        with startup_profiler.phase("lifespan:seed"):
+            check_and_seed_if_empty(runtime)
     except Exception as e:
-        logger.warning(f"Seeding skipped (likely concurrent worker race): {e}")
+        logger.warning(f"Seeding failed: {e}")
 
     # Store in app.state for access via dependencies
     app.state.config = config
     app.state.runtime = runtime
 
+    # Publish this worker's route metrics for cross-worker aggregation
+    metrics_flusher = asyncio.create_task(flush_periodically())
+    loop_monitor = asyncio.create_task(loop_lag.monitor.run())
+
+    startup_profiler.mark_ready()
+    startup_profiler.log_report()
+
     yield
 
+    for task in (metrics_flusher, loop_monitor):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    jobs.shutdown(runtime)
+    await serving.aclose()
+    await runtime.close()
+
 
 app = FastAPI(title=f"{app_name}", lifespan=lifespan)
-ui = StaticFiles(directory=dist_dir, html=True)
+ui = SpaStaticFiles(directory=dist_dir, html=True)
+
+# ty does not match middleware classes to Starlette's ``_MiddlewareFactory`` protocol
+app.add_middleware(SQLStatsMiddleware)  # type: ignore[invalid-argument-type]
+app.add_middleware(RouteMetricsMiddleware)  # type: ignore[invalid-argument-type]
 
 # note the order of includes and mounts!
 app.include_router(api)
 app.mount("/", ui)
 
 
-add_not_found_handler(app)
+add_not_found_handler(app, ui)
@@ -0,0 +1,195 @@
+"""Bulk loader for seed data.
+
+Seed generators produce plain tuples instead of ORM objects. ``BulkLoader``
+buffers them per table and writes each full batch with one round trip:
+``COPY ... FROM STDIN`` on Postgres (psycopg) and an ``executemany`` INSERT
+elsewhere. Loading happens on the session's own connection, so it shares the
+seeding transaction and ORM objects flushed earlier are visible (and vice
+versa).
+
+Columns omitted from a table's column list get the model's Python-side
+default (e.g. ``created_at``), evaluated once per ``table()`` call.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from sqlalchemy import JSON, insert
+from sqlmodel import Session, SQLModel
+
+from .logger import logger
+
+
+ProgressCallback = Callable[[str, int], None]
+
+
+@dataclass(frozen=True)
+class BulkOptions:
+    batch_size: int = int(os.getenv("SEED_BATCH_SIZE", "5000"))
+    # COPY can be turned off for Postgres-compatible servers without COPY support
+    use_copy: bool = os.getenv("SEED_BULK_COPY", "1") != "0"
+    progress: ProgressCallback | None = None
+
+
+_options: ContextVar[BulkOptions] = ContextVar("bulk_options", default=BulkOptions())
+
+
+@contextmanager
+def bulk_options(**overrides) -> Iterator[BulkOptions]:
+    """Override batch size / COPY usage / progress for loaders created inside the block."""
+    options = BulkOptions(**{**_options.get().__dict__, **overrides})
+    token = _options.set(options)
+    try:
+        yield options
+    finally:
+        _options.reset(token)
+
+
+class TableBuffer:
+    """Rows for one table, written whenever ``batch_size`` rows are pending."""
+
+    def __init__(
+        self,
+        loader: "BulkLoader",
+        model: type[SQLModel],
+        columns: Sequence[str],
+    ) -> None:
+        self.loader = loader
+        self.table = model.__table__  # type: ignore[attr-defined]
+        defaults = _python_defaults(model, columns)
+        self.columns = list(columns) + list(defaults)
+        self._suffix = tuple(defaults.values())
+        self._converters = _copy_converters(self.table, self.columns)
+        self._pending: list[tuple] = []
+        self.loaded = 0
+
+    def append(self, row: tuple) -> None:
+        self._pending.append(row + self._suffix if self._suffix else row)
+        if len(self._pending) >= self.loader.batch_size:
+            self.flush()
+
+    def extend(self, rows: Iterable[tuple]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        self.loader._write(self, rows)
+        self.loaded += len(rows)
+        if self.loader.progress is not None:
+            self.loader.progress(self.table.name, self.loaded)
+
+
+class BulkLoader:
+    """Context manager that batches tuple rows into their tables."""
+
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int | None = None,
+        use_copy: bool | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        options = _options.get()
+        self.session = session
+        self.batch_size = batch_size or options.batch_size
+        dialect = session.get_bind().dialect
+        self.use_copy = (options.use_copy if use_copy is None else use_copy) and (
+            dialect.name == "postgresql" and dialect.driver == "psycopg"
+        )
+        self.progress = progress or options.progress
+        self._quote = dialect.identifier_preparer.quote
+        self._buffers: list[TableBuffer] = []
+        self._started = time.perf_counter()
+
+    def table(self, model: type[SQLModel], columns: Sequence[str]) -> TableBuffer:
+        buffer = TableBuffer(self, model, columns)
+        self._buffers.append(buffer)
+        return buffer
+
+    def load(self, model: type[SQLModel], columns: Sequence[str], rows: Iterable[tuple]) -> int:
+        """Stream ``rows`` into ``model``'s table and return the number written."""
+        buffer = self.table(model, columns)
+        buffer.extend(rows)
+        buffer.flush()
+        return buffer.loaded
+
+    def flush(self) -> None:
+        for buffer in self._buffers:
+            buffer.flush()
+
+    def __enter__(self) -> "BulkLoader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            return
+        self.flush()
+        elapsed = time.perf_counter() - self._started
+        for buffer in self._buffers:
+            if buffer.loaded:
+                print(f"    Loaded {buffer.loaded} rows into {buffer.table.name}")
+        total = sum(b.loaded for b in self._buffers)
+        logger.info(
+            f"Bulk loaded {total} rows in {elapsed:.2f}s "
+            f"({'COPY' if self.use_copy else 'executemany'}, batch size {self.batch_size})"
+        )
+
+    def _write(self, buffer: TableBuffer, rows: list[tuple]) -> None:
+        # Parent rows added through the ORM must exist before children reference them
+        self.session.flush()
+        if self.use_copy:
+            self._copy(buffer, rows)
+        else:
+            self.session.execute(
+                insert(buffer.table), [dict(zip(buffer.columns, row)) for row in rows]
+            )
+
+    def _copy(self, buffer: TableBuffer, rows: list[tuple]) -> None:
+        dbapi_conn = self.session.connection().connection.driver_connection
+        columns = ", ".join(self._quote(c) for c in buffer.columns)
+        statement = f"COPY {self._quote(buffer.table.name)} ({columns}) FROM STDIN"
+        converters = buffer._converters
+        with dbapi_conn.cursor() as cursor, cursor.copy(statement) as copy:  # type: ignore[union-attr]
+            for row in rows:
+                copy.write_row(
+                    [conv(v) if conv and v is not None else v for conv, v in zip(converters, row)]
+                )
+
+
+def _python_defaults(model: type[SQLModel], columns: Sequence[str]) -> dict[str, Any]:
+    defaults: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if name in columns or name not in model.__table__.columns:  # type: ignore[attr-defined]
+            continue
+        column = model.__table__.columns[name]  # type: ignore[attr-defined]
+        if column.primary_key or field.is_required():
+            continue
+        if field.default_factory is not None or field.default is not None:
+            defaults[name] = field.get_default(call_default_factory=True)
+    return defaults
+
+
+def _enum_name(value: Any) -> Any:
+    # SQLAlchemy's Enum type persists member names, not values
+    return value.name if isinstance(value, Enum) else value
+
+
+def _copy_converters(table, columns: Sequence[str]) -> list[Callable[[Any], Any] | None]:
+    converters: list[Callable[[Any], Any] | None] = []
+    for name in columns:
+        column_type = table.columns[name].type
+        if isinstance(column_type, JSON):
+            converters.append(json.dumps)
+        elif hasattr(column_type, "enum_class"):
+            converters.append(_enum_name)
+        else:
+            converters.append(None)
+    return converters
@@ -0,0 +1,105 @@
+"""Conditional GET (``ETag`` / ``If-None-Match``) for polled endpoints.
+
+Handlers that the UI polls compute a cheap validator before doing the real
+work, and answer ``304 Not Modified`` when the client already has the current
+version::
+
+    @router.get("", response_model=list[MacAnomalyAlertOut], operation_id="mac_listAnomalyAlerts")
+    def list_anomaly_alerts(session: SessionDep, conditional: ConditionalDep, ...):
+        q = select(MacAnomalyAlert).where(...)
+        not_modified = conditional.check_query(
+            session, q, MacAnomalyAlert.detected_at, tags=["mac:anomaly-alerts"]
+        )
+        if not_modified is not None:
+            return not_modified
+        return session.exec(q.order_by(...).limit(limit)).all()
+
+The validator of a query is one aggregate over the rows it filters: the row
+count and the ``max`` of the given timestamp columns, hashed together with the
+SQL and its parameters (the filters, including identity-derived ones), the
+request's path and query string, and the response-cache versions of ``tags``.
+Inserts and deletes change the count; updates change the maximum when the
+writer maintains a timestamp such as ``updated_at``. Rows without such a column
+rely on their write handlers declaring ``@invalidates(tag)`` instead.
+
+On a match the handler returns before running the list query, so neither the
+body nor its serialization is ever built. Otherwise the ``ETag`` is attached to
+the normal response.
+"""
+import hashlib
+from typing import Annotated, Iterable
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import func
+from sqlalchemy.sql import Select
+from sqlmodel import Session
+
+from . import response_cache
+
+# Browsers revalidate on every poll instead of reusing a stored copy unasked
+CACHE_CONTROL = "private, no-cache"
+
+
+def query_validator(session: Session, statement: Select, *columns) -> tuple:
+    """Row count and ``max`` of each of ``columns`` over the rows ``statement`` selects.
+
+    Ordering, limit and offset are dropped, so the aggregate covers every
+    matching row; the page bounds are part of the query string instead.
+    """
+    aggregate = (
+        statement.order_by(None)
+        .limit(None)
+        .offset(None)
+        .with_only_columns(func.count(), *(func.max(c) for c in columns), maintain_column_froms=True)
+    )
+    compiled = aggregate.compile(dialect=session.get_bind().dialect)
+    row = session.execute(aggregate).one()
+    return (str(compiled), sorted(compiled.params.items()), tuple(row))
+
+
+def make_etag(*parts: object) -> str:
+    # Weak: equal validators mean equivalent, not byte-identical, bodies
+    return 'W/"' + hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest() + '"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+class Conditional:
+    """Per-request ETag check; inject with ``ConditionalDep``."""
+
+    def __init__(self, request: Request, response: Response) -> None:
+        self.request = request
+        self.response = response
+
+    def check(self, *validator: object, tags: Iterable[str] = ()) -> Response | None:
+        """A ``304`` response if the client's copy matches ``validator``, else ``None``.
+
+        In the ``None`` case the ``ETag`` is set on the handler's response.
+        """
+        etag = make_etag(
+            self.request.url.path,
+            sorted(self.request.query_params.multi_items()),
+            validator,
+            response_cache.versions(tags),
+        )
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if _matches(self.request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        self.response.headers.update(headers)
+        return None
+
+    def check_query(
+        self, session: Session, statement: Select, *columns, tags: Iterable[str] = ()
+    ) -> Response | None:
+        """``check`` with the ``query_validator`` of ``statement`` over ``columns``."""
+        return self.check(*query_validator(session, statement, *columns), tags=tags)
+
+
+ConditionalDep = Annotated[Conditional, Depends()]
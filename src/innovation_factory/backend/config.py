@@ -49,6 +49,32 @@ class DatabaseConfig(BaseSettings):
         default=None,
         validation_alias="ENDPOINT_NAME",
     )
+    pool_size: int = Field(
+        description="Persistent connections kept per engine and worker process",
+        default=4,
+        validation_alias="DB_POOL_SIZE",
+    )
+    max_overflow: int = Field(
+        description="Extra connections opened under burst load on top of pool_size",
+        default=10,
+        validation_alias="DB_MAX_OVERFLOW",
+    )
+    pool_timeout: float = Field(
+        description="Seconds to wait for a free connection before raising",
+        default=30.0,
+        validation_alias="DB_POOL_TIMEOUT",
+    )
+    pool_pre_ping: bool = Field(
+        description="Test connections on checkout (survives Lakebase scale-to-zero and restarts)",
+        default=True,
+        validation_alias="DB_POOL_PRE_PING",
+    )
+    pool_recycle: int = Field(
+        description="Seconds after which a pooled connection is replaced "
+        "(must stay below the one-hour OAuth token lifetime)",
+        default=45 * 60,
+        validation_alias="DB_POOL_RECYCLE",
+    )
 
 
 class AppConfig(BaseSettings):
@@ -1,12 +1,16 @@
-from typing import Annotated, Generator
+from typing import Annotated, AsyncGenerator, Generator
+import hashlib
 import os
+import threading
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.iam import User as DatabricksUser, Name, ComplexValue
 from fastapi import Depends, Header, Request
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from dataclasses import dataclass
 
+from .cache import TTLCache
 from .config import AppConfig
 from .runtime import Runtime
 
@@ -73,11 +77,60 @@ class MockWorkspaceClient:
         self.current_user = self.MockCurrentUser()
 
 
+class _MemoizedCurrentUserAPI:
+    """Wraps ``CurrentUserAPI`` so ``me()`` hits SCIM once per client."""
+
+    def __init__(self, api):
+        self._api = api
+        self._me: DatabricksUser | None = None
+        self._lock = threading.Lock()
+
+    def me(self) -> DatabricksUser:
+        me = self._me
+        if me is None:
+            with self._lock:
+                me = self._me
+                if me is None:
+                    me = self._me = self._api.me()
+        return me
+
+    def __getattr__(self, name):
+        return getattr(self._api, name)
+
+
+class OboWorkspaceClient(WorkspaceClient):
+    """WorkspaceClient for a forwarded user token with a memoized ``current_user.me()``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._memoized_current_user = _MemoizedCurrentUserAPI(self._current_user)
+
+    @property
+    def current_user(self):
+        return self._memoized_current_user
+
+
+# Forwarded tokens are short-lived; cap reuse well below their lifetime so a
+# revoked token or changed identity is picked up quickly.
+OBO_CLIENT_TTL_SECONDS = 300
+OBO_CLIENT_CACHE_SIZE = 1024
+
+obo_clients: TTLCache[str, OboWorkspaceClient] = TTLCache(
+    "obo_clients", maxsize=OBO_CLIENT_CACHE_SIZE, ttl=OBO_CLIENT_TTL_SECONDS
+)
+
+
+def _token_key(token: str) -> str:
+    # Never keep raw tokens as dictionary keys
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def get_obo_ws(
     token: Annotated[str | None, Header(alias="X-Forwarded-Access-Token")] = None,
 ) -> WorkspaceClient:
     """
     Returns a Databricks Workspace client with authentication behalf of user.
+    Clients (and their resolved identity) are reused per token for a few minutes.
     In local development mode, returns a mock client.
     """
     if is_local_dev():
@@ -88,8 +141,8 @@ def get_obo_ws(
             "OBO token is not provided in the header X-Forwarded-Access-Token"
         )
 
-    return WorkspaceClient(
-        token=token, auth_type="pat"
+    return obo_clients.get_or_set(
+        _token_key(token), lambda: OboWorkspaceClient(token=token, auth_type="pat")
     )
 
 
@@ -99,3 +152,11 @@ def get_session(rt: RuntimeDep) -> Generator[Session, None, None]:
 
 
 SessionDep = Annotated[Session, Depends(get_session)]
+
+
+async def get_async_session(rt: RuntimeDep) -> AsyncGenerator[AsyncSession, None]:
+    async with rt.get_async_session() as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
@@ -0,0 +1,242 @@
+"""In-memory index of the project documentation (``docs/projects/*.md``).
+
+The markdown files are parsed once into documents (title, headings, sections)
+and an inverted index from terms to sections, so doc pages and search are
+answered from memory. Edits are picked up without a restart: at most every
+``DOCS_RELOAD_INTERVAL`` seconds a request stats the directory and reparses
+the files whose mtime changed. Readers always see a complete snapshot; a
+reload builds a new one and swaps it in.
+
+Search ranks sections with BM25. Heading terms count more than body terms, and
+a query term also matches longer terms it is a prefix of ("pump" finds
+"pumps") at half weight.
+"""
+import bisect
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from .logger import logger
+
+DOCS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "docs" / "projects"
+DOCS_RELOAD_INTERVAL = float(os.getenv("DOCS_RELOAD_INTERVAL", "2"))
+
+HEADING_WEIGHT = 3
+PREFIX_WEIGHT = 0.5
+SNIPPET_CHARS = 160
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TERM_RE = re.compile(r"\w+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MARKUP_RE = re.compile(r"[`*>#]+")
+_RULE_RE = re.compile(r"\||-{3,}")
+
+
+def terms(text: str) -> list[str]:
+    return [t.lower() for t in _TERM_RE.findall(text)]
+
+
+def _plain(markdown: str) -> str:
+    """Markdown reduced to the words a snippet shows."""
+    text = _MARKUP_RE.sub("", _LINK_RE.sub(r"\1", markdown))
+    return " ".join(_RULE_RE.sub(" ", text).split())
+
+
+@dataclass(frozen=True)
+class Section:
+    slug: str
+    heading: str
+    text: str
+    length: int
+
+
+@dataclass(frozen=True)
+class Doc:
+    slug: str
+    title: str
+    content: str
+    headings: tuple[str, ...]
+    sections: tuple[Section, ...]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    slug: str
+    title: str
+    heading: str
+    snippet: str
+    score: float
+
+
+def parse(slug: str, content: str) -> Doc:
+    """Split a markdown document into sections at its headings."""
+    title, headings, sections = slug, [], []
+    heading, body = "", []
+
+    def close() -> None:
+        if heading or any(line.strip() for line in body):
+            text = _plain("\n".join(body))
+            sections.append(Section(slug, heading, text, len(terms(heading)) + len(terms(text))))
+
+    in_code = False
+    for line in content.splitlines():
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        match = None if in_code else _HEADING_RE.match(line)
+        if match is None:
+            body.append(line)
+            continue
+        close()
+        heading, body = _plain(match.group(2)), []
+        headings.append(heading)
+        if match.group(1) == "#" and title == slug:
+            title = heading
+    close()
+    return Doc(slug, title, content, tuple(headings), tuple(sections))
+
+
+class _Snapshot:
+    """Immutable documents plus the inverted index over their sections."""
+
+    def __init__(self, docs: dict[str, Doc], mtimes: dict[str, int]) -> None:
+        self.docs = docs
+        self.mtimes = mtimes
+        self.sections = [s for slug in sorted(docs) for s in docs[slug].sections]
+        self.postings: dict[str, dict[int, int]] = {}
+        for i, section in enumerate(self.sections):
+            counts = Counter(terms(section.text))
+            for term in terms(section.heading):
+                counts[term] += HEADING_WEIGHT
+            for term, count in counts.items():
+                self.postings.setdefault(term, {})[i] = count
+        self.vocabulary = sorted(self.postings)
+        self.avg_length = sum(s.length for s in self.sections) / len(self.sections) if self.sections else 0.0
+
+    def expand(self, term: str) -> list[tuple[str, float]]:
+        """Index terms matching a query term, with their weight."""
+        matches = [(term, 1.0)] if term in self.postings else []
+        i = bisect.bisect_right(self.vocabulary, term)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(term):
+            matches.append((self.vocabulary[i], PREFIX_WEIGHT))
+            i += 1
+        return matches
+
+    def score(self, query: list[str]) -> dict[int, tuple[float, set[str]]]:
+        n = len(self.sections)
+        scores: dict[int, tuple[float, set[str]]] = {}
+        for term in query:
+            for match, weight in self.expand(term):
+                postings = self.postings[match]
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for i, tf in postings.items():
+                    norm = 1 - BM25_B + BM25_B * self.sections[i].length / self.avg_length
+                    gain = weight * idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                    total, matched = scores.get(i, (0.0, set()))
+                    scores[i] = (total + gain, matched | {match})
+        return scores
+
+
+def snippet(text: str, matched: set[str], width: int = SNIPPET_CHARS) -> str:
+    """About ``width`` characters of ``text`` around the first matched term."""
+    start = 0
+    for m in _TERM_RE.finditer(text):
+        if m.group().lower() in matched:
+            start = m.start()
+            break
+    begin = max(0, start - width // 3)
+    if begin:
+        begin = text.find(" ", begin) + 1 or begin
+    end = begin + width
+    if end < len(text):
+        cut = text.rfind(" ", begin, end)
+        end = cut if cut > start else end
+    else:
+        end = len(text)
+    return ("…" if begin else "") + text[begin:end].strip() + ("…" if end < len(text) else "")
+
+
+class DocsIndex:
+    """Project documentation of ``directory``, reloaded when files change."""
+
+    def __init__(self, directory: Path, reload_interval: float = DOCS_RELOAD_INTERVAL) -> None:
+        self.directory = directory
+        self.reload_interval = reload_interval
+        self._snapshot = _Snapshot({}, {})
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def _mtimes(self) -> dict[str, int]:
+        try:
+            with os.scandir(self.directory) as entries:
+                return {
+                    e.name[:-3]: e.stat().st_mtime_ns
+                    for e in entries
+                    if e.name.endswith(".md") and e.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+
+    def refresh(self, force: bool = False) -> _Snapshot:
+        """The current snapshot, reloading changed files if the check is due."""
+        now = time.monotonic()
+        checked_at = self._checked_at
+        if not force and checked_at is not None and now - checked_at < self.reload_interval:
+            return self._snapshot
+        with self._lock:
+            if not force and self._checked_at != checked_at:
+                return self._snapshot  # another thread just checked
+            current, mtimes = self._snapshot, self._mtimes()
+            if mtimes != current.mtimes:
+                docs = {}
+                for slug, mtime in mtimes.items():
+                    if current.mtimes.get(slug) == mtime:
+                        docs[slug] = current.docs[slug]
+                        continue
+                    try:
+                        docs[slug] = parse(slug, (self.directory / f"{slug}.md").read_text(encoding="utf-8"))
+                    except OSError as exc:  # removed between scandir and read
+                        logger.warning(f"Skipping doc {slug}: {exc}")
+                        mtimes = {**mtimes, slug: -1}
+                self._snapshot = _Snapshot(docs, mtimes)
+                self.reloads += 1
+                logger.info(f"Loaded {len(docs)} project docs from {self.directory}")
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def slugs(self) -> list[str]:
+        return sorted(self.refresh().docs)
+
+    def get(self, slug: str) -> Doc | None:
+        return self.refresh().docs.get(slug)
+
+    def search(self, query: str, limit: int = 10, slug: str | None = None) -> list[SearchHit]:
+        """Sections matching ``query``, best first."""
+        snapshot = self.refresh()
+        scores = snapshot.score(list(dict.fromkeys(terms(query))))
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], item[0]))
+        hits = []
+        for i, (score, matched) in ranked:
+            section = snapshot.sections[i]
+            if slug is not None and section.slug != slug:
+                continue
+            hits.append(SearchHit(
+                slug=section.slug,
+                title=snapshot.docs[section.slug].title,
+                heading=section.heading,
+                snippet=snippet(section.text, matched),
+                score=round(score, 4),
+            ))
+            if len(hits) == limit:
+                break
+        return hits
+
+
+docs_index = DocsIndex(DOCS_DIR)
@@ -0,0 +1,229 @@
+"""In-process background jobs with progress tracked in the database.
+
+Work that does not belong on the request path (seeding, anomaly detection,
+exports) is registered as a job kind and submitted through ``jobs.submit``::
+
+    @job("at:detect-anomalies", "Run all enabled anomaly rules", exclusive=True)
+    def detect_anomalies(ctx: JobContext, lookback_days: int | None = None) -> dict:
+        with ctx.session() as db:
+            ...
+            ctx.progress(i / len(rules), f"Rule {rule.name}")
+        return {"created": n}
+
+Each submission is an ``if_jobs`` row, so every worker can report on every job
+(``/api/jobs``). Jobs run on a bounded thread pool (``JOB_WORKERS`` threads);
+at most ``JOB_QUEUE_SIZE`` more may wait, after which submissions are refused
+with 503. An exclusive kind runs under the ``job:<kind>`` process lock, so
+only one worker runs it at a time, and a second submission while one is
+queued or running is refused with 409. A ``dev_only`` kind is refused with 403
+unless the app runs against the local dev database, whichever route submits it. A ``running`` row whose lock is free
+belongs to a worker that died, and so does a ``queued`` row that this worker
+no longer has in its pool or that another worker left waiting for
+``JOB_QUEUED_STALE_SECONDS``; such a row is marked failed when the next one
+is submitted.
+"""
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+from .locks import process_lock
+from .logger import logger
+from .models import Job, JobStatus
+from .runtime import Runtime
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "16"))
+# A queued job starts as soon as a pool thread is free; one still queued by
+# another worker after this many seconds was left by a worker that was killed
+JOB_QUEUED_STALE_SECONDS = float(os.getenv("JOB_QUEUED_STALE_SECONDS", "600"))
+# Progress is written at most this often (seconds); the final state always is
+PROGRESS_INTERVAL = 0.5
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+ACTIVE = (JobStatus.queued, JobStatus.running)
+
+
+@dataclass(frozen=True)
+class JobKind:
+    name: str
+    description: str
+    run: Callable[..., dict | None]
+    exclusive: bool = False
+    dev_only: bool = False
+
+
+kinds: dict[str, JobKind] = {}
+
+
+def job(name: str, description: str, exclusive: bool = False, dev_only: bool = False) -> Callable:
+    """Register the decorated function as the job kind ``name``."""
+
+    def decorator(fn: Callable[..., dict | None]) -> Callable[..., dict | None]:
+        kinds[name] = JobKind(name, description, fn, exclusive, dev_only)
+        return fn
+
+    return decorator
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobContext:
+    """What a running job gets: the runtime, sessions and progress reporting."""
+
+    def __init__(self, runner: "JobRunner", runtime: Runtime, job_id: int) -> None:
+        self.runner = runner
+        self.runtime = runtime
+        self.job_id = job_id
+        self._reported_at = 0.0
+
+    def session(self) -> Session:
+        return self.runtime.get_session()
+
+    def progress(self, fraction: float, message: str | None = None) -> None:
+        """Record progress (0..1); writes are throttled to ``PROGRESS_INTERVAL``."""
+        now = time.monotonic()
+        if now - self._reported_at < PROGRESS_INTERVAL and fraction < 1:
+            return
+        self._reported_at = now
+        self.runner.update(self.runtime, self.job_id, progress=min(max(fraction, 0.0), 1.0), message=message)
+
+
+class JobRunner:
+    """Bounded thread pool running registered job kinds for this worker."""
+
+    def __init__(self, workers: int = JOB_WORKERS, queue_size: int = JOB_QUEUE_SIZE) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._futures: dict[int, Future] = {}
+
+    def update(self, runtime: Runtime, job_id: int, **values: Any) -> None:
+        with runtime.get_session() as db:
+            record = db.get(Job, job_id)
+            if record is None:
+                return
+            for name, value in values.items():
+                setattr(record, name, value)
+            db.add(record)
+            db.commit()
+
+    def _is_stale(self, runtime: Runtime, record: Job) -> bool:
+        """Whether an active job lost its worker (called with ``self._lock`` held).
+
+        A running job holds its kind's lock, so a free lock means its worker
+        died. A queued job holds nothing yet: this worker's is live while its
+        future is, another worker's is given up after ``JOB_QUEUED_STALE_SECONDS``.
+        """
+        if record.status == JobStatus.queued:
+            if record.worker == WORKER_ID:
+                return record.id not in self._futures
+            created_at = record.created_at
+            if created_at.tzinfo is None:  # SQLite returns naive UTC
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            return (_now() - created_at).total_seconds() > JOB_QUEUED_STALE_SECONDS
+        with process_lock(runtime.engine, f"job:{record.kind}", blocking=False) as acquired:
+            return acquired
+
+    def submit(self, runtime: Runtime, kind: str, params: dict | None = None) -> Job:
+        """Record and queue a job; raises 404 (unknown kind), 403 (dev only), 409 (already active) or 503 (queue full)."""
+        spec = kinds.get(kind)
+        if spec is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job kind '{kind}'")
+        if spec.dev_only and not runtime._dev_db_port:
+            raise HTTPException(status_code=403, detail=f"Job '{kind}' is only available in local dev mode")
+        params = params or {}
+        with self._lock:
+            if len(self._futures) >= self.workers + self.queue_size:
+                raise HTTPException(status_code=503, detail="Job queue is full, try again later")
+            with runtime.get_session() as db:
+                if spec.exclusive:
+                    active = db.exec(
+                        select(Job).where(Job.kind == kind, Job.status.in_(ACTIVE))  # type: ignore[unresolved-attribute]
+                    ).first()
+                    if active is not None and self._is_stale(runtime, active):
+                        logger.warning(f"Job {active.id} ({kind}) lost its worker {active.worker}")
+                        active.error = (
+                            "Worker stopped before the job started"
+                            if active.status == JobStatus.queued
+                            else "Worker stopped while the job was running"
+                        )
+                        active.status, active.finished_at = JobStatus.failed, _now()
+                        db.add(active)
+                        db.commit()
+                    elif active is not None:
+                        raise HTTPException(
+                            status_code=409, detail=f"Job '{kind}' is already {active.status.value} (job {active.id})"
+                        )
+                record = Job(kind=kind, params=params, worker=WORKER_ID)
+                db.add(record)
+                db.commit()
+                db.refresh(record)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            job_id = record.id
+            assert job_id is not None
+            future = self._executor.submit(self._run, runtime, job_id, spec, params)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget(job_id))
+        logger.info(f"Queued job {job_id} ({kind})")
+        return record
+
+    def _forget(self, job_id: int) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def _run(self, runtime: Runtime, job_id: int, spec: JobKind, params: dict) -> None:
+        lock = process_lock(runtime.engine, f"job:{spec.name}", blocking=False) if spec.exclusive else nullcontext(True)
+        try:
+            with lock as acquired:
+                if not acquired:
+                    self.update(
+                        runtime, job_id, status=JobStatus.failed, finished_at=_now(),
+                        error=f"Job '{spec.name}' is already running in another worker",
+                    )
+                    return
+                self.update(runtime, job_id, status=JobStatus.running, started_at=_now(), worker=WORKER_ID)
+                start = time.perf_counter()
+                result = spec.run(JobContext(self, runtime, job_id), **params)
+                self.update(
+                    runtime, job_id, status=JobStatus.succeeded, progress=1.0, result=result, finished_at=_now()
+                )
+                logger.info(f"Job {job_id} ({spec.name}) succeeded in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            logger.exception(f"Job {job_id} ({spec.name}) failed")
+            self.update(runtime, job_id, status=JobStatus.failed, error=f"{type(e).__name__}: {e}", finished_at=_now())
+
+    def shutdown(self, runtime: Runtime) -> None:
+        """Stop accepting work; jobs that never started are marked failed."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            futures = dict(self._futures)
+        if executor is None:
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
+        for job_id, future in futures.items():
+            if future.cancelled():
+                self.update(
+                    runtime, job_id, status=JobStatus.failed, finished_at=_now(),
+                    error="Worker shut down before the job started",
+                )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"workers": self.workers, "queue_size": self.queue_size, "active": len(self._futures)}
+
+
+jobs = JobRunner()
@@ -0,0 +1,94 @@
+"""Cross-process locks for work that only one worker may do (DDL, seeding, jobs).
+
+On Postgres these are session-level advisory locks held on a dedicated
+connection. SQLite has no such facility, so an ``flock`` on a file in the temp
+directory stands in (all workers share the host when SQLite is used). The same
+goes for PGlite in local dev (an engine without a pool): it is always one local
+process, and it serves a single connection, which the lock must not occupy
+while the DDL or seed it guards needs one.
+"""
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import Engine, text
+from sqlalchemy.pool import NullPool
+
+from .._metadata import app_slug
+from .logger import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines
+    fcntl = None  # type: ignore[assignment]
+
+
+def advisory_key(name: str) -> int:
+    """Stable signed 64-bit key for ``pg_advisory_lock``."""
+    digest = hashlib.sha256(f"{app_slug}:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def _lock_file(engine: Engine, name: str) -> Path:
+    scope = f"{engine.url.database}:{name}"
+    suffix = hashlib.sha256(scope.encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"{app_slug}-{suffix}.lock"
+
+
+@contextmanager
+def _pg_lock(engine: Engine, name: str, blocking: bool) -> Iterator[bool]:
+    key = advisory_key(name)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if blocking:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+            acquired = True
+        else:
+            acquired = bool(
+                conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar()
+            )
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+
+
+@contextmanager
+def _file_lock(engine: Engine, name: str, blocking: bool) -> Iterator[bool]:
+    if fcntl is None:
+        yield True
+        return
+    path = _lock_file(engine, name)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+            acquired = True
+        except BlockingIOError:
+            acquired = False
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def process_lock(engine: Engine, name: str, blocking: bool = True) -> Iterator[bool]:
+    """Hold a named lock shared by all workers using ``engine``'s database.
+
+    Yields whether the lock was acquired; with ``blocking=True`` that is always
+    ``True`` once the other holder releases it.
+    """
+    advisory = engine.dialect.name == "postgresql" and not isinstance(engine.pool, NullPool)
+    lock = _pg_lock if advisory else _file_lock
+    with lock(engine, name, blocking) as acquired:
+        if acquired:
+            logger.debug(f"Acquired process lock '{name}'")
+        yield acquired
@@ -0,0 +1,52 @@
+"""Event loop lag monitoring.
+
+A background task sleeps for a fixed interval and records how much later than
+requested it wakes up. Anything that blocks the event loop (a synchronous SDK
+call inside an ``async def`` route, CPU-heavy serialization) shows up as lag,
+and delays every other request and stream on the same worker by that amount.
+"""
+import asyncio
+import os
+
+from .metrics import Histogram
+
+LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("LOOP_LAG_INTERVAL", "0.1"))
+
+LOOP_LAG_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class LoopLagMonitor:
+    """Samples the lag of the running event loop into a histogram."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL_SECONDS) -> None:
+        self.interval = interval
+        self.lag = Histogram(LOOP_LAG_BUCKETS)
+        self.max_lag = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.lag.observe(seconds)
+        if seconds > self.max_lag:
+            self.max_lag = seconds
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(loop.time() - start - self.interval, 0.0))
+
+    def stats(self) -> dict:
+        p99 = self.lag.quantile(0.99)
+        return {
+            "interval_seconds": self.interval,
+            "lag_seconds": self.lag.snapshot(),
+            # A bucket bound, so never above the actual maximum (nor +Inf, which JSON can't carry)
+            "lag_p99_seconds": None if p99 is None else min(p99, self.max_lag),
+            "max_lag_seconds": self.max_lag,
+        }
+
+
+monitor = LoopLagMonitor()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from sqlmodel import SQLModel, Field
-from typing import Optional, List
+from sqlmodel import Column, Field, JSON, SQLModel
+from typing import Any, Optional, List
 from datetime import datetime, timezone
 from enum import Enum
 from .. import __version__
@@ -66,6 +66,34 @@ class IdeaMessage(SQLModel, table=True):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# ============================================================================
+# Background Jobs
+# ============================================================================
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class Job(SQLModel, table=True):
+    __tablename__ = "if_jobs"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str = Field(index=True)
+    status: JobStatus = Field(default=JobStatus.queued, index=True)
+    progress: float = 0.0
+    message: Optional[str] = None
+    params: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    result: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = None
+    worker: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
 # ============================================================================
 # Pydantic Models (Input/Output)
 # ============================================================================
@@ -111,3 +139,30 @@ class IdeaMessageOut(BaseModel):
     role: str
     content: str
     created_at: datetime
+
+
+class JobIn(BaseModel):
+    kind: str
+    params: dict[str, Any] = {}
+
+
+class JobOut(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    progress: float
+    message: Optional[str] = None
+    params: Optional[dict] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    worker: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobKindOut(BaseModel):
+    name: str
+    description: str
+    exclusive: bool
+    dev_only: bool
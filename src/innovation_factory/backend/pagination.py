@@ -0,0 +1,109 @@
+"""Keyset (cursor) pagination for large list endpoints.
+
+Lists are ordered newest first by an indexed column, with ``id`` as the
+tie-breaker. Rather than ``OFFSET n``, which makes the database produce and
+discard ``n`` rows, a page starts right after the last row of the previous one::
+
+    WHERE (sale_date, id) < (:last_sale_date, :last_id)
+    ORDER BY sale_date DESC, id DESC LIMIT :limit + 1
+
+so a deep page costs the same as the first. The position travels as an opaque
+token in the ``X-Next-Cursor`` response header, which is absent on the last
+page, and comes back as ``?cursor=``. Response bodies stay plain lists::
+
+    SHIFT_PAGES = Keyset(MacWorkforceShift.shift_date, MacWorkforceShift.id)
+
+    def list_shifts(session: SessionDep, response: Response, ..., cursor: CursorQuery = None):
+        q = select(MacWorkforceShift).where(...)
+        return SHIFT_PAGES.fetch(session, q, cursor, limit, response)
+
+Handlers that build their own ``Response`` use ``page`` and ``trim`` directly.
+Lists that were unbounded before keyset paging take ``limit=None`` by default,
+which returns every row (after ``cursor``, if given) in keyset order.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Annotated, Any, Mapping, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import literal, tuple_
+from sqlmodel import Session
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CursorQuery = Annotated[
+    str | None,
+    Query(description=f"Opaque position from the {NEXT_CURSOR_HEADER} header of the previous page"),
+]
+
+
+# select(Model) for ORM rows, RowSerializer.select() for column tuples
+_Statement = TypeVar("_Statement", SelectOfScalar[Any], Select[Any])
+
+
+def _value(row: Any, name: str) -> Any:
+    return row[name] if isinstance(row, Mapping) else getattr(row, name)
+
+
+class Keyset:
+    """Descending keyset over ``(key, id)``; ``key`` should be indexed."""
+
+    def __init__(self, key: Any, id: Any) -> None:
+        self.key = key
+        self.id = id
+        self.key_name: str = key.key
+        self.id_name: str = id.key
+        self._key_type = key.type.python_type
+
+    def encode(self, row: Any) -> str:
+        value = _value(row, self.key_name)
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        payload = json.dumps([self.key_name, value, _value(row, self.id_name)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> tuple[Any, Any]:
+        try:
+            name, value, id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if name != self.key_name:
+                raise ValueError(f"cursor is for '{name}'")
+            if self._key_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif self._key_type is date:
+                value = date.fromisoformat(value)
+            return value, id
+        except (ValueError, TypeError, binascii.Error) as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {exc}") from exc
+
+    def page(self, statement: _Statement, cursor: str | None, limit: int | None) -> _Statement:
+        """``statement`` ordered by the keyset, starting after ``cursor``, with one look-ahead row."""
+        if cursor:
+            value, id = self.decode(cursor)
+            statement = statement.where(
+                tuple_(self.key, self.id) < tuple_(literal(value, self.key.type), literal(id, self.id.type))
+            )
+        statement = statement.order_by(self.key.desc(), self.id.desc())
+        return statement if limit is None else statement.limit(limit + 1)
+
+    def trim(self, rows: Sequence, limit: int | None) -> tuple[list, dict[str, str]]:
+        """The page's rows, and the ``X-Next-Cursor`` header if the look-ahead row exists."""
+        if limit is None or len(rows) <= limit:
+            return list(rows), {}
+        page = list(rows[:limit])
+        return page, {NEXT_CURSOR_HEADER: self.encode(page[-1])}
+
+    def fetch(
+        self,
+        session: Session,
+        statement: SelectOfScalar[Any],
+        cursor: str | None,
+        limit: int | None,
+        response: Response,
+    ) -> list:
+        """One page of ``statement``'s rows; sets ``X-Next-Cursor`` on ``response`` if there are more."""
+        rows, headers = self.trim(session.exec(self.page(statement, cursor, limit)).all(), limit)
+        response.headers.update(headers)
+        return rows
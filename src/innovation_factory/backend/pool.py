@@ -0,0 +1,83 @@
+"""Instrumented SQLAlchemy connection pools.
+
+The stock pools expose point-in-time gauges (size, checked out, overflow) but
+not how long callers waited for a connection or how often they gave up. The
+pool classes here time every checkout and count ``pool_timeout`` expiries so
+pool sizing can be based on observed contention.
+"""
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from .metrics import Histogram
+
+# Waits are usually sub-millisecond; the tail is what matters for sizing
+POOL_WAIT_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 10.0, 30.0,
+)
+
+
+class PoolMonitor:
+    """Collects checkout wait times and timeout counts for one pool."""
+
+    def __init__(self) -> None:
+        self.wait = Histogram(POOL_WAIT_BUCKETS)
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait.observe(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> dict:
+        stats: dict = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        stats.update(
+            timeouts=self.timeouts,
+            wait_seconds=self.wait.snapshot(),
+            wait_p99_seconds=self.wait.quantile(0.99),
+        )
+        return stats
+
+
+class _MonitoredPoolMixin:
+    monitor: PoolMonitor | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()  # type: ignore[misc]
+        except exc.TimeoutError:
+            if self.monitor is not None:
+                self.monitor.record_timeout()
+            raise
+        if self.monitor is not None:
+            self.monitor.record_wait(time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep reporting into the same monitor
+        pool = super().recreate()  # type: ignore[misc]
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(_MonitoredPoolMixin, QueuePool):
+    pass
+
+
+class MonitoredAsyncQueuePool(_MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    pass
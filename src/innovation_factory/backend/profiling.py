@@ -0,0 +1,53 @@
+"""Startup profiler: wall-clock timings of imports and lifespan phases."""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from .logger import logger
+
+
+class StartupProfiler:
+    """Records named phases relative to when this module was first imported."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self._phases: list[dict] = []
+        self._lock = threading.Lock()
+        self.ready_after: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, started=start)
+
+    def record(self, name: str, seconds: float, started: float | None = None) -> None:
+        offset = (started if started is not None else time.perf_counter() - seconds) - self.origin
+        with self._lock:
+            self._phases.append(
+                {"phase": name, "ms": round(seconds * 1000, 2), "offset_ms": round(offset * 1000, 2)}
+            )
+
+    def mark_ready(self) -> None:
+        self.ready_after = time.perf_counter() - self.origin
+
+    def report(self) -> dict:
+        with self._lock:
+            phases = list(self._phases)
+        return {
+            "ready_ms": round(self.ready_after * 1000, 2) if self.ready_after is not None else None,
+            "phases": phases,
+        }
+
+    def log_report(self) -> None:
+        report = self.report()
+        lines = [f"  {p['phase']:<48} {p['ms']:>9.1f} ms" for p in report["phases"]]
+        logger.info(
+            f"Startup ready after {report['ready_ms']} ms:\n" + "\n".join(lines)
+        )
+
+
+startup_profiler = StartupProfiler()
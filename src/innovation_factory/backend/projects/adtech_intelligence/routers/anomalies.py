@@ -1,11 +1,15 @@
 """Anomaly detection routes for AdTech Intelligence."""
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, func, select
 from datetime import datetime, timezone
 
+from ....conditional import ConditionalDep
 from ....dependencies import get_session
+from ....jobs import JobContext, job
+from ....pagination import CursorQuery, Keyset
+from ....response_cache import cached, invalidate, invalidates
 from ..models import (
     AnomalySeverity,
     AnomalyStatus,
@@ -16,9 +20,26 @@ from ..models import (
     AtAnomalyRuleOut,
     AtAnomalyUpdate,
 )
+from ..services.anomaly_service import AnomalyService
 
 router = APIRouter(tags=["adtech-anomalies"])
 
+ANOMALY_PAGES = Keyset(AtAnomaly.detected_at, AtAnomaly.id)
+
+
+@job(
+    "at:detect-anomalies",
+    "Run all enabled anomaly rules over recent performance metrics",
+    exclusive=True,
+    dev_only=True,
+)
+def detect_anomalies(ctx: JobContext, lookback_days: Optional[int] = None) -> dict:
+    with ctx.session() as db:
+        created = AnomalyService().run_detection(db, lookback_override=lookback_days, progress=ctx.progress)
+    if created:
+        invalidate("at:anomalies")
+    return {"created": len(created)}
+
 
 # -- Anomaly counts (for badges) ----------------------------------------
 
@@ -29,9 +50,14 @@ router = APIRouter(tags=["adtech-anomalies"])
 )
 def get_anomaly_counts(
     db: Annotated[Session, Depends(get_session)],
+    conditional: ConditionalDep,
 ):
     """Return anomaly counts grouped by severity for active anomalies."""
     active_statuses = [AnomalyStatus.new, AnomalyStatus.acknowledged, AnomalyStatus.investigating]
+    active = select(AtAnomaly).where(AtAnomaly.status.in_(active_statuses))  # type: ignore[unresolved-attribute]
+    not_modified = conditional.check_query(db, active, AtAnomaly.detected_at, tags=["at:anomalies"])
+    if not_modified is not None:
+        return not_modified
     stmt = (
         select(AtAnomaly.severity, func.count(AtAnomaly.id))
         .where(AtAnomaly.status.in_(active_statuses))  # type: ignore[unresolved-attribute]
@@ -55,12 +81,15 @@ def get_anomaly_counts(
 )
 def list_anomalies(
     db: Annotated[Session, Depends(get_session)],
+    conditional: ConditionalDep,
+    response: Response,
     status: Optional[AnomalyStatus] = None,
     severity: Optional[AnomalySeverity] = None,
     anomaly_type: Optional[AnomalyType] = None,
     campaign_id: Optional[int] = None,
     limit: int = Query(default=50, le=200),
-    offset: int = 0,
+    offset: int = Query(default=0, ge=0, deprecated=True, description="Use cursor instead"),
+    cursor: CursorQuery = None,
 ):
     """List anomalies with optional filters."""
     stmt = select(AtAnomaly)
@@ -72,8 +101,11 @@ def list_anomalies(
         stmt = stmt.where(AtAnomaly.anomaly_type == anomaly_type)
     if campaign_id:
         stmt = stmt.where(AtAnomaly.campaign_id == campaign_id)
-    stmt = stmt.order_by(AtAnomaly.detected_at.desc()).offset(offset).limit(limit)  # type: ignore[unresolved-attribute]
-    return db.exec(stmt).all()
+    # Status changes keep detected_at; at_updateAnomaly bumps the tag instead
+    not_modified = conditional.check_query(db, stmt, AtAnomaly.detected_at, tags=["at:anomalies"])
+    if not_modified is not None:
+        return not_modified
+    return ANOMALY_PAGES.fetch(db, stmt.offset(offset), cursor, limit, response)
 
 
 @router.get(
@@ -96,6 +128,7 @@ def get_anomaly(
     response_model=AtAnomalyOut,
     operation_id="at_updateAnomaly",
 )
+@invalidates("at:anomalies")
 def update_anomaly(
     anomaly_id: int,
     body: AtAnomalyUpdate,
@@ -122,6 +155,7 @@ def update_anomaly(
     response_model=list[AtAnomalyRuleOut],
     operation_id="at_listAnomalyRules",
 )
+@cached("at_listAnomalyRules", tags=["at:anomaly-rules"])
 def list_anomaly_rules(
     db: Annotated[Session, Depends(get_session)],
 ):
@@ -5,6 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, func, select
 
 from ....dependencies import get_session
+from ....pagination import CursorQuery, Keyset
+from ....serialization import RowSerializer
 from ..models import (
     AtCampaign,
     AtCampaignIn,
@@ -17,6 +19,7 @@ from ..models import (
     CampaignType,
     AtDashboardSummaryOut,
     AtAdInventory,
+    AtAdvertiser,
     AtAnomaly,
     AtPerformanceMetric,
     AnomalyStatus,
@@ -25,6 +28,9 @@ from ..models import (
 
 router = APIRouter(tags=["adtech-campaigns"])
 
+CAMPAIGNS = RowSerializer(AtCampaignOut)
+CAMPAIGN_PAGES = Keyset(AtCampaign.created_at, AtCampaign.id)
+
 
 # -- Dashboard Summary --------------------------------------------------
 
@@ -94,18 +100,22 @@ def list_campaigns(
     campaign_type: Optional[CampaignType] = None,
     advertiser_id: Optional[int] = None,
     limit: int = Query(default=50, le=200),
-    offset: int = 0,
+    offset: int = Query(default=0, ge=0, deprecated=True, description="Use cursor instead"),
+    cursor: CursorQuery = None,
 ):
     """List campaigns with optional filters."""
-    stmt = select(AtCampaign)
+    stmt = CAMPAIGNS.select(AtCampaign, advertiser=AtAdvertiser).outerjoin(
+        AtAdvertiser, AtAdvertiser.id == AtCampaign.advertiser_id  # type: ignore[invalid-argument-type]
+    )
     if status:
         stmt = stmt.where(AtCampaign.status == status)
     if campaign_type:
         stmt = stmt.where(AtCampaign.campaign_type == campaign_type)
     if advertiser_id:
         stmt = stmt.where(AtCampaign.advertiser_id == advertiser_id)
-    stmt = stmt.order_by(AtCampaign.created_at.desc()).offset(offset).limit(limit)  # type: ignore[unresolved-attribute]
-    return db.exec(stmt).all()
+    stmt = CAMPAIGN_PAGES.page(stmt, cursor, limit).offset(offset)
+    rows, headers = CAMPAIGN_PAGES.trim(CAMPAIGNS.rows(db.exec(stmt)), limit)
+    return CAMPAIGNS.list_response(rows, headers=headers)
 
 
 @router.get(
@@ -6,12 +6,14 @@ Provides two chat endpoints:
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ....dependencies import get_session, get_runtime
+from ....dependencies import get_async_session, get_session, get_runtime
 from ....runtime import Runtime
+from ....services.agent_cache import cache_allowed
 from ..models import (
     AtChatHistoryOut,
     AtChatMessage,
@@ -29,8 +31,9 @@ chat_service = ChatService()
 @router.post("/chat", operation_id="at_sendChatMessage")
 async def send_chat_message(
     message: AtChatMessageIn,
-    db: Annotated[Session, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_async_session)],
     runtime: Annotated[Runtime, Depends(get_runtime)],
+    request: Request,
 ):
     """Send a message to the issue-resolution KA and get a streaming response."""
 
@@ -40,6 +43,7 @@ async def send_chat_message(
             db=db,
             user_message=message.message,
             session_id=message.session_id,
+            cache=cache_allowed(request),
         ):
             yield f"data: {chunk}\n\n"
 
@@ -53,8 +57,9 @@ async def send_chat_message(
 @router.post("/mas-chat", operation_id="at_sendMasChatMessage")
 async def send_mas_chat_message(
     message: AtChatMessageIn,
-    db: Annotated[Session, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_async_session)],
     runtime: Annotated[Runtime, Depends(get_runtime)],
+    request: Request,
 ):
     """Send a message to the Multi-Agent Supervisor and get a streaming response."""
 
@@ -64,6 +69,7 @@ async def send_mas_chat_message(
             db=db,
             user_message=message.message,
             session_id=message.session_id,
+            cache=cache_allowed(request),
         ):
             yield f"data: {chunk}\n\n"
 
@@ -100,7 +106,7 @@ def list_chat_sessions(
                 session_type=s.session_type,
                 started_at=s.started_at,
                 ended_at=s.ended_at,
-                messages=[AtChatMessageOut.model_validate(m) for m in messages],
+                messages=[AtChatMessageOut.model_validate(m, from_attributes=True) for m in messages],
             )
         )
     return result
@@ -132,5 +138,5 @@ def get_chat_session(
         session_type=session.session_type,
         started_at=session.started_at,
         ended_at=session.ended_at,
-        messages=[AtChatMessageOut.model_validate(m) for m in messages],
+        messages=[AtChatMessageOut.model_validate(m, from_attributes=True) for m in messages],
     )
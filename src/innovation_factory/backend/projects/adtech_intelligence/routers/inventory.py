@@ -1,10 +1,11 @@
 """Inventory routes for AdTech Intelligence."""
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, select
 
 from ....dependencies import get_session
+from ....pagination import CursorQuery, Keyset
 from ..models import (
     AtAdInventory,
     AtAdInventoryOut,
@@ -15,6 +16,8 @@ from ..models import (
 
 router = APIRouter(tags=["adtech-inventory"])
 
+INVENTORY_PAGES = Keyset(AtAdInventory.created_at, AtAdInventory.id)
+
 
 @router.get(
     "/inventory",
@@ -23,12 +26,14 @@ router = APIRouter(tags=["adtech-inventory"])
 )
 def list_inventory(
     db: Annotated[Session, Depends(get_session)],
+    response: Response,
     inventory_type: Optional[InventoryType] = None,
     location_type: Optional[LocationType] = None,
     status: Optional[InventoryStatus] = None,
     city: Optional[str] = None,
     limit: int = Query(default=50, le=500),
-    offset: int = 0,
+    offset: int = Query(default=0, ge=0, deprecated=True, description="Use cursor instead"),
+    cursor: CursorQuery = None,
 ):
     """List ad inventory with optional filters."""
     stmt = select(AtAdInventory)
@@ -40,8 +45,7 @@ def list_inventory(
         stmt = stmt.where(AtAdInventory.status == status)
     if city:
         stmt = stmt.where(AtAdInventory.city == city)
-    stmt = stmt.order_by(AtAdInventory.created_at.desc()).offset(offset).limit(limit)  # type: ignore[unresolved-attribute]
-    return db.exec(stmt).all()
+    return INVENTORY_PAGES.fetch(db, stmt.offset(offset), cursor, limit, response)
 
 
 @router.get(
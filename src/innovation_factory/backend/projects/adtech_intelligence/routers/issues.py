@@ -1,10 +1,12 @@
 """Issue / support-ticket routes for AdTech Intelligence."""
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, select
 
 from ....dependencies import get_session
+from ....pagination import CursorQuery, Keyset
+from ....response_cache import cached
 from ..models import (
     AtIssue,
     AtIssueIn,
@@ -21,6 +23,8 @@ from ..models import (
 
 router = APIRouter(tags=["adtech-issues"])
 
+ISSUE_PAGES = Keyset(AtIssue.created_at, AtIssue.id)
+
 
 # -- Issues --------------------------------------------------------------
 
@@ -32,12 +36,14 @@ router = APIRouter(tags=["adtech-issues"])
 )
 def list_issues(
     db: Annotated[Session, Depends(get_session)],
+    response: Response,
     status: Optional[IssueStatus] = None,
     priority: Optional[IssuePriority] = None,
     category: Optional[IssueCategory] = None,
     campaign_id: Optional[int] = None,
     limit: int = Query(default=50, le=200),
-    offset: int = 0,
+    offset: int = Query(default=0, ge=0, deprecated=True, description="Use cursor instead"),
+    cursor: CursorQuery = None,
 ):
     stmt = select(AtIssue)
     if status:
@@ -48,8 +54,7 @@ def list_issues(
         stmt = stmt.where(AtIssue.category == category)
     if campaign_id:
         stmt = stmt.where(AtIssue.campaign_id == campaign_id)
-    stmt = stmt.order_by(AtIssue.created_at.desc()).offset(offset).limit(limit)  # type: ignore[unresolved-attribute]
-    return db.exec(stmt).all()
+    return ISSUE_PAGES.fetch(db, stmt.offset(offset), cursor, limit, response)
 
 
 @router.get(
@@ -96,6 +101,7 @@ def update_issue(
     response_model=list[AtAdvertiserOut],
     operation_id="at_listAdvertisers",
 )
+@cached("at_listAdvertisers", tags=["at:advertisers"])
 def list_advertisers(
     db: Annotated[Session, Depends(get_session)],
 ):
@@ -9,6 +9,7 @@ from datetime import date, datetime, timedelta, timezone
 
 from sqlmodel import Session, select
 
+from ...bulk import BulkLoader
 from .models import (
     AnomalySeverity,
     AnomalyStatus,
@@ -343,9 +344,12 @@ def _seed_placements(
 def _seed_performance_metrics(
     session: Session, placements: list[AtPlacement]
 ) -> None:
-    count = 0
-    batch: list[AtPerformanceMetric] = []
-    batch_size = 30  # PGLite (WASM) crashes with large INSERT statements
+    # Batch size comes from the loader options (kept small for local PGlite)
+    loader = BulkLoader(session)
+    metrics = loader.table(AtPerformanceMetric, (
+        "placement_id", "metric_date", "impressions", "clicks", "ctr",
+        "conversions", "spend", "viewability_rate",
+    ))
 
     for placement in placements:
         if placement.status in (PlacementStatus.cancelled,):
@@ -360,31 +364,14 @@ def _seed_performance_metrics(
             conversions = int(clicks * _rng.uniform(0.01, 0.15))
             spend = round(impressions / 1000 * placement.daily_budget * _rng.uniform(0.6, 1.2), 2)
 
-            metric = AtPerformanceMetric(
-                placement_id=placement.id,
-                metric_date=current,
-                impressions=impressions,
-                clicks=clicks,
-                ctr=ctr,
-                conversions=conversions,
-                spend=spend,
-                viewability_rate=round(_rng.uniform(0.45, 0.95), 4),
-            )
-            batch.append(metric)
-            count += 1
-
-            if len(batch) >= batch_size:
-                session.add_all(batch)
-                session.flush()
-                batch = []
-
+            metrics.append((
+                placement.id, current, impressions, clicks, ctr,
+                conversions, spend, round(_rng.uniform(0.45, 0.95), 4),
+            ))
             current += timedelta(days=1)
 
-    if batch:
-        session.add_all(batch)
-        session.flush()
-
-    print(f"    Seeded {count} performance metric rows.")
+    metrics.flush()
+    print(f"    Seeded {metrics.loaded} performance metric rows.")
 
 
 # -- Anomaly Rules ------------------------------------------------------
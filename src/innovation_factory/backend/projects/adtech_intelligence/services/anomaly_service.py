@@ -6,7 +6,7 @@ a trigger endpoint for demo purposes.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 
 from sqlmodel import Session, func, select
 
@@ -29,6 +29,7 @@ class AnomalyService:
         self,
         db: Session,
         lookback_override: Optional[int] = None,
+        progress: Optional[Callable[[float, str], None]] = None,
     ) -> list[AtAnomaly]:
         """Run all enabled anomaly rules and return newly created anomalies."""
         rules = db.exec(
@@ -36,7 +37,9 @@ class AnomalyService:
         ).all()
 
         new_anomalies: list[AtAnomaly] = []
-        for rule in rules:
+        for i, rule in enumerate(rules):
+            if progress:
+                progress(i / len(rules), f"Evaluating rule '{rule.name}'")
             lookback = lookback_override or rule.lookback_days
             detected = self._evaluate_rule(db, rule, lookback)
             new_anomalies.extend(detected)
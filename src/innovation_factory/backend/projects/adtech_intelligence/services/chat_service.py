@@ -4,7 +4,8 @@ Routes chat messages to Databricks serving endpoints:
 - MAS (Multi-Agent Supervisor) for the overview page
 - KA (Knowledge Assistant) for issue resolution on the issues page
 
-Agent Bricks endpoints use the ``input`` field (not ``messages``).
+Agent Bricks endpoints use the ``input`` field (not ``messages``). Answers are
+streamed: each SSE chunk carries the text generated since the previous one.
 """
 
 import json
@@ -12,9 +13,10 @@ import logging
 from typing import AsyncIterator, Optional
 
 from databricks.sdk import WorkspaceClient
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ....services.databricks_agents import extract_agent_text, query_agent_endpoint
+from ....services.databricks_agents import stream_agent_endpoint
 from ..databricks_config import (
     ISSUE_RESOLUTION_KA_ENDPOINT,
     MAS_ENDPOINT_NAME,
@@ -34,101 +36,111 @@ class ChatService:
     async def stream_mas_response(
         self,
         ws: WorkspaceClient,
-        db: Session,
+        db: AsyncSession,
         user_message: str,
         session_id: Optional[int] = None,
+        cache: bool = True,
     ) -> AsyncIterator[str]:
         """Stream a response from the Multi-Agent Supervisor."""
-        session = self._get_or_create_session(db, session_id, "mas")
-        assert session.id is not None
-        self._save_user_message(db, session.id, user_message)
-
-        # Build messages for the MAS endpoint
-        history = self._get_message_history(db, session.id, limit=10)
-        messages = [{"role": m["role"], "content": m["content"]} for m in history]
-
-        try:
-            result = query_agent_endpoint(ws, MAS_ENDPOINT_NAME, messages)
-            content = extract_agent_text(result)
-            sources = [{"type": "mas", "source": "AdTech Intelligence Agent"}]
-        except Exception as e:
-            logger.error(f"MAS endpoint error: {type(e).__name__}: {e}", exc_info=True)
-            content = (
+        async for chunk in self._stream_agent_response(
+            ws, db, user_message, session_id, "mas", cache,
+            endpoint=MAS_ENDPOINT_NAME,
+            sources=[{"type": "mas", "source": "AdTech Intelligence Agent"}],
+            unavailable=(
                 "I'm sorry, I couldn't reach the AdTech Intelligence Agent right now. "
                 "Please check that the serving endpoint is online and try again."
-            )
-            sources = [{"type": "error", "source": "System"}]
-
-        self._save_assistant_message(db, session.id, content, sources)
-
-        yield json.dumps({
-            "session_id": session.id,
-            "content": content,
-            "sources": sources,
-            "done": False,
-        })
-        yield json.dumps({"content": "", "done": True})
+            ),
+        ):
+            yield chunk
 
     async def stream_ka_response(
         self,
         ws: WorkspaceClient,
-        db: Session,
+        db: AsyncSession,
         user_message: str,
         session_id: Optional[int] = None,
+        cache: bool = True,
     ) -> AsyncIterator[str]:
         """Stream a response from the Issue Resolution Knowledge Assistant."""
-        session = self._get_or_create_session(db, session_id, "issue_resolution")
+        async for chunk in self._stream_agent_response(
+            ws, db, user_message, session_id, "issue_resolution", cache,
+            endpoint=ISSUE_RESOLUTION_KA_ENDPOINT,
+            sources=[{"type": "knowledge_base", "source": "Issue Resolution Knowledge Base"}],
+            unavailable=(
+                "I'm sorry, I couldn't reach the Issue Resolution Knowledge Base right now. "
+                "Please check that the serving endpoint is online and try again."
+            ),
+        ):
+            yield chunk
+
+    async def _stream_agent_response(
+        self,
+        ws: WorkspaceClient,
+        db: AsyncSession,
+        user_message: str,
+        session_id: Optional[int],
+        session_type: str,
+        cache: bool,
+        endpoint: str,
+        sources: list[dict],
+        unavailable: str,
+    ) -> AsyncIterator[str]:
+        """Forward the agent's answer chunk by chunk as it is generated.
+
+        The first chunk carries the session id and sources; if the endpoint
+        fails, ``unavailable`` is sent (after any partial answer) with error
+        sources. The full answer is saved once the stream ends. With ``cache``
+        a cached answer to the same conversation window may be sent instead.
+        """
+        session = await self._get_or_create_session(db, session_id, session_type)
         assert session.id is not None
-        self._save_user_message(db, session.id, user_message)
+        await self._save_user_message(db, session.id, user_message)
 
-        # Build messages for the KA endpoint
-        history = self._get_message_history(db, session.id, limit=10)
+        history = await self._get_message_history(db, session.id, limit=10)
         messages = [{"role": m["role"], "content": m["content"]} for m in history]
 
+        content = ""
         try:
-            result = query_agent_endpoint(ws, ISSUE_RESOLUTION_KA_ENDPOINT, messages)
-            content = extract_agent_text(result)
-            sources = [{"type": "knowledge_base", "source": "Issue Resolution Knowledge Base"}]
+            async for delta in stream_agent_endpoint(ws, endpoint, messages, cache=cache):
+                chunk = {"content": delta, "done": False}
+                if not content:
+                    chunk = {"session_id": session.id, **chunk, "sources": sources}
+                content += delta
+                yield json.dumps(chunk)
+            if not content:
+                raise ValueError("empty response")
         except Exception as e:
-            logger.error(f"KA endpoint error: {type(e).__name__}: {e}", exc_info=True)
-            content = (
-                "I'm sorry, I couldn't reach the Issue Resolution Knowledge Base right now. "
-                "Please check that the serving endpoint is online and try again."
-            )
+            logger.error(f"{session_type} endpoint error: {type(e).__name__}: {e}", exc_info=True)
             sources = [{"type": "error", "source": "System"}]
+            delta = f"\n\n{unavailable}" if content else unavailable
+            content += delta
+            yield json.dumps({"session_id": session.id, "content": delta, "sources": sources, "done": False})
 
-        self._save_assistant_message(db, session.id, content, sources)
-
-        yield json.dumps({
-            "session_id": session.id,
-            "content": content,
-            "sources": sources,
-            "done": False,
-        })
+        await self._save_assistant_message(db, session.id, content, sources)
         yield json.dumps({"content": "", "done": True})
 
     # ---- helpers ----
 
-    def _get_or_create_session(
-        self, db: Session, session_id: Optional[int], session_type: str
+    async def _get_or_create_session(
+        self, db: AsyncSession, session_id: Optional[int], session_type: str
     ) -> AtChatSession:
         if session_id:
-            session = db.get(AtChatSession, session_id)
+            session = await db.get(AtChatSession, session_id)
             if session:
                 return session
         session = AtChatSession(session_type=session_type)
         db.add(session)
-        db.commit()
-        db.refresh(session)
+        await db.commit()
+        await db.refresh(session)
         return session
 
-    def _save_user_message(self, db: Session, session_id: int, content: str) -> None:
+    async def _save_user_message(self, db: AsyncSession, session_id: int, content: str) -> None:
         msg = AtChatMessage(session_id=session_id, role=AtChatRole.user, content=content)
         db.add(msg)
-        db.commit()
+        await db.commit()
 
-    def _save_assistant_message(
-        self, db: Session, session_id: int, content: str, sources: list[dict]
+    async def _save_assistant_message(
+        self, db: AsyncSession, session_id: int, content: str, sources: list[dict]
     ) -> None:
         msg = AtChatMessage(
             session_id=session_id,
@@ -137,14 +149,14 @@ class ChatService:
             sources=sources,
         )
         db.add(msg)
-        db.commit()
+        await db.commit()
 
-    def _get_message_history(self, db: Session, session_id: int, limit: int = 10) -> list[dict]:
-        messages = db.exec(
+    async def _get_message_history(self, db: AsyncSession, session_id: int, limit: int = 10) -> list[dict]:
+        messages = (await db.exec(
             select(AtChatMessage)
             .where(AtChatMessage.session_id == session_id)
             .order_by(AtChatMessage.created_at.asc())  # type: ignore[unresolved-attribute]
-        ).all()
+        )).all()
         # Return the last N messages
         recent = messages[-limit:] if len(messages) > limit else messages
         return [{"role": m.role, "content": m.content} for m in recent]
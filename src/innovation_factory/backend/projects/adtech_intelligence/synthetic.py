@@ -0,0 +1,59 @@
+"""Scale-factor synthetic data for adtech-intelligence.
+
+Scale factor 1: 50,000 placements over the seeded campaigns and inventory, each
+with 365 days of ``AtPerformanceMetric`` (~18.25M rows). Metric distributions
+follow ``seed.py``.
+"""
+from datetime import date, timedelta
+
+from sqlmodel import Session, col, select
+
+from ...bulk import BulkLoader
+from ...synthetic import DEFAULT_SEED, ids_after, max_id, require_numpy, rng, rows, scaled
+from .models import AtAdInventory, AtCampaign, AtPerformanceMetric, AtPlacement, PlacementStatus
+
+PLACEMENTS = 50_000
+DAYS = 365
+
+
+def generate(session: Session, scale: float, seed: int = DEFAULT_SEED, end: date | None = None) -> None:
+    np = require_numpy()
+    r = rng(seed, "adtech-intelligence")
+    n = scaled(PLACEMENTS, scale)
+    end = end or date.today()
+    start = end - timedelta(days=DAYS - 1)
+
+    campaign_ids = np.array(session.exec(select(AtCampaign.id).order_by(col(AtCampaign.id))).all())
+    inventory_ids = np.array(session.exec(select(AtAdInventory.id).order_by(col(AtAdInventory.id))).all())
+    if not len(campaign_ids) or not len(inventory_ids):
+        raise RuntimeError("Run the adtech-intelligence seed before generating synthetic data")
+
+    print(f"  Generating adtech-intelligence synthetic data ({n} placements x {DAYS} days)...")
+    daily_budget = r.uniform(50, 2000, n).round(2)
+
+    with BulkLoader(session) as loader:
+        first = max_id(session, AtPlacement)
+        placements = loader.table(AtPlacement, (
+            "campaign_id", "inventory_id", "start_date", "end_date", "daily_budget", "status",
+        ))
+        placements.extend(rows(
+            r.choice(campaign_ids, n), r.choice(inventory_ids, n), start, end, daily_budget,
+            PlacementStatus.active,
+        ))
+        placements.flush()
+        placement_ids = np.array(ids_after(session, AtPlacement, first))
+
+        metrics = loader.table(AtPerformanceMetric, (
+            "placement_id", "metric_date", "impressions", "clicks", "ctr",
+            "conversions", "spend", "viewability_rate",
+        ))
+        for day_offset in range(DAYS):
+            d = start + timedelta(days=day_offset)
+            impressions = r.integers(500, 50_001, n)
+            clicks = (impressions * r.uniform(0.005, 0.04, n)).astype(int)
+            conversions = (clicks * r.uniform(0.01, 0.15, n)).astype(int)
+            spend = (impressions / 1000 * daily_budget * r.uniform(0.6, 1.2, n)).round(2)
+            metrics.extend(rows(
+                placement_ids, d, impressions, clicks, (clicks / impressions * 100).round(4),
+                conversions, spend, r.uniform(0.45, 0.95, n).round(4),
+            ))
@@ -4,18 +4,19 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlmodel import Session, select
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from databricks.sdk import WorkspaceClient
 
-from ....dependencies import get_obo_ws, get_session
+from ....dependencies import get_async_session, get_obo_ws, get_session
 from ..models import (
     BshTicket,
     BshChatMessageIn,
     BshChatMessageOut,
     BshChatHistoryOut,
-    BshCustomer,
 )
 from ..services.chat_service import ChatService
+from .users import BshIdentityDep
 
 router = APIRouter(tags=["bsh-chat"])
 
@@ -26,19 +27,16 @@ chat_service = ChatService()
 async def send_chat_message(
     ticket_id: int,
     message: BshChatMessageIn,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
-    db: Annotated[Session, Depends(get_session)],
+    identity: BshIdentityDep,
+    db: Annotated[AsyncSession, Depends(get_async_session)],
 ):
     """Send a message and get streaming AI response."""
-    databricks_user = obo_ws.current_user.me()
-    ticket = db.get(BshTicket, ticket_id)
+    ticket = await db.get(BshTicket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
     # Determine session type based on user role
-    customer_statement = select(BshCustomer).where(BshCustomer.databricks_user_id == databricks_user.id)
-    customer = db.exec(customer_statement).first()
-    session_type = "customer_support" if customer and ticket.customer_id == customer.id else "technician_assist"
+    session_type = "customer_support" if identity.is_customer_of(ticket) else "technician_assist"
 
     async def event_generator():
         async for chunk in chat_service.stream_chat_response(
@@ -2,9 +2,9 @@
 from typing import Annotated, List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
-from databricks.sdk import WorkspaceClient
 
-from ....dependencies import get_obo_ws, get_session
+from ....dependencies import get_session
+from ....response_cache import cached
 from ..models import (
     BshDevice,
     BshDeviceOut,
@@ -12,12 +12,13 @@ from ..models import (
     BshCustomerDeviceIn,
     BshCustomerDeviceOut,
 )
-from .users import get_or_create_customer
+from .users import BshIdentityDep
 
 router = APIRouter(tags=["bsh-devices"])
 
 
 @router.get("/devices", response_model=List[BshDeviceOut], operation_id="bsh_listDevices")
+@cached("bsh_listDevices", tags=["bsh:devices"])
 def list_devices(db: Annotated[Session, Depends(get_session)], category: str | None = None):
     """List all available device types in the catalog."""
     statement = select(BshDevice)
@@ -29,13 +30,12 @@ def list_devices(db: Annotated[Session, Depends(get_session)], category: str | N
 
 @router.get("/customers/me/devices", response_model=List[BshCustomerDeviceOut], operation_id="bsh_listMyDevices")
 def list_my_devices(
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Get customer's registered devices."""
-    databricks_user = obo_ws.current_user.me()
-    customer = get_or_create_customer(db, databricks_user)
-    statement = select(BshCustomerDevice).where(BshCustomerDevice.customer_id == customer.id)
+    customer_id = identity.ensure_customer_id(db)
+    statement = select(BshCustomerDevice).where(BshCustomerDevice.customer_id == customer_id)
     customer_devices = db.exec(statement).all()
 
     result = []
@@ -55,12 +55,11 @@ def list_my_devices(
 @router.post("/customers/me/devices", response_model=BshCustomerDeviceOut, operation_id="bsh_registerDevice")
 def register_device(
     device_data: BshCustomerDeviceIn,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Register a new device for the current customer."""
-    databricks_user = obo_ws.current_user.me()
-    customer = get_or_create_customer(db, databricks_user)
+    customer_id = identity.ensure_customer_id(db)
 
     device = db.get(BshDevice, device_data.device_id)
     if not device:
@@ -73,7 +72,7 @@ def register_device(
         raise HTTPException(status_code=400, detail="Serial number already registered")
 
     customer_device = BshCustomerDevice(
-        customer_id=customer.id, device_id=device_data.device_id,
+        customer_id=customer_id, device_id=device_data.device_id,
         serial_number=device_data.serial_number, purchase_date=device_data.purchase_date,
         warranty_expiry_date=device_data.warranty_expiry_date, batch_number=device_data.batch_number,
     )
@@ -96,15 +95,14 @@ def register_device(
 @router.get("/customers/me/devices/{device_id}", response_model=BshCustomerDeviceOut, operation_id="bsh_getMyDevice")
 def get_my_device(
     device_id: int,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Get details of a registered device."""
-    databricks_user = obo_ws.current_user.me()
-    customer = get_or_create_customer(db, databricks_user)
+    customer_id = identity.ensure_customer_id(db)
 
     customer_device = db.get(BshCustomerDevice, device_id)
-    if not customer_device or customer_device.customer_id != customer.id:
+    if not customer_device or customer_device.customer_id != customer_id:
         raise HTTPException(status_code=404, detail="Device not found")
 
     device = db.get(BshDevice, customer_device.device_id)
@@ -45,7 +45,7 @@ def get_device_knowledge(device_id: int, db: Annotated[Session, Depends(get_sess
     """Get knowledge articles for a specific device."""
     statement = select(BshKnowledgeArticle).where(BshKnowledgeArticle.device_id == device_id)
     articles = db.exec(statement).all()
-    return [BshKnowledgeArticleOut.model_validate(article) for article in articles]
+    return [BshKnowledgeArticleOut.model_validate(article, from_attributes=True) for article in articles]
 
 
 @router.get("/documents/{device_id}", response_model=List[BshDocumentOut], operation_id="bsh_getDeviceDocuments")
@@ -53,4 +53,4 @@ def get_device_documents(device_id: int, db: Annotated[Session, Depends(get_sess
     """Get documents for a specific device."""
     statement = select(BshDocument).where(BshDocument.device_id == device_id)
     documents = db.exec(statement).all()
-    return [BshDocumentOut.model_validate(doc) for doc in documents]
+    return [BshDocumentOut.model_validate(doc, from_attributes=True) for doc in documents]
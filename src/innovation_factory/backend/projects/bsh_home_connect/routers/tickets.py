@@ -1,11 +1,13 @@
 """Support ticket management router for BSH Home Connect."""
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File, Form
 from sqlmodel import Session, select
 from databricks.sdk import WorkspaceClient
 from datetime import datetime, timezone
 
+from ....conditional import ConditionalDep
 from ....dependencies import get_obo_ws, get_session
+from ....pagination import CursorQuery, Keyset
 from ..models import (
     BshTicket,
     BshTicketIn,
@@ -14,7 +16,6 @@ from ..models import (
     BshTicketStatus,
     BshCustomerDevice,
     BshDevice,
-    BshCustomer,
     BshCustomerOut,
     BshCustomerDeviceOut,
     BshDeviceOut,
@@ -27,10 +28,12 @@ from ..models import (
     MediaType,
     UserRole,
 )
-from .users import get_or_create_customer, get_or_create_technician
+from .users import BshIdentityDep
 
 router = APIRouter(tags=["bsh-tickets"])
 
+TICKET_PAGES = Keyset(BshTicket.created_at, BshTicket.id)
+
 
 def _build_ticket_out(ticket: BshTicket, db: Session) -> BshTicketOut:
     """Build BshTicketOut with relationships."""
@@ -67,19 +70,18 @@ def _build_ticket_out(ticket: BshTicket, db: Session) -> BshTicketOut:
 @router.post("/tickets", response_model=BshTicketOut, operation_id="bsh_createTicket")
 def create_ticket(
     ticket_data: BshTicketIn,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Create a new support ticket."""
-    databricks_user = obo_ws.current_user.me()
-    customer = get_or_create_customer(db, databricks_user)
+    customer_id = identity.ensure_customer_id(db)
 
     customer_device = db.get(BshCustomerDevice, ticket_data.customer_device_id)
-    if not customer_device or customer_device.customer_id != customer.id:
+    if not customer_device or customer_device.customer_id != customer_id:
         raise HTTPException(status_code=404, detail="Device not found")
 
     ticket = BshTicket(
-        customer_id=customer.id,
+        customer_id=customer_id,
         customer_device_id=ticket_data.customer_device_id,
         title=ticket_data.title,
         description=ticket_data.description,
@@ -94,30 +96,30 @@ def create_ticket(
 
 @router.get("/tickets", response_model=List[BshTicketOut], operation_id="bsh_listTickets")
 def list_tickets(
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
+    conditional: ConditionalDep,
+    response: Response,
     status: BshTicketStatus | None = None,
     role: str | None = None,
+    limit: int | None = Query(None, ge=1, le=1000, description="Page size; all tickets if omitted"),
+    cursor: CursorQuery = None,
 ):
     """List tickets filtered by role."""
-    databricks_user = obo_ws.current_user.me()
-
     if not role:
-        customer_statement = select(BshCustomer).where(BshCustomer.databricks_user_id == databricks_user.id)
-        customer = db.exec(customer_statement).first()
-        role = "customer" if customer else "technician"
+        role = identity.role.value
 
     if role == "customer":
-        customer = get_or_create_customer(db, databricks_user)
-        statement = select(BshTicket).where(BshTicket.customer_id == customer.id)
+        statement = select(BshTicket).where(BshTicket.customer_id == identity.ensure_customer_id(db))
     else:
-        technician = get_or_create_technician(db, databricks_user)
-        statement = select(BshTicket).where(BshTicket.technician_id == technician.id)
+        statement = select(BshTicket).where(BshTicket.technician_id == identity.ensure_technician_id(db))
 
     if status:
         statement = statement.where(BshTicket.status == status)
-    statement = statement.order_by(BshTicket.created_at.desc())  # type: ignore[unresolved-attribute]
-    tickets = db.exec(statement).all()
+    not_modified = conditional.check_query(db, statement, BshTicket.updated_at)
+    if not_modified is not None:
+        return not_modified
+    tickets = TICKET_PAGES.fetch(db, statement, cursor, limit, response)
     return [_build_ticket_out(t, db) for t in tickets]
 
 
@@ -165,25 +167,20 @@ def update_ticket(
 def add_ticket_note(
     ticket_id: int,
     note_data: BshTicketNoteIn,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Add a note to a ticket."""
-    databricks_user = obo_ws.current_user.me()
     ticket = db.get(BshTicket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    customer_statement = select(BshCustomer).where(BshCustomer.databricks_user_id == databricks_user.id)
-    customer = db.exec(customer_statement).first()
-
-    if customer and ticket.customer_id == customer.id:
+    if identity.is_customer_of(ticket):
         role = UserRole.customer
-        author_id = customer.id
+        author_id = identity.customer_id
     else:
-        technician = get_or_create_technician(db, databricks_user)
         role = UserRole.technician
-        author_id = technician.id
+        author_id = identity.ensure_technician_id(db)
 
     note = BshTicketNote(
         ticket_id=ticket_id, content=note_data.content,
@@ -198,18 +195,15 @@ def add_ticket_note(
 @router.get("/tickets/{ticket_id}/notes", response_model=List[BshTicketNoteOut], operation_id="bsh_listTicketNotes")
 def list_ticket_notes(
     ticket_id: int,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """List notes for a ticket."""
-    databricks_user = obo_ws.current_user.me()
     ticket = db.get(BshTicket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    customer_statement = select(BshCustomer).where(BshCustomer.databricks_user_id == databricks_user.id)
-    customer = db.exec(customer_statement).first()
-    is_customer = customer and ticket.customer_id == customer.id
+    is_customer = identity.is_customer_of(ticket)
 
     statement = select(BshTicketNote).where(BshTicketNote.ticket_id == ticket_id)
     if is_customer:
@@ -223,7 +217,7 @@ async def upload_ticket_media(
     ticket_id: int,
     file: UploadFile = File(...),
     media_type: str = Form(...),
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)] = None,  # type: ignore[invalid-parameter-default]
+    identity: BshIdentityDep = None,  # type: ignore[invalid-parameter-default]
     db: Annotated[Session, Depends(get_session)] = None,  # type: ignore[invalid-parameter-default]
 ):
     """Upload media to a ticket."""
@@ -231,10 +225,7 @@ async def upload_ticket_media(
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    databricks_user = obo_ws.current_user.me()
-    customer_statement = select(BshCustomer).where(BshCustomer.databricks_user_id == databricks_user.id)
-    customer = db.exec(customer_statement).first()
-    role = UserRole.customer if customer and ticket.customer_id == customer.id else UserRole.technician
+    role = UserRole.customer if identity.is_customer_of(ticket) else UserRole.technician
 
     file_url = f"/uploads/tickets/{ticket_id}/{file.filename}"
     media = BshTicketMedia(
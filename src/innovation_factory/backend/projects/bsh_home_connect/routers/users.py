@@ -1,10 +1,12 @@
 """User management router for BSH Home Connect."""
+from dataclasses import dataclass
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.iam import User as DatabricksUser
 
+from ....cache import TTLCache
 from ....dependencies import get_obo_ws, get_session
 from ..models import (
     BshCustomer,
@@ -12,10 +14,21 @@ from ..models import (
     BshCustomerIn,
     BshTechnician,
     BshTechnicianOut,
+    UserRole,
 )
 
 router = APIRouter(tags=["bsh-users"])
 
+# Databricks user id -> (customer id, technician id). Rows are never deleted, so
+# resolved ids stay valid. Only callers with a customer row are cached: whether
+# one exists decides the caller's role, and another worker may create it at any
+# time. A missing technician id is re-checked sooner, and get_or_create_technician
+# looks in the database before creating a row.
+_identity_cache: TTLCache[str, tuple[int | None, int | None]] = TTLCache(
+    "bsh_identities", maxsize=4096, ttl=600
+)
+_UNRESOLVED_TTL_SECONDS = 30
+
 
 def get_or_create_customer(db: Session, databricks_user: DatabricksUser) -> BshCustomer:
     """Get existing customer or create a new one from Databricks user."""
@@ -36,6 +49,8 @@ def get_or_create_customer(db: Session, databricks_user: DatabricksUser) -> BshC
     db.add(customer)
     db.commit()
     db.refresh(customer)
+    if user_id is not None:
+        _identity_cache.pop(user_id)
     return customer
 
 
@@ -58,28 +73,98 @@ def get_or_create_technician(db: Session, databricks_user: DatabricksUser) -> Bs
     db.add(technician)
     db.commit()
     db.refresh(technician)
+    if user_id is not None:
+        _identity_cache.pop(user_id)
     return technician
 
 
+@dataclass
+class BshIdentity:
+    """The calling Databricks user and their BSH customer/technician rows, if any."""
+
+    user: DatabricksUser
+    customer_id: int | None
+    technician_id: int | None
+
+    @property
+    def role(self) -> UserRole:
+        return UserRole.customer if self.customer_id is not None else UserRole.technician
+
+    def is_customer_of(self, ticket) -> bool:
+        return self.customer_id is not None and ticket.customer_id == self.customer_id
+
+    def customer(self, db: Session) -> BshCustomer:
+        if self.customer_id is not None:
+            customer = db.get(BshCustomer, self.customer_id)
+            if customer:
+                return customer
+        customer = get_or_create_customer(db, self.user)
+        self.customer_id = customer.id
+        return customer
+
+    def technician(self, db: Session) -> BshTechnician:
+        if self.technician_id is not None:
+            technician = db.get(BshTechnician, self.technician_id)
+            if technician:
+                return technician
+        technician = get_or_create_technician(db, self.user)
+        self.technician_id = technician.id
+        return technician
+
+    def ensure_customer_id(self, db: Session) -> int:
+        if self.customer_id is None:
+            self.customer(db)
+        return self.customer_id  # type: ignore[return-value]
+
+    def ensure_technician_id(self, db: Session) -> int:
+        if self.technician_id is None:
+            self.technician(db)
+        return self.technician_id  # type: ignore[return-value]
+
+
+def get_bsh_identity(
+    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    db: Annotated[Session, Depends(get_session)],
+) -> BshIdentity:
+    """Resolve the caller's customer and technician ids once per request."""
+    databricks_user = obo_ws.current_user.me()
+    user_id = databricks_user.id
+    cached = _identity_cache.get(user_id) if user_id is not None else None
+    if cached is None:
+        customer_id = db.exec(
+            select(BshCustomer.id).where(BshCustomer.databricks_user_id == user_id)
+        ).first()
+        technician_id = db.exec(
+            select(BshTechnician.id).where(BshTechnician.databricks_user_id == user_id)
+        ).first()
+        cached = (customer_id, technician_id)
+        if user_id is not None and customer_id is not None:
+            _identity_cache.set(
+                user_id, cached, ttl=None if technician_id is not None else _UNRESOLVED_TTL_SECONDS
+            )
+    return BshIdentity(databricks_user, *cached)
+
+
+BshIdentityDep = Annotated[BshIdentity, Depends(get_bsh_identity)]
+
+
 @router.get("/customers/me", response_model=BshCustomerOut, operation_id="bsh_getCurrentCustomer")
 def get_current_customer(
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Get the current customer profile."""
-    databricks_user = obo_ws.current_user.me()
-    return get_or_create_customer(db, databricks_user)
+    return identity.customer(db)
 
 
 @router.put("/customers/me", response_model=BshCustomerOut, operation_id="bsh_updateCurrentCustomer")
 def update_current_customer(
     customer_update: BshCustomerIn,
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Update the current customer profile."""
-    databricks_user = obo_ws.current_user.me()
-    customer = get_or_create_customer(db, databricks_user)
+    customer = identity.customer(db)
     for key, value in customer_update.model_dump(exclude_unset=True).items():
         setattr(customer, key, value)
     db.add(customer)
@@ -90,12 +175,11 @@ def update_current_customer(
 
 @router.get("/technicians/me", response_model=BshTechnicianOut, operation_id="bsh_getCurrentTechnician")
 def get_current_technician(
-    obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)],
+    identity: BshIdentityDep,
     db: Annotated[Session, Depends(get_session)],
 ):
     """Get the current technician profile."""
-    databricks_user = obo_ws.current_user.me()
-    return get_or_create_technician(db, databricks_user)
+    return identity.technician(db)
 
 
 @router.get("/technicians/{technician_id}", response_model=BshTechnicianOut, operation_id="bsh_getTechnician")
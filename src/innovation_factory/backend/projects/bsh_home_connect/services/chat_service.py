@@ -1,6 +1,7 @@
 """Chat service with RAG pipeline for BSH appliance support."""
 from typing import List, Dict, Any, AsyncIterator
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 import json
 from datetime import datetime
 
@@ -34,8 +35,8 @@ CRITICAL GUARDRAILS:
 6. Keep responses clear, step-by-step, and focused.
 """
 
-    def _retrieve_context(
-        self, db: Session, ticket: BshTicket,
+    async def _retrieve_context(
+        self, db: AsyncSession, ticket: BshTicket,
         customer_device: BshCustomerDevice, device: BshDevice, query: str,
     ) -> List[Dict[str, Any]]:
         contexts = []
@@ -54,7 +55,7 @@ Warranty Status: {'Active' if customer_device.warranty_expiry_date and customer_
         kb_statement = select(BshKnowledgeArticle).where(
             BshKnowledgeArticle.category == device.category
         ).limit(5)
-        articles = db.exec(kb_statement).all()
+        articles = (await db.exec(kb_statement)).all()
         for article in articles:
             if any(word.lower() in article.content.lower() for word in query.split() if len(word) > 3):
                 contexts.append({
@@ -64,7 +65,7 @@ Warranty Status: {'Active' if customer_device.warranty_expiry_date and customer_
                 })
 
         doc_statement = select(BshDocument).where(BshDocument.device_id == device.id)
-        documents = db.exec(doc_statement).all()
+        documents = (await db.exec(doc_statement)).all()
         for doc in documents:
             contexts.append({
                 "type": "document",
@@ -75,40 +76,40 @@ Warranty Status: {'Active' if customer_device.warranty_expiry_date and customer_
         return contexts
 
     async def stream_chat_response(
-        self, db: Session, ticket_id: int, user_message: str,
+        self, db: AsyncSession, ticket_id: int, user_message: str,
         session_type: str = "customer_support",
     ) -> AsyncIterator[str]:
         """Stream AI response with RAG."""
-        ticket = db.get(BshTicket, ticket_id)
+        ticket = await db.get(BshTicket, ticket_id)
         if not ticket:
             yield json.dumps({"error": "Ticket not found"})
             return
 
-        customer_device = db.get(BshCustomerDevice, ticket.customer_device_id)
-        device = db.get(BshDevice, customer_device.device_id)  # type: ignore[possibly-missing-attribute]
+        customer_device = await db.get(BshCustomerDevice, ticket.customer_device_id)
+        device = await db.get(BshDevice, customer_device.device_id)  # type: ignore[possibly-missing-attribute]
 
         # Get or create chat session
         session_statement = select(BshChatSession).where(
             BshChatSession.ticket_id == ticket_id,
             BshChatSession.session_type == session_type,
         ).order_by(BshChatSession.started_at.desc())  # type: ignore[unresolved-attribute]
-        session = db.exec(session_statement).first()
+        session = (await db.exec(session_statement)).first()
 
         if not session:
             session = BshChatSession(ticket_id=ticket_id, session_type=session_type)
             db.add(session)
-            db.commit()
-            db.refresh(session)
+            await db.commit()
+            await db.refresh(session)
 
         # Save user message
         user_msg = BshChatMessage(
             session_id=session.id, role=BshChatRole.user, content=user_message,
         )
         db.add(user_msg)
-        db.commit()
+        await db.commit()
 
         # Retrieve context
-        contexts = self._retrieve_context(db, ticket, customer_device, device, user_message)  # type: ignore[invalid-argument-type]
+        contexts = await self._retrieve_context(db, ticket, customer_device, device, user_message)  # type: ignore[invalid-argument-type]
 
         # Generate mock response (in production, use Databricks Foundation Model API)
         response = self._generate_mock_response(user_message, device, contexts)  # type: ignore[invalid-argument-type]
@@ -119,7 +120,7 @@ Warranty Status: {'Active' if customer_device.warranty_expiry_date and customer_
             sources=[ctx["source"] for ctx in contexts],
         )
         db.add(assistant_msg)
-        db.commit()
+        await db.commit()
 
         yield json.dumps({"content": response, "done": False})
         yield json.dumps({"content": "", "done": True})
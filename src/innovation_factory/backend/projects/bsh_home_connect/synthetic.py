@@ -0,0 +1,103 @@
+"""Scale-factor synthetic data for bsh-home-connect.
+
+Scale factor 1: 100,000 customers owning one to four registered appliances
+from the seeded catalog (~250k registrations), and service tickets for about
+a third of those appliances spread over the last two years. Tickets past the
+``open`` state are assigned to the seeded technicians.
+"""
+from datetime import date, datetime, time, timedelta
+
+from sqlmodel import Session, col, select
+
+from ...bulk import BulkLoader
+from ...synthetic import DEFAULT_SEED, ids_after, max_id, require_numpy, rng, rows, scaled
+from .models import BshCustomer, BshCustomerDevice, BshDevice, BshTechnician, BshTicket, BshTicketStatus
+
+CUSTOMERS = 100_000
+TICKET_RATE = 0.33
+HISTORY_DAYS = 2 * 365
+
+COUNTRIES = ["Germany", "UK", "France", "Italy", "Spain", "Sweden", "Netherlands"]
+TITLES = [
+    "Appliance does not start",
+    "Error code on display",
+    "Unusual noise during operation",
+    "Water leaking",
+    "Home Connect pairing fails",
+    "Door does not close properly",
+]
+STATUS_WEIGHTS = {
+    BshTicketStatus.open: 0.15,
+    BshTicketStatus.in_progress: 0.1,
+    BshTicketStatus.awaiting_parts: 0.05,
+    BshTicketStatus.awaiting_customer: 0.05,
+    BshTicketStatus.shipped_for_repair: 0.03,
+    BshTicketStatus.in_repair: 0.02,
+    BshTicketStatus.resolved: 0.25,
+    BshTicketStatus.closed: 0.35,
+}
+
+
+def generate(session: Session, scale: float, seed: int = DEFAULT_SEED, end: date | None = None) -> None:
+    np = require_numpy()
+    r = rng(seed, "bsh-home-connect")
+    n = scaled(CUSTOMERS, scale)
+    end = end or date.today()
+
+    device_ids = np.array(session.exec(select(BshDevice.id).order_by(col(BshDevice.id))).all())
+    technician_ids = np.array(session.exec(select(BshTechnician.id).order_by(col(BshTechnician.id))).all())
+    if not len(device_ids) or not len(technician_ids):
+        raise RuntimeError("Run the bsh-home-connect seed before generating synthetic data")
+
+    print(f"  Generating bsh-home-connect synthetic data ({n} customers)...")
+    with BulkLoader(session) as loader:
+        first = max_id(session, BshCustomer)
+        customers = loader.table(BshCustomer, (
+            "databricks_user_id", "email", "first_name", "last_name", "city", "country",
+        ))
+        customers.extend(rows(
+            [f"synthetic_customer_{i + 1:07d}" for i in range(n)],
+            [f"customer{i + 1:07d}@synthetic.example.com" for i in range(n)],
+            "Synthetic",
+            [f"Customer {i + 1}" for i in range(n)],
+            "Synthetic City",
+            np.array(COUNTRIES, dtype=object)[r.integers(0, len(COUNTRIES), n)],
+        ))
+        customers.flush()
+        customer_ids = np.array(ids_after(session, BshCustomer, first))
+
+        owner = np.repeat(customer_ids, r.integers(1, 5, n))
+        m = len(owner)
+        purchase = np.datetime64(end, "D") - r.integers(30, 6 * 365, m).astype("timedelta64[D]")
+        first = max_id(session, BshCustomerDevice)
+        registrations = loader.table(BshCustomerDevice, (
+            "customer_id", "device_id", "serial_number", "purchase_date", "warranty_expiry_date",
+        ))
+        registrations.extend(rows(
+            owner, r.choice(device_ids, m),
+            [f"SYN{i + 1:09d}" for i in range(m)],
+            purchase, purchase + np.timedelta64(2 * 365, "D"),
+        ))
+        registrations.flush()
+        registration_ids = np.array(ids_after(session, BshCustomerDevice, first))
+
+        with_ticket = np.flatnonzero(r.random(m) < TICKET_RATE)
+        k = len(with_ticket)
+        statuses = np.array(list(STATUS_WEIGHTS), dtype=object)[
+            r.choice(len(STATUS_WEIGHTS), k, p=list(STATUS_WEIGHTS.values()))
+        ]
+        technicians = np.where(
+            statuses == BshTicketStatus.open, None, r.choice(technician_ids, k).astype(object)
+        )
+        anchor = datetime.combine(end, time())
+        created = [anchor - timedelta(minutes=x) for x in r.integers(0, HISTORY_DAYS * 24 * 60, k).tolist()]
+        tickets = loader.table(BshTicket, (
+            "customer_id", "customer_device_id", "technician_id", "title", "description", "status",
+            "priority", "created_at", "updated_at",
+        ))
+        tickets.extend(rows(
+            owner[with_ticket], registration_ids[with_ticket], technicians,
+            np.array(TITLES, dtype=object)[r.integers(0, len(TITLES), k)],
+            "Synthetic ticket generated for benchmarking.",
+            statuses, r.integers(1, 6, k), created, created,
+        ))
@@ -2,10 +2,13 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from sqlmodel import select
 
+from ....conditional import ConditionalDep
 from ....dependencies import SessionDep
+from ....pagination import CursorQuery, Keyset
+from ....response_cache import invalidates
 from ..models import (
     MacAnomalyAlert,
     MacAnomalyAlertOut,
@@ -16,14 +19,19 @@ from ..models import (
 
 router = APIRouter(prefix="/anomalies", tags=["mac-anomalies"])
 
+ALERT_PAGES = Keyset(MacAnomalyAlert.detected_at, MacAnomalyAlert.id)
+
 
 @router.get("", response_model=list[MacAnomalyAlertOut], operation_id="mac_listAnomalyAlerts")
 def list_anomaly_alerts(
     session: SessionDep,
+    conditional: ConditionalDep,
+    response: Response,
     station_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     severity: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=500),
+    cursor: CursorQuery = None,
 ):
     """List anomaly alerts with filters."""
     q = select(MacAnomalyAlert)
@@ -33,8 +41,11 @@ def list_anomaly_alerts(
         q = q.where(MacAnomalyAlert.status == status)
     if severity:
         q = q.where(MacAnomalyAlert.severity == severity)
-    q = q.order_by(MacAnomalyAlert.detected_at.desc()).limit(limit)  # type: ignore[unresolved-attribute]
-    return session.exec(q).all()
+    # Status changes keep detected_at; the PATCH below bumps the tag instead
+    not_modified = conditional.check_query(session, q, MacAnomalyAlert.detected_at, tags=["mac:anomaly-alerts"])
+    if not_modified is not None:
+        return not_modified
+    return ALERT_PAGES.fetch(session, q, cursor, limit, response)
 
 
 @router.get("/{alert_id}", response_model=MacAnomalyAlertOut, operation_id="mac_getAnomalyAlert")
@@ -47,6 +58,7 @@ def get_anomaly_alert(alert_id: int, session: SessionDep):
 
 
 @router.patch("/{alert_id}", response_model=MacAnomalyAlertOut, operation_id="mac_updateAnomalyAlert")
+@invalidates("mac:anomaly-alerts")
 def update_anomaly_alert(alert_id: int, update: MacAnomalyAlertUpdate, session: SessionDep):
     """Update an anomaly alert (e.g. acknowledge, resolve, dismiss)."""
     alert = session.get(MacAnomalyAlert, alert_id)
@@ -2,12 +2,15 @@
 
 Proxies user messages to the Multi-Agent Supervisor (MAS) serving endpoint.
 """
+import json
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
 
-from ....dependencies import SessionDep
+from ....dependencies import AsyncSessionDep, SessionDep
+from ....services.agent_cache import cache_allowed
 from ..models import (
     MacChatSession,
     MacChatMessage,
@@ -16,28 +19,35 @@ from ..models import (
     MacChatMessageOut,
     MacChatHistoryOut,
 )
-from ..services.chat_service import send_message
+from ..services.chat_service import send_message, stream_message
 
 router = APIRouter(prefix="/chat", tags=["mac-chat"])
 
 
 @router.post("/send", response_model=MacChatMessageOut, operation_id="mac_sendChatMessage")
-def send_chat_message(
+async def send_chat_message(
     body: MacChatMessageIn,
-    session: SessionDep,
+    session: AsyncSessionDep,
     request: Request,
     session_id: Optional[int] = Query(None),
 ):
-    """Send a message to the Issue Resolution Agent and get a response."""
+    """Send a message to the Issue Resolution Agent and get a response.
+
+    With ``Accept: text/event-stream`` the answer is streamed as it is
+    generated (``{"session_id", "content", "done": false}`` chunks, then
+    ``{"id", "session_id", "content": "", "done": true}`` once the answer is
+    saved) instead of returned in one body. ``Cache-Control: no-cache``
+    bypasses the agent answer cache.
+    """
     # Get or create session
     if session_id:
-        chat_session = session.get(MacChatSession, session_id)
+        chat_session = await session.get(MacChatSession, session_id)
         if not chat_session:
             raise HTTPException(status_code=404, detail="Chat session not found")
     else:
         chat_session = MacChatSession(session_type=body.session_type)
         session.add(chat_session)
-        session.flush()
+        await session.flush()
 
     # Save user message
     user_msg = MacChatMessage(
@@ -46,23 +56,41 @@ def send_chat_message(
         content=body.message,
     )
     session.add(user_msg)
-    session.flush()
+    await session.flush()
 
     # Call MAS endpoint (or mock if not available)
     runtime = request.app.state.runtime
-    response_content = send_message(runtime.ws, body.message)
+    cache = cache_allowed(request)
+    chat_session_id = chat_session.id
 
-    # Save assistant response
-    assistant_msg = MacChatMessage(
-        session_id=chat_session.id,
-        role=MacChatRole.assistant,
-        content=response_content,
-    )
-    session.add(assistant_msg)
-    session.commit()
-    session.refresh(assistant_msg)
+    async def save(content: str) -> MacChatMessage:
+        assistant_msg = MacChatMessage(
+            session_id=chat_session_id,
+            role=MacChatRole.assistant,
+            content=content,
+        )
+        session.add(assistant_msg)
+        await session.commit()
+        await session.refresh(assistant_msg)
+        return assistant_msg
+
+    if "text/event-stream" not in request.headers.get("accept", ""):
+        return await save(await send_message(runtime, body.message, cache))
+
+    # The user message is committed now, so the session exists whatever the stream does
+    await session.commit()
+
+    async def event_generator():
+        content = ""
+        async for delta in stream_message(runtime, body.message, cache):
+            content += delta
+            yield f"data: {json.dumps({'session_id': chat_session_id, 'content': delta, 'done': False})}\n\n"
+        saved = await save(content)
+        done = {"id": saved.id, "session_id": chat_session_id, "content": "", "done": True}
+        yield f"data: {json.dumps(done)}\n\n"
+        yield "data: [DONE]\n\n"
 
-    return assistant_msg
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
 @router.get("/history/{session_id}", response_model=MacChatHistoryOut, operation_id="mac_getChatHistory")
@@ -83,5 +111,5 @@ def get_chat_history(session_id: int, session: SessionDep):
         session_type=chat_session.session_type,
         started_at=chat_session.started_at,
         ended_at=chat_session.ended_at,
-        messages=[MacChatMessageOut.model_validate(m) for m in messages],
+        messages=[MacChatMessageOut.model_validate(m, from_attributes=True) for m in messages],
     )
@@ -2,10 +2,12 @@
 from datetime import date, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from sqlmodel import select
 
 from ....dependencies import SessionDep
+from ....pagination import CursorQuery, Keyset
+from ....serialization import RowSerializer
 from ..models import (
     MacFuelSale,
     MacFuelSaleOut,
@@ -17,6 +19,11 @@ from ..models import (
 
 router = APIRouter(prefix="/sales", tags=["mac-sales"])
 
+FUEL_SALES = RowSerializer(MacFuelSaleOut)
+FUEL_SALE_PAGES = Keyset(MacFuelSale.sale_date, MacFuelSale.id)
+NONFUEL_SALE_PAGES = Keyset(MacNonfuelSale.sale_date, MacNonfuelSale.id)
+LOYALTY_PAGES = Keyset(MacLoyaltyMetric.month, MacLoyaltyMetric.id)
+
 
 @router.get("/fuel", response_model=list[MacFuelSaleOut], operation_id="mac_listFuelSales")
 def list_fuel_sales(
@@ -25,25 +32,29 @@ def list_fuel_sales(
     fuel_type: Optional[str] = Query(None),
     days: int = Query(30, ge=1, le=365),
     limit: int = Query(1000, ge=1, le=10000),
+    cursor: CursorQuery = None,
 ):
     """List fuel sales records with filters."""
     cutoff = date.today() - timedelta(days=days)
-    q = select(MacFuelSale).where(MacFuelSale.sale_date >= cutoff)
+    q = FUEL_SALES.select(MacFuelSale).where(MacFuelSale.sale_date >= cutoff)
     if station_id is not None:
         q = q.where(MacFuelSale.station_id == station_id)
     if fuel_type:
         q = q.where(MacFuelSale.fuel_type == fuel_type)
-    q = q.order_by(MacFuelSale.sale_date.desc()).limit(limit)  # type: ignore[unresolved-attribute]
-    return session.exec(q).all()
+    q = FUEL_SALE_PAGES.page(q, cursor, limit)
+    rows, headers = FUEL_SALE_PAGES.trim(FUEL_SALES.rows(session.exec(q)), limit)
+    return FUEL_SALES.list_response(rows, headers=headers)
 
 
 @router.get("/nonfuel", response_model=list[MacNonfuelSaleOut], operation_id="mac_listNonfuelSales")
 def list_nonfuel_sales(
     session: SessionDep,
+    response: Response,
     station_id: Optional[int] = Query(None),
     category: Optional[str] = Query(None),
     days: int = Query(30, ge=1, le=365),
     limit: int = Query(1000, ge=1, le=10000),
+    cursor: CursorQuery = None,
 ):
     """List non-fuel sales records with filters."""
     cutoff = date.today() - timedelta(days=days)
@@ -52,19 +63,19 @@ def list_nonfuel_sales(
         q = q.where(MacNonfuelSale.station_id == station_id)
     if category:
         q = q.where(MacNonfuelSale.category == category)
-    q = q.order_by(MacNonfuelSale.sale_date.desc()).limit(limit)  # type: ignore[unresolved-attribute]
-    return session.exec(q).all()
+    return NONFUEL_SALE_PAGES.fetch(session, q, cursor, limit, response)
 
 
 @router.get("/loyalty", response_model=list[MacLoyaltyMetricOut], operation_id="mac_listLoyaltyMetrics")
 def list_loyalty_metrics(
     session: SessionDep,
+    response: Response,
     station_id: Optional[int] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: CursorQuery = None,
 ):
     """List loyalty metrics (monthly)."""
     q = select(MacLoyaltyMetric)
     if station_id is not None:
         q = q.where(MacLoyaltyMetric.station_id == station_id)
-    q = q.order_by(MacLoyaltyMetric.month.desc()).limit(limit)  # type: ignore[unresolved-attribute]
-    return session.exec(q).all()
+    return LOYALTY_PAGES.fetch(session, q, cursor, limit, response)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Query
 from sqlmodel import col, func, select
 
 from ....dependencies import SessionDep
+from ....response_cache import cached
 from ..models import (
     MacAnomalyAlert,
     MacAlertStatus,
@@ -21,12 +22,14 @@ router = APIRouter(prefix="/stations", tags=["mac-stations"])
 
 
 @router.get("/regions", response_model=list[MacRegionOut], operation_id="mac_listRegions")
+@cached("mac_listRegions", tags=["mac:regions"])
 def list_regions(session: SessionDep):
     """List all regions."""
     return session.exec(select(MacRegion).order_by(MacRegion.name)).all()
 
 
 @router.get("", response_model=list[MacStationOut], operation_id="mac_listStations")
+@cached("mac_listStations", tags=["mac:stations"])
 def list_stations(
     session: SessionDep,
     region_id: Optional[int] = Query(None),
@@ -2,10 +2,11 @@
 from datetime import date, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from sqlmodel import select
 
 from ....dependencies import SessionDep
+from ....pagination import CursorQuery, Keyset
 from ..models import (
     MacWorkforceShift,
     MacWorkforceShiftOut,
@@ -19,30 +20,36 @@ from ..models import (
 
 router = APIRouter(prefix="/workforce", tags=["mac-workforce"])
 
+SHIFT_PAGES = Keyset(MacWorkforceShift.shift_date, MacWorkforceShift.id)
+ISSUE_PAGES = Keyset(MacIssue.created_at, MacIssue.id)
+
 
 @router.get("/shifts", response_model=list[MacWorkforceShiftOut], operation_id="mac_listWorkforceShifts")
 def list_shifts(
     session: SessionDep,
+    response: Response,
     station_id: Optional[int] = Query(None),
     days: int = Query(7, ge=1, le=90),
     limit: int = Query(500, ge=1, le=5000),
+    cursor: CursorQuery = None,
 ):
     """List workforce shift records."""
     cutoff = date.today() - timedelta(days=days)
     q = select(MacWorkforceShift).where(MacWorkforceShift.shift_date >= cutoff)
     if station_id is not None:
         q = q.where(MacWorkforceShift.station_id == station_id)
-    q = q.order_by(MacWorkforceShift.shift_date.desc()).limit(limit)  # type: ignore[unresolved-attribute]
-    return session.exec(q).all()
+    return SHIFT_PAGES.fetch(session, q, cursor, limit, response)
 
 
 @router.get("/issues", response_model=list[MacIssueOut], operation_id="mac_listIssues")
 def list_issues(
     session: SessionDep,
+    response: Response,
     station_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=500),
+    cursor: CursorQuery = None,
 ):
     """List operational issues."""
     q = select(MacIssue)
@@ -52,8 +59,7 @@ def list_issues(
         q = q.where(MacIssue.status == status)
     if category:
         q = q.where(MacIssue.category == category)
-    q = q.order_by(MacIssue.created_at.desc()).limit(limit)  # type: ignore[unresolved-attribute]
-    return session.exec(q).all()
+    return ISSUE_PAGES.fetch(session, q, cursor, limit, response)
 
 
 @router.get("/customers", response_model=list[MacCustomerProfileOut], operation_id="mac_listCustomerProfiles")
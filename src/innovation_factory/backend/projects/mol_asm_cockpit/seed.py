@@ -9,6 +9,7 @@ import random
 from datetime import date, datetime, timedelta, timezone
 from sqlmodel import Session, select
 
+from ...bulk import BulkLoader
 from .models import (
     MacRegion,
     MacStation,
@@ -196,127 +197,129 @@ def _seed_stations(session: Session, regions: dict[str, MacRegion]) -> list[MacS
 def _seed_daily_facts(session: Session, stations: list[MacStation]):
     """Generate daily fact data for all stations (last 14 days for dev).
 
-    Uses per-station flushing to keep INSERT statements small enough for PGLite.
+    Rows are streamed as tuples through the bulk loader instead of ORM objects.
     """
     today = date.today()
     start = today - timedelta(days=14)
     num_days = (today - start).days
 
-    for day_offset in range(num_days):
-        d = start + timedelta(days=day_offset)
-        dow = d.weekday()  # 0=Mon
-        is_weekend = dow >= 5
-        month_factor = 1.0 + 0.12 * (1.0 if d.month in (6, 7, 8) else (-0.08 if d.month in (12, 1, 2) else 0.0))
-        weekend_factor = 1.15 if is_weekend else 1.0
-
-        for station in stations:
-            type_factor = {"highway": 1.5, "urban": 1.0, "suburban": 0.75}[station.station_type.value]
-            records: list = []
-
-            # ---- Fuel Sales ----
-            for ft in FuelType:
-                mean_vol, std_vol = FUEL_DAILY_VOLUME[ft.value]
-                vol = max(0, random.gauss(mean_vol * type_factor * month_factor * weekend_factor, std_vol))
-                base_price, base_cost = FUEL_BASE_PRICES[ft.value]
-                price = base_price * random.uniform(0.97, 1.03)
-                cost = base_cost * random.uniform(0.97, 1.03)
-                records.append(MacFuelSale(
-                    station_id=station.id, sale_date=d, fuel_type=ft,
-                    volume_liters=round(vol, 1),
-                    revenue=round(vol * price, 2),
-                    unit_price=round(price, 4),
-                    margin=round(vol * (price - cost), 2),
-                ))
-
-            # ---- Non-Fuel Sales ----
-            for cat in NonfuelCategory:
-                base_qty = {"coffee": 120, "hot_food": 45, "cold_food": 30, "bakery": 55,
-                            "beverages": 60, "tobacco": 25, "car_care": 8, "convenience": 35}[cat.value]
-                if not station.has_fresh_corner and cat.value in ("hot_food", "cold_food", "bakery"):
-                    base_qty = int(base_qty * 0.2)
-                qty = max(0, int(random.gauss(base_qty * type_factor * weekend_factor, base_qty * 0.25)))
-                avg_price = {"coffee": 2.5, "hot_food": 4.2, "cold_food": 3.5, "bakery": 2.0,
-                             "beverages": 2.8, "tobacco": 5.5, "car_care": 12.0, "convenience": 3.0}[cat.value]
-                margin_pct = {"coffee": 0.65, "hot_food": 0.55, "cold_food": 0.50, "bakery": 0.60,
-                              "beverages": 0.40, "tobacco": 0.10, "car_care": 0.35, "convenience": 0.30}[cat.value]
-                rev = round(qty * avg_price * random.uniform(0.9, 1.1), 2)
-                records.append(MacNonfuelSale(
-                    station_id=station.id, sale_date=d, category=cat,
-                    quantity=qty, revenue=rev, margin=round(rev * margin_pct, 2),
-                ))
+    with BulkLoader(session) as loader:
+        fuel_sales = loader.table(MacFuelSale, (
+            "station_id", "sale_date", "fuel_type", "volume_liters", "revenue", "unit_price", "margin",
+        ))
+        nonfuel_sales = loader.table(MacNonfuelSale, (
+            "station_id", "sale_date", "category", "quantity", "revenue", "margin",
+        ))
+        shifts = loader.table(MacWorkforceShift, (
+            "station_id", "shift_date", "shift_type", "planned_headcount", "actual_headcount", "overtime_hours",
+        ))
+        inventory = loader.table(MacInventory, (
+            "station_id", "record_date", "product_category", "stock_level", "reorder_point",
+            "spoilage_count", "stock_out_events", "delivery_scheduled",
+        ))
+        competitor_prices = loader.table(MacCompetitorPrice, (
+            "station_id", "price_date", "competitor_name", "fuel_type", "price_per_liter",
+        ))
+        price_history = loader.table(MacPriceHistory, (
+            "station_id", "price_date", "fuel_type", "price_per_liter", "cost_per_liter",
+        ))
+        loyalty = loader.table(MacLoyaltyMetric, (
+            "station_id", "month", "active_members", "new_signups", "points_redeemed", "loyalty_revenue_share",
+        ))
 
-            # ---- Workforce Shifts ----
-            for st in ShiftType:
-                planned = {"morning": 4, "afternoon": 3, "night": 2}[st.value]
-                if station.station_type == StationType.highway:
-                    planned += 1
-                actual = planned + random.choice([-1, 0, 0, 0, 0, 1])
-                actual = max(1, actual)
-                ot = round(max(0, random.gauss(0.5, 0.8)), 1) if actual < planned else 0.0
-                records.append(MacWorkforceShift(
-                    station_id=station.id, shift_date=d, shift_type=st,
-                    planned_headcount=planned, actual_headcount=actual, overtime_hours=ot,
-                ))
+        for day_offset in range(num_days):
+            d = start + timedelta(days=day_offset)
+            dow = d.weekday()  # 0=Mon
+            is_weekend = dow >= 5
+            month_factor = 1.0 + 0.12 * (1.0 if d.month in (6, 7, 8) else (-0.08 if d.month in (12, 1, 2) else 0.0))
+            weekend_factor = 1.15 if is_weekend else 1.0
+
+            for station in stations:
+                type_factor = {"highway": 1.5, "urban": 1.0, "suburban": 0.75}[station.station_type.value]
+
+                # ---- Fuel Sales ----
+                for ft in FuelType:
+                    mean_vol, std_vol = FUEL_DAILY_VOLUME[ft.value]
+                    vol = max(0, random.gauss(mean_vol * type_factor * month_factor * weekend_factor, std_vol))
+                    base_price, base_cost = FUEL_BASE_PRICES[ft.value]
+                    price = base_price * random.uniform(0.97, 1.03)
+                    cost = base_cost * random.uniform(0.97, 1.03)
+                    fuel_sales.append((
+                        station.id, d, ft, round(vol, 1), round(vol * price, 2),
+                        round(price, 4), round(vol * (price - cost), 2),
+                    ))
 
-            # ---- Inventory ----
-            for pc in [ProductCategory.coffee, ProductCategory.hot_food, ProductCategory.bakery,
-                       ProductCategory.beverages, ProductCategory.cold_food,
-                       ProductCategory.tobacco, ProductCategory.car_care, ProductCategory.convenience]:
-                base_stock = {"coffee": 200, "hot_food": 60, "bakery": 80, "beverages": 150,
-                              "cold_food": 50, "tobacco": 100, "car_care": 40, "convenience": 120}[pc.value]
-                stock = max(0, int(random.gauss(base_stock, base_stock * 0.2)))
-                reorder = int(base_stock * 0.3)
-                spoilage = 0
-                if pc.value in ("hot_food", "bakery", "cold_food"):
-                    spoilage = random.choices([0, 1, 2, 3, 5], weights=[50, 25, 15, 7, 3])[0]
-                stock_out = 1 if stock < reorder * 0.5 else 0
-                records.append(MacInventory(
-                    station_id=station.id, record_date=d, product_category=pc,
-                    stock_level=stock, reorder_point=reorder, spoilage_count=spoilage,
-                    stock_out_events=stock_out,
-                    delivery_scheduled=random.random() < 0.15,
-                ))
+                # ---- Non-Fuel Sales ----
+                for cat in NonfuelCategory:
+                    base_qty = {"coffee": 120, "hot_food": 45, "cold_food": 30, "bakery": 55,
+                                "beverages": 60, "tobacco": 25, "car_care": 8, "convenience": 35}[cat.value]
+                    if not station.has_fresh_corner and cat.value in ("hot_food", "cold_food", "bakery"):
+                        base_qty = int(base_qty * 0.2)
+                    qty = max(0, int(random.gauss(base_qty * type_factor * weekend_factor, base_qty * 0.25)))
+                    avg_price = {"coffee": 2.5, "hot_food": 4.2, "cold_food": 3.5, "bakery": 2.0,
+                                 "beverages": 2.8, "tobacco": 5.5, "car_care": 12.0, "convenience": 3.0}[cat.value]
+                    margin_pct = {"coffee": 0.65, "hot_food": 0.55, "cold_food": 0.50, "bakery": 0.60,
+                                  "beverages": 0.40, "tobacco": 0.10, "car_care": 0.35, "convenience": 0.30}[cat.value]
+                    rev = round(qty * avg_price * random.uniform(0.9, 1.1), 2)
+                    nonfuel_sales.append((station.id, d, cat, qty, rev, round(rev * margin_pct, 2)))
+
+                # ---- Workforce Shifts ----
+                for st in ShiftType:
+                    planned = {"morning": 4, "afternoon": 3, "night": 2}[st.value]
+                    if station.station_type == StationType.highway:
+                        planned += 1
+                    actual = planned + random.choice([-1, 0, 0, 0, 0, 1])
+                    actual = max(1, actual)
+                    ot = round(max(0, random.gauss(0.5, 0.8)), 1) if actual < planned else 0.0
+                    shifts.append((station.id, d, st, planned, actual, ot))
+
+                # ---- Inventory ----
+                for pc in [ProductCategory.coffee, ProductCategory.hot_food, ProductCategory.bakery,
+                           ProductCategory.beverages, ProductCategory.cold_food,
+                           ProductCategory.tobacco, ProductCategory.car_care, ProductCategory.convenience]:
+                    base_stock = {"coffee": 200, "hot_food": 60, "bakery": 80, "beverages": 150,
+                                  "cold_food": 50, "tobacco": 100, "car_care": 40, "convenience": 120}[pc.value]
+                    stock = max(0, int(random.gauss(base_stock, base_stock * 0.2)))
+                    reorder = int(base_stock * 0.3)
+                    spoilage = 0
+                    if pc.value in ("hot_food", "bakery", "cold_food"):
+                        spoilage = random.choices([0, 1, 2, 3, 5], weights=[50, 25, 15, 7, 3])[0]
+                    stock_out = 1 if stock < reorder * 0.5 else 0
+                    inventory.append((
+                        station.id, d, pc, stock, reorder, spoilage, stock_out, random.random() < 0.15,
+                    ))
 
-            # ---- Competitor Prices ----
-            chosen_comps = random.sample(COMPETITORS, 2)
-            for comp in chosen_comps:
-                for ft in [FuelType.diesel, FuelType.regular_95]:
-                    base_price, _ = FUEL_BASE_PRICES[ft.value]
-                    comp_price = base_price * random.uniform(0.96, 1.04)
-                    records.append(MacCompetitorPrice(
-                        station_id=station.id, price_date=d,
-                        competitor_name=comp, fuel_type=ft,
-                        price_per_liter=round(comp_price, 4),
+                # ---- Competitor Prices ----
+                chosen_comps = random.sample(COMPETITORS, 2)
+                for comp in chosen_comps:
+                    for ft in [FuelType.diesel, FuelType.regular_95]:
+                        base_price, _ = FUEL_BASE_PRICES[ft.value]
+                        comp_price = base_price * random.uniform(0.96, 1.04)
+                        competitor_prices.append((station.id, d, comp, ft, round(comp_price, 4)))
+
+                # ---- Price History ----
+                for ft in FuelType:
+                    base_price, base_cost = FUEL_BASE_PRICES[ft.value]
+                    price_history.append((
+                        station.id, d, ft,
+                        round(base_price * random.uniform(0.97, 1.03), 4),
+                        round(base_cost * random.uniform(0.97, 1.03), 4),
                     ))
 
-            # ---- Price History ----
-            for ft in FuelType:
-                base_price, base_cost = FUEL_BASE_PRICES[ft.value]
-                records.append(MacPriceHistory(
-                    station_id=station.id, price_date=d, fuel_type=ft,
-                    price_per_liter=round(base_price * random.uniform(0.97, 1.03), 4),
-                    cost_per_liter=round(base_cost * random.uniform(0.97, 1.03), 4),
+        # ---- Loyalty Metrics (monthly) ----
+        for month_offset in range(12):
+            m = date(today.year - 1 + (today.month + month_offset - 1) // 12,
+                     (today.month + month_offset - 1) % 12 + 1, 1)
+            for station in stations:
+                base_members = int(station.shop_area_sqm * 8)
+                loyalty.append((
+                    station.id, m,
+                    int(random.gauss(base_members, base_members * 0.1)),
+                    random.randint(5, 50),
+                    random.randint(200, 2000),
+                    round(random.uniform(0.08, 0.25), 3),
                 ))
 
-            # Flush per station-day (~33 records) to keep INSERTs small for PGLite
-            session.add_all(records)
-            session.flush()
-
-    # ---- Loyalty Metrics (monthly) ----
-    for month_offset in range(12):
-        m = date(today.year - 1 + (today.month + month_offset - 1) // 12,
-                 (today.month + month_offset - 1) % 12 + 1, 1)
-        for station in stations:
-            base_members = int(station.shop_area_sqm * 8)
-            session.add(MacLoyaltyMetric(
-                station_id=station.id, month=m,
-                active_members=int(random.gauss(base_members, base_members * 0.1)),
-                new_signups=random.randint(5, 50),
-                points_redeemed=random.randint(200, 2000),
-                loyalty_revenue_share=round(random.uniform(0.08, 0.25), 3),
-            ))
-        session.flush()
-
     print("    Daily facts seeded (14 days).")
 
 
@@ -4,36 +4,54 @@ Proxies user messages to the Multi-Agent Supervisor (MAS) serving endpoint.
 Uses shared Databricks Agent Bricks utilities.
 """
 
-from databricks.sdk import WorkspaceClient
+import asyncio
+from typing import AsyncIterator
 
-from ....services.databricks_agents import extract_agent_text, query_agent_endpoint
+from ....runtime import Runtime
+from ....services.databricks_agents import stream_agent_endpoint
 from ..databricks_config import MAS_ENDPOINT_NAME
 
 
-def send_message(ws: WorkspaceClient, user_message: str) -> str:
-    """Send a message to the Multi-Agent Supervisor and return the response.
+async def stream_message(runtime: Runtime, user_message: str, cache: bool = True) -> AsyncIterator[str]:
+    """Send a message to the Multi-Agent Supervisor and yield the response as it is generated.
 
-    If MAS_ENDPOINT_NAME is not configured, returns a mock response for development.
+    If MAS_ENDPOINT_NAME is not configured, yields a mock response for development.
+    If the endpoint fails, an error notice follows whatever was already streamed.
 
     Args:
-        ws: WorkspaceClient instance
+        runtime: App runtime (provides the WorkspaceClient)
         user_message: The user's message
+        cache: Whether a cached answer to the same question may be used
 
-    Returns:
-        The assistant's response text
+    Yields:
+        Chunks of the assistant's response text
     """
     if not MAS_ENDPOINT_NAME:
-        return _mock_response(user_message)
+        yield _mock_response(user_message)
+        return
 
+    streamed = False
     try:
+        ws = await asyncio.to_thread(lambda: runtime.ws)
         messages = [{"role": "user", "content": user_message}]
-        result = query_agent_endpoint(ws, MAS_ENDPOINT_NAME, messages)
-        return extract_agent_text(result)
+        async for delta in stream_agent_endpoint(ws, MAS_ENDPOINT_NAME, messages, cache=cache):
+            streamed = True
+            yield delta
+        if streamed:
+            return
+        error = "the agent returned an empty response"
     except Exception as e:
-        return (
-            f"I encountered an issue connecting to the agent system: {str(e)}. "
-            "Please try again in a moment."
-        )
+        error = str(e) or type(e).__name__
+    yield (
+        ("\n\n" if streamed else "")
+        + f"I encountered an issue connecting to the agent system: {error}. "
+        "Please try again in a moment."
+    )
+
+
+async def send_message(runtime: Runtime, user_message: str, cache: bool = True) -> str:
+    """Send a message to the Multi-Agent Supervisor and return the full response."""
+    return "".join([chunk async for chunk in stream_message(runtime, user_message, cache)])
 
 
 def _mock_response(user_message: str) -> str:
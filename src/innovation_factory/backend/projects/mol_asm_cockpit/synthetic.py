@@ -0,0 +1,124 @@
+"""Scale-factor synthetic data for the ASM Cockpit.
+
+Scale factor 1: 500 stations spread over the seeded regions with three years
+of daily fuel sales, non-fuel sales, workforce shifts and price history
+(~11.5M rows). Distributions follow ``seed.py``.
+"""
+from datetime import date, timedelta
+
+from sqlmodel import Session, col, select
+
+from ...bulk import BulkLoader
+from ...synthetic import DEFAULT_SEED, ids_after, max_id, require_numpy, rng, rows, scaled
+from .models import (
+    FuelType,
+    MacFuelSale,
+    MacNonfuelSale,
+    MacPriceHistory,
+    MacRegion,
+    MacStation,
+    MacWorkforceShift,
+    NonfuelCategory,
+    ShiftType,
+    StationType,
+)
+from .seed import FUEL_BASE_PRICES, FUEL_DAILY_VOLUME
+
+STATIONS = 500
+DAYS = 3 * 365
+
+# Per category: (base daily quantity, average price, margin share)
+NONFUEL_PROFILE: dict[str, tuple[int, float, float]] = {
+    "coffee": (120, 2.5, 0.65),
+    "hot_food": (45, 4.2, 0.55),
+    "cold_food": (30, 3.5, 0.50),
+    "bakery": (55, 2.0, 0.60),
+    "beverages": (60, 2.8, 0.40),
+    "tobacco": (25, 5.5, 0.10),
+    "car_care": (8, 12.0, 0.35),
+    "convenience": (35, 3.0, 0.30),
+}
+FRESH_CATEGORIES = ("hot_food", "cold_food", "bakery")
+PLANNED_HEADCOUNT = {"morning": 4, "afternoon": 3, "night": 2}
+
+
+def generate(session: Session, scale: float, seed: int = DEFAULT_SEED, end: date | None = None) -> None:
+    np = require_numpy()
+    r = rng(seed, "mol-asm-cockpit")
+    n = scaled(STATIONS, scale)
+    end = end or date.today()
+    start = end - timedelta(days=DAYS)
+
+    region_ids = np.array(session.exec(select(MacRegion.id).order_by(col(MacRegion.id))).all())
+    if not len(region_ids):
+        raise RuntimeError("Run the ASM Cockpit seed before generating synthetic data")
+
+    print(f"  Generating ASM Cockpit synthetic data ({n} stations x {DAYS} days)...")
+    types = np.array(list(StationType), dtype=object)[r.choice(3, n, p=[0.2, 0.5, 0.3])]
+    type_factor = np.array([{"highway": 1.5, "urban": 1.0, "suburban": 0.75}[t.value] for t in types])
+    fresh_corner = r.random(n) < 0.6
+    shop_area = r.uniform(40, 160, n).round(0)
+
+    with BulkLoader(session) as loader:
+        first = max_id(session, MacStation)
+        stations = loader.table(MacStation, (
+            "station_code", "name", "city", "region_id", "latitude", "longitude", "station_type",
+            "has_fresh_corner", "has_ev_charging", "num_pumps", "shop_area_sqm", "opened_date",
+        ))
+        stations.extend(rows(
+            [f"SYN{i + 1:05d}" for i in range(n)],
+            [f"Synthetic Station {i + 1}" for i in range(n)],
+            "Synthetic City",
+            r.choice(region_ids, n),
+            r.uniform(44.0, 50.0, n).round(5),
+            r.uniform(13.5, 22.5, n).round(5),
+            types, fresh_corner, r.random(n) < 0.4, r.integers(4, 13, n), shop_area,
+            date(2015, 1, 1),
+        ))
+        stations.flush()
+        station_ids = np.array(ids_after(session, MacStation, first))
+
+        fuel_sales = loader.table(MacFuelSale, (
+            "station_id", "sale_date", "fuel_type", "volume_liters", "revenue", "unit_price", "margin",
+        ))
+        nonfuel_sales = loader.table(MacNonfuelSale, (
+            "station_id", "sale_date", "category", "quantity", "revenue", "margin",
+        ))
+        shifts = loader.table(MacWorkforceShift, (
+            "station_id", "shift_date", "shift_type", "planned_headcount", "actual_headcount", "overtime_hours",
+        ))
+        price_history = loader.table(MacPriceHistory, (
+            "station_id", "price_date", "fuel_type", "price_per_liter", "cost_per_liter",
+        ))
+
+        for day_offset in range(DAYS):
+            d = start + timedelta(days=day_offset)
+            month_factor = 1.0 + 0.12 * (1.0 if d.month in (6, 7, 8) else (-0.08 if d.month in (12, 1, 2) else 0.0))
+            weekend_factor = 1.15 if d.weekday() >= 5 else 1.0
+
+            for ft in FuelType:
+                mean_vol, std_vol = FUEL_DAILY_VOLUME[ft.value]
+                base_price, base_cost = FUEL_BASE_PRICES[ft.value]
+                vol = np.maximum(0.0, r.normal(mean_vol * type_factor * month_factor * weekend_factor, std_vol))
+                price = base_price * r.uniform(0.97, 1.03, n)
+                cost = base_cost * r.uniform(0.97, 1.03, n)
+                fuel_sales.extend(rows(
+                    station_ids, d, ft, vol.round(1), (vol * price).round(2), price.round(4),
+                    (vol * (price - cost)).round(2),
+                ))
+                price_history.extend(rows(station_ids, d, ft, price.round(4), cost.round(4)))
+
+            for cat in NonfuelCategory:
+                base_qty, avg_price, margin_pct = NONFUEL_PROFILE[cat.value]
+                base = np.full(n, float(base_qty))
+                if cat.value in FRESH_CATEGORIES:
+                    base = np.where(fresh_corner, base, (base * 0.2).astype(int))
+                qty = np.maximum(0, r.normal(base * type_factor * weekend_factor, base * 0.25)).astype(int)
+                revenue = (qty * avg_price * r.uniform(0.9, 1.1, n)).round(2)
+                nonfuel_sales.extend(rows(station_ids, d, cat, qty, revenue, (revenue * margin_pct).round(2)))
+
+            for st in ShiftType:
+                planned = PLANNED_HEADCOUNT[st.value] + (types == StationType.highway).astype(int)
+                actual = np.maximum(1, planned + r.choice([-1, 0, 0, 0, 0, 1], n))
+                overtime = np.where(actual < planned, np.maximum(0.0, r.normal(0.5, 0.8, n)).round(1), 0.0)
+                shifts.extend(rows(station_ids, d, st, planned, actual, overtime))
@@ -0,0 +1,68 @@
+"""Registry of the showcase projects hosted by the platform.
+
+Each project declares where its router, table models and seeder live as dotted
+module paths; nothing is imported until the platform asks for it. Routers and
+models are loaded once at startup (the API needs them), seed modules only when
+the database is actually empty, and the NumPy-based ``synthetic`` modules only
+when a scale factor is requested. ``ENABLED_PROJECTS`` (comma-separated slugs)
+restricts which projects are loaded at all.
+"""
+import importlib
+import os
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import APIRouter
+from sqlmodel import Session
+
+from ..profiling import startup_profiler
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    slug: str
+    package: str
+    seeder: str
+
+    @property
+    def prefix(self) -> str:
+        return f"/projects/{self.slug}"
+
+    def _import(self, module: str):
+        with startup_profiler.phase(f"import:{self.slug}.{module}"):
+            return importlib.import_module(f"{__package__}.{self.package}.{module}")
+
+    def load_router(self) -> APIRouter:
+        return self._import("router").router
+
+    def load_models(self) -> None:
+        """Import the table models so they are registered on ``SQLModel.metadata``."""
+        self._import("models")
+
+    def load_seeder(self) -> Callable[[Session], None]:
+        return getattr(self._import("seed"), self.seeder)
+
+    def load_generator(self) -> Callable[..., None]:
+        """Scale-factor generator: ``generate(session, scale, seed, end)``."""
+        return self._import("synthetic").generate
+
+
+PROJECTS: tuple[ProjectSpec, ...] = (
+    ProjectSpec(slug="vi-home-one", package="vi_home_one", seeder="seed_vh_data"),
+    ProjectSpec(slug="bsh-home-connect", package="bsh_home_connect", seeder="seed_bsh_data"),
+    ProjectSpec(slug="mol-asm-cockpit", package="mol_asm_cockpit", seeder="seed_mac_data"),
+    ProjectSpec(slug="adtech-intelligence", package="adtech_intelligence", seeder="seed_at_data"),
+)
+
+
+def enabled_projects() -> list[ProjectSpec]:
+    selected = os.getenv("ENABLED_PROJECTS", "").strip()
+    if not selected:
+        return list(PROJECTS)
+    slugs = {s.strip() for s in selected.split(",") if s.strip()}
+    return [p for p in PROJECTS if p.slug in slugs]
+
+
+def load_all_models() -> None:
+    for project in enabled_projects():
+        project.load_models()
@@ -3,7 +3,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlmodel import select
 
-from ....dependencies import SessionDep
+from ....dependencies import AsyncSessionDep, SessionDep
 from ..models import (
     VhTicket,
     VhChatSession,
@@ -21,9 +21,9 @@ chat_service = ChatService()
 
 
 @router.post("/tickets/{ticket_id}/chat", operation_id="vh_send_chat_message")
-async def send_chat_message(ticket_id: int, message: VhChatMessageIn, db: SessionDep):
+async def send_chat_message(ticket_id: int, message: VhChatMessageIn, db: AsyncSessionDep):
     """Send a chat message and get streaming AI response."""
-    ticket = db.get(VhTicket, ticket_id)
+    ticket = await db.get(VhTicket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
@@ -31,13 +31,13 @@ async def send_chat_message(ticket_id: int, message: VhChatMessageIn, db: Sessio
         VhChatSession.ticket_id == ticket_id,
         VhChatSession.ended_at.is_(None)  # type: ignore[unresolved-attribute]
     )
-    chat_session = db.exec(session_query).first()
+    chat_session = (await db.exec(session_query)).first()
 
     if not chat_session:
         chat_session = VhChatSession(ticket_id=ticket_id, session_type="support")
         db.add(chat_session)
-        db.commit()
-        db.refresh(chat_session)
+        await db.commit()
+        await db.refresh(chat_session)
 
     user_msg = VhChatMessage(
         session_id=chat_session.id,
@@ -45,7 +45,7 @@ async def send_chat_message(ticket_id: int, message: VhChatMessageIn, db: Sessio
         content=message.content,
     )
     db.add(user_msg)
-    db.commit()
+    await db.commit()
 
     async def event_generator():
         full_response = ""
@@ -60,7 +60,7 @@ async def send_chat_message(ticket_id: int, message: VhChatMessageIn, db: Sessio
             sources="Knowledge Base",
         )
         db.add(assistant_msg)
-        db.commit()
+        await db.commit()
 
         yield "data: [DONE]\n\n"
 
@@ -4,6 +4,7 @@ from sqlmodel import select
 from datetime import datetime, timedelta, timezone
 
 from ....dependencies import SessionDep
+from ....serialization import RowSerializer
 from ..models import (
     VhHousehold,
     VhEnergyDevice,
@@ -12,14 +13,17 @@ from ..models import (
     VhHouseholdOut,
     VhHouseholdCockpitOut,
     VhEnergyReadingOut,
-    VhConsumptionBreakdownOut,
-    VhEnergySourcesOut,
     VhEnergyDeviceOut,
     VhOptimizationModeUpdate,
 )
 
 router = APIRouter(prefix="/households", tags=["vh-households"])
 
+HOUSEHOLD = RowSerializer(VhHouseholdOut)
+READINGS = RowSerializer(VhEnergyReadingOut)
+DEVICES = RowSerializer(VhEnergyDeviceOut)
+COCKPIT = RowSerializer(VhHouseholdCockpitOut)
+
 
 @router.get("/{household_id}", response_model=VhHouseholdOut, operation_id="vh_get_household")
 def get_household(household_id: int, db: SessionDep):
@@ -73,43 +77,25 @@ def get_household_cockpit(household_id: int, db: SessionDep):
             for category, value_kwh in categories:
                 if value_kwh > 0:
                     percentage = (value_kwh / total) * 100
-                    consumption_breakdown.append(VhConsumptionBreakdownOut(
-                        category=category,
-                        value_kwh=round(value_kwh, 3),
-                        percentage=round(percentage, 1),
-                    ))
-
-    energy_sources = VhEnergySourcesOut(
-        pv_generation_kw=latest_reading.pv_generation_kwh if latest_reading else 0.0,
-        battery_discharge_kw=latest_reading.battery_discharge_kwh if latest_reading else 0.0,
-        grid_import_kw=latest_reading.grid_import_kwh if latest_reading else 0.0,
-        total_available_kw=0.0,
-    )
-    energy_sources.total_available_kw = (
-        energy_sources.pv_generation_kw +
-        energy_sources.battery_discharge_kw +
-        energy_sources.grid_import_kw
-    )
+                    consumption_breakdown.append({
+                        "category": category,
+                        "value_kwh": round(value_kwh, 3),
+                        "percentage": round(percentage, 1),
+                    })
+
+    energy_sources = {
+        "pv_generation_kw": latest_reading.pv_generation_kwh if latest_reading else 0.0,
+        "battery_discharge_kw": latest_reading.battery_discharge_kwh if latest_reading else 0.0,
+        "grid_import_kw": latest_reading.grid_import_kwh if latest_reading else 0.0,
+    }
+    energy_sources["total_available_kw"] = sum(energy_sources.values())
 
     one_day_ago = datetime.now(timezone.utc) - timedelta(hours=24)
-    recent_readings_query = select(VhEnergyReading).where(
+    recent_readings_query = READINGS.select(VhEnergyReading).where(
         VhEnergyReading.household_id == household_id,
         VhEnergyReading.timestamp >= one_day_ago
     ).order_by(VhEnergyReading.timestamp.desc()).limit(24)  # type: ignore[unresolved-attribute]
-    recent_readings_raw = db.exec(recent_readings_query).all()
-
-    recent_readings = [
-        VhEnergyReadingOut(
-            id=r.id,  # type: ignore[invalid-argument-type]
-            household_id=r.household_id, timestamp=r.timestamp,
-            pv_generation_kwh=r.pv_generation_kwh, battery_charge_kwh=r.battery_charge_kwh,
-            battery_discharge_kwh=r.battery_discharge_kwh, battery_level_kwh=r.battery_level_kwh,
-            grid_import_kwh=r.grid_import_kwh, grid_export_kwh=r.grid_export_kwh,
-            ev_consumption_kwh=r.ev_consumption_kwh, heat_pump_consumption_kwh=r.heat_pump_consumption_kwh,
-            household_consumption_kwh=r.household_consumption_kwh, total_consumption_kwh=r.total_consumption_kwh,
-        )
-        for r in recent_readings_raw
-    ]
+    recent_readings = READINGS.rows(db.exec(recent_readings_query))
 
     # Calculate costs
     cost_today = 0.0
@@ -135,36 +121,16 @@ def get_household_cockpit(household_id: int, db: SessionDep):
         cost_this_month += reading.grid_import_kwh * 0.32
         cost_this_month -= reading.grid_export_kwh * 0.082
 
-    devices_query = select(VhEnergyDevice).where(VhEnergyDevice.household_id == household_id)
-    devices_raw = db.exec(devices_query).all()
-
-    devices = [
-        VhEnergyDeviceOut(
-            id=d.id,  # type: ignore[invalid-argument-type]
-            household_id=d.household_id, device_type=d.device_type,
-            brand=d.brand, model=d.model, capacity_kw=d.capacity_kw,
-            installation_date=d.installation_date, last_maintenance_date=d.last_maintenance_date,
-            next_maintenance_date=d.next_maintenance_date, serial_number=d.serial_number,
-            specifications=d.specifications,
-        )
-        for d in devices_raw
-    ]
-
-    return VhHouseholdCockpitOut(
-        household=VhHouseholdOut(
-            id=household.id,  # type: ignore[invalid-argument-type]
-            neighborhood_id=household.neighborhood_id,
-            owner_name=household.owner_name, address=household.address,
-            optimization_mode=household.optimization_mode,
-            has_pv=household.has_pv, has_battery=household.has_battery,
-            has_ev=household.has_ev, has_heat_pump=household.has_heat_pump,
-            created_at=household.created_at, updated_at=household.updated_at,
-        ),
-        current_consumption_kw=round(current_consumption_kw, 2),
-        consumption_breakdown=consumption_breakdown,
-        energy_sources=energy_sources,
-        recent_readings=recent_readings,
-        cost_today_eur=round(cost_today, 2),
-        cost_this_month_eur=round(cost_this_month, 2),
-        devices=devices,
-    )
+    devices_query = DEVICES.select(VhEnergyDevice).where(VhEnergyDevice.household_id == household_id)
+    devices = DEVICES.rows(db.exec(devices_query))
+
+    return COCKPIT.response({
+        "household": HOUSEHOLD.from_entity(household),
+        "current_consumption_kw": round(current_consumption_kw, 2),
+        "consumption_breakdown": consumption_breakdown,
+        "energy_sources": energy_sources,
+        "recent_readings": recent_readings,
+        "cost_today_eur": round(cost_today, 2),
+        "cost_this_month_eur": round(cost_this_month, 2),
+        "devices": devices,
+    })
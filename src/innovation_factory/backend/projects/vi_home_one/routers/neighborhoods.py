@@ -4,6 +4,7 @@ from sqlmodel import select
 from datetime import datetime, timedelta, timezone
 
 from ....dependencies import SessionDep
+from ....response_cache import cached
 from ..models import (
     VhNeighborhood,
     VhHousehold,
@@ -19,6 +20,7 @@ router = APIRouter(prefix="/neighborhoods", tags=["vh-neighborhoods"])
 
 
 @router.get("", response_model=list[VhNeighborhoodOut], operation_id="vh_list_neighborhoods")
+@cached("vh_list_neighborhoods", tags=["vh:neighborhoods"])
 def list_neighborhoods(db: SessionDep):
     """List all neighborhoods."""
     statement = select(VhNeighborhood)
@@ -4,6 +4,7 @@ from sqlmodel import select
 from datetime import datetime, timedelta, timezone
 
 from ....dependencies import SessionDep
+from ....response_cache import cached
 from ..models import (
     VhHousehold,
     VhEnergyProvider,
@@ -17,6 +18,7 @@ router = APIRouter(prefix="/providers", tags=["vh-providers"])
 
 
 @router.get("", response_model=list[VhEnergyProviderOut], operation_id="vh_list_providers")
+@cached("vh_list_providers", tags=["vh:providers"])
 def list_providers(db: SessionDep):
     """List all energy providers."""
     statement = select(VhEnergyProvider)
@@ -1,9 +1,11 @@
 """API router for support tickets."""
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, Query, Response, UploadFile, File
 from sqlmodel import select
 from datetime import datetime, timezone
 
+from ....conditional import ConditionalDep
 from ....dependencies import SessionDep
+from ....pagination import CursorQuery, Keyset
 from ..models import (
     VhTicket,
     VhTicketStatus,
@@ -16,12 +18,18 @@ from ..models import (
 
 router = APIRouter(prefix="/tickets", tags=["vh-tickets"])
 
+TICKET_PAGES = Keyset(VhTicket.created_at, VhTicket.id)
+
 
 @router.get("", response_model=list[VhTicketOut], operation_id="vh_list_tickets")
 def list_tickets(
     db: SessionDep,
+    conditional: ConditionalDep,
+    response: Response,
     household_id: int | None = None,
     status: VhTicketStatus | None = None,
+    limit: int | None = Query(None, ge=1, le=1000, description="Page size; all tickets if omitted"),
+    cursor: CursorQuery = None,
 ):
     """List support tickets with optional filters."""
     query = select(VhTicket)
@@ -29,9 +37,10 @@ def list_tickets(
         query = query.where(VhTicket.household_id == household_id)
     if status:
         query = query.where(VhTicket.status == status)
-    query = query.order_by(VhTicket.created_at.desc())  # type: ignore[unresolved-attribute]
-    tickets = db.exec(query).all()
-    return list(tickets)
+    not_modified = conditional.check_query(db, query, VhTicket.updated_at)
+    if not_modified is not None:
+        return not_modified
+    return TICKET_PAGES.fetch(db, query, cursor, limit, response)
 
 
 @router.post("", response_model=VhTicketOut, operation_id="vh_create_ticket")
@@ -4,6 +4,7 @@ import random
 from datetime import datetime, date, timedelta
 from sqlmodel import Session, select
 
+from ...bulk import BulkLoader
 from .models import (
     VhNeighborhood,
     VhHousehold,
@@ -133,7 +134,13 @@ def _seed_energy_readings(session: Session, households: list[VhHousehold]):
         {"base_load": 0.5, "mult": 1.0},
         {"base_load": 0.5, "mult": 1.0},
     ]
-    count = 0
+    loader = BulkLoader(session)
+    readings = loader.table(VhEnergyReading, (
+        "household_id", "timestamp", "pv_generation_kwh", "battery_charge_kwh",
+        "battery_discharge_kwh", "battery_level_kwh", "grid_import_kwh", "grid_export_kwh",
+        "ev_consumption_kwh", "heat_pump_consumption_kwh", "household_consumption_kwh",
+        "total_consumption_kwh",
+    ))
     for idx, household in enumerate(households):
         cfg = configs[idx]
         devices = session.exec(select(VhEnergyDevice).where(VhEnergyDevice.household_id == household.id)).all()
@@ -174,16 +181,16 @@ def _seed_energy_readings(session: Session, households: list[VhHousehold]):
                 else:
                     grid_import = total_cons - pv_gen
 
-            session.add(VhEnergyReading(
-                household_id=household.id, timestamp=ts,
-                pv_generation_kwh=round(pv_gen, 3), battery_charge_kwh=round(bat_charge, 3),
-                battery_discharge_kwh=round(bat_discharge, 3), battery_level_kwh=round(bat_level, 3),
-                grid_import_kwh=round(grid_import, 3), grid_export_kwh=round(grid_export, 3),
-                ev_consumption_kwh=round(ev_cons, 3), heat_pump_consumption_kwh=round(hp_cons, 3),
-                household_consumption_kwh=round(hh_cons, 3), total_consumption_kwh=round(total_cons, 3),
+            readings.append((
+                household.id, ts,
+                round(pv_gen, 3), round(bat_charge, 3),
+                round(bat_discharge, 3), round(bat_level, 3),
+                round(grid_import, 3), round(grid_export, 3),
+                round(ev_cons, 3), round(hp_cons, 3),
+                round(hh_cons, 3), round(total_cons, 3),
             ))
-            count += 1
-    print(f"    Seeded {count} energy readings")
+    readings.flush()
+    print(f"    Seeded {readings.loaded} energy readings")
 
 
 def _seed_energy_providers(session: Session):
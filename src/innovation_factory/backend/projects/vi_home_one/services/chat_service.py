@@ -1,6 +1,8 @@
 """Chat service with RAG pipeline and guardrails for energy system support."""
+import asyncio
 from typing import AsyncGenerator
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models import (
     VhTicket,
@@ -34,18 +36,18 @@ GUARDRAILS (S4 Framework - Show Sources or Say Sorry):
 """
 
     async def stream_chat_response(
-        self, ticket_id: int, user_message: str, session: Session,
+        self, ticket_id: int, user_message: str, session: AsyncSession,
     ) -> AsyncGenerator[str, None]:
         """Stream chat response with RAG context retrieval."""
-        ticket = session.get(VhTicket, ticket_id)
+        ticket = await session.get(VhTicket, ticket_id)
         if not ticket:
             yield "Error: Ticket not found."
             return
 
-        household = session.get(VhHousehold, ticket.household_id)
+        household = await session.get(VhHousehold, ticket.household_id)
         device = None
         if ticket.device_id:
-            device = session.get(VhEnergyDevice, ticket.device_id)
+            device = await session.get(VhEnergyDevice, ticket.device_id)
 
         context_parts = []
 
@@ -53,7 +55,7 @@ GUARDRAILS (S4 Framework - Show Sources or Say Sorry):
             articles_query = select(VhKnowledgeArticle).where(
                 VhKnowledgeArticle.device_type == device.device_type
             ).limit(3)
-            articles = session.exec(articles_query).all()
+            articles = (await session.exec(articles_query)).all()
             for article in articles:
                 context_parts.append(f"### {article.title}\n{article.content}\n")
 
@@ -71,7 +73,7 @@ GUARDRAILS (S4 Framework - Show Sources or Say Sorry):
             latest_reading_query = select(VhEnergyReading).where(
                 VhEnergyReading.household_id == household.id
             ).order_by(VhEnergyReading.timestamp.desc()).limit(1)  # type: ignore[unresolved-attribute]
-            latest_reading = session.exec(latest_reading_query).first()
+            latest_reading = (await session.exec(latest_reading_query)).first()
             if latest_reading:
                 context_parts.append(f"""
 ### Current Energy Status
@@ -90,7 +92,6 @@ GUARDRAILS (S4 Framework - Show Sources or Say Sorry):
             if i > 0:
                 yield " "
             yield word
-            import asyncio
             await asyncio.sleep(0.05)
 
     def _generate_mock_response(self, user_message: str, context: str, device) -> str:
@@ -0,0 +1,118 @@
+"""Scale-factor synthetic data for vi-home-one.
+
+Scale factor 1: one neighborhood of 10,000 households with a year of hourly
+energy readings (~87.6M rows). The energy model mirrors ``seed.py``: PV follows
+a daily/seasonal curve with random cloud cover, the heat pump a seasonal load,
+and the battery is simulated hour by hour across all households at once.
+"""
+from datetime import date, datetime, timedelta
+
+from sqlmodel import Session
+
+from ...bulk import BulkLoader
+from ...synthetic import DEFAULT_SEED, ids_after, max_id, require_numpy, rng, rows, scaled
+from .models import (
+    DeviceType,
+    OptimizationMode,
+    VhEnergyDevice,
+    VhEnergyReading,
+    VhHousehold,
+    VhNeighborhood,
+)
+
+HOUSEHOLDS = 10_000
+DAYS = 365
+
+
+def generate(session: Session, scale: float, seed: int = DEFAULT_SEED, end: date | None = None) -> None:
+    np = require_numpy()
+    r = rng(seed, "vi-home-one")
+    n = scaled(HOUSEHOLDS, scale)
+    end = end or date.today()
+    start = datetime.combine(end - timedelta(days=DAYS), datetime.min.time())
+
+    print(f"  Generating vi-home-one synthetic data ({n} households x {DAYS} days)...")
+    neighborhood = VhNeighborhood(
+        name=f"Synthetic District (scale {scale:g})", location="Stuttgart, Germany", total_households=n,
+    )
+    session.add(neighborhood)
+    session.flush()
+
+    has_pv = r.random(n) < 0.7
+    has_battery = has_pv & (r.random(n) < 0.6)
+    has_ev = r.random(n) < 0.5
+    has_heat_pump = r.random(n) < 0.8
+    mode = np.array(list(OptimizationMode), dtype=object)[r.integers(0, 2, n)]
+    pv_cap = np.where(has_pv, r.choice([8.0, 10.0, 12.0], n), 0.0)
+    bat_cap = np.where(has_battery, r.choice([8.0, 10.0, 15.0], n), 0.0)
+    hp_cap = np.where(has_heat_pump, r.choice([8.0, 10.0], n), 0.0)
+    base_load = r.uniform(0.4, 0.7, n)
+    mult = r.choice([1.0, 1.0, 1.5], n)
+
+    with BulkLoader(session) as loader:
+        first = max_id(session, VhHousehold)
+        households = loader.table(VhHousehold, (
+            "neighborhood_id", "owner_name", "address", "optimization_mode",
+            "has_pv", "has_battery", "has_ev", "has_heat_pump",
+        ))
+        idx = np.arange(n)
+        households.extend(rows(
+            neighborhood.id,
+            [f"Household {i + 1}" for i in range(n)],
+            [f"Synthstr. {i + 1}, 70173 Stuttgart" for i in range(n)],
+            mode, has_pv, has_battery, has_ev, has_heat_pump,
+        ))
+        households.flush()
+        household_ids = np.array(ids_after(session, VhHousehold, first))
+
+        devices = loader.table(VhEnergyDevice, (
+            "household_id", "device_type", "brand", "model", "capacity_kw", "installation_date", "serial_number",
+        ))
+        for dtype, present, capacity, model in (
+            (DeviceType.heat_pump, has_heat_pump, hp_cap, "Vitocal 250-A"),
+            (DeviceType.pv_system, has_pv, pv_cap, "Vitovolt 300"),
+            (DeviceType.battery, has_battery, bat_cap, "VitoCharge VX3"),
+        ):
+            sel = idx[present]
+            devices.extend(rows(
+                household_ids[sel], dtype, "Viessmann", model, capacity[sel], date(2023, 1, 1),
+                [f"{dtype.value.upper()}-SYN-{i:06d}" for i in sel.tolist()],
+            ))
+
+        readings = loader.table(VhEnergyReading, (
+            "household_id", "timestamp", "pv_generation_kwh", "battery_charge_kwh",
+            "battery_discharge_kwh", "battery_level_kwh", "grid_import_kwh", "grid_export_kwh",
+            "ev_consumption_kwh", "heat_pump_consumption_kwh", "household_consumption_kwh",
+            "total_consumption_kwh",
+        ))
+        bat_level = bat_cap * 0.5
+        for hour_offset in range(DAYS * 24):
+            ts = start + timedelta(hours=hour_offset)
+            hour, doy = ts.hour, ts.timetuple().tm_yday
+            season = np.cos((doy - 172) * 2 * np.pi / 365)
+
+            if 6 <= hour < 20:
+                curve = np.cos(abs(hour - 12) * np.pi / 12) ** 2
+                pv = np.maximum(0.0, pv_cap * curve * (0.3 + 0.7 * season) * r.uniform(0.6, 1.0, n))
+            else:
+                pv = np.zeros(n)
+            hp_factor = 1.2 if (6 <= hour < 9 or 18 <= hour < 23) else (0.8 if hour < 6 else 1.0)
+            hp = np.where(has_heat_pump, 0.5 + hp_cap * 0.3 * (0.8 + 0.4 * season) * hp_factor, 0.0)
+            peak = 2.0 if 7 <= hour < 9 else (2.5 if 18 <= hour < 22 else (0.5 if hour < 6 else 1.0))
+            hh = base_load * peak * r.uniform(0.8, 1.2, n) * mult
+            charging = has_ev & (hour >= 18 or hour < 6) & (r.random(n) < 0.3)
+            ev = np.where(charging, r.uniform(3.0, 7.0, n), 0.0)
+            total = hp + hh + ev
+
+            surplus = np.maximum(pv - total, 0.0)
+            deficit = np.maximum(total - pv, 0.0)
+            charge = np.where(has_battery, np.minimum(surplus, np.minimum(bat_cap - bat_level, bat_cap * 0.2)), 0.0)
+            discharge = np.where(has_battery, np.minimum(deficit, np.minimum(bat_level, bat_cap * 0.2)), 0.0)
+            bat_level = bat_level + charge - discharge
+
+            readings.extend(rows(
+                household_ids, ts,
+                pv.round(3), charge.round(3), discharge.round(3), bat_level.round(3),
+                (deficit - discharge).round(3), (surplus - charge).round(3),
+                ev.round(3), hp.round(3), hh.round(3), total.round(3),
+            ))
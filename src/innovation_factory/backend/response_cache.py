@@ -0,0 +1,217 @@
+"""Declarative response caching for read-mostly endpoints.
+
+Routers opt in per endpoint::
+
+    @router.get("/regions", response_model=list[MacRegionOut], operation_id="mac_listRegions")
+    @cached("mac_listRegions", tags=["mac:regions"])
+    def list_regions(session: SessionDep): ...
+
+and the handlers that change the underlying rows declare what they invalidate::
+
+    @router.patch("/regions/{region_id}", ...)
+    @invalidates("mac:regions")
+    def update_region(...): ...
+
+Results are stored JSON-encoded in a named ``TTLCache`` (LRU-bounded, listed at
+``/api/debug/caches`` and exported to ``/api/metrics``), keyed by the endpoint's
+scalar arguments (path and query parameters; dependencies such as sessions are
+ignored) plus the current version of each of its tags. Invalidating a tag bumps
+its version, so later lookups miss without scanning the cache; superseded
+entries age out through LRU eviction and the TTL.
+
+Tag versions live in a ``TagVersions`` backend. The default ``file`` backend
+keeps them as marker-file modification times in ``RESPONSE_CACHE_DIR``, which
+all uvicorn workers on the host share: an invalidation in one worker is seen by
+the next lookup in every other worker. ``RESPONSE_CACHE_BACKEND=local`` keeps
+them in-process (single worker; other workers then only converge via the TTL).
+``RESPONSE_CACHE=0`` disables caching altogether.
+"""
+import functools
+import inspect
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Iterable, Protocol, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+
+from .._metadata import app_slug
+from .cache import TTLCache
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "1") != "0"
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "file")
+RESPONSE_CACHE_DIR = Path(
+    os.getenv("RESPONSE_CACHE_DIR", Path(tempfile.gettempdir()) / f"{app_slug}-response-cache")
+)
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAXSIZE = 256
+
+# Implicit tag of every cached endpoint, e.g. for bulk reseeding
+ALL = "*"
+
+F = TypeVar("F", bound=Callable)
+
+_MISS = object()
+
+_SCALARS = (str, int, float, bool, Enum, date, datetime, type(None))
+
+
+class TagVersions(Protocol):
+    def get(self, tags: tuple[str, ...]) -> tuple[int, ...]: ...
+
+    def bump(self, tags: Iterable[str]) -> None: ...
+
+
+class LocalTagVersions:
+    """Tag versions of this process only."""
+
+    def __init__(self) -> None:
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tags: tuple[str, ...]) -> tuple[int, ...]:
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    def bump(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+class FileTagVersions:
+    """Tag versions shared by all processes on the host: one marker file per tag.
+
+    A version is the marker's ``st_mtime_ns``, so reading it is one ``stat`` and
+    bumping it one ``utime``; no locking or file contents are involved.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, tag: str) -> Path:
+        return self.directory / (re.sub(r"[^A-Za-z0-9_.-]", "_", tag) + ".tag")
+
+    def _version(self, path: Path) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def get(self, tags: tuple[str, ...]) -> tuple[int, ...]:
+        return tuple(self._version(self._path(tag)) for tag in tags)
+
+    def bump(self, tags: Iterable[str]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for tag in tags:
+            path = self._path(tag)
+            # Strictly increasing even if the clock is coarse or steps back
+            version = max(time.time_ns(), self._version(path) + 1)
+            path.touch()
+            os.utime(path, ns=(version, version))
+
+
+def _default_backend() -> TagVersions:
+    if RESPONSE_CACHE_BACKEND == "local":
+        return LocalTagVersions()
+    if RESPONSE_CACHE_BACKEND == "file":
+        return FileTagVersions(RESPONSE_CACHE_DIR)
+    raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND '{RESPONSE_CACHE_BACKEND}' (use 'file' or 'local')")
+
+
+tag_versions: TagVersions = _default_backend()
+
+
+def invalidate(*tags: str) -> None:
+    """Make every cached response depending on any of ``tags`` stale, in all workers."""
+    tag_versions.bump(tags)
+
+
+def invalidate_all() -> None:
+    invalidate(ALL)
+
+
+def versions(tags: Iterable[str]) -> tuple[int, ...]:
+    """Current versions of ``tags`` (and of the implicit ``ALL`` tag)."""
+    return tag_versions.get((ALL, *tags))
+
+
+def _key_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> tuple:
+    bound = signature.bind_partial(*args, **kwargs)
+    return tuple(
+        (name, value) for name, value in sorted(bound.arguments.items()) if isinstance(value, _SCALARS)
+    )
+
+
+def cached(
+    name: str,
+    *,
+    tags: Iterable[str] = (),
+    ttl: float | None = None,
+    maxsize: int = RESPONSE_CACHE_MAXSIZE,
+) -> Callable[[F], F]:
+    """Cache an endpoint's JSON-encoded result; ``name`` is usually its operation_id."""
+    tags = tuple(tags)
+    cache: TTLCache[tuple, object] = TTLCache(
+        f"response:{name}", maxsize=maxsize, ttl=RESPONSE_CACHE_TTL_SECONDS if ttl is None else ttl
+    )
+
+    def decorator(func: F) -> F:
+        if not RESPONSE_CACHE_ENABLED:
+            return func
+        signature = inspect.signature(func)
+
+        def key(args: tuple, kwargs: dict) -> tuple:
+            # Versions are read before the handler runs: a write committed meanwhile bumps
+            # them, so a result computed from older rows is stored under a key nobody reads
+            return (_key_arguments(signature, args, kwargs), versions(tags))
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                k = key(args, kwargs)
+                value = cache.get(k, _MISS)
+                if value is _MISS:
+                    value = jsonable_encoder(await func(*args, **kwargs))
+                    cache.set(k, value)
+                return value
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(args, kwargs)
+            return cache.get_or_set(k, lambda: jsonable_encoder(func(*args, **kwargs)))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates(*tags: str) -> Callable[[F], F]:
+    """Invalidate ``tags`` after the decorated write handler returns successfully."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                invalidate(*tags)
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            invalidate(*tags)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
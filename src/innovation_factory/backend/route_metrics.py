@@ -0,0 +1,310 @@
+"""Per-route latency and throughput metrics, exported in Prometheus text format.
+
+``RouteMetricsMiddleware`` records request counts by status, in-flight gauges
+and latency histograms keyed by the route's ``operation_id``. Streaming
+responses (``text/event-stream``) are measured separately: time to first body
+chunk and total stream duration.
+
+Uvicorn runs several worker processes, each with its own registry. Every worker
+periodically writes its snapshot to ``METRICS_DIR`` (one JSON file per pid);
+``/api/metrics`` merges the files of all live workers, so a scrape that lands
+on any worker reports the whole app. The snapshot also carries the
+serving-endpoint call metrics of ``agent_metrics`` (``agent_*`` series,
+labelled by endpoint).
+"""
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .._metadata import api_prefix, app_slug
+from . import agent_metrics
+from .cache import caches
+from .logger import logger
+from .metrics import Histogram
+
+METRICS_DIR = Path(
+    os.getenv("METRICS_DIR", Path(tempfile.gettempdir()) / f"{app_slug}-metrics")
+)
+FLUSH_INTERVAL_SECONDS = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
+UNMATCHED = "unmatched"
+_ROUTE_CACHE_SIZE = 4096
+
+# Snapshot key -> Prometheus name and help of the agent_metrics histograms
+AGENT_HISTOGRAMS = {
+    "duration": ("agent_call_duration_seconds", "Duration of serving-endpoint calls, including queueing and retries"),
+    "upstream": ("agent_upstream_seconds", "Time from sending a serving-endpoint request until its body was read"),
+    "queue_wait": ("agent_queue_wait_seconds", "Time serving-endpoint calls waited for a concurrency slot"),
+    "first_text": ("agent_time_to_first_text_seconds", "Time until a streamed agent answer produced text"),
+    "response_bytes": ("agent_response_bytes", "Size of serving-endpoint response bodies"),
+    "text_chars": ("agent_text_chars", "Length of the answer text extracted from serving-endpoint responses"),
+}
+
+
+class RouteMetrics:
+    """In-process metric registry for one worker."""
+
+    def __init__(self) -> None:
+        self.requests: dict[tuple[str, str, str], int] = defaultdict(int)
+        self.in_flight: dict[str, int] = defaultdict(int)
+        self.latency: dict[str, Histogram] = defaultdict(Histogram)
+        self.sse_ttfb: dict[str, Histogram] = defaultdict(Histogram)
+        self.sse_duration: dict[str, Histogram] = defaultdict(Histogram)
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": [[op, method, status, n] for (op, method, status), n in self.requests.items()],
+            "in_flight": dict(self.in_flight),
+            "latency": {op: h.snapshot() for op, h in self.latency.items()},
+            "sse_ttfb": {op: h.snapshot() for op, h in self.sse_ttfb.items()},
+            "sse_duration": {op: h.snapshot() for op, h in self.sse_duration.items()},
+            "caches": {
+                name: {"hits": c.hits, "misses": c.misses, "evictions": c.evictions, "size": len(c)}
+                for name, c in caches.items()
+            },
+            "agents": agent_metrics.registry.snapshot(),
+        }
+
+
+registry = RouteMetrics()
+
+
+# ---------------------------------------------------------------------------
+# Cross-worker aggregation
+# ---------------------------------------------------------------------------
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def write_snapshot(metrics: RouteMetrics = registry, directory: Path = METRICS_DIR) -> None:
+    """Atomically publish this worker's snapshot."""
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / f"{os.getpid()}.json"
+    tmp = target.with_suffix(".tmp")
+    tmp.write_text(json.dumps(metrics.snapshot()))
+    os.replace(tmp, target)
+
+
+def read_snapshots(directory: Path = METRICS_DIR) -> list[dict]:
+    """Load the snapshots of all live workers, removing those of exited ones."""
+    snapshots = []
+    if not directory.exists():
+        return snapshots
+    for path in directory.glob("*.json"):
+        try:
+            pid = int(path.stem)
+        except ValueError:
+            continue
+        if pid != os.getpid() and not _pid_alive(pid):
+            path.unlink(missing_ok=True)
+            continue
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except (OSError, json.JSONDecodeError):
+            continue  # being replaced concurrently; picked up next scrape
+    return snapshots
+
+
+def _merge_histograms(target: dict, source: dict) -> None:
+    for op, hist in source.items():
+        merged = target.setdefault(op, {"buckets": {}, "count": 0, "sum": 0.0})
+        for le, n in hist["buckets"].items():
+            merged["buckets"][le] = merged["buckets"].get(le, 0) + n
+        merged["count"] += hist["count"]
+        merged["sum"] += hist["sum"]
+
+
+def merge_snapshots(snapshots: list[dict]) -> dict:
+    merged: dict = {
+        "workers": len(snapshots),
+        "requests": defaultdict(int),
+        "in_flight": defaultdict(int),
+        "latency": {},
+        "sse_ttfb": {},
+        "sse_duration": {},
+        "caches": defaultdict(lambda: defaultdict(int)),
+        "agents": {"calls": defaultdict(int), **{key: {} for key in AGENT_HISTOGRAMS}},
+    }
+    for snap in snapshots:
+        for op, method, status, n in snap["requests"]:
+            merged["requests"][(op, method, status)] += n
+        for op, n in snap["in_flight"].items():
+            merged["in_flight"][op] += n
+        for key in ("latency", "sse_ttfb", "sse_duration"):
+            _merge_histograms(merged[key], snap[key])
+        for name, counters in snap.get("caches", {}).items():
+            for counter, n in counters.items():
+                merged["caches"][name][counter] += n
+        agents = snap.get("agents", {})
+        for endpoint, kind, outcome, n in agents.get("calls", []):
+            merged["agents"]["calls"][(endpoint, kind, outcome)] += n
+        for key in AGENT_HISTOGRAMS:
+            _merge_histograms(merged["agents"][key], agents.get(key, {}))
+    return merged
+
+
+async def flush_periodically(interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+    """Background task publishing this worker's snapshot until cancelled."""
+    while True:
+        try:
+            await asyncio.to_thread(write_snapshot)
+        except Exception as e:
+            logger.warning(f"Writing metrics snapshot failed: {e}")
+        await asyncio.sleep(interval)
+
+
+# ---------------------------------------------------------------------------
+# Prometheus exposition
+# ---------------------------------------------------------------------------
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _render_histogram(lines: list[str], name: str, help_text: str, hists: dict, label: str = "operation") -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key in sorted(hists):
+        hist = hists[key]
+        for le, n in hist["buckets"].items():
+            lines.append(f"{name}_bucket{_labels(**{label: key}, le=le)} {n}")
+        lines.append(f"{name}_sum{_labels(**{label: key})} {hist['sum']:.6f}")
+        lines.append(f"{name}_count{_labels(**{label: key})} {hist['count']}")
+
+
+def render_prometheus(merged: dict) -> str:
+    lines = [
+        "# HELP app_workers Worker processes contributing to these metrics",
+        "# TYPE app_workers gauge",
+        f"app_workers {merged['workers']}",
+        "# HELP http_requests_total Completed API requests",
+        "# TYPE http_requests_total counter",
+    ]
+    for (op, method, status), n in sorted(merged["requests"].items()):
+        lines.append(f"http_requests_total{_labels(operation=op, method=method, status=status)} {n}")
+    lines.append("# HELP http_requests_in_flight API requests currently being handled")
+    lines.append("# TYPE http_requests_in_flight gauge")
+    for op, n in sorted(merged["in_flight"].items()):
+        lines.append(f"http_requests_in_flight{_labels(operation=op)} {n}")
+    _render_histogram(
+        lines, "http_request_duration_seconds",
+        "Latency of non-streaming API requests", merged["latency"],
+    )
+    _render_histogram(
+        lines, "sse_time_to_first_byte_seconds",
+        "Time until the first chunk of a streaming response", merged["sse_ttfb"],
+    )
+    _render_histogram(
+        lines, "sse_stream_duration_seconds",
+        "Total duration of streaming responses", merged["sse_duration"],
+    )
+    for counter, kind, help_text in (
+        ("hits", "counter", "Cache lookups served from the cache"),
+        ("misses", "counter", "Cache lookups that had to compute the value"),
+        ("evictions", "counter", "Entries dropped to stay within the size bound"),
+        ("size", "gauge", "Entries currently cached"),
+    ):
+        name = f"cache_{counter}_total" if kind == "counter" else "cache_entries"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for cache in sorted(merged["caches"]):
+            lines.append(f"{name}{_labels(cache=cache)} {merged['caches'][cache][counter]}")
+    lines.append("# HELP agent_calls_total Serving-endpoint calls by outcome (ok or error class)")
+    lines.append("# TYPE agent_calls_total counter")
+    for (endpoint, kind, outcome), n in sorted(merged["agents"]["calls"].items()):
+        lines.append(f"agent_calls_total{_labels(endpoint=endpoint, kind=kind, outcome=outcome)} {n}")
+    for key, (name, help_text) in AGENT_HISTOGRAMS.items():
+        _render_histogram(lines, name, help_text, merged["agents"][key], label="endpoint")
+    return "\n".join(lines) + "\n"
+
+
+def collect_prometheus() -> str:
+    """Publish this worker's snapshot and render the merge of all workers."""
+    write_snapshot()
+    return render_prometheus(merge_snapshots(read_snapshots()))
+
+
+# ---------------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------------
+
+class RouteMetricsMiddleware:
+    """Pure ASGI middleware recording per-operation_id request metrics for API paths."""
+
+    def __init__(self, app: ASGIApp, metrics: RouteMetrics = registry) -> None:
+        self.app = app
+        self.metrics = metrics
+        self._operations: dict[tuple[str, str], str] = {}
+
+    def _operation(self, scope: Scope) -> str:
+        # Resolve before the handler runs so the in-flight gauge is labelled correctly
+        key = (scope["method"], scope["path"])
+        operation = self._operations.get(key)
+        if operation is not None:
+            return operation
+        operation = UNMATCHED
+        for route in getattr(scope["app"].router, "routes", []):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                operation = (
+                    getattr(route, "operation_id", None) or getattr(route, "name", None) or UNMATCHED
+                )
+                break
+        if len(self._operations) >= _ROUTE_CACHE_SIZE:
+            self._operations.clear()
+        self._operations[key] = operation
+        return operation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(api_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        operation = self._operation(scope)
+        start = time.perf_counter()
+        status = "500"
+        streaming = False
+        first_byte: float | None = None
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, streaming, first_byte
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                for name, value in message.get("headers", []):
+                    if name == b"content-type" and value.startswith(b"text/event-stream"):
+                        streaming = True
+            elif message["type"] == "http.response.body" and first_byte is None and message.get("body"):
+                first_byte = time.perf_counter() - start
+            await send(message)
+
+        metrics.in_flight[operation] += 1
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.in_flight[operation] -= 1
+            metrics.requests[(operation, scope["method"], status)] += 1
+            if streaming:
+                metrics.sse_ttfb[operation].observe(first_byte if first_byte is not None else elapsed)
+                metrics.sse_duration[operation].observe(elapsed)
+            else:
+                metrics.latency[operation].observe(elapsed)
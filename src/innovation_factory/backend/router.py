@@ -1,26 +1,40 @@
-import threading
-from pathlib import Path
 from typing import Annotated
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.iam import User as UserOut
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from .._metadata import api_prefix
 from .dependencies import get_obo_ws
+from .docs import docs_index
+from .jobs import JobContext, job, jobs
 from .models import VersionOut
+from .projects.registry import enabled_projects
+from .route_metrics import collect_prometheus
 
 api = APIRouter(prefix=api_prefix)
 
-_seed_started = False
-
 
 @api.get("/version", response_model=VersionOut, operation_id="version")
 async def version():
     return VersionOut.from_metadata()
 
 
+@api.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    operation_id="metrics",
+    include_in_schema=False,
+)
+def metrics():
+    """Route metrics of all workers in Prometheus text format."""
+    return PlainTextResponse(
+        collect_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @api.get("/current-user", operation_id="currentUser")
 def me(obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)]):
     """Get current user information."""
@@ -37,24 +51,24 @@ def me(obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)]):
     }
 
 
-@api.post("/seed", operation_id="seedDatabase")
-def seed_database(request: Request):
-    """Trigger database seeding (local dev only)."""
-    global _seed_started
-    runtime = request.app.state.runtime
-    if not runtime._dev_db_port:
-        return {"status": "skipped", "message": "Seeding only available in local dev mode"}
-    if _seed_started:
-        return {"status": "already_started"}
-
-    _seed_started = True
+@job("seed", "Seed the demo data if the database is empty", exclusive=True, dev_only=True)
+def seed_job(ctx: JobContext) -> dict:
+    from .seed import check_and_seed_if_empty
+    return {"seeded": check_and_seed_if_empty(ctx.runtime, progress=ctx.progress)}
 
-    def _do_seed():
-        from .seed import check_and_seed_if_empty
-        check_and_seed_if_empty(runtime)
 
-    threading.Thread(target=_do_seed, daemon=True).start()
-    return {"status": "started"}
+@api.post("/seed", operation_id="seedDatabase")
+def seed_database(request: Request):
+    """Trigger database seeding as a background job (local dev only)."""
+    try:
+        record = jobs.submit(request.app.state.runtime, "seed")
+    except HTTPException as e:
+        if e.status_code == 403:
+            return {"status": "skipped", "message": "Seeding only available in local dev mode"}
+        if e.status_code != 409:
+            raise
+        return {"status": "already_started", "message": e.detail}
+    return {"status": "started", "job_id": record.id}
 
 
 class DocListOut(BaseModel):
@@ -67,7 +81,12 @@ class DocContentOut(BaseModel):
     content: str
 
 
-_DOCS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "docs" / "projects"
+class DocSearchHitOut(BaseModel):
+    slug: str
+    title: str
+    heading: str
+    snippet: str
+    score: float
 
 
 @api.get(
@@ -77,10 +96,7 @@ _DOCS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "docs" / "pro
 )
 async def list_project_docs():
     """List available project documentation slugs."""
-    if not _DOCS_DIR.exists():
-        return DocListOut(slugs=[])
-    slugs = sorted(p.stem for p in _DOCS_DIR.glob("*.md"))
-    return DocListOut(slugs=slugs)
+    return DocListOut(slugs=docs_index.slugs())
 
 
 @api.get(
@@ -90,32 +106,34 @@ async def list_project_docs():
 )
 async def get_project_doc(slug: str):
     """Get markdown content for a project's documentation."""
-    md_file = _DOCS_DIR / f"{slug}.md"
-    if not md_file.exists():
+    doc = docs_index.get(slug)
+    if doc is None:
         raise HTTPException(status_code=404, detail=f"Documentation not found for '{slug}'")
-    content = md_file.read_text(encoding="utf-8")
-    # Extract title from first markdown heading
-    title = slug
-    for line in content.splitlines():
-        if line.startswith("# "):
-            title = line[2:].strip()
-            break
-    return DocContentOut(slug=slug, title=title, content=content)
+    return DocContentOut(slug=doc.slug, title=doc.title, content=doc.content)
+
+
+@api.get(
+    "/docs/search",
+    response_model=list[DocSearchHitOut],
+    operation_id="searchProjectDocs",
+)
+async def search_project_docs(
+    q: str = Query(min_length=1, max_length=200),
+    slug: str | None = None,
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    """Full-text search over the project documentation, best matching sections first."""
+    return [DocSearchHitOut.model_validate(hit, from_attributes=True) for hit in docs_index.search(q, limit=limit, slug=slug)]
 
 
 # Platform routers
-from .routers import projects, ideas
+from .routers import projects, ideas, diagnostics, jobs as jobs_router
 
 api.include_router(projects.router)
 api.include_router(ideas.router)
+api.include_router(diagnostics.router)
+api.include_router(jobs_router.router)
 
 # Project-specific routers (mounted under /projects/{slug}/)
-from .projects.vi_home_one.router import router as vh_router
-from .projects.bsh_home_connect.router import router as bsh_router
-from .projects.mol_asm_cockpit.router import router as mac_router
-from .projects.adtech_intelligence.router import router as at_router
-
-api.include_router(vh_router, prefix="/projects/vi-home-one")
-api.include_router(bsh_router, prefix="/projects/bsh-home-connect")
-api.include_router(mac_router, prefix="/projects/mol-asm-cockpit")
-api.include_router(at_router, prefix="/projects/adtech-intelligence")
+for project in enabled_projects():
+    api.include_router(project.load_router(), prefix=project.prefix)
@@ -0,0 +1,61 @@
+from fastapi import APIRouter
+
+from .. import agent_metrics, loop_lag, sql_stats
+from ..cache import caches
+from ..dependencies import RuntimeDep
+from ..profiling import startup_profiler
+from ..services.agent_cache import agent_cache
+from ..services.serving_client import serving
+
+router = APIRouter(prefix="/debug", tags=["diagnostics"])
+
+
+@router.get("/pool", operation_id="poolStats")
+async def pool_stats(rt: RuntimeDep):
+    """Connection pool gauges, checkout wait histogram and timeouts for this worker."""
+    return {"config": rt._pool_options, "engines": rt.pool_stats()}
+
+
+@router.get("/credentials", operation_id="credentialStats")
+async def credential_stats(rt: RuntimeDep):
+    """Hits, refreshes, failures and expiry of this worker's cached Lakebase credential."""
+    return rt.credential_stats()
+
+
+@router.get("/sql", operation_id="sqlStats")
+async def sql_stats_table():
+    """Statement counts and DB time per operation over the recent requests of this worker."""
+    return {
+        "n_plus_one_threshold": sql_stats.N_PLUS_ONE_THRESHOLD,
+        "operations": sql_stats.table.summary(),
+    }
+
+
+@router.get("/loop", operation_id="loopLag")
+async def loop_lag_stats():
+    """How late this worker's event loop runs scheduled callbacks (blocking-call detector)."""
+    return loop_lag.monitor.stats()
+
+
+@router.get("/caches", operation_id="cacheStats")
+async def cache_stats():
+    """Size, hit rate and evictions of every named in-process cache of this worker."""
+    return {name: cache.stats() for name, cache in sorted(caches.items())}
+
+
+@router.get("/serving", operation_id="servingStats")
+async def serving_stats():
+    """Calls, retries, rejections and circuit state per serving endpoint, plus the agent answer cache."""
+    return {**serving.stats(), "cache": agent_cache.stats()}
+
+
+@router.get("/agents", operation_id="agentCallStats")
+async def agent_call_stats():
+    """Outcomes and latency quantiles per serving endpoint, plus samples of slow calls."""
+    return agent_metrics.registry.stats()
+
+
+@router.get("/startup", operation_id="startupProfile")
+async def startup_profile():
+    """Import and lifespan phase timings of this worker's startup."""
+    return startup_profiler.report()
@@ -1,13 +1,15 @@
 """Idea generation router — connects to the innovation-factory-generator Agent Bricks endpoint."""
 
+import asyncio
+import json
 import os
-from typing import List
+from typing import AsyncGenerator, AsyncIterator, List
 
-from databricks.sdk import WorkspaceClient
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
 
-from ..dependencies import SessionDep, RuntimeDep
+from ..dependencies import AsyncSessionDep, SessionDep, RuntimeDep
 from ..logger import logger
 from ..models import (
     IdeaSession,
@@ -18,10 +20,17 @@ from ..models import (
     IdeaMessageIn,
     IdeaMessageOut,
 )
+from ..runtime import Runtime
+from ..services.databricks_agents import stream_chat_completion
 
 router = APIRouter(prefix="/ideas", tags=["ideas"])
 
 IDEA_GENERATOR_ENDPOINT = os.getenv("IDEA_GENERATOR_ENDPOINT", "t2t-f9df30eb-endpoint")
+# Seconds until the first token, and for the whole generation, before falling back to the template
+IDEA_FIRST_TOKEN_TIMEOUT = float(os.getenv("IDEA_FIRST_TOKEN_TIMEOUT", "10"))
+IDEA_GENERATOR_TIMEOUT = float(os.getenv("IDEA_GENERATOR_TIMEOUT", "60"))
+
+_generations: set[asyncio.Task] = set()
 
 
 @router.post("/sessions", response_model=IdeaSessionOut, operation_id="createIdeaSession")
@@ -72,46 +81,123 @@ def get_idea_messages(session_id: int, db: SessionDep):
     return list(messages)
 
 
-def _query_idea_generator(ws: WorkspaceClient, company_name: str, description: str) -> str:
-    """Call the innovation-factory-generator serving endpoint.
-
-    Uses the standard chat messages format (``messages`` / ``choices``).
+async def _with_deadlines(
+    stream: AsyncGenerator[str, None], first_timeout: float, total_timeout: float
+) -> AsyncGenerator[str, None]:
+    """Items of ``stream``; ``TimeoutError`` if the first is later than ``first_timeout``
+    or the stream outlasts ``total_timeout`` seconds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + total_timeout
+    timeout = min(first_timeout, total_timeout)
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(anext(stream), timeout)
+            except StopAsyncIteration:
+                return
+            yield item
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                raise TimeoutError(f"generation took longer than {total_timeout:.0f}s")
+    finally:
+        await stream.aclose()
+
+
+async def _idea_events(rt: Runtime, company_name: str, description: str) -> AsyncIterator[tuple[str, str]]:
+    """Stream the generated prompt as ``("delta", text)`` events.
+
+    Uses the innovation-factory-generator serving endpoint (chat ``messages``
+    format). If it is not configured, fails, or misses its deadlines, the
+    template from ``_fallback_prompt`` is sent instead, preceded by a
+    ``("reset", reason)`` event if part of a generated prompt was already sent.
     """
     endpoint = IDEA_GENERATOR_ENDPOINT
+    streamed = False
     if not endpoint:
         logger.warning("IDEA_GENERATOR_ENDPOINT not set — falling back to template")
-        return _fallback_prompt(company_name, description)
-
-    prompt = (
-        f"Generate a detailed project idea for a company called \"{company_name}\". "
-        f"Description: {description}"
+        reason = "generator not configured"
+    else:
+        prompt = (
+            f"Generate a detailed project idea for a company called \"{company_name}\". "
+            f"Description: {description}"
+        )
+        try:
+            ws = await asyncio.to_thread(lambda: rt.ws)
+            stream = stream_chat_completion(
+                ws, endpoint, [{"role": "user", "content": prompt}], max_tokens=2000
+            )
+            async for delta in _with_deadlines(stream, IDEA_FIRST_TOKEN_TIMEOUT, IDEA_GENERATOR_TIMEOUT):
+                streamed = True
+                yield "delta", delta
+            if streamed:
+                return
+            reason = "empty response"
+        except Exception as e:
+            logger.error(f"Idea generator endpoint failed: {type(e).__name__}: {e}")
+            reason = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+    if streamed:
+        yield "reset", reason
+    yield "delta", _fallback_prompt(company_name, description)
+
+
+def _completion_message(prompt: str) -> str:
+    return f"Here's your generated project idea:\n\n---\n\n{prompt}\n\n---\n\nYou can copy this prompt and use it with a coding agent to build your application!"
+
+
+async def _generate_idea(
+    rt: Runtime, session_id: int, company_name: str, description: str, events: asyncio.Queue | None = None
+) -> str:
+    """Generate the prompt, forwarding events to ``events``, and persist the result.
+
+    Runs as its own task with its own database session, so a client that
+    disconnects mid-stream does not leave the session stuck in ``generating``.
+    """
+    prompt = ""
+    async for kind, text in _idea_events(rt, company_name, description):
+        prompt = "" if kind == "reset" else prompt + text
+        if events is not None:
+            events.put_nowait({"type": kind, ("reason" if kind == "reset" else "text"): text})
+
+    async with rt.get_async_session() as db:
+        session = await db.get(IdeaSession, session_id)
+        if session is not None:
+            session.generated_prompt = prompt
+            session.status = IdeaSessionStatus.completed
+            db.add(session)
+        db.add(IdeaMessage(session_id=session_id, role="assistant", content=_completion_message(prompt)))
+        await db.commit()
+    return prompt
+
+
+def _start_generation(rt: Runtime, session: IdeaSession, events: asyncio.Queue | None = None) -> asyncio.Task:
+    task = asyncio.create_task(
+        _generate_idea(rt, session.id, session.company_name or "", session.description or "", events)  # type: ignore[arg-type]
     )
+    # Keep a reference until done; the event loop only holds weak ones
+    _generations.add(task)
+    task.add_done_callback(_generations.discard)
+    return task
 
-    try:
-        result = ws.api_client.do(
-            "POST",
-            f"/serving-endpoints/{endpoint}/invocations",
-            body={"messages": [{"role": "user", "content": prompt}], "max_tokens": 2000},
-        )
-        # Standard chat completion response
-        choices = result.get("choices", [])  # type: ignore[union-attr]
-        if choices:
-            return choices[0].get("message", {}).get("content", "")  # type: ignore[union-attr,index]
-        return _fallback_prompt(company_name, description)
-    except Exception as e:
-        logger.error(f"Idea generator endpoint failed: {e}")
-        return _fallback_prompt(company_name, description)
+
+def _sse(event: dict) -> str:
+    return f"data: {json.dumps(event)}\n\n"
 
 
 @router.post("/sessions/{session_id}/chat", operation_id="sendIdeaMessage")
 async def send_idea_message(
     session_id: int,
     message: IdeaMessageIn,
-    db: SessionDep,
+    db: AsyncSessionDep,
     rt: RuntimeDep,
+    request: Request,
 ):
-    """Send a message in an idea session and get a response."""
-    session = db.get(IdeaSession, session_id)
+    """Send a message in an idea session and get a response.
+
+    With ``Accept: text/event-stream`` the generated prompt is streamed as
+    server-sent events (``delta``, ``reset``, then ``done`` with the final
+    state) instead of being returned in one JSON body.
+    """
+    session = await db.get(IdeaSession, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -122,14 +208,14 @@ async def send_idea_message(
         content=message.content,
     )
     db.add(user_msg)
-    db.commit()
+    await db.commit()
 
     # Process based on session state
     if session.status == IdeaSessionStatus.collecting_name:
         session.company_name = message.content.strip()
         session.status = IdeaSessionStatus.collecting_description
         db.add(session)
-        db.commit()
+        await db.commit()
 
         reply = IdeaMessage(
             session_id=session.id,
@@ -137,7 +223,7 @@ async def send_idea_message(
             content=f'Great! "{session.company_name}" sounds interesting. Now describe what you\'d like to build. What kind of application or service should it be?',
         )
         db.add(reply)
-        db.commit()
+        await db.commit()
 
         return {"message": reply.content, "status": session.status, "done": True}
 
@@ -145,32 +231,39 @@ async def send_idea_message(
         session.description = message.content.strip()
         session.status = IdeaSessionStatus.generating
         db.add(session)
-        db.commit()
-
-        # Call the Agent Bricks endpoint to generate the idea
-        prompt = _query_idea_generator(
-            rt.ws, session.company_name or "", session.description or ""
-        )
-
-        session.generated_prompt = prompt
-        session.status = IdeaSessionStatus.completed
-        db.add(session)
-        db.commit()
-
-        reply = IdeaMessage(
-            session_id=session.id,
-            role="assistant",
-            content=f"Here's your generated project idea:\n\n---\n\n{prompt}\n\n---\n\nYou can copy this prompt and use it with a coding agent to build your application!",
-        )
-        db.add(reply)
-        db.commit()
-
-        return {
-            "message": reply.content,
-            "status": session.status,
-            "generated_prompt": prompt,
-            "done": True,
-        }
+        await db.commit()
+
+        if "text/event-stream" not in request.headers.get("accept", ""):
+            # Shielded: a client that goes away does not cancel the generation
+            prompt = await asyncio.shield(_start_generation(rt, session))
+            return {
+                "message": _completion_message(prompt),
+                "status": IdeaSessionStatus.completed,
+                "generated_prompt": prompt,
+                "done": True,
+            }
+
+        events: asyncio.Queue = asyncio.Queue()
+        task = _start_generation(rt, session, events)
+
+        async def event_generator():
+            while not (task.done() and events.empty()):
+                getter = asyncio.ensure_future(events.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield _sse(getter.result())
+                else:
+                    getter.cancel()
+            prompt = task.result()
+            yield _sse({
+                "type": "done",
+                "message": _completion_message(prompt),
+                "status": IdeaSessionStatus.completed.value,
+                "generated_prompt": prompt,
+            })
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(event_generator(), media_type="text/event-stream")
 
     else:
         return {
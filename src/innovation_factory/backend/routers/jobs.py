@@ -0,0 +1,51 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlmodel import select
+
+from ..dependencies import RuntimeDep, SessionDep
+from ..jobs import jobs, kinds
+from ..models import Job, JobIn, JobKindOut, JobOut, JobStatus
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("", response_model=List[JobOut], operation_id="listJobs")
+def list_jobs(
+    db: SessionDep,
+    kind: Optional[str] = None,
+    status: Optional[JobStatus] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+):
+    """Recent background jobs of all workers, newest first."""
+    statement = select(Job)
+    if kind:
+        statement = statement.where(Job.kind == kind)
+    if status:
+        statement = statement.where(Job.status == status)
+    statement = statement.order_by(Job.id.desc()).limit(limit)  # type: ignore[unresolved-attribute]
+    return db.exec(statement).all()
+
+
+@router.get("/kinds", response_model=List[JobKindOut], operation_id="listJobKinds")
+def list_job_kinds():
+    """Job kinds that can be submitted."""
+    return [
+        JobKindOut(name=k.name, description=k.description, exclusive=k.exclusive, dev_only=k.dev_only)
+        for k in sorted(kinds.values(), key=lambda k: k.name)
+    ]
+
+
+@router.get("/{job_id}", response_model=JobOut, operation_id="getJob")
+def get_job(job_id: int, db: SessionDep):
+    """Status, progress and result of a background job."""
+    record = db.get(Job, job_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return record
+
+
+@router.post("", response_model=JobOut, status_code=202, operation_id="submitJob")
+def submit_job(body: JobIn, rt: RuntimeDep):
+    """Queue a background job; poll ``GET /jobs/{id}`` for its progress."""
+    return jobs.submit(rt, body.kind, body.params)
@@ -4,11 +4,13 @@ from sqlmodel import select
 
 from ..dependencies import SessionDep
 from ..models import Project, ProjectOut
+from ..response_cache import cached
 
 router = APIRouter(tags=["projects"])
 
 
 @router.get("/projects", response_model=List[ProjectOut], operation_id="listProjects")
+@cached("listProjects", tags=["projects"])
 def list_projects(db: SessionDep):
     """List all available projects for the gallery."""
     statement = select(Project).order_by(Project.created_at.asc())  # type: ignore[unresolved-attribute]
@@ -17,6 +19,7 @@ def list_projects(db: SessionDep):
 
 
 @router.get("/projects/{slug}", response_model=ProjectOut, operation_id="getProject")
+@cached("getProject", tags=["projects"])
 def get_project(slug: str, db: SessionDep):
     """Get a project by slug."""
     statement = select(Project).where(Project.slug == slug)
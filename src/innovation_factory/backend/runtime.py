@@ -1,14 +1,165 @@
 import os
+import threading
+import time
+from datetime import datetime, timezone
 from functools import cached_property
 from urllib.parse import quote
 
 from databricks.sdk import WorkspaceClient
-from sqlalchemy import Engine, Enum as SAEnum, create_engine, event
+from sqlalchemy import URL, Engine, Enum as SAEnum, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import NullPool, StaticPool
 from sqlmodel import SQLModel, Session, text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from .._metadata import app_slug
 from .config import AppConfig
+from .locks import process_lock
 from .logger import logger
+from .pool import MonitoredAsyncQueuePool, MonitoredQueuePool, PoolMonitor
+from .schema import schema_fingerprint, store_fingerprint, stored_fingerprint
+from .sql_stats import instrument_engine
+
+# Lakebase OAuth tokens are valid for one hour
+DEFAULT_CREDENTIAL_LIFETIME_SECONDS = 60 * 60
+
+
+class LakebaseCredentialManager:
+    """Caches the Lakebase OAuth credential and refreshes it before it expires.
+
+    Every new pooled connection needs a password. Instead of minting a token
+    per connection, the token is cached together with its expiry and shared by
+    all connections. A background thread refreshes it ``refresh_margin`` seconds
+    before expiry, so connection churn (pool recycle, pool growth, reconnects
+    after a Lakebase blip) is served from the cache. The control-plane call is
+    made outside the cache lock, so connections keep getting the current token
+    while a refresh is in flight.
+    """
+
+    def __init__(
+        self,
+        ws: WorkspaceClient,
+        endpoint_name: str,
+        refresh_margin: float = 15 * 60,
+        retry_interval: float = 30,
+    ) -> None:
+        self._ws = ws
+        self._endpoint_name = endpoint_name
+        self._refresh_margin = refresh_margin
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+        # Serializes control-plane calls; ``_lock`` only guards the cached token
+        self._fetch_lock = threading.Lock()
+        self._token: str | None = None
+        self._expires_at: float = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.hits = 0
+        self.refreshes = 0
+        self.failures = 0
+
+    def get_token(self) -> str:
+        """Return a valid token, fetching one synchronously only if none is cached."""
+        token = self._cached() or self._fetch(reuse_cached=True)
+        self._ensure_refresher()
+        return token
+
+    def refresh(self) -> str:
+        """Force a new token from the control plane."""
+        return self._fetch(reuse_cached=False)
+
+    def _cached(self) -> str | None:
+        with self._lock:
+            if self._token is not None and time.time() < self._expires_at:
+                self.hits += 1
+                return self._token
+        return None
+
+    def _fetch(self, reuse_cached: bool) -> str:
+        with self._fetch_lock:
+            # Concurrent misses wait here and reuse the token the first one fetched
+            if reuse_cached and (token := self._cached()) is not None:
+                return token
+            try:
+                credential = self._ws.postgres.generate_database_credential(
+                    endpoint=self._endpoint_name
+                )
+                if not credential.token:
+                    raise ValueError(f"Lakebase returned an empty credential for {self._endpoint_name}")
+            except Exception:
+                with self._lock:
+                    self.failures += 1
+                raise
+            with self._lock:
+                self._token = credential.token
+                self._expires_at = self._expiry_of(credential)
+                self.refreshes += 1
+            return credential.token
+
+    @staticmethod
+    def _expiry_of(credential) -> float:
+        expire_time = getattr(credential, "expire_time", None)
+        if expire_time is not None:
+            try:
+                return expire_time.ToDatetime(tzinfo=timezone.utc).timestamp()
+            except Exception:
+                pass
+        return time.time() + DEFAULT_CREDENTIAL_LIFETIME_SECONDS
+
+    def _ensure_refresher(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._refresh_loop, name="lakebase-credentials", daemon=True
+                )
+                self._thread.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            wait = self._expires_at - self._refresh_margin - time.time()
+            if wait > 0 and self._stop.wait(wait):
+                return
+            try:
+                self.refresh()
+                logger.info("Refreshed Lakebase credential ahead of expiry")
+            except Exception as e:
+                logger.warning(f"Lakebase credential refresh failed, retrying: {e}")
+                if self._stop.wait(self._retry_interval):
+                    return
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict:
+        expires_at = self._expires_at or None
+        return {
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "expires_at": (
+                datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat()
+                if expires_at
+                else None
+            ),
+        }
+
+
+# How long a SQLite connection waits for another connection's write lock
+SQLITE_BUSY_TIMEOUT_MS = 30_000
+
+
+def _configure_sqlite(engine: Engine, in_memory: bool) -> None:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if not in_memory:
+            # Readers don't block the writer (and vice versa) when concurrent requests share the file
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
 
 
 class Runtime:
@@ -74,22 +225,24 @@ class Runtime:
             "Set DATABASE_URL or PGHOST env vars, or run with 'apx dev start'."
         )
 
-    def _before_connect(self, dialect, conn_rec, cargs, cparams):
-        """Inject fresh Lakebase credential as database password before each connection.
-
-        Lakebase Autoscaling uses OAuth tokens that expire after one hour.
-        This callback calls ws.postgres.generate_database_credential() to get
-        a fresh token for every new connection, matching the recommended pattern
-        from the Lakebase Autoscaling documentation.
-        """
+    @cached_property
+    def credentials(self) -> LakebaseCredentialManager:
         endpoint_name = self.config.db.endpoint_name
         if not endpoint_name:
             raise ValueError(
                 "ENDPOINT_NAME must be set for Lakebase Autoscaling credential rotation. "
                 "Get it from the Lakebase Connect modal or: databricks postgres list-endpoints"
             )
-        credential = self.ws.postgres.generate_database_credential(endpoint=endpoint_name)
-        cparams["password"] = credential.token
+        return LakebaseCredentialManager(self.ws, endpoint_name)
+
+    def _before_connect(self, dialect, conn_rec, cargs, cparams):
+        """Inject the Lakebase credential as database password before each connection.
+
+        Lakebase Autoscaling uses OAuth tokens that expire after one hour.
+        The token is served from the credential manager's cache, which refreshes
+        it in the background well before expiry.
+        """
+        cparams["password"] = self.credentials.get_token()
 
     @cached_property
     def _is_local_dev(self) -> bool:
@@ -105,23 +258,67 @@ class Runtime:
         """Whether we need Databricks SDK token-based auth for the DB connection."""
         return not self._is_local_dev
 
+    @cached_property
+    def _pool_options(self) -> dict:
+        db = self.config.db
+        return {
+            "pool_size": db.pool_size,
+            "max_overflow": db.max_overflow,
+            "pool_timeout": db.pool_timeout,
+            "pool_pre_ping": db.pool_pre_ping,
+            "pool_recycle": db.pool_recycle,
+        }
+
+    @cached_property
+    def pool_monitors(self) -> dict[str, PoolMonitor]:
+        return {"sync": PoolMonitor(), "async": PoolMonitor()}
+
+    def pool_stats(self) -> dict:
+        """Gauges, checkout wait histogram and timeouts for each engine created so far."""
+        stats = {}
+        if "engine" in self.__dict__:
+            stats["sync"] = self.pool_monitors["sync"].snapshot(self.engine.pool)
+        if "async_engine" in self.__dict__:
+            stats["async"] = self.pool_monitors["async"].snapshot(self.async_engine.pool)
+        return stats
+
+    def credential_stats(self) -> dict | None:
+        """Lakebase credential cache counters, or ``None`` if no credential was needed yet."""
+        if "credentials" not in self.__dict__:
+            return None
+        return self.credentials.stats()
+
+    @cached_property
+    def _sqlite_url(self) -> tuple[URL, bool]:
+        """SQLite URL for both engines, and whether the database lives in memory.
+
+        A plain in-memory URL (``sqlite://``) would give the sync and the async
+        engine a private database each, so it becomes a named shared-cache
+        in-memory database that every connection of this runtime opens.
+        """
+        url = make_url(self.engine_url)
+        if url.database not in (None, "", ":memory:"):
+            return url, False
+        return url.set(
+            database=f"file:{app_slug}-{id(self):x}",
+            query={"mode": "memory", "cache": "shared", "uri": "true"},
+        ), True
+
     @cached_property
     def engine(self) -> Engine:
         # SQLite: for testing (DATABASE_URL=sqlite://)
         if self.engine_url.startswith("sqlite"):
+            # One shared connection is only needed to keep an in-memory database alive;
+            # file databases get a regular pool so concurrent requests don't share it
+            url, in_memory = self._sqlite_url
             engine = create_engine(
-                self.engine_url,
+                url,
                 connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
+                poolclass=StaticPool if in_memory else None,
             )
 
-            @event.listens_for(engine, "connect")
-            def set_sqlite_pragma(dbapi_conn, connection_record):
-                cursor = dbapi_conn.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.close()
-
-            return engine
+            _configure_sqlite(engine, in_memory)
+            return instrument_engine(engine)
 
         # In PGlite dev mode: no SSL, no password callback, single connection (PGlite limit)
         # Otherwise (Lakebase Autoscaling): require SSL and use Databricks OAuth token callback
@@ -133,16 +330,62 @@ class Runtime:
         else:
             engine = create_engine(
                 self.engine_url,
-                pool_recycle=45 * 60,
                 connect_args={"sslmode": "require"},
-                pool_size=4,
+                poolclass=MonitoredQueuePool,
+                **self._pool_options,
             )
+            engine.pool.monitor = self.pool_monitors["sync"]  # type: ignore[attr-defined]
             event.listens_for(engine, "do_connect")(self._before_connect)
+        return instrument_engine(engine)
+
+    @cached_property
+    def async_engine(self) -> AsyncEngine:
+        """Async counterpart of ``engine`` for ``async def`` routes (psycopg async / aiosqlite)."""
+        url = make_url(self.engine_url)
+
+        # SQLite: for testing (DATABASE_URL=sqlite://), requires aiosqlite
+        if url.get_backend_name() == "sqlite":
+            url, in_memory = self._sqlite_url
+            url = url.set(drivername="sqlite+aiosqlite")
+            engine = create_async_engine(
+                url, poolclass=StaticPool if in_memory else None
+            )
+
+            _configure_sqlite(engine.sync_engine, in_memory)
+            instrument_engine(engine.sync_engine)
+            return engine
+
+        # postgresql+psycopg resolves to the psycopg async dialect
+        if self._is_local_dev:
+            engine = create_async_engine(url, poolclass=NullPool)
+        else:
+            engine = create_async_engine(
+                url,
+                connect_args={"sslmode": "require"},
+                poolclass=MonitoredAsyncQueuePool,
+                **self._pool_options,
+            )
+            engine.pool.monitor = self.pool_monitors["async"]  # type: ignore[attr-defined]
+            event.listens_for(engine.sync_engine, "do_connect")(self._before_connect)
+        instrument_engine(engine.sync_engine)
         return engine
 
     def get_session(self) -> Session:
         return Session(self.engine)
 
+    def get_async_session(self) -> AsyncSession:
+        # Attributes stay loaded after commit; lazy refreshes would need implicit async IO
+        return AsyncSession(self.async_engine, expire_on_commit=False)
+
+    async def close(self) -> None:
+        """Stop background credential refresh and release pooled connections."""
+        if "credentials" in self.__dict__:
+            self.credentials.stop()
+        if "async_engine" in self.__dict__:
+            await self.async_engine.dispose()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
+
     def validate_db(self) -> None:
         if self._is_local_dev:
             logger.info(
@@ -165,17 +408,34 @@ class Runtime:
 
         logger.info("Database connection validated successfully")
 
-    def initialize_models(self) -> None:
+    def initialize_models(self) -> bool:
+        """Create missing tables unless the stored schema fingerprint is current.
+
+        Only one worker runs DDL: it holds the ``schema`` process lock, re-checks
+        the fingerprint, runs ``create_all`` and stores the new fingerprint.
+        Returns whether DDL was executed by this worker.
+        """
         logger.info("Initializing database models")
+        from .projects.registry import load_all_models
+
+        load_all_models()
         # Disable native PostgreSQL ENUMs - Lakebase doesn't allow CREATE TYPE
         for table in SQLModel.metadata.tables.values():
             for column in table.columns:
                 if isinstance(column.type, SAEnum):
                     column.type.native_enum = False
-        try:
+
+        fingerprint = schema_fingerprint(SQLModel.metadata)
+        if stored_fingerprint(self.engine) == fingerprint:
+            logger.info(f"Schema fingerprint {fingerprint[:12]} is current - skipping DDL")
+            return False
+
+        with process_lock(self.engine, "schema"):
+            # Another worker may have finished the DDL while we waited
+            if stored_fingerprint(self.engine) == fingerprint:
+                logger.info("Schema was initialized by another worker")
+                return False
             SQLModel.metadata.create_all(self.engine)
-        except Exception as e:
-            # With multiple uvicorn workers, another worker may have already created
-            # the tables. If so, just log a warning and continue.
-            logger.warning(f"create_all raised (likely concurrent worker race): {e}")
-        logger.info("Database models initialized successfully")
+            store_fingerprint(self.engine, fingerprint)
+        logger.info(f"Database models initialized successfully (fingerprint {fingerprint[:12]})")
+        return True
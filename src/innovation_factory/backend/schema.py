@@ -0,0 +1,85 @@
+"""Schema fingerprinting so workers can skip DDL when the database is current.
+
+The fingerprint is a hash over the table definitions in ``SQLModel.metadata``
+(columns, types, nullability, keys, indexes). The worker that runs
+``create_all`` stores it in ``if_schema_meta``; workers that find a matching
+fingerprint skip DDL and reflection entirely.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Engine,
+    MetaData,
+    String,
+    Table,
+    exc,
+    select,
+)
+from sqlalchemy.dialects import postgresql
+
+# Kept outside SQLModel.metadata so it is not part of its own fingerprint
+_meta = MetaData()
+schema_meta = Table(
+    "if_schema_meta",
+    _meta,
+    Column("key", String(64), primary_key=True),
+    Column("value", String(128), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+FINGERPRINT_KEY = "schema_fingerprint"
+
+_dialect = postgresql.dialect()
+
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    tables = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        tables.append({
+            "name": table.name,
+            "columns": [
+                [
+                    c.name,
+                    c.type.compile(dialect=_dialect),
+                    c.nullable,
+                    c.primary_key,
+                    sorted(fk.target_fullname for fk in c.foreign_keys),
+                ]
+                for c in table.columns
+            ],
+            "indexes": sorted(
+                [i.name or "", i.unique, [c.name for c in i.columns]] for i in table.indexes
+            ),
+        })
+    canonical = json.dumps(tables, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def stored_fingerprint(engine: Engine) -> str | None:
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                select(schema_meta.c.value).where(schema_meta.c.key == FINGERPRINT_KEY)
+            ).scalar()
+    except exc.DBAPIError:
+        # Table does not exist yet (first boot)
+        return None
+
+
+def store_fingerprint(engine: Engine, fingerprint: str) -> None:
+    _meta.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        updated = conn.execute(
+            schema_meta.update()
+            .where(schema_meta.c.key == FINGERPRINT_KEY)
+            .values(value=fingerprint, updated_at=now)
+        ).rowcount
+        if not updated:
+            conn.execute(
+                schema_meta.insert().values(key=FINGERPRINT_KEY, value=fingerprint, updated_at=now)
+            )
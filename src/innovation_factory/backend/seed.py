@@ -1,43 +1,96 @@
 """Master seed script for the innovation-factory platform."""
+import os
+from datetime import date
+from typing import Callable
+
 from sqlmodel import Session, select
 from .runtime import Runtime
+from .bulk import bulk_options
+from .locks import process_lock
 from .models import Project
-from .projects.vi_home_one.seed import seed_vh_data
-from .projects.bsh_home_connect.seed import seed_bsh_data
-from .projects.mol_asm_cockpit.seed import seed_mac_data
-from .projects.adtech_intelligence.seed import seed_at_data
+from .projects.registry import ProjectSpec, enabled_projects
+from .response_cache import invalidate_all
 from .logger import logger
 
+# Optional scale factor for benchmark-sized data on top of the demo seed (see synthetic.py)
+SEED_SCALE = float(os.getenv("SEED_SCALE", "0"))
+SEED_RANDOM_SEED = int(os.getenv("SEED_RANDOM_SEED", "42"))
+
 
-def check_and_seed_if_empty(runtime: Runtime):
-    """Check if database is empty and seed if needed."""
+def _has_data(runtime: Runtime) -> bool:
     with runtime.get_session() as session:
         try:
-            project = session.exec(select(Project)).first()
-            if project:
-                logger.info("Database already contains data - skipping seed")
-                return
+            return session.exec(select(Project)).first() is not None
         except Exception as e:
             logger.error(f"Error checking database: {e}")
+            return False
+
+
+def check_and_seed_if_empty(runtime: Runtime, progress: Callable[[float, str], None] | None = None) -> bool:
+    """Check if database is empty and seed if needed; returns whether this call seeded.
+
+    Seeding runs under the ``seed`` process lock; workers that had to wait for
+    it re-check and find the data another worker just committed.
+    """
+    if _has_data(runtime):
+        logger.info("Database already contains data - skipping seed")
+        return False
+
+    with process_lock(runtime.engine, "seed"), runtime.get_session() as session:
+        if _has_data(runtime):
+            logger.info("Database was seeded by another worker - skipping seed")
+            return False
 
         logger.info("Database is empty - running seed script")
         print("\nStarting database seeding for innovation-factory...")
 
-        _seed_projects(session)
-        seed_vh_data(session)
-        seed_bsh_data(session)
-        seed_mac_data(session)
-        seed_at_data(session)
-
-        # Ensure everything is committed (sub-seed functions may return early
-        # if their data already exists, skipping their own commit calls)
-        session.commit()
+        # PGlite (WASM) crashes on large INSERT statements and has no COPY
+        options = {"batch_size": 30, "use_copy": False} if runtime._is_local_dev else {}
+        with bulk_options(**options):
+            seed_database(session, scale=SEED_SCALE or None, seed=SEED_RANDOM_SEED, progress=progress)
 
         print("\nDatabase seeding completed successfully!\n")
+    return True
+
+
+def seed_database(
+    session: Session,
+    projects: list[ProjectSpec] | None = None,
+    scale: float | None = None,
+    seed: int = SEED_RANDOM_SEED,
+    end: date | None = None,
+    progress: Callable[[float, str], None] | None = None,
+):
+    """Seed the platform and project demo data, optionally scaled up.
+
+    With a ``scale`` factor each project's synthetic generator appends
+    production-sized data (NumPy required) after its demo seed; ``seed`` and
+    ``end`` (last generated day, default today) make the output reproducible.
+    ``progress`` is called with the completed fraction before each step.
+    """
+    projects = enabled_projects() if projects is None else projects
+    steps = len(projects) * (2 if scale else 1)
+    report = progress or (lambda fraction, message: None)
+    _seed_projects(session, projects)
+    # Seed modules carry the bulk demo data; they are only imported here
+    for i, project in enumerate(projects):
+        report(i / steps, f"Seeding {project.slug}")
+        project.load_seeder()(session)
+    if scale:
+        for i, project in enumerate(projects, start=len(projects)):
+            report(i / steps, f"Generating scale-factor data for {project.slug}")
+            project.load_generator()(session, scale=scale, seed=seed, end=end)
+            session.commit()
+
+    # Ensure everything is committed (sub-seed functions may return early
+    # if their data already exists, skipping their own commit calls)
+    session.commit()
+    # Catalog responses cached before (or during) seeding are now stale
+    invalidate_all()
 
 
-def _seed_projects(session: Session):
-    """Seed the projects table."""
+def _seed_projects(session: Session, projects: list[ProjectSpec]):
+    """Seed the projects table with the catalog entries of ``projects``."""
     projects_data = [
         {
             "slug": "vi-home-one",
@@ -73,7 +126,10 @@ def _seed_projects(session: Session):
         },
     ]
 
+    slugs = {project.slug for project in projects}
     for project_data in projects_data:
+        if project_data["slug"] not in slugs:
+            continue
         existing = session.exec(
             select(Project).where(Project.slug == project_data["slug"])
         ).first()
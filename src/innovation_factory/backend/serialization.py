@@ -0,0 +1,184 @@
+"""Fast JSON responses for rows read straight from the database.
+
+By default FastAPI turns a handler's result into JSON in four steps: ORM
+objects are dumped to dicts, the dicts are validated against ``response_model``
+into fresh ``*Out`` instances, those are serialized back to Python primitives,
+and the standard library encodes the result. For large lists of rows from our
+own tables the validation only re-checks what the column types already
+guarantee, and much of the remaining time goes into attribute access on ORM
+instances.
+
+A ``RowSerializer`` is built once per ``*Out`` model, at import time. It selects
+the model's fields as plain columns (no ORM instances, no identity map), builds
+each row as a dict without validation (trusted construction, so only for data
+read from the database) and encodes the lot with a prebuilt pydantic-core
+``TypeAdapter`` straight to JSON bytes. Nested ``*Out`` models are mapped to
+``TypedDict``s, so a composed payload is serialized in a single call::
+
+    FUEL_SALES = RowSerializer(MacFuelSaleOut)
+
+    @router.get("/fuel", response_model=list[MacFuelSaleOut], operation_id="mac_listFuelSales")
+    def list_fuel_sales(session: SessionDep, ...):
+        q = FUEL_SALES.select(MacFuelSale).where(...)
+        return FUEL_SALES.list_response(session.exec(q))
+
+``response_model`` stays on the route for the OpenAPI schema and the generated
+client; FastAPI skips its own validation and encoding when a handler returns a
+``Response``.
+"""
+import functools
+import types
+from typing import Any, Iterable, Mapping, Union, cast, get_args, get_origin
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import inspect
+from sqlalchemy.engine import Result, TupleResult
+from sqlmodel.sql.expression import Select
+from typing_extensions import TypedDict
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@functools.cache
+def row_type(model: type[BaseModel]) -> type:
+    """A ``TypedDict`` with the fields of ``model``; nested models are mapped as well."""
+    if not model.__pydantic_complete__:
+        # Resolve forward references such as ``List["VhEnergyDeviceOut"]``
+        model.model_rebuild()
+    return TypedDict(
+        f"{model.__name__}Row",
+        {name: _row_annotation(field.annotation) for name, field in model.model_fields.items()},
+    )
+
+
+def _row_annotation(annotation: Any) -> Any:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return row_type(annotation)
+    args = get_args(annotation)
+    mapped = tuple(_row_annotation(arg) for arg in args)
+    if mapped == args:
+        return annotation
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        return Union[mapped]
+    return origin[mapped]
+
+
+@functools.cache
+def _column_names(entity: type) -> frozenset[str]:
+    return frozenset(inspect(entity).column_attrs.keys())
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return next(filter(None, map(_nested_model, get_args(annotation))), None)
+
+
+# Label separator of related columns, e.g. ``advertiser__name``
+NESTED_SEP = "__"
+
+
+class RowSerializer:
+    """Trusted construction and prebuilt JSON encoding for one ``*Out`` model."""
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.fields = tuple(model.model_fields)
+        self.defaults = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in model.model_fields.items()
+            if not field.is_required()
+        }
+        row = row_type(model)
+        self._one = TypeAdapter(row)
+        self._many = TypeAdapter(types.GenericAlias(list, (row,)))
+
+    def columns(self, entity: type, exclude: Iterable[str] = ()) -> list:
+        """The columns of ``entity`` that are fields; the other fields take their defaults."""
+        columns = _column_names(entity)
+        names = [name for name in self.fields if name in columns and name not in exclude]
+        missing = [name for name in self.fields if name not in names and name not in self.defaults]
+        if missing:
+            raise ValueError(f"{entity.__name__} has no columns for required {self.model.__name__} fields {missing}")
+        return [getattr(entity, name) for name in names]
+
+    def select(self, entity: type, **related: type) -> Select[Any]:
+        """``SELECT`` of the model's fields from ``entity``.
+
+        A SQLModel ``Select`` (tuple rows, like ``sqlmodel.select`` of several
+        columns), so it goes through ``session.exec`` like any other query.
+
+        ``related`` maps a nested model field to the entity it is read from, e.g.
+        ``select(AtCampaign, advertiser=AtAdvertiser)``; the caller joins that
+        entity in. Without a matching row (outer join) the field is ``None``.
+        """
+        columns = self.columns(entity, exclude=related)
+        for name, related_entity in related.items():
+            nested = _nested_model(self.model.model_fields[name].annotation)
+            if nested is None:
+                raise ValueError(f"{self.model.__name__}.{name} is not a nested model")
+            columns += [
+                column.label(f"{name}{NESTED_SEP}{column.key}")
+                for column in serializer(nested).columns(related_entity)
+            ]
+        return Select(*columns)
+
+    def rows(self, result: Result | TupleResult) -> list[dict]:
+        """Rows of a ``select()`` result as dicts, without validation."""
+        # ``Session.exec`` is typed as returning a ``TupleResult``; it is a ``Result`` at runtime
+        keys = tuple(cast(Result, result).keys())
+        defaults = {name: value for name, value in self.defaults.items() if name not in keys}
+        if not any(NESTED_SEP in key for key in keys):
+            if defaults:
+                return [{**dict(zip(keys, row)), **defaults} for row in result]
+            return [dict(zip(keys, row)) for row in result]
+
+        flat = [(i, key) for i, key in enumerate(keys) if NESTED_SEP not in key]
+        nested: dict[str, list[tuple[int, str]]] = {}
+        for i, key in enumerate(keys):
+            if NESTED_SEP in key:
+                name, column = key.split(NESTED_SEP, 1)
+                nested.setdefault(name, []).append((i, column))
+                defaults.pop(name, None)
+        items = []
+        for row in result:
+            item = {key: row[i] for i, key in flat}
+            for name, columns in nested.items():
+                values = {column: row[i] for i, column in columns}
+                item[name] = values if any(v is not None for v in values.values()) else None
+            item.update(defaults)
+            items.append(item)
+        return items
+
+    def from_entity(self, entity: Any) -> dict:
+        """An already loaded ORM instance as a dict, without validation or lazy loads."""
+        columns = _column_names(type(entity))
+        return {
+            name: getattr(entity, name) if name in columns else self.defaults.get(name)
+            for name in self.fields
+        }
+
+    def json(self, value: Mapping) -> bytes:
+        return self._one.dump_json(value)
+
+    def list_json(self, values: Iterable[Mapping]) -> bytes:
+        return self._many.dump_json(list(values))
+
+    def response(self, value: Mapping) -> Response:
+        return Response(self.json(value), media_type=JSON_MEDIA_TYPE)
+
+    def list_response(
+        self, rows: Result | TupleResult | list[dict], headers: Mapping[str, str] | None = None
+    ) -> Response:
+        """A JSON array response of a ``select()`` result or of already built rows."""
+        if not isinstance(rows, list):
+            rows = self.rows(rows)
+        return Response(self.list_json(rows), media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+@functools.cache
+def serializer(model: type[BaseModel]) -> RowSerializer:
+    """The shared ``RowSerializer`` of ``model``."""
+    return RowSerializer(model)
@@ -0,0 +1,217 @@
+"""Answer cache for Agent Bricks (MAS/KA) invocations.
+
+Users keep asking the same canned questions ("Which 10 stations have the
+biggest margin upside this weekend?"), and each one used to be a full agent
+invocation. ``query_agent_endpoint`` and ``stream_agent_endpoint`` look answers
+up here first, keyed on the endpoint plus the normalized conversation window
+they send (role and content of every message, lower-cased, whitespace
+collapsed, trailing punctuation dropped). A follow-up in a longer conversation
+therefore only hits if the whole window matches.
+
+Answers live in the ``agent:answers`` ``TTLCache`` (``AGENT_CACHE_TTL`` seconds,
+at most ``AGENT_CACHE_MAXSIZE`` entries, hit rate at ``/api/debug/caches`` and
+``/api/metrics``). Failed and empty answers are not cached. Callers opt out per
+request with ``cache=False``; the chat routes pass that for requests sent with
+``Cache-Control: no-cache``. ``AGENT_CACHE=0`` disables the cache.
+
+With ``AGENT_CACHE_SINGLE_FLIGHT`` (default on) identical questions asked while
+the first is still being answered share its upstream call: the call runs as
+its own task, every asker follows its output (streams chunk by chunk), and a
+client that disconnects neither cancels it nor keeps the answer out of the
+cache.
+"""
+import asyncio
+import hashlib
+import json
+import os
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+from fastapi import Request
+
+from ..cache import TTLCache
+
+AGENT_CACHE_ENABLED = os.getenv("AGENT_CACHE", "1") != "0"
+AGENT_CACHE_TTL_SECONDS = float(os.getenv("AGENT_CACHE_TTL", "900"))
+AGENT_CACHE_MAXSIZE = int(os.getenv("AGENT_CACHE_MAXSIZE", "512"))
+AGENT_CACHE_SINGLE_FLIGHT = os.getenv("AGENT_CACHE_SINGLE_FLIGHT", "1") != "0"
+
+_MISS = object()
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split()).rstrip(" ?!.")
+
+
+def cache_key(kind: str, endpoint_name: str, messages: list[dict]) -> str:
+    """Digest of the endpoint and normalized conversation window."""
+    window = [[m["role"], normalize(str(m["content"]))] for m in messages]
+    return hashlib.sha256(json.dumps([kind, endpoint_name, window]).encode()).hexdigest()
+
+
+def cache_allowed(request: Request) -> bool:
+    """Whether the client allows a cached answer (no ``Cache-Control: no-cache``)."""
+    return "no-cache" not in request.headers.get("cache-control", "").lower()
+
+
+class _Flight:
+    """One upstream call shared by every asker of the same question."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.chunks: list[Any] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.changed = asyncio.Condition()
+        self.task: asyncio.Task | None = None
+
+    async def publish(self, chunk: Any) -> None:
+        async with self.changed:
+            self.chunks.append(chunk)
+            self.changed.notify_all()
+
+    async def finish(self, error: BaseException | None = None) -> None:
+        async with self.changed:
+            self.done, self.error = True, error
+            self.changed.notify_all()
+
+    async def follow(self) -> AsyncGenerator[Any, None]:
+        """Everything published so far, then new chunks until the call ends."""
+        seen = 0
+        while True:
+            async with self.changed:
+                await self.changed.wait_for(lambda: len(self.chunks) > seen or self.done)
+                chunks, done, error = self.chunks[seen:], self.done, self.error
+            for chunk in chunks:
+                yield chunk
+            seen += len(chunks)
+            if done and seen == len(self.chunks):
+                if error is not None:
+                    raise error
+                return
+
+
+class AgentCache:
+    """TTL/LRU answer cache with optional single-flight coalescing."""
+
+    def __init__(
+        self,
+        ttl: float = AGENT_CACHE_TTL_SECONDS,
+        maxsize: int = AGENT_CACHE_MAXSIZE,
+        single_flight: bool = AGENT_CACHE_SINGLE_FLIGHT,
+        enabled: bool = AGENT_CACHE_ENABLED,
+        name: str = "agent:answers",
+    ) -> None:
+        self.answers: TTLCache[str, Any] = TTLCache(name, maxsize=maxsize, ttl=ttl)
+        self.single_flight = single_flight
+        self.enabled = enabled
+        self._flights: dict[str, _Flight] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.coalesced = 0
+        self.bypassed = 0
+
+    def _join_or_start(self, key: str, produce: Callable[[_Flight], Awaitable[Any]]) -> _Flight:
+        flight = self._flights.get(key)
+        if flight is not None and flight.loop is asyncio.get_running_loop() and not flight.done:
+            self.coalesced += 1
+            return flight
+        flight = self._flights[key] = _Flight()
+
+        async def run() -> None:
+            try:
+                result = await produce(flight)
+            except BaseException as e:
+                await flight.finish(e)
+                if not isinstance(e, Exception):
+                    raise
+            else:
+                if result:
+                    self.answers.set(key, result)
+                await flight.finish()
+            finally:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+        flight.task = asyncio.create_task(run())
+        # Keep a reference until done; the event loop only holds weak ones
+        self._tasks.add(flight.task)
+        flight.task.add_done_callback(self._tasks.discard)
+        return flight
+
+    async def invoke(
+        self, endpoint_name: str, messages: list[dict], call: Callable[[], Awaitable[dict]], cache: bool = True
+    ) -> dict:
+        """Cached result of ``call()``, the endpoint's raw response for ``messages``."""
+        if not (self.enabled and cache):
+            self.bypassed += 1
+            return await call()
+        key = cache_key("invoke", endpoint_name, messages)
+        value = self.answers.get(key, _MISS)
+        if value is not _MISS:
+            return value
+        if not self.single_flight:
+            value = await call()
+            if value:
+                self.answers.set(key, value)
+            return value
+
+        async def produce(flight: _Flight) -> dict:
+            result = await call()
+            await flight.publish(result)
+            return result
+
+        async for result in self._join_or_start(key, produce).follow():
+            return result
+        raise RuntimeError(f"Agent call to '{endpoint_name}' ended without a response")
+
+    async def stream(
+        self,
+        endpoint_name: str,
+        messages: list[dict],
+        produce: Callable[[], AsyncGenerator[str, None]],
+        cache: bool = True,
+    ) -> AsyncGenerator[str, None]:
+        """Text chunks of ``produce()``; a cached answer is sent as one chunk."""
+        if not (self.enabled and cache):
+            self.bypassed += 1
+            async with aclosing(produce()) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
+        key = cache_key("stream", endpoint_name, messages)
+        text = self.answers.get(key, _MISS)
+        if text is not _MISS:
+            yield text
+            return
+        if not self.single_flight:
+            parts = []
+            async with aclosing(produce()) as chunks:
+                async for chunk in chunks:
+                    parts.append(chunk)
+                    yield chunk
+            if text := "".join(parts):
+                self.answers.set(key, text)
+            return
+
+        async def fill(flight: _Flight) -> str:
+            chunks = []
+            async for chunk in produce():
+                chunks.append(chunk)
+                await flight.publish(chunk)
+            return "".join(chunks)
+
+        async for chunk in self._join_or_start(key, fill).follow():
+            yield chunk
+
+    def stats(self) -> dict:
+        return {
+            **self.answers.stats(),
+            "enabled": self.enabled,
+            "single_flight": self.single_flight,
+            "in_flight": len(self._flights),
+            "coalesced": self.coalesced,
+            "bypassed": self.bypassed,
+        }
+
+
+agent_cache = AgentCache()
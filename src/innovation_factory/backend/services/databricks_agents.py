@@ -1,37 +1,56 @@
 """Shared utilities for Databricks Agent Bricks (MAS/KA) serving endpoints."""
 
+import json
+from contextlib import aclosing
+from typing import AsyncGenerator
+
 from databricks.sdk import WorkspaceClient
 
+from ..agent_metrics import agent_call, shape
 from ..logger import logger
+from .agent_cache import agent_cache
+from .serving_client import serving
 
 
-def query_agent_endpoint(
+async def query_agent_endpoint(
     ws: WorkspaceClient,
     endpoint_name: str,
     messages: list[dict],
+    cache: bool = True,
 ) -> dict:
     """Call a Databricks Agent Bricks serving endpoint using the input/output format.
 
     Agent Bricks endpoints require the 'input' field (not 'messages').
-    Uses ws.api_client.do() for proper OAuth handling.
+    Goes through the pooled ``serving`` client (connection reuse, per-endpoint
+    concurrency limit, retries on 429/5xx, circuit breaker); authentication
+    headers come from the SDK config. Answers are cached in ``agent_cache``;
+    upstream calls are recorded as ``agent_metrics`` spans.
 
     Args:
         ws: WorkspaceClient instance
         endpoint_name: Name of the serving endpoint
         messages: List of message dicts with 'role' and 'content' keys
+        cache: Whether a cached answer may be used (and this one cached)
 
     Returns:
         Raw response dict from the endpoint
+
+    Raises:
+        httpx.HTTPError: the endpoint failed after retries
+        ServingUnavailableError: the endpoint's circuit is open or it is saturated
     """
     payload = [{"role": m["role"], "content": m["content"]} for m in messages]
     logger.info(f"Querying serving endpoint '{endpoint_name}' with {len(payload)} messages")
-    result = ws.api_client.do(
-        "POST",
-        f"/serving-endpoints/{endpoint_name}/invocations",
-        body={"input": payload},
-    )
-    logger.info(f"Received response from '{endpoint_name}'")
-    return result  # type: ignore[invalid-return-type]
+
+    async def call() -> dict:
+        body = {"input": payload}
+        with agent_call(endpoint_name, "invoke", body) as span:
+            result = await serving.invoke(ws, endpoint_name, body, span=span)
+            span.response_shape = shape(result)
+            span.text_chars = len(extract_agent_text(result))
+            return result
+
+    return await agent_cache.invoke(endpoint_name, payload, call, cache=cache)
 
 
 def extract_agent_text(response: dict | list | str) -> str:
@@ -100,3 +119,156 @@ def extract_agent_text(response: dict | list | str) -> str:
         return "\n".join(texts) if texts else str(response)
 
     return str(response)
+
+
+def _is_answer(item: dict) -> bool:
+    """Whether an output item carries text for the user (as in ``extract_agent_text``)."""
+    item_type = item.get("type", "")
+    if item_type in ("function_call", "function_call_output"):
+        return False
+    return item_type != "message" or item.get("role") == "assistant"
+
+
+class AgentStreamParser:
+    """Incremental counterpart of ``extract_agent_text`` for streamed responses.
+
+    ``feed`` takes one decoded server-sent event and returns the text it adds
+    (often ``""``). Understands:
+    - Responses API events: ``response.output_text.delta`` deltas, and
+      ``response.output_item.done`` items whose text was not streamed
+    - chat completion chunks: ``{"choices": [{"delta": {"content": "..."}}]}``
+    - agent chunks: ``{"delta": {"content": "..."}}``
+    - complete ``output``/``choices`` bodies (endpoints that do not stream)
+
+    Text of ``function_call``/``function_call_output`` items and of
+    non-assistant messages is skipped as it arrives; separate output items are
+    joined with a newline, like ``extract_agent_text`` does.
+    """
+
+    def __init__(self) -> None:
+        self._skipped: set[str] = set()
+        self._streamed: set[str] = set()
+        self._deltas_since_done = False
+        self._last_item: str | None = None
+        self._emitted = False
+
+    def _text(self, item_id: str | None, text: str) -> str:
+        if not text:
+            return ""
+        if self._emitted and item_id != self._last_item:
+            text = "\n" + text
+        self._last_item, self._emitted = item_id, True
+        return text
+
+    def feed(self, event: dict) -> str:
+        event_type = event.get("type", "")
+        if event_type == "error":
+            raise RuntimeError(event.get("message") or json.dumps(event))
+        if event_type == "response.output_item.added":
+            item = event.get("item") or {}
+            if not _is_answer(item) and item.get("id"):
+                self._skipped.add(item["id"])
+            return ""
+        if event_type == "response.output_text.delta":
+            item_id = event.get("item_id")
+            if item_id in self._skipped:
+                return ""
+            if item_id:
+                self._streamed.add(item_id)
+            self._deltas_since_done = True
+            return self._text(item_id, event.get("delta") or "")
+        if event_type == "response.output_item.done":
+            item = event.get("item") or {}
+            item_id = item.get("id")
+            # Without an id, an item that followed deltas is the one they streamed
+            streamed = item_id in self._streamed if item_id else self._deltas_since_done
+            self._deltas_since_done = False
+            if streamed or not _is_answer(item):
+                return ""
+            return self._text(item_id, extract_agent_text([item]))
+        if event_type.startswith("response."):
+            return ""
+
+        choices = event.get("choices")
+        if choices and isinstance(choices, list):
+            delta = choices[0].get("delta") or choices[0].get("message") or {}
+            return self._text(None, delta.get("content") or "")
+        delta = event.get("delta")
+        if isinstance(delta, dict):
+            return self._text(None, delta.get("content") or "")
+        if "output" in event:
+            return self._text(None, extract_agent_text(event))
+        return ""
+
+
+async def _stream_text(ws: WorkspaceClient, endpoint_name: str, body: dict) -> AsyncGenerator[str, None]:
+    """Invoke with ``"stream": true`` and yield the parsed text as it arrives."""
+    parser = AgentStreamParser()
+    body = {**body, "stream": True}
+    with agent_call(endpoint_name, "stream", body) as span:
+        async with serving.stream(ws, endpoint_name, body, span=span) as response:
+            if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                # The endpoint answered in one piece
+                event = json.loads(await response.aread())
+                span.events["json"] += 1
+                text = parser.feed(event)
+                span.add_text(text)
+                if text:
+                    yield text
+                return
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                span.events[event.get("type") or event.get("object") or "data"] += 1
+                text = parser.feed(event)
+                span.add_text(text)
+                if text:
+                    yield text
+
+
+async def stream_agent_endpoint(
+    ws: WorkspaceClient,
+    endpoint_name: str,
+    messages: list[dict],
+    cache: bool = True,
+) -> AsyncGenerator[str, None]:
+    """Stream an Agent Bricks answer, yielding text as the agent produces it.
+
+    Streaming counterpart of ``query_agent_endpoint`` + ``extract_agent_text``:
+    the first text arrives about one round trip after the agent starts
+    answering instead of after the whole generation. Errors before the first
+    byte are retried by the pooled ``serving`` client; later ones propagate.
+    A cached answer (``agent_cache``, unless ``cache=False``) arrives as one chunk.
+    """
+    payload = [{"role": m["role"], "content": m["content"]} for m in messages]
+    logger.info(f"Streaming from serving endpoint '{endpoint_name}' with {len(payload)} messages")
+    stream = agent_cache.stream(
+        endpoint_name, payload, lambda: _stream_text(ws, endpoint_name, {"input": payload}), cache=cache
+    )
+    # aclosing: a consumer that stops early frees the endpoint slot right away
+    async with aclosing(stream) as stream:
+        async for text in stream:
+            yield text
+
+
+async def stream_chat_completion(
+    ws: WorkspaceClient,
+    endpoint_name: str,
+    messages: list[dict],
+    **params,
+) -> AsyncGenerator[str, None]:
+    """Stream a chat completion from a serving endpoint, yielding text deltas.
+
+    Sends ``"stream": true`` with the ``messages`` format and reads the
+    server-sent ``choices[].delta`` chunks as they arrive, without blocking the
+    event loop. The call goes through the pooled ``serving`` client, which
+    retries until the first byte; HTTP errors raise ``httpx.HTTPStatusError``.
+    """
+    logger.info(f"Streaming from serving endpoint '{endpoint_name}'")
+    async with aclosing(_stream_text(ws, endpoint_name, {"messages": messages, **params})) as stream:
+        async for text in stream:
+            yield text
@@ -0,0 +1,331 @@
+"""Pooled async client for Databricks model serving endpoints.
+
+Every Agent Bricks (MAS/KA) and chat completion call goes through ``serving``,
+a single ``httpx.AsyncClient`` per event loop, so connections to the workspace
+are reused instead of being opened per call by the SDK's synchronous client::
+
+    response = await serving.invoke(ws, "mas-endpoint", {"input": messages})
+
+    async with serving.stream(ws, "generator", {"messages": messages, "stream": True}) as response:
+        async for line in response.aiter_lines():
+            ...
+
+Per endpoint, at most ``SERVING_CONCURRENCY`` calls run at once; further
+callers wait up to ``SERVING_QUEUE_TIMEOUT`` seconds for a slot. Responses
+with status 429 or 5xx and transport errors are retried ``SERVING_RETRIES``
+times with full-jitter exponential backoff (honouring ``Retry-After``). After
+``SERVING_BREAKER_THRESHOLD`` consecutive failures the endpoint's circuit
+opens and calls fail fast with ``ServingUnavailableError`` for
+``SERVING_BREAKER_COOLDOWN`` seconds; then a single trial call decides
+whether it closes again. Streams are only retried before the first byte.
+
+Callers pass an ``agent_metrics.AgentCallSpan`` as ``span`` to have attempts,
+queue wait, upstream time, status and response bytes recorded on it.
+
+For local runs and tests, ``serving_stub`` stands in for the endpoints.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+import httpx
+from databricks.sdk import WorkspaceClient
+
+from ..agent_metrics import AgentCallSpan
+from ..logger import logger
+
+SERVING_CONCURRENCY = int(os.getenv("SERVING_CONCURRENCY", "8"))
+SERVING_QUEUE_TIMEOUT = float(os.getenv("SERVING_QUEUE_TIMEOUT", "30"))
+SERVING_TIMEOUT = float(os.getenv("SERVING_TIMEOUT", "120"))
+SERVING_RETRIES = int(os.getenv("SERVING_RETRIES", "2"))
+SERVING_BREAKER_THRESHOLD = int(os.getenv("SERVING_BREAKER_THRESHOLD", "5"))
+SERVING_BREAKER_COOLDOWN = float(os.getenv("SERVING_BREAKER_COOLDOWN", "30"))
+SERVING_MAX_CONNECTIONS = int(os.getenv("SERVING_MAX_CONNECTIONS", "64"))
+
+CONNECT_TIMEOUT = 10.0
+# Backoff before retry n is uniform in [0, min(BACKOFF_CAP, BACKOFF_BASE * 2**n)]
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class ServingUnavailableError(Exception):
+    """The endpoint's circuit is open, or no call slot freed up in time."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed → open → half-open → closed)."""
+
+    def __init__(self, threshold: int = SERVING_BREAKER_THRESHOLD, cooldown: float = SERVING_BREAKER_COOLDOWN) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go out; in half-open state only one trial at a time."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def success(self) -> None:
+        self.failures, self.opened_at, self._trial = 0, None, False
+
+    def failure(self) -> None:
+        self.failures += 1
+        self._trial = False
+        if self.failures >= self.threshold or self.opened_at is not None:
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a trial call that neither succeeded nor failed (e.g. cancelled)."""
+        self._trial = False
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+class _Endpoint:
+    def __init__(self, concurrency: int, breaker: CircuitBreaker) -> None:
+        self.slots = asyncio.Semaphore(concurrency)
+        self.breaker = breaker
+        self.stats = EndpointStats()
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return min(float(response.headers["retry-after"]), BACKOFF_CAP)
+    except (KeyError, ValueError):
+        return None
+
+
+class ServingClient:
+    """Pooled serving-endpoint client with per-endpoint limits, retries and breakers."""
+
+    def __init__(
+        self,
+        concurrency: int = SERVING_CONCURRENCY,
+        retries: int = SERVING_RETRIES,
+        timeout: float = SERVING_TIMEOUT,
+        queue_timeout: float = SERVING_QUEUE_TIMEOUT,
+        breaker_threshold: int = SERVING_BREAKER_THRESHOLD,
+        breaker_cooldown: float = SERVING_BREAKER_COOLDOWN,
+        max_connections: int = SERVING_MAX_CONNECTIONS,
+    ) -> None:
+        self.concurrency = concurrency
+        self.retries = retries
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        # Clients and semaphores belong to one event loop; breakers span loops
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._http: httpx.AsyncClient | None = None
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is loop:
+                return
+            stale, stale_loop = self._http, self._loop
+            self._loop = loop
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(CONNECT_TIMEOUT, read=self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+            )
+            self._endpoints = {}
+        if stale is not None:
+            self._retire(stale, stale_loop)
+
+    @staticmethod
+    def _retire(http: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Close a client of another event loop on that loop; it cannot be closed once the loop stopped."""
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(http.aclose(), loop)
+            return
+        logger.warning("Dropping the serving HTTP client of a stopped event loop without closing its connections")
+
+    def _endpoint(self, name: str) -> _Endpoint:
+        self._bind()
+        with self._lock:
+            endpoint = self._endpoints.get(name)
+            if endpoint is None:
+                breaker = self._breakers.setdefault(
+                    name, CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+                )
+                endpoint = self._endpoints[name] = _Endpoint(self.concurrency, breaker)
+            return endpoint
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        self._bind()
+        assert self._http is not None
+        return self._http
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+    @asynccontextmanager
+    async def _call(
+        self, ws: WorkspaceClient, name: str, body: dict, stream: bool, span: AgentCallSpan | None = None
+    ) -> AsyncIterator[httpx.Response]:
+        """One call with retries; yields a successful response whose body may still be unread."""
+        endpoint = self._endpoint(name)
+        stats = endpoint.stats
+        headers = await asyncio.to_thread(ws.config.authenticate)
+        url = f"{ws.config.host}/serving-endpoints/{name}/invocations"
+        attempt = 0
+        while True:
+            if not endpoint.breaker.allow():
+                stats.rejected += 1
+                raise ServingUnavailableError(f"Serving endpoint '{name}' is unavailable (circuit open)")
+            if span is not None:
+                span.attempts += 1
+            queued = time.perf_counter()
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    await endpoint.slots.acquire()
+            except TimeoutError:
+                if span is not None:
+                    span.queue_wait += time.perf_counter() - queued
+                endpoint.breaker.release()
+                stats.rejected += 1
+                raise ServingUnavailableError(
+                    f"Serving endpoint '{name}' is saturated ({self.concurrency} calls in flight)"
+                ) from None
+            sent = time.perf_counter()
+            if span is not None:
+                span.queue_wait += sent - queued
+            stats.requests += 1
+            stats.in_flight += 1
+            stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+            delay = None
+            try:
+                request = self.http.build_request("POST", url, json=body, headers=headers)
+                try:
+                    response = await self.http.send(request, stream=stream)
+                except httpx.TransportError as e:
+                    if span is not None:
+                        span.upstream += time.perf_counter() - sent
+                    endpoint.breaker.failure()
+                    stats.failures += 1
+                    if attempt >= self.retries:
+                        raise
+                    logger.warning(f"Serving endpoint '{name}' failed ({type(e).__name__}), retrying")
+                else:
+                    stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+                    try:
+                        if response.status_code >= 500:
+                            endpoint.breaker.failure()
+                            stats.failures += 1
+                        if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                            logger.warning(f"Serving endpoint '{name}' returned {response.status_code}, retrying")
+                            delay = _retry_after(response)
+                        elif response.is_error:
+                            await response.aread()
+                            if response.status_code < 500:
+                                endpoint.breaker.release()
+                            response.raise_for_status()
+                        else:
+                            try:
+                                yield response
+                            except httpx.TransportError:
+                                endpoint.breaker.failure()
+                                stats.failures += 1
+                                raise
+                            endpoint.breaker.success()
+                            return
+                    finally:
+                        await response.aclose()
+                        if span is not None:
+                            span.upstream += time.perf_counter() - sent
+                            span.status = response.status_code
+                            span.response_bytes += response.num_bytes_downloaded
+            except BaseException:
+                endpoint.breaker.release()
+                raise
+            finally:
+                stats.in_flight -= 1
+                endpoint.slots.release()
+            endpoint.breaker.release()
+            attempt += 1
+            stats.retries += 1
+            await asyncio.sleep(self._backoff(attempt - 1) if delay is None else delay)
+
+    async def invoke(
+        self, ws: WorkspaceClient, endpoint_name: str, body: dict, span: AgentCallSpan | None = None
+    ) -> dict:
+        """POST ``body`` to the endpoint's invocations route and return the JSON response."""
+        async with self._call(ws, endpoint_name, body, stream=False, span=span) as response:
+            return response.json()
+
+    @asynccontextmanager
+    async def stream(
+        self, ws: WorkspaceClient, endpoint_name: str, body: dict, span: AgentCallSpan | None = None
+    ) -> AsyncIterator[httpx.Response]:
+        """POST ``body`` and yield the response before its (server-sent event) body is read."""
+        async with self._call(ws, endpoint_name, body, stream=True, span=span) as response:
+            yield response
+
+    async def aclose(self) -> None:
+        with self._lock:
+            http, self._http, self._loop = self._http, None, None
+        if http is not None:
+            await http.aclose()
+
+    def stats(self) -> dict:
+        with self._lock:
+            endpoints = dict(self._endpoints)
+            breakers = dict(self._breakers)
+        return {
+            "config": {
+                "concurrency": self.concurrency,
+                "retries": self.retries,
+                "timeout_seconds": self.timeout,
+                "queue_timeout_seconds": self.queue_timeout,
+                "breaker_threshold": self.breaker_threshold,
+                "breaker_cooldown_seconds": self.breaker_cooldown,
+                "max_connections": self.max_connections,
+            },
+            "endpoints": {
+                name: {
+                    **(vars(endpoints[name].stats) if name in endpoints else {}),
+                    "circuit": breaker.state,
+                    "consecutive_failures": breaker.failures,
+                }
+                for name, breaker in sorted(breakers.items())
+            },
+        }
+
+
+serving = ServingClient()
@@ -0,0 +1,212 @@
+"""Local stand-in for Databricks model serving (``/serving-endpoints/{name}/invocations``).
+
+Lets the chat routes run, and be load-tested, without live Agent Bricks
+endpoints. Start it and point the Databricks SDK at it:
+
+    uv run python -m innovation_factory.backend.serving_stub --port 8765 --profile agent
+    DATABRICKS_HOST=http://127.0.0.1:8765 DATABRICKS_TOKEN=stub uv run apx dev start
+
+Responses follow the shape of the request: ``input`` requests (Agent Bricks)
+get the ``output`` format, ``messages`` requests get ``choices``. With
+``"stream": true`` in the body the answer is sent token by token as
+server-sent events (``response.output_text.delta`` events, or chat completion
+chunks with ``choices[].delta``), ending with ``data: [DONE]``; otherwise the
+full body is returned once the profile's generation time has passed.
+"""
+import argparse
+import asyncio
+import json
+import random
+from dataclasses import dataclass, replace
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+WORDS = (
+    "the station energy device ticket customer campaign placement forecast anomaly "
+    "battery margin inventory technician warranty schedule household report trend"
+).split()
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Timing of one simulated generation.
+
+    ``first_token_ms`` is the time before the first token (retrieval, tool calls,
+    prefill); every further token takes ``token_ms``. Both vary uniformly by
+    ``±jitter`` (relative). ``error_rate`` is the share of requests answered
+    with a 503; additionally the first ``fail_first`` requests to each endpoint
+    are, which makes retries deterministic to test.
+    """
+
+    first_token_ms: float = 300.0
+    token_ms: float = 20.0
+    tokens: int = 120
+    jitter: float = 0.2
+    error_rate: float = 0.0
+    fail_first: int = 0
+
+
+PROFILES: dict[str, LatencyProfile] = {
+    "instant": LatencyProfile(first_token_ms=0, token_ms=0, tokens=20, jitter=0),
+    "fast": LatencyProfile(first_token_ms=100, token_ms=5, tokens=60),
+    # Typical Knowledge Assistant / Multi-Agent Supervisor answer
+    "agent": LatencyProfile(first_token_ms=1500, token_ms=25, tokens=250),
+    "slow": LatencyProfile(first_token_ms=8000, token_ms=60, tokens=400),
+}
+
+
+class StubStats:
+    """Request counters of the stub, served at ``/stub/stats``."""
+
+    def __init__(self) -> None:
+        self.requests: dict[str, int] = {}
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def start(self, endpoint: str) -> None:
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finish(self) -> None:
+        self.in_flight -= 1
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+        }
+
+
+def _last_user_text(body: dict) -> str:
+    for message in reversed(body.get("input") or body.get("messages") or []):
+        if isinstance(message, dict) and message.get("role") == "user":
+            content = message.get("content")
+            return content if isinstance(content, str) else json.dumps(content)
+    return ""
+
+
+def _tokens(prompt: str, count: int, rng: random.Random) -> list[str]:
+    """``count`` tokens: an echo of the prompt, then filler words."""
+    head = f"Stub answer to: {prompt[:80]}".split()
+    words = head + [rng.choice(WORDS) for _ in range(max(count - len(head), 0))]
+    return [w if i == 0 else f" {w}" for i, w in enumerate(words[:count])]
+
+
+def _full_body(body: dict, text: str) -> dict:
+    if "input" in body:
+        return {
+            "object": "response",
+            "output": [{
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text}],
+            }],
+        }
+    return {
+        "object": "chat.completion",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+    }
+
+
+def _delta_event(body: dict, token: str) -> dict:
+    if "input" in body:
+        return {"type": "response.output_text.delta", "item_id": "stub-message", "delta": token}
+    return {"object": "chat.completion.chunk", "choices": [{"index": 0, "delta": {"content": token}}]}
+
+
+def create_app(
+    profile: LatencyProfile = PROFILES["fast"],
+    endpoints: dict[str, LatencyProfile] | None = None,
+    seed: int | None = None,
+) -> Starlette:
+    """Stub app; ``endpoints`` overrides the profile per serving endpoint name."""
+    endpoints = endpoints or {}
+    rng = random.Random(seed)
+    stats = StubStats()
+
+    def vary(ms: float, p: LatencyProfile) -> float:
+        return max(ms * (1 + rng.uniform(-p.jitter, p.jitter)), 0.0) / 1000
+
+    async def invocations(request: Request) -> Response:
+        name = request.path_params["name"]
+        p = endpoints.get(name, profile)
+        body = await request.json()
+        stats.start(name)
+        if stats.requests[name] <= p.fail_first or rng.random() < p.error_rate:
+            stats.errors += 1
+            stats.finish()
+            return JSONResponse(
+                {"error_code": "TEMPORARILY_UNAVAILABLE", "message": f"Stub endpoint {name} is overloaded"},
+                status_code=503,
+            )
+        tokens = _tokens(_last_user_text(body), p.tokens, rng)
+
+        if not body.get("stream"):
+            try:
+                await asyncio.sleep(vary(p.first_token_ms, p) + sum(vary(p.token_ms, p) for _ in tokens[1:]))
+            finally:
+                stats.finish()
+            return JSONResponse(_full_body(body, "".join(tokens)))
+
+        async def events():
+            try:
+                await asyncio.sleep(vary(p.first_token_ms, p))
+                for i, token in enumerate(tokens):
+                    if i:
+                        await asyncio.sleep(vary(p.token_ms, p))
+                    yield f"data: {json.dumps(_delta_event(body, token))}\n\n"
+                if "input" in body:
+                    done = {"type": "response.output_item.done", "item": _full_body(body, "".join(tokens))["output"][0]}
+                    yield f"data: {json.dumps(done)}\n\n"
+                yield "data: [DONE]\n\n"
+            finally:
+                stats.finish()
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    async def stub_stats(request: Request) -> Response:
+        return JSONResponse(stats.as_dict())
+
+    app = Starlette(routes=[
+        Route("/serving-endpoints/{name}/invocations", invocations, methods=["POST"]),
+        Route("/stub/stats", stub_stats),
+    ])
+    app.state.stats = stats
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub Databricks serving endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="fast")
+    parser.add_argument("--first-token-ms", type=float, help="override the profile's time to first token")
+    parser.add_argument("--token-ms", type=float, help="override the profile's time per token")
+    parser.add_argument("--tokens", type=int, help="override the profile's tokens per answer")
+    parser.add_argument("--error-rate", type=float, help="share of requests answered with 503")
+    parser.add_argument("--fail-first", type=int, help="answer the first N requests per endpoint with 503")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    overrides = {
+        key: value
+        for key in ("first_token_ms", "token_ms", "tokens", "error_rate", "fail_first")
+        if (value := getattr(args, key)) is not None
+    }
+    profile = replace(PROFILES[args.profile], **overrides)
+
+    import uvicorn
+
+    print(f"Stub serving endpoint on http://{args.host}:{args.port} ({profile})", flush=True)
+    uvicorn.run(create_app(profile, seed=args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
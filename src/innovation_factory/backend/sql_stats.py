@@ -0,0 +1,192 @@
+"""Per-request SQL statement accounting.
+
+SQLAlchemy cursor events feed a request-scoped collector (a contextvar set by
+``SQLStatsMiddleware``), so every request knows how many statements it issued
+and how long they took. The totals are sent back as a ``Server-Timing`` header,
+folded into a rolling per-``operation_id`` table served at ``/api/debug/sql``,
+and any statement shape repeated more than ``N_PLUS_ONE_THRESHOLD`` times in one
+request is flagged as a likely N+1 query. Serving-endpoint calls made during
+the request (``agent_metrics.agent_call``) are counted alongside, so chat
+requests split into DB time and agent time.
+"""
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .._metadata import api_prefix
+from .logger import logger
+
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+RECENT_REQUESTS = 200
+
+
+@dataclass
+class QueryStats:
+    """Statements issued while handling one request."""
+
+    operation: str = "unknown"
+    statements: int = 0
+    db_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    agent_calls: int = 0
+    agent_seconds: float = 0.0
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.db_seconds += seconds
+        self.shapes[statement] += 1
+
+    def record_agent_call(self, seconds: float) -> None:
+        self.agent_calls += 1
+        self.agent_seconds += seconds
+
+    def repeated_shapes(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """Statement shapes executed more than ``threshold`` times."""
+        return {s: n for s, n in self.shapes.items() if n > threshold}
+
+    def server_timing(self) -> str:
+        timing = f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} queries"'
+        if self.agent_calls:
+            timing += f', agent;dur={self.agent_seconds * 1000:.1f};desc="{self.agent_calls} calls"'
+        return timing
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("sql_query_stats", default=None)
+
+
+def current() -> QueryStats | None:
+    """The collector of the request (or ``capture`` block) being handled, if any."""
+    return _current.get()
+
+
+def _shape(statement: str) -> str:
+    # Statements are already parameterised; collapse whitespace so identical shapes match
+    return " ".join(statement.split())
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._sql_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    start = getattr(context, "_sql_stats_start", None)
+    if stats is None or start is None:
+        return
+    stats.record(_shape(statement), time.perf_counter() - start)
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Attach statement counting hooks (pass ``AsyncEngine.sync_engine`` for async engines)."""
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+@contextmanager
+def capture(operation: str = "capture") -> Iterator[QueryStats]:
+    """Collect statements issued inside the block (scripts, tests, background work)."""
+    stats = QueryStats(operation=operation)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+class QueryStatsTable:
+    """Rolling per-operation aggregates of recent request statistics."""
+
+    def __init__(self, maxlen: int = RECENT_REQUESTS) -> None:
+        self._recent: deque[dict] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def add(self, stats: QueryStats, flagged: dict[str, int]) -> None:
+        entry = {
+            "operation": stats.operation,
+            "statements": stats.statements,
+            "db_ms": round(stats.db_seconds * 1000, 2),
+            "agent_calls": stats.agent_calls,
+            "agent_ms": round(stats.agent_seconds * 1000, 2),
+            "n_plus_one": flagged,
+        }
+        with self._lock:
+            self._recent.append(entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+
+    def summary(self) -> dict[str, dict]:
+        with self._lock:
+            recent = list(self._recent)
+        summary: dict[str, dict] = {}
+        for entry in recent:
+            row = summary.setdefault(
+                entry["operation"],
+                {"requests": 0, "statements": 0, "max_statements": 0,
+                 "db_ms": 0.0, "agent_calls": 0, "agent_ms": 0.0,
+                 "n_plus_one_requests": 0, "n_plus_one_shapes": {}},
+            )
+            row["requests"] += 1
+            row["statements"] += entry["statements"]
+            row["max_statements"] = max(row["max_statements"], entry["statements"])
+            row["db_ms"] = round(row["db_ms"] + entry["db_ms"], 2)
+            row["agent_calls"] += entry["agent_calls"]
+            row["agent_ms"] = round(row["agent_ms"] + entry["agent_ms"], 2)
+            if entry["n_plus_one"]:
+                row["n_plus_one_requests"] += 1
+                row["n_plus_one_shapes"].update(entry["n_plus_one"])
+        for row in summary.values():
+            row["avg_statements"] = round(row["statements"] / row["requests"], 2)
+        return summary
+
+
+table = QueryStatsTable()
+
+
+class SQLStatsMiddleware:
+    """Pure ASGI middleware that scopes a ``QueryStats`` collector to each API request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(api_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            stats.operation = getattr(route, "operation_id", None) or scope["path"]
+            flagged = stats.repeated_shapes()
+            if flagged:
+                worst = max(flagged.values())
+                logger.warning(
+                    f"Possible N+1 in {stats.operation}: {len(flagged)} statement shape(s) "
+                    f"repeated up to {worst}x ({stats.statements} statements total)"
+                )
+            table.add(stats, flagged)
@@ -0,0 +1,230 @@
+"""Serving of the SPA bundle (``__dist__``) from memory, precompressed.
+
+At startup every file of the bundle is read once, along with a gzip and (if
+the optional ``brotli`` package is installed) a brotli variant of the
+compressible ones. Requests are then answered from memory in the best encoding
+the client accepts, without a thread hop for ``stat`` or file I/O. That
+includes ``index.html``, which also answers every SPA deep link.
+
+Compressing at startup uses fast settings. A build step can write
+maximum-compression ``.gz`` / ``.br`` sidecar files next to the assets instead
+(``scripts/precompress_assets.py``); they are used as-is when present and not
+older than their source.
+
+Vite's content-hashed files under ``assets/`` never change, so they are
+cached by browsers for a year (``immutable``). Everything else is revalidated
+through its ``ETag``. Files too large to keep in memory and paths not in the
+bundle are handled by ``StaticFiles`` as before.
+"""
+import gzip
+import hashlib
+import importlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass
+from email.utils import formatdate
+from pathlib import Path
+from types import ModuleType
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+
+from .logger import logger
+
+# Optional and not a declared dependency; gzip only without it
+brotli: ModuleType | None
+try:
+    brotli = importlib.import_module("brotli")
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE = {
+    ".html", ".js", ".mjs", ".css", ".svg", ".json", ".map", ".txt", ".xml", ".webmanifest", ".ico", ".wasm",
+}
+MIN_COMPRESS_BYTES = 1024
+STATIC_MAX_FILE_BYTES = int(os.getenv("STATIC_MAX_FILE_BYTES", str(8 * 1024 * 1024)))
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# encoding -> (sidecar suffix, ETag suffix)
+ENCODINGS = {"br": (".br", "-br"), "gzip": (".gz", "-gz")}
+
+_HASHED_RE = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8}\.\w+$")
+
+
+def is_hashed(path: str) -> bool:
+    """Vite's content-hashed output (``assets/index-BvX3k9aZ.js``)."""
+    return bool(_HASHED_RE.match(path))
+
+
+def compress(data: bytes, encoding: str, best: bool = False) -> bytes:
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(data, quality=11 if best else 5)
+    return gzip.compress(data, compresslevel=9 if best else 6, mtime=0)
+
+
+def available_encodings() -> list[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content codings with a non-zero q-value in an ``Accept-Encoding`` header."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().lower().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding)
+    if "*" in accepted:
+        accepted |= set(ENCODINGS)
+    return accepted
+
+
+@dataclass(frozen=True)
+class Asset:
+    path: str
+    media_type: str
+    etag: str
+    last_modified: str
+    cache_control: str
+    # encoding ("identity", "br", "gzip") -> body; compressed only where smaller
+    bodies: dict[str, bytes]
+
+    def headers(self, encoding: str) -> dict[str, str]:
+        headers = {
+            "etag": self.etag if encoding == "identity" else f'{self.etag[:-1]}{ENCODINGS[encoding][1]}"',
+            "last-modified": self.last_modified,
+            "cache-control": self.cache_control,
+        }
+        if len(self.bodies) > 1:
+            headers["vary"] = "Accept-Encoding"
+        if encoding != "identity":
+            headers["content-encoding"] = encoding
+        return headers
+
+    def response(self, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        encoding = next((e for e in ENCODINGS if e in accepted and e in self.bodies), "identity")
+        headers = self.headers(encoding)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and headers["etag"] in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            headers.pop("content-encoding", None)
+            return Response(status_code=304, headers=headers)
+        body = self.bodies[encoding]
+        if scope["method"] == "HEAD":
+            headers["content-length"] = str(len(body))
+            body = b""
+        return Response(body, media_type=self.media_type, headers=headers)
+
+
+def _sidecar(file: Path, encoding: str) -> bytes | None:
+    sidecar = file.with_name(file.name + ENCODINGS[encoding][0])
+    try:
+        if sidecar.stat().st_mtime_ns >= file.stat().st_mtime_ns:
+            return sidecar.read_bytes()
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def load_asset(file: Path, path: str) -> Asset:
+    data = file.read_bytes()
+    stat = file.stat()
+    bodies = {"identity": data}
+    if file.suffix in COMPRESSIBLE and len(data) >= MIN_COMPRESS_BYTES:
+        for encoding in ENCODINGS:
+            body = _sidecar(file, encoding)
+            if body is None and encoding in available_encodings():
+                body = compress(data, encoding)
+            if body is not None and len(body) < len(data):
+                bodies[encoding] = body
+    media_type = mimetypes.guess_type(file.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type in ("application/javascript", "image/svg+xml"):
+        media_type += "; charset=utf-8"
+    return Asset(
+        path=path,
+        media_type=media_type,
+        etag=f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"',
+        last_modified=formatdate(stat.st_mtime, usegmt=True),
+        cache_control=IMMUTABLE if is_hashed(path) else REVALIDATE,
+        bodies=bodies,
+    )
+
+
+def bundle_files(directory: Path) -> list[tuple[Path, str]]:
+    """The bundle's files (not sidecars) and their URL paths."""
+    files = []
+    for file in sorted(directory.rglob("*")):
+        if not file.is_file():
+            continue
+        if file.suffix in (".gz", ".br") and file.with_suffix("").is_file():
+            continue
+        files.append((file, file.relative_to(directory).as_posix()))
+    return files
+
+
+def precompress(directory: Path) -> int:
+    """Write maximum-compression sidecar files for the bundle; returns how many."""
+    written = 0
+    for file, _ in bundle_files(directory):
+        if file.suffix not in COMPRESSIBLE or file.stat().st_size < MIN_COMPRESS_BYTES:
+            continue
+        data = file.read_bytes()
+        for encoding in available_encodings():
+            body = compress(data, encoding, best=True)
+            if len(body) < len(data):
+                file.with_name(file.name + ENCODINGS[encoding][0]).write_bytes(body)
+                written += 1
+    return written
+
+
+class SpaStaticFiles(StaticFiles):
+    """``StaticFiles`` that answers from the in-memory assets once ``load`` has run."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.assets: dict[str, Asset] = {}
+
+    def load(self) -> None:
+        if self.directory is None or not Path(self.directory).is_dir():
+            logger.warning(f"Static directory {self.directory} not found, serving nothing from memory")
+            return
+        assets = {}
+        for file, path in bundle_files(Path(self.directory)):
+            if file.stat().st_size <= STATIC_MAX_FILE_BYTES:
+                assets[path] = load_asset(file, path)
+        self.assets = assets
+        total = sum(len(b) for a in assets.values() for b in a.bodies.values())
+        logger.info(
+            f"Loaded {len(assets)} static assets ({total / 1024:.0f} KiB incl. "
+            f"{'/'.join(available_encodings())} variants) from {self.directory}"
+        )
+
+    def index_response(self, scope: Scope) -> Response | None:
+        """``index.html`` for SPA deep links, if loaded."""
+        index = self.assets.get("index.html")
+        return index.response(scope) if index is not None else None
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] in ("GET", "HEAD"):
+            key = "" if path == "." else path.replace(os.sep, "/")
+            asset = self.assets.get(key)
+            if asset is None and self.html and (not key or scope["path"].endswith("/")):
+                asset = self.assets.get(f"{key}/index.html".lstrip("/"))
+            if asset is not None:
+                return asset.response(scope)
+        return await super().get_response(path, scope)
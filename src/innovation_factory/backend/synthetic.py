@@ -0,0 +1,64 @@
+"""Scale-factor synthetic data for benchmark databases.
+
+Each project package has a ``synthetic`` module whose ``generate(session,
+scale, seed, end)`` appends production-sized data on top of the regular demo
+seed. Scale factor 1 is the production sizing documented in each module;
+fractional factors shrink the entity counts (never the time span).
+
+Values are computed with NumPy, vectorized across entities per time step, and
+streamed as plain tuples through ``BulkLoader``, so memory stays flat no matter
+how many rows are written. For a given ``seed`` and ``end`` date the output is
+identical across runs.
+
+NumPy is only needed here and lives in the ``bench`` dependency group
+(``uv sync --group bench``).
+"""
+import zlib
+from typing import TYPE_CHECKING, Any, Iterator
+
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, select
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_SEED = 42
+
+
+def require_numpy():
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "Synthetic data generation needs NumPy; install it with `uv sync --group bench`"
+        ) from e
+    return numpy
+
+
+def rng(seed: int, stream: str) -> "np.random.Generator":
+    """Independent, reproducible random stream per project/table."""
+    np = require_numpy()
+    return np.random.default_rng([seed, zlib.crc32(stream.encode())])
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def rows(*columns: Any) -> Iterator[tuple]:
+    """Zip column arrays/lists into row tuples of Python values; scalars repeat."""
+    lists: list[Any] = [c.tolist() if hasattr(c, "tolist") else c for c in columns]
+    length = max(len(c) for c in lists if isinstance(c, list))
+    return zip(*(c if isinstance(c, list) else [c] * length for c in lists))
+
+
+def max_id(session: Session, model: type[SQLModel]) -> int:
+    return session.exec(select(func.coalesce(func.max(model.id), 0))).one()  # type: ignore[attr-defined]
+
+
+def ids_after(session: Session, model: type[SQLModel], start: int) -> list[int]:
+    """Ids of rows bulk-loaded after ``max_id`` returned ``start``, in insert order."""
+    session.flush()
+    return list(
+        session.exec(select(model.id).where(model.id > start).order_by(model.id))  # type: ignore[attr-defined]
+    )
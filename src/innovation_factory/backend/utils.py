@@ -4,9 +4,10 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .._metadata import api_prefix, dist_dir
 from .logger import logger
+from .static import SpaStaticFiles
 
 
-def add_not_found_handler(app: FastAPI):
+def add_not_found_handler(app: FastAPI, ui: SpaStaticFiles):
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         logger.info(
             f"HTTP exception handler called for request {request.url.path} with status code {exc.status_code}"
@@ -23,7 +24,7 @@ def add_not_found_handler(app: FastAPI):
 
             if (not is_api) and is_get_page_nav and (not looks_like_asset):
                 # Let the SPA router handle it
-                return FileResponse(dist_dir / "index.html")
+                return ui.index_response(request.scope) or FileResponse(dist_dir / "index.html")
         # Default: return the original HTTP error (JSON 404 for API, etc.)
         return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
 
@@ -0,0 +1 @@
+"""Endpoint benchmarks with regression gates (opt-in)."""
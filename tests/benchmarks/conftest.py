@@ -0,0 +1,162 @@
+"""Fixtures for the endpoint benchmarks.
+
+The suite is opt-in (``RUN_BENCHMARKS=1``) and best run on its own:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks -q
+
+Settings (environment variables):
+
+- ``BENCH_DATABASE_URL``: benchmark an existing database, e.g. one built by
+  ``scripts/generate_benchmark_db.py`` (set ``BENCH_SCALE`` to the scale it was
+  built with). Default: a temporary SQLite file seeded at ``BENCH_SCALE``
+  (default 0.002; needs the ``bench`` dependency group).
+- ``BENCH_ITERATIONS``: timed requests per route (default 20). p99 is only gated
+  from 100 iterations on (``harness.P99_MIN_ITERATIONS``); below that it is the
+  slowest single request.
+- ``BENCH_TOLERANCE``: allowed relative latency regression against the baseline (default 0.5;
+  SQL statement counts are gated exactly).
+- ``BENCH_P99_TOLERANCE``: the same for tail latency (default 1.0).
+- ``BENCH_BASELINE``: baseline JSON (default ``tests/benchmarks/baseline.json``).
+- ``BENCH_OUTPUT``: where this run's results are written (default ``.benchmarks/latest.json``).
+- ``BENCH_UPDATE_BASELINE=1``: overwrite the baseline with this run's results.
+"""
+import contextlib
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from . import harness
+
+BENCH_SCALE = float(os.getenv("BENCH_SCALE", "0.002"))
+BENCH_ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20"))
+BENCH_TOLERANCE = float(os.getenv("BENCH_TOLERANCE", "0.5"))
+BENCH_P99_TOLERANCE = float(os.getenv("BENCH_P99_TOLERANCE", "1.0"))
+BENCH_BASELINE = Path(os.getenv("BENCH_BASELINE", Path(__file__).with_name("baseline.json")))
+BENCH_OUTPUT = Path(os.getenv("BENCH_OUTPUT", ".benchmarks/latest.json"))
+BENCH_UPDATE_BASELINE = os.getenv("BENCH_UPDATE_BASELINE") == "1"
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run the endpoint benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def bench_engine():
+    """Engine on the benchmark database, seeded on first use unless one is supplied."""
+    import innovation_factory.backend.models  # noqa: F401
+    from innovation_factory.backend.projects.registry import load_all_models
+    from innovation_factory.backend.sql_stats import instrument_engine
+
+    load_all_models()
+    url = os.getenv("BENCH_DATABASE_URL")
+    if url:
+        return instrument_engine(create_engine(url))
+
+    from innovation_factory.backend.seed import seed_database
+
+    path = Path(tempfile.mkdtemp(prefix="innovation-factory-bench-")) / "bench.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session, contextlib.redirect_stdout(io.StringIO()):
+        seed_database(session, scale=BENCH_SCALE or None)
+    return instrument_engine(engine)
+
+
+@pytest.fixture(scope="session")
+def bench_async_engine(bench_engine):
+    from innovation_factory.backend.sql_stats import instrument_engine
+
+    url = bench_engine.url
+    if url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    async_engine = create_async_engine(url)
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+
+@pytest.fixture(scope="session")
+def bench_identity(bench_engine):
+    """BSH caller: the customer with most registered devices and the busiest technician."""
+    from innovation_factory.backend.dependencies import MockDatabricksUser
+    from innovation_factory.backend.projects.bsh_home_connect.models import BshCustomerDevice, BshTicket
+    from innovation_factory.backend.projects.bsh_home_connect.routers.users import BshIdentity
+
+    with Session(bench_engine) as session:
+        customer_id = session.exec(
+            select(BshCustomerDevice.customer_id)
+            .group_by(col(BshCustomerDevice.customer_id))
+            .order_by(func.count().desc())
+        ).first()
+        technician_id = session.exec(
+            select(BshTicket.technician_id)
+            .where(BshTicket.technician_id.is_not(None))  # type: ignore[union-attr]
+            .group_by(col(BshTicket.technician_id))
+            .order_by(func.count().desc())
+        ).first()
+    return BshIdentity(user=MockDatabricksUser(), customer_id=customer_id, technician_id=technician_id)  # type: ignore[arg-type]
+
+
+@pytest.fixture(scope="session")
+def bench_client(bench_engine, bench_async_engine, bench_identity):
+    from innovation_factory.backend.app import app
+    from innovation_factory.backend.dependencies import get_async_session, get_session
+    from innovation_factory.backend.projects.bsh_home_connect.routers.users import get_bsh_identity
+
+    def override_get_session():
+        with Session(bench_engine) as session:
+            yield session
+
+    async def override_get_async_session():
+        async with AsyncSession(bench_async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_bsh_identity] = lambda: bench_identity
+
+    with TestClient(app) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def bench_environment(bench_client, bench_engine) -> dict:
+    return harness.environment(BENCH_SCALE, bench_engine.dialect.name, harness.calibrate(bench_client))
+
+
+@pytest.fixture(scope="session")
+def bench_results(bench_environment):
+    """Collects per-route results; written out (and optionally promoted to baseline) at the end."""
+    results: dict[str, dict] = {}
+    yield results
+    if not results:
+        return
+    harness.save(BENCH_OUTPUT, bench_environment, results)
+    if BENCH_UPDATE_BASELINE:
+        harness.save(BENCH_BASELINE, bench_environment, results)
+
+
+@pytest.fixture(scope="session")
+def bench_baseline(bench_environment) -> dict[str, dict]:
+    """Baseline entries adjusted to this machine's speed; empty if not comparable."""
+    baseline = harness.load(BENCH_BASELINE)
+    recorded = baseline.get("environment", {})
+    if BENCH_UPDATE_BASELINE or any(recorded.get(k) != bench_environment[k] for k in ("scale", "dialect")):
+        return {}
+    # Only ever relax: a noisy calibration on a fast machine must not tighten the gates
+    factor = bench_environment["calibration_ms"] / recorded["calibration_ms"]
+    return harness.rescale(baseline.get("routes", {}), max(factor, 1.0))
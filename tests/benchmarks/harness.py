@@ -0,0 +1,133 @@
+"""Measurement and baseline comparison for the endpoint benchmarks."""
+import gc
+import json
+import math
+import platform
+import resource
+import sys
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+# Absolute slack so scheduler/GC noise on fast routes never trips the gate;
+# tail latency is far noisier than the median, so it gets more
+LATENCY_SLACK_MS = {"p50_ms": 2.0, "p99_ms": 10.0}
+# Below this many samples the nearest-rank p99 is the slowest single request,
+# so one scheduler hiccup would fail the run; p99 is then reported, not gated
+P99_MIN_ITERATIONS = 100
+MIN_RSS_SLACK_MB = 16.0
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``q`` in 0..100)."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _statements(response) -> int | None:
+    # Server-Timing: db;dur=1.2;desc="N queries" (see sql_stats.SQLStatsMiddleware)
+    header = response.headers.get("server-timing", "")
+    if 'desc="' not in header:
+        return None
+    return int(header.split('desc="', 1)[1].split(" ", 1)[0])
+
+
+def measure(client: TestClient, url: str, iterations: int, warmup: int = 2) -> dict:
+    """Call ``url`` repeatedly and summarize latency, SQL statements and memory."""
+    for _ in range(warmup):
+        response = client.get(url)
+        response.raise_for_status()
+
+    rss_before = peak_rss_mb()
+    latencies: list[float] = []
+    statements: list[int] = []
+    # As in timeit: GC pauses land on whichever request happens to trigger them
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = client.get(url)
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+            count = _statements(response)
+            if count is not None:
+                statements.append(count)
+    finally:
+        gc.enable()
+    peak = peak_rss_mb()
+
+    return {
+        "url": url,
+        "iterations": iterations,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "sql_statements": max(statements) if statements else None,
+        "response_bytes": len(response.content),
+        "peak_rss_mb": round(peak, 1),
+        "rss_growth_mb": round(peak - rss_before, 1),
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float, p99_tolerance: float) -> list[str]:
+    """Regressions of ``result`` against its ``baseline`` entry, as messages."""
+    problems = []
+    gated = [("p50_ms", tolerance)]
+    if result["iterations"] >= P99_MIN_ITERATIONS:
+        gated.append(("p99_ms", p99_tolerance))
+    for key, tol in gated:
+        allowed = baseline[key] * (1 + tol) + LATENCY_SLACK_MS[key]
+        if result[key] > allowed:
+            problems.append(f"{key} {result[key]:.2f} > {allowed:.2f} (baseline {baseline[key]:.2f})")
+    if baseline.get("sql_statements") is not None and result["sql_statements"] is not None:
+        # Statement counts are deterministic; any growth is a regression (e.g. a new N+1)
+        if result["sql_statements"] > baseline["sql_statements"]:
+            problems.append(
+                f"sql_statements {result['sql_statements']} > baseline {baseline['sql_statements']}"
+            )
+    allowed_rss = baseline["rss_growth_mb"] * (1 + tolerance) + MIN_RSS_SLACK_MB
+    if result["rss_growth_mb"] > allowed_rss:
+        problems.append(f"rss_growth_mb {result['rss_growth_mb']} > {allowed_rss:.1f}")
+    return problems
+
+
+def calibrate(client: TestClient, iterations: int = 50) -> float:
+    """p50 of a trivial route, used to rescale baselines recorded on a faster/slower machine."""
+    return measure(client, "/api/version", iterations)["p50_ms"]
+
+
+def rescale(routes: dict[str, dict], factor: float) -> dict[str, dict]:
+    return {
+        op: {**entry, "p50_ms": entry["p50_ms"] * factor, "p99_ms": entry["p99_ms"] * factor}
+        for op, entry in routes.items()
+    }
+
+
+def environment(scale: float, dialect: str, calibration_ms: float) -> dict:
+    """Run parameters; ``scale`` and ``dialect`` must match for results to be comparable."""
+    return {
+        "scale": scale,
+        "dialect": dialect,
+        "python": platform.python_version(),
+        "calibration_ms": calibration_ms,
+    }
+
+
+def load(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save(path: Path, env: dict, results: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"environment": env, "routes": dict(sorted(results.items()))}
+    path.write_text(json.dumps(payload, indent=2) + "\n")
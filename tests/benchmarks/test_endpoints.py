@@ -0,0 +1,211 @@
+"""Latency / SQL-count / memory benchmarks for every read endpoint.
+
+Each GET ``operation_id`` needs an entry in ``CASES`` (or ``EXCLUDED`` with a
+reason), so new routes cannot silently escape the benchmark. Path and query
+parameters point at the newest rows, i.e. the scale-factor synthetic entities,
+which carry the bulk of the data.
+"""
+from typing import Any, Callable
+
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from innovation_factory.backend.models import IdeaSession, Job
+from innovation_factory.backend.projects.adtech_intelligence.models import (
+    AtAdInventory,
+    AtAnomaly,
+    AtCampaign,
+    AtChatSession,
+    AtIssue,
+    AtPlacement,
+)
+from innovation_factory.backend.projects.bsh_home_connect.models import (
+    BshCustomerDevice,
+    BshDevice,
+    BshTicket,
+)
+from innovation_factory.backend.projects.mol_asm_cockpit.models import (
+    MacAnomalyAlert,
+    MacChatSession,
+    MacCustomerProfile,
+    MacStation,
+)
+from innovation_factory.backend.projects.vi_home_one.models import (
+    VhEnergyProvider,
+    VhHousehold,
+    VhNeighborhood,
+    VhTicket,
+)
+
+from . import harness
+from .conftest import BENCH_ITERATIONS, BENCH_P99_TOLERANCE, BENCH_TOLERANCE
+
+pytestmark = pytest.mark.benchmark
+
+Resolver = Callable[[Session, Any], Any]
+
+
+def newest(model) -> Resolver:
+    return lambda db, identity: db.exec(select(func.max(model.id))).one()
+
+
+def _my_device(db: Session, identity) -> int | None:
+    return db.exec(
+        select(func.max(BshCustomerDevice.id)).where(BshCustomerDevice.customer_id == identity.customer_id)
+    ).one()
+
+
+def _my_ticket(db: Session, identity) -> int | None:
+    return db.exec(
+        select(func.max(BshTicket.id)).where(BshTicket.technician_id == identity.technician_id)
+    ).one()
+
+
+def _my_technician(db: Session, identity) -> int | None:
+    return identity.technician_id
+
+
+# operation_id -> parameters (path and query); resolvers are evaluated against the database
+CASES: dict[str, dict[str, Any]] = {
+    "version": {},
+    "currentUser": {},
+    "listProjectDocs": {},
+    "getProjectDoc": {"slug": "vi-home-one"},
+    "searchProjectDocs": {"q": "energy"},
+    "listProjects": {},
+    "getProject": {"slug": "vi-home-one"},
+    "getIdeaSession": {"session_id": newest(IdeaSession)},
+    "getIdeaMessages": {"session_id": newest(IdeaSession)},
+    "listJobs": {},
+    "listJobKinds": {},
+    "getJob": {"job_id": newest(Job)},
+    # vi-home-one
+    "vh_list_neighborhoods": {},
+    "vh_get_neighborhood_summary": {"neighborhood_id": newest(VhNeighborhood)},
+    "vh_get_household": {"household_id": newest(VhHousehold)},
+    "vh_get_household_cockpit": {"household_id": newest(VhHousehold)},
+    "vh_get_energy_readings": {"household_id": newest(VhHousehold), "hours": 24 * 7},
+    "vh_get_current_reading": {"household_id": newest(VhHousehold)},
+    "vh_get_optimization_suggestions": {"household_id": newest(VhHousehold)},
+    "vh_list_providers": {},
+    "vh_compare_providers": {"household_id": newest(VhHousehold), "current_provider_id": newest(VhEnergyProvider)},
+    "vh_list_maintenance_alerts": {"household_id": newest(VhHousehold)},
+    "vh_list_tickets": {},
+    "vh_get_ticket": {"ticket_id": newest(VhTicket)},
+    "vh_get_chat_history": {"ticket_id": newest(VhTicket)},
+    # bsh-home-connect
+    "bsh_getCurrentCustomer": {},
+    "bsh_getCurrentTechnician": {},
+    "bsh_getTechnician": {"technician_id": _my_technician},
+    "bsh_listDevices": {},
+    "bsh_listMyDevices": {},
+    "bsh_getMyDevice": {"device_id": _my_device},
+    "bsh_listTickets": {"role": "technician"},
+    "bsh_getTicket": {"ticket_id": _my_ticket},
+    "bsh_listTicketNotes": {"ticket_id": _my_ticket},
+    "bsh_getChatHistory": {"ticket_id": _my_ticket},
+    "bsh_searchKnowledge": {"query": "error"},
+    "bsh_getDeviceKnowledge": {"device_id": newest(BshDevice)},
+    "bsh_getDeviceDocuments": {"device_id": newest(BshDevice)},
+    # mol-asm-cockpit
+    "mac_listRegions": {},
+    "mac_listStations": {},
+    "mac_stationKPIs": {"days": 90},
+    "mac_getStation": {"station_id": newest(MacStation)},
+    "mac_listFuelSales": {},
+    "mac_listNonfuelSales": {},
+    "mac_listLoyaltyMetrics": {},
+    "mac_listAnomalyAlerts": {},
+    "mac_getAnomalyAlert": {"alert_id": newest(MacAnomalyAlert)},
+    "mac_listInventory": {},
+    "mac_listCompetitorPrices": {},
+    "mac_listPriceHistory": {},
+    "mac_listWorkforceShifts": {},
+    "mac_listIssues": {},
+    "mac_listCustomerProfiles": {},
+    "mac_listCustomerContracts": {"customer_id": newest(MacCustomerProfile)},
+    "mac_getChatHistory": {"session_id": newest(MacChatSession)},
+    # adtech-intelligence
+    "at_getDashboardSummary": {},
+    "at_listCampaigns": {},
+    "at_getCampaign": {"campaign_id": newest(AtCampaign)},
+    "at_listPlacements": {"campaign_id": newest(AtCampaign)},
+    "at_getPlacement": {"placement_id": newest(AtPlacement)},
+    "at_listInventory": {},
+    "at_getInventoryItem": {"inventory_id": newest(AtAdInventory)},
+    "at_getAnomalyCounts": {},
+    "at_listAnomalies": {},
+    "at_getAnomaly": {"anomaly_id": newest(AtAnomaly)},
+    "at_listAnomalyRules": {},
+    "at_listIssues": {},
+    "at_getIssue": {"issue_id": newest(AtIssue)},
+    "at_listAdvertisers": {},
+    "at_listContracts": {},
+    "at_listChatSessions": {},
+    "at_getChatSession": {"session_id": newest(AtChatSession)},
+}
+
+EXCLUDED: dict[str, str] = {
+    "metrics": "observability endpoint",
+    "poolStats": "observability endpoint",
+    "credentialStats": "observability endpoint",
+    "sqlStats": "observability endpoint",
+    "cacheStats": "observability endpoint",
+    "loopLag": "observability endpoint",
+    "servingStats": "observability endpoint",
+    "agentCallStats": "observability endpoint",
+    "startupProfile": "observability endpoint",
+    "mac_getDashboardEmbed": "needs a Databricks workspace",
+    "at_getDatabricksResources": "needs a Databricks workspace",
+}
+
+
+def _get_operations() -> dict[str, str]:
+    from innovation_factory.backend.app import app
+
+    return {
+        route.operation_id: route.path
+        for route in app.routes
+        if isinstance(route, APIRoute) and "GET" in route.methods and route.operation_id
+    }
+
+
+def test_every_get_route_is_benchmarked():
+    missing = set(_get_operations()) - set(CASES) - set(EXCLUDED)
+    assert not missing, f"add benchmark cases for: {sorted(missing)}"
+
+
+def _url(db: Session, identity, path: str, params: dict[str, Any]) -> str:
+    query = {}
+    for name, value in params.items():
+        if callable(value):
+            value = value(db, identity)
+            if value is None:
+                pytest.skip(f"no data for '{name}' in the benchmark database")
+        if "{" + name + "}" in path:
+            path = path.replace("{" + name + "}", str(value))
+        else:
+            query[name] = value
+    if query:
+        path += "?" + "&".join(f"{k}={v}" for k, v in query.items())
+    return path
+
+
+@pytest.mark.parametrize("operation_id", sorted(CASES))
+def test_endpoint(operation_id, bench_client, bench_engine, bench_identity, bench_results, bench_baseline):
+    path = _get_operations()[operation_id]
+    if operation_id in ("getIdeaSession", "getIdeaMessages"):
+        bench_client.post("/api/ideas/sessions")
+    with Session(bench_engine) as db:
+        url = _url(db, bench_identity, path, CASES[operation_id])
+
+    result = harness.measure(bench_client, url, BENCH_ITERATIONS)
+    bench_results[operation_id] = result
+
+    baseline = bench_baseline.get(operation_id)
+    if baseline is None:
+        return
+    problems = harness.compare(result, baseline, BENCH_TOLERANCE, BENCH_P99_TOLERANCE)
+    assert not problems, f"{operation_id} regressed: " + "; ".join(problems)
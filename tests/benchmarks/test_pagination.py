@@ -0,0 +1,38 @@
+"""Deep keyset pages cost about the same as the first page."""
+import pytest
+
+from innovation_factory.backend.pagination import NEXT_CURSOR_HEADER
+
+from . import harness
+from .conftest import BENCH_ITERATIONS
+
+pytestmark = pytest.mark.benchmark
+
+PAGE_SIZE = 100
+
+# operation_id -> (path, query parameters)
+LISTS = {
+    "mac_listFuelSales": ("/api/projects/mol-asm-cockpit/sales/fuel", {"days": 365}),
+    "mac_listNonfuelSales": ("/api/projects/mol-asm-cockpit/sales/nonfuel", {"days": 365}),
+}
+
+
+@pytest.mark.parametrize("operation_id", sorted(LISTS))
+def test_deep_page_costs_the_same(operation_id, bench_client):
+    path, params = LISTS[operation_id]
+    query = "&".join(f"{k}={v}" for k, v in {**params, "limit": PAGE_SIZE}.items())
+    first_url = f"{path}?{query}"
+
+    # Follow the cursors to the last page
+    url, pages = first_url, 1
+    while cursor := bench_client.get(url).headers.get(NEXT_CURSOR_HEADER):
+        url, pages = f"{first_url}&cursor={cursor}", pages + 1
+    if pages < 5:
+        pytest.skip(f"only {pages} pages of {operation_id} in the benchmark database")
+
+    first = harness.measure(bench_client, first_url, BENCH_ITERATIONS)
+    deep = harness.measure(bench_client, url, BENCH_ITERATIONS)
+    print(f"\n{operation_id}: page 1 {first['p50_ms']:.2f} ms, page {pages} {deep['p50_ms']:.2f} ms")
+    assert deep["sql_statements"] == first["sql_statements"]
+    # The last page may be shorter; it must never be meaningfully slower
+    assert deep["p50_ms"] <= first["p50_ms"] * 1.5 + harness.LATENCY_SLACK_MS["p50_ms"]
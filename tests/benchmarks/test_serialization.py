@@ -0,0 +1,117 @@
+"""Fast JSON path vs FastAPI's default response handling on the large list endpoints.
+
+Both sides run the endpoint's query against the benchmark database and produce
+the response body: the default path loads ORM instances and hands them to
+FastAPI's own ``serialize_response`` (validation against ``response_model``,
+then ``JSONResponse``), the fast path is what the handler now does
+(``RowSerializer``: column select, trusted construction, prebuilt TypeAdapter).
+The bodies must be equal; the fast path must be clearly cheaper in CPU time.
+"""
+import asyncio
+import json
+import statistics
+import time
+from typing import Callable
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy import func
+from sqlmodel import Session, col, select
+
+from innovation_factory.backend.projects.adtech_intelligence.models import AtAdvertiser, AtCampaign
+from innovation_factory.backend.projects.adtech_intelligence.routers.campaigns import CAMPAIGNS
+from innovation_factory.backend.projects.mol_asm_cockpit.models import MacFuelSale
+from innovation_factory.backend.projects.mol_asm_cockpit.routers.sales import FUEL_SALES
+from innovation_factory.backend.projects.vi_home_one.models import VhEnergyReading
+from innovation_factory.backend.projects.vi_home_one.routers.energy import READINGS
+
+from .conftest import BENCH_ITERATIONS
+
+pytestmark = pytest.mark.benchmark
+
+# Required CPU-time ratio (default / fast), median of BENCH_ITERATIONS runs
+MIN_SPEEDUP = 1.5
+
+
+def _fuel_sales(db: Session) -> tuple:
+    order = MacFuelSale.sale_date.desc()  # type: ignore[unresolved-attribute]
+    orm = select(MacFuelSale).order_by(order).limit(10000)
+    return orm, lambda: FUEL_SALES.list_response(db.exec(FUEL_SALES.select(MacFuelSale).order_by(order).limit(10000)))
+
+
+def _energy_readings(db: Session) -> tuple:
+    household_id = db.exec(
+        select(VhEnergyReading.household_id)
+        .group_by(col(VhEnergyReading.household_id))
+        .order_by(func.count().desc())
+    ).first()
+    where = VhEnergyReading.household_id == household_id
+    order = VhEnergyReading.timestamp.desc()  # type: ignore[unresolved-attribute]
+    orm = select(VhEnergyReading).where(where).order_by(order)
+    return orm, lambda: READINGS.list_response(db.exec(READINGS.select(VhEnergyReading).where(where).order_by(order)))
+
+
+def _campaigns(db: Session) -> tuple:
+    order = AtCampaign.created_at.desc()  # type: ignore[unresolved-attribute]
+    orm = select(AtCampaign).order_by(order).limit(200)
+    fast = (
+        CAMPAIGNS.select(AtCampaign, advertiser=AtAdvertiser)
+        .outerjoin(AtAdvertiser, AtAdvertiser.id == AtCampaign.advertiser_id)  # type: ignore[invalid-argument-type]
+        .order_by(order)
+        .limit(200)
+    )
+    return orm, lambda: CAMPAIGNS.list_response(db.exec(fast))
+
+
+# operation_id -> (ORM statement for the default path, fast-path response builder)
+CASES: dict[str, Callable[[Session], tuple]] = {
+    "mac_listFuelSales": _fuel_sales,
+    "vh_get_energy_readings": _energy_readings,
+    "at_listCampaigns": _campaigns,
+}
+
+
+def _response_field(operation_id: str):
+    from innovation_factory.backend.app import app
+
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.operation_id == operation_id:
+            return route.response_field
+    raise LookupError(operation_id)
+
+
+def _cpu_ms(run: Callable[[], bytes], iterations: int) -> tuple[float, bytes]:
+    samples, body = [], b""
+    for _ in range(iterations):
+        start = time.process_time()
+        body = run()
+        samples.append((time.process_time() - start) * 1000)
+    return statistics.median(samples), body
+
+
+@pytest.mark.parametrize("operation_id", sorted(CASES))
+def test_fast_path(operation_id, bench_engine):
+    field = _response_field(operation_id)
+    with Session(bench_engine) as db:
+        statement, fast = CASES[operation_id](db)
+
+        def default() -> bytes:
+            db.expunge_all()
+            rows = db.exec(statement).all()
+            content = asyncio.run(serialize_response(field=field, response_content=rows))
+            return bytes(JSONResponse(content).body)
+
+        def fast_path() -> bytes:
+            db.expunge_all()
+            return fast().body
+
+        default_ms, default_body = _cpu_ms(default, BENCH_ITERATIONS)
+        fast_ms, fast_body = _cpu_ms(fast_path, BENCH_ITERATIONS)
+
+    assert json.loads(fast_body) == json.loads(default_body)
+    assert json.loads(fast_body), f"no rows for {operation_id} in the benchmark database"
+    speedup = default_ms / fast_ms
+    print(f"\n{operation_id}: default {default_ms:.2f} ms, fast {fast_ms:.2f} ms CPU ({speedup:.1f}x), "
+          f"{len(fast_body)} bytes")
+    assert speedup >= MIN_SPEEDUP, f"{operation_id}: fast path only {speedup:.2f}x faster"
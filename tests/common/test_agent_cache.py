@@ -0,0 +1,149 @@
+"""Tests for the Agent Bricks answer cache and single-flight coalescing."""
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from innovation_factory.backend.cache import caches
+from innovation_factory.backend.services.agent_cache import AgentCache, cache_key
+
+QUESTION = [{"role": "user", "content": "Which 10 stations have the biggest margin upside this weekend?"}]
+
+
+@pytest.fixture
+def make_cache():
+    def make(**kwargs) -> AgentCache:
+        return AgentCache(name="test:agent-answers", **kwargs)
+
+    yield make
+    caches.pop("test:agent-answers", None)
+
+
+class Upstream:
+    """Counts calls; answers after ``delay`` seconds, streamed in ``parts``."""
+
+    def __init__(self, delay: float = 0.0, parts: tuple[str, ...] = ("Station ", "HU-1"), fail: bool = False):
+        self.delay = delay
+        self.parts = parts
+        self.fail = fail
+        self.calls = 0
+
+    async def invoke(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("endpoint down")
+        return {"output": "".join(self.parts)}
+
+    async def stream(self):
+        self.calls += 1
+        for part in self.parts:
+            await asyncio.sleep(self.delay)
+            yield part
+        if self.fail:
+            raise RuntimeError("endpoint down")
+
+
+async def collect(stream) -> list[str]:
+    return [chunk async for chunk in stream]
+
+
+class TestCacheKey:
+    def test_normalized_window(self):
+        same = [{"role": "user", "content": "  which 10 stations have the biggest MARGIN upside this weekend "}]
+        assert cache_key("invoke", "mas", QUESTION) == cache_key("invoke", "mas", same)
+
+    def test_endpoint_and_history_matter(self):
+        key = cache_key("invoke", "mas", QUESTION)
+        assert key != cache_key("invoke", "ka", QUESTION)
+        history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}, *QUESTION]
+        assert key != cache_key("invoke", "mas", history)
+
+
+class TestAgentCache:
+    async def test_invoke_hit_and_opt_out(self, make_cache):
+        cache, upstream = make_cache(), Upstream()
+        first = await cache.invoke("mas", QUESTION, upstream.invoke)
+        assert await cache.invoke("mas", QUESTION, upstream.invoke) == first
+        assert upstream.calls == 1
+        await cache.invoke("mas", QUESTION, upstream.invoke, cache=False)
+        assert upstream.calls == 2
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["bypassed"]) == (1, 1, 1)
+
+    async def test_failures_are_not_cached(self, make_cache):
+        cache, upstream = make_cache(), Upstream(fail=True)
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.invoke("mas", QUESTION, upstream.invoke)
+        assert upstream.calls == 2
+
+    async def test_stream_replays_cached_answer(self, make_cache):
+        cache, upstream = make_cache(), Upstream()
+        assert await collect(cache.stream("mas", QUESTION, upstream.stream)) == ["Station ", "HU-1"]
+        assert await collect(cache.stream("mas", QUESTION, upstream.stream)) == ["Station HU-1"]
+        assert upstream.calls == 1
+
+    async def test_broken_stream_is_not_cached(self, make_cache):
+        cache, upstream = make_cache(), Upstream(fail=True)
+        with pytest.raises(RuntimeError):
+            await collect(cache.stream("mas", QUESTION, upstream.stream))
+        assert len(cache.answers) == 0
+
+    async def test_ttl(self, make_cache):
+        cache, upstream = make_cache(ttl=0.05), Upstream()
+        await cache.invoke("mas", QUESTION, upstream.invoke)
+        await asyncio.sleep(0.06)
+        await cache.invoke("mas", QUESTION, upstream.invoke)
+        assert upstream.calls == 2
+
+    async def test_without_single_flight(self, make_cache):
+        cache, upstream = make_cache(single_flight=False), Upstream(delay=0.02)
+        await asyncio.gather(*(cache.invoke("mas", QUESTION, upstream.invoke) for _ in range(3)))
+        assert upstream.calls == 3
+        assert await collect(cache.stream("ka", QUESTION, upstream.stream)) == ["Station ", "HU-1"]
+        assert await collect(cache.stream("ka", QUESTION, upstream.stream)) == ["Station HU-1"]
+
+    async def test_empty_answers_are_not_cached_without_single_flight(self, make_cache):
+        cache, upstream = make_cache(single_flight=False), Upstream(parts=("", ""))
+
+        async def empty() -> dict:
+            upstream.calls += 1
+            return {}
+
+        for _ in range(2):
+            assert await cache.invoke("mas", QUESTION, empty) == {}
+            assert await collect(cache.stream("ka", QUESTION, upstream.stream)) == ["", ""]
+        assert upstream.calls == 4
+        assert len(cache.answers) == 0
+
+
+class TestSingleFlight:
+    async def test_concurrent_invokes_share_one_call(self, make_cache):
+        cache, upstream = make_cache(), Upstream(delay=0.05)
+        results = await asyncio.gather(*(cache.invoke("mas", QUESTION, upstream.invoke) for _ in range(5)))
+        assert upstream.calls == 1
+        assert all(r == results[0] for r in results)
+        assert cache.stats()["coalesced"] == 4
+
+    async def test_concurrent_streams_all_get_every_chunk(self, make_cache):
+        cache, upstream = make_cache(), Upstream(delay=0.01, parts=("a", "b", "c"))
+        results = await asyncio.gather(*(collect(cache.stream("mas", QUESTION, upstream.stream)) for _ in range(3)))
+        assert upstream.calls == 1
+        assert results == [["a", "b", "c"]] * 3
+
+    async def test_errors_reach_every_asker(self, make_cache):
+        cache, upstream = make_cache(), Upstream(delay=0.02, fail=True)
+        results = await asyncio.gather(
+            *(cache.invoke("mas", QUESTION, upstream.invoke) for _ in range(3)), return_exceptions=True
+        )
+        assert upstream.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_disconnect_does_not_lose_the_answer(self, make_cache):
+        cache, upstream = make_cache(), Upstream(delay=0.01, parts=("a", "b", "c"))
+        async with aclosing(cache.stream("mas", QUESTION, upstream.stream)) as stream:
+            assert await anext(stream) == "a"
+        await asyncio.sleep(0.05)
+        assert await collect(cache.stream("mas", QUESTION, upstream.stream)) == ["abc"]
+        assert upstream.calls == 1
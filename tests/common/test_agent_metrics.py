@@ -0,0 +1,93 @@
+"""Tests for serving-endpoint call spans, per-endpoint metrics and slow-call samples."""
+from contextlib import aclosing
+
+import httpx
+import pytest
+
+from innovation_factory.backend import agent_metrics, sql_stats
+from innovation_factory.backend.agent_metrics import AgentMetrics, shape
+from innovation_factory.backend.route_metrics import RouteMetrics, merge_snapshots, render_prometheus
+from innovation_factory.backend.serving_stub import LatencyProfile
+from innovation_factory.backend.services import serving_client
+from innovation_factory.backend.services.databricks_agents import (
+    query_agent_endpoint,
+    stream_agent_endpoint,
+)
+
+INSTANT = LatencyProfile(first_token_ms=0, token_ms=0, tokens=10, jitter=0)
+QUESTION = [{"role": "user", "content": "Which stations are short on diesel?"}]
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """A fresh registry that samples every call as slow."""
+    registry = AgentMetrics(slow_seconds=0.0)
+    monkeypatch.setattr(agent_metrics, "registry", registry)
+    monkeypatch.setattr(serving_client, "BACKOFF_BASE", 0.0)
+    return registry
+
+
+class TestShape:
+    def test_text_is_reduced_to_length(self):
+        assert shape({"input": QUESTION, "stream": True, "max_tokens": 5}) == {
+            "input": [{"role": "user", "content": "str(35)"}],
+            "stream": "bool",
+            "max_tokens": "int",
+        }
+
+    def test_long_lists_are_truncated(self):
+        assert shape(list(range(10))) == ["int"] * 8 + ["... 2 more"]
+
+
+class TestAgentCallSpans:
+    async def test_invoke_is_recorded(self, serving_endpoint, metrics):
+        ws = serving_endpoint(LatencyProfile(first_token_ms=0, token_ms=0, tokens=10, fail_first=1))
+        with sql_stats.capture() as stats:
+            await query_agent_endpoint(ws, "mas", QUESTION, cache=False)
+        assert metrics.calls == {("mas", "invoke", "ok"): 1}
+        assert stats.agent_calls == 1 and stats.agent_seconds > 0
+
+        [sample] = metrics.slow
+        assert (sample["attempts"], sample["status"]) == (2, 200)
+        assert sample["response_bytes"] > sample["text_chars"] > 0
+        assert sample["request"] == {"input": [{"role": "user", "content": "str(35)"}]}
+        assert sample["response"]["output"][0]["type"] == "message"
+        assert "diesel" not in str(sample)
+
+    async def test_failures_are_classified(self, serving_endpoint, metrics):
+        ws = serving_endpoint(LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, error_rate=1.0))
+        with pytest.raises(httpx.HTTPStatusError):
+            await query_agent_endpoint(ws, "mas", QUESTION, cache=False)
+        row = metrics.stats()["endpoints"]["mas"]
+        assert row["outcomes"] == {"HTTP 503": 1}
+        assert row["error_rate"] == 1.0
+
+    async def test_stream_is_recorded(self, serving_endpoint, metrics):
+        ws = serving_endpoint(INSTANT)
+        answer = "".join([text async for text in stream_agent_endpoint(ws, "ka", QUESTION, cache=False)])
+        assert metrics.first_text["ka"].count == 1
+        [sample] = metrics.slow
+        assert sample["text_chars"] == len(answer)
+        assert sample["response"]["events"]["response.output_text.delta"] == INSTANT.tokens
+
+    async def test_abandoned_stream_is_cancelled(self, serving_endpoint, metrics):
+        ws = serving_endpoint(INSTANT)
+        async with aclosing(stream_agent_endpoint(ws, "ka", QUESTION, cache=False)) as stream:
+            await anext(stream)
+        assert metrics.calls == {("ka", "stream", "cancelled"): 1}
+
+    async def test_fast_calls_are_not_sampled(self, serving_endpoint, metrics):
+        metrics.slow_seconds = 60
+        await query_agent_endpoint(serving_endpoint(INSTANT), "mas", QUESTION, cache=False)
+        assert not metrics.slow
+        assert metrics.duration["mas"].count == 1
+
+
+class TestAgentPrometheus:
+    async def test_histograms_are_exported_per_endpoint(self, serving_endpoint, metrics):
+        await query_agent_endpoint(serving_endpoint(INSTANT), "mas", QUESTION, cache=False)
+        snapshot = RouteMetrics().snapshot()
+        text = render_prometheus(merge_snapshots([snapshot, snapshot]))
+        assert 'agent_calls_total{endpoint="mas",kind="invoke",outcome="ok"} 2' in text
+        assert 'agent_call_duration_seconds_count{endpoint="mas"} 2' in text
+        assert 'agent_response_bytes_bucket{endpoint="mas",le="+Inf"} 2' in text
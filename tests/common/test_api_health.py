@@ -1,6 +1,10 @@
 """Test common API endpoints."""
+from types import SimpleNamespace
+
 import pytest
 
+from innovation_factory.backend.runtime import LakebaseCredentialManager
+
 
 class TestHealthEndpoints:
     def test_version_endpoint(self, client):
@@ -24,6 +28,31 @@ class TestHealthEndpoints:
         resp = client.get("/api/docs/projects/nonexistent")
         assert resp.status_code == 404
 
+    def test_pool_stats(self, client):
+        resp = client.get("/api/debug/pool")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["config"]["pool_size"] >= 1
+        assert "engines" in data
+
+    def test_credential_stats(self, client, monkeypatch):
+        # SQLite needs no Lakebase credential
+        assert client.get("/api/debug/credentials").json() is None
+
+        postgres = SimpleNamespace(
+            generate_database_credential=lambda endpoint: SimpleNamespace(token="t", expire_time=None)
+        )
+        manager = LakebaseCredentialManager(SimpleNamespace(postgres=postgres), "endpoint")  # type: ignore[arg-type]
+        monkeypatch.setitem(client.app.state.runtime.__dict__, "credentials", manager)
+        try:
+            manager.get_token()
+            manager.get_token()
+            data = client.get("/api/debug/credentials").json()
+        finally:
+            manager.stop()
+        assert (data["hits"], data["refreshes"], data["failures"]) == (1, 1, 0)
+        assert data["expires_at"] is not None
+
 
 class TestIdeaEndpoints:
     def test_create_idea_session(self, client):
@@ -0,0 +1,51 @@
+"""Tests for the seed bulk loader."""
+from sqlmodel import select
+
+from innovation_factory.backend.bulk import BulkLoader, bulk_options
+from innovation_factory.backend.projects.vi_home_one.models import (
+    OptimizationMode,
+    VhHousehold,
+    VhNeighborhood,
+)
+
+
+def _neighborhood(session) -> VhNeighborhood:
+    neighborhood = VhNeighborhood(name="Bulk Test", location="Nowhere", total_households=3)
+    session.add(neighborhood)
+    session.flush()
+    return neighborhood
+
+
+class TestBulkLoader:
+    def test_batches_rows_with_executemany(self, session):
+        batches = []
+        neighborhood = _neighborhood(session)
+        with BulkLoader(session, batch_size=2, progress=lambda t, n: batches.append(n)) as loader:
+            households = loader.table(VhHousehold, ("neighborhood_id", "owner_name", "address"))
+            for i in range(5):
+                households.append((neighborhood.id, f"Owner {i}", f"Street {i}"))
+
+        assert households.loaded == 5
+        assert batches == [2, 4, 5]
+        assert not loader.use_copy  # SQLite
+
+    def test_python_defaults_and_enums(self, session):
+        neighborhood = _neighborhood(session)
+        with BulkLoader(session) as loader:
+            loader.load(
+                VhHousehold,
+                ("neighborhood_id", "owner_name", "address", "optimization_mode"),
+                [(neighborhood.id, "Enum Owner", "Enum Street", OptimizationMode.cost_saver)],
+            )
+        household = session.exec(
+            select(VhHousehold).where(VhHousehold.owner_name == "Enum Owner")
+        ).one()
+        assert household.optimization_mode == OptimizationMode.cost_saver
+        assert household.created_at is not None
+        assert household.has_pv is False
+
+    def test_options_apply_to_new_loaders(self, session):
+        with bulk_options(batch_size=30, use_copy=False):
+            loader = BulkLoader(session)
+        assert loader.batch_size == 30
+        assert BulkLoader(session).batch_size != 30
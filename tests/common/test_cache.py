@@ -0,0 +1,85 @@
+"""Tests for in-process TTL caches and the OBO client cache."""
+import time
+
+import pytest
+
+from innovation_factory.backend import dependencies
+from innovation_factory.backend.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_hits_and_misses(self):
+        cache = TTLCache("test_hits", maxsize=4, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_entries_expire(self):
+        cache = TTLCache("test_expiry", ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache("test_lru", maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_failed_factory_is_not_cached(self):
+        cache = TTLCache("test_factory", ttl=60)
+
+        def boom():
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_set("a", boom)
+        assert cache.get_or_set("a", lambda: 2) == 2
+
+
+class _FakeOboClient:
+    created = 0
+
+    def __init__(self, token: str, auth_type: str):
+        type(self).created += 1
+        self.token = token
+
+
+class TestOboClientCache:
+    @pytest.fixture(autouse=True)
+    def _remote_mode(self, monkeypatch):
+        monkeypatch.setattr(dependencies, "is_local_dev", lambda: False)
+        monkeypatch.setattr(dependencies, "OboWorkspaceClient", _FakeOboClient)
+        dependencies.obo_clients.clear()
+        _FakeOboClient.created = 0
+        yield
+        dependencies.obo_clients.clear()
+
+    def test_client_is_reused_per_token(self):
+        first = dependencies.get_obo_ws(token="token-a")
+        assert dependencies.get_obo_ws(token="token-a") is first
+        assert dependencies.get_obo_ws(token="token-b") is not first
+        assert _FakeOboClient.created == 2
+
+    def test_raw_token_is_not_a_key(self):
+        dependencies.get_obo_ws(token="secret-token")
+        assert "secret-token" not in dependencies.obo_clients._data
+
+    def test_identity_is_memoized(self):
+        calls = []
+
+        class _Api:
+            def me(self):
+                calls.append(1)
+                return "user"
+
+        memoized = dependencies._MemoizedCurrentUserAPI(_Api())
+        assert memoized.me() == memoized.me() == "user"
+        assert len(calls) == 1
@@ -0,0 +1,116 @@
+"""Tests for ETag / If-None-Match conditional responses."""
+import pytest
+from sqlmodel import select
+
+from innovation_factory.backend import response_cache
+from innovation_factory.backend.conditional import _matches
+from innovation_factory.backend.projects.mol_asm_cockpit.models import (
+    MacAlertSeverity,
+    MacAnomalyAlert,
+    MacRegion,
+    MacStation,
+    StationType,
+)
+from innovation_factory.backend.response_cache import LocalTagVersions
+
+ALERTS = "/api/projects/mol-asm-cockpit/anomalies"
+
+
+@pytest.fixture(autouse=True)
+def local_tag_versions(monkeypatch):
+    monkeypatch.setattr(response_cache, "tag_versions", LocalTagVersions())
+
+
+@pytest.fixture
+def station(session):
+    region = MacRegion(name="ETag Region", country="HU")
+    session.add(region)
+    session.flush()
+    station = MacStation(
+        station_code="HU-ET-001",
+        name="ETag Station",
+        city="Pécs",
+        region_id=region.id,
+        station_type=StationType.urban,
+        has_fresh_corner=False,
+        has_ev_charging=False,
+        num_pumps=4,
+        latitude=46.07,
+        longitude=18.23,
+    )
+    session.add(station)
+    session.commit()
+    yield station
+    for alert in session.exec(select(MacAnomalyAlert).where(MacAnomalyAlert.station_id == station.id)):
+        session.delete(alert)
+    session.flush()
+    session.delete(station)
+    session.flush()
+    session.delete(region)
+    session.commit()
+
+
+def add_alert(session, station) -> MacAnomalyAlert:
+    alert = MacAnomalyAlert(
+        station_id=station.id,
+        metric_type="fuel_volume",
+        severity=MacAlertSeverity.high,
+        title="Volume drop",
+        description="Fuel volume below forecast",
+        suggested_action="Check pumps",
+    )
+    session.add(alert)
+    session.commit()
+    return alert
+
+
+class TestConditionalResponses:
+    def test_unchanged_list_is_not_modified(self, client, session, station):
+        add_alert(session, station)
+        params = {"station_id": station.id}
+        first = client.get(ALERTS, params=params)
+        etag = first.headers["etag"]
+        assert first.status_code == 200 and len(first.json()) == 1
+        assert etag.startswith('W/"')
+
+        again = client.get(ALERTS, params=params, headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+    def test_filters_change_the_etag(self, client, station):
+        a = client.get(ALERTS, params={"station_id": station.id}).headers["etag"]
+        b = client.get(ALERTS, params={"station_id": station.id, "limit": 5}).headers["etag"]
+        c = client.get(ALERTS, params={"station_id": station.id, "status": "active"}).headers["etag"]
+        assert len({a, b, c}) == 3
+
+    def test_new_rows_change_the_etag(self, client, session, station):
+        params = {"station_id": station.id}
+        etag = client.get(ALERTS, params=params).headers["etag"]
+        add_alert(session, station)
+        resp = client.get(ALERTS, params=params, headers={"If-None-Match": etag})
+        assert resp.status_code == 200 and len(resp.json()) == 1
+
+    def test_status_update_changes_the_etag(self, client, session, station):
+        alert = add_alert(session, station)
+        params = {"station_id": station.id}
+        etag = client.get(ALERTS, params=params).headers["etag"]
+        assert client.patch(f"{ALERTS}/{alert.id}", json={"status": "acknowledged"}).status_code == 200
+        resp = client.get(ALERTS, params=params, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()[0]["status"] == "acknowledged"
+
+    def test_dashboard_counts(self, client):
+        url = "/api/projects/adtech-intelligence/anomalies/counts"
+        first = client.get(url)
+        assert "total" in first.json()
+        resp = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert resp.status_code == 304
+
+    def test_if_none_match_parsing(self):
+        etag = 'W/"abc"'
+        assert _matches('"abc"', etag)
+        assert _matches('"x", W/"abc"', etag)
+        assert _matches("*", etag)
+        assert not _matches('"abd"', etag)
+        assert not _matches(None, etag)
@@ -1,7 +1,7 @@
 """Unit tests for Databricks agent utilities (no live connection required)."""
 import pytest
 
-from innovation_factory.backend.services.databricks_agents import extract_agent_text
+from innovation_factory.backend.services.databricks_agents import AgentStreamParser, extract_agent_text
 
 
 class TestAgentTextExtraction:
@@ -37,3 +37,66 @@ class TestAgentTextExtraction:
         result = extract_agent_text(response)
         assert "Real answer" in result
         assert "function_call" not in result
+
+
+def _message(text: str, item_id: str | None = None) -> dict:
+    item = {"type": "message", "role": "assistant", "content": [{"type": "output_text", "text": text}]}
+    return {**item, "id": item_id} if item_id else item
+
+
+def _feed(events: list[dict]) -> list[str]:
+    parser = AgentStreamParser()
+    return [text for text in map(parser.feed, events) if text]
+
+
+class TestAgentStreamParser:
+    """Test incremental text extraction from streamed agent events."""
+
+    def test_text_deltas(self):
+        events = [
+            {"type": "response.created"},
+            {"type": "response.output_item.added", "item": {"type": "message", "role": "assistant", "id": "m1"}},
+            {"type": "response.output_text.delta", "item_id": "m1", "delta": "Hel"},
+            {"type": "response.output_text.delta", "item_id": "m1", "delta": "lo"},
+            {"type": "response.output_item.done", "item": _message("Hello", "m1")},
+            {"type": "response.completed"},
+        ]
+        assert _feed(events) == ["Hel", "lo"]
+
+    def test_done_item_without_id_is_not_repeated(self):
+        events = [
+            {"type": "response.output_text.delta", "item_id": "m1", "delta": "Hi"},
+            {"type": "response.output_item.done", "item": _message("Hi")},
+        ]
+        assert _feed(events) == ["Hi"]
+
+    def test_skips_tool_calls_as_they_arrive(self):
+        call = {"type": "function_call", "id": "c1", "name": "genie", "arguments": "{}"}
+        events = [
+            {"type": "response.output_item.added", "item": call},
+            {"type": "response.function_call_arguments.delta", "item_id": "c1", "delta": "{}"},
+            {"type": "response.output_item.done", "item": call},
+            {"type": "response.output_item.done", "item": {"type": "function_call_output", "output": "rows"}},
+            {"type": "response.output_item.done", "item": {"type": "message", "role": "tool", "content": "x"}},
+            {"type": "response.output_text.delta", "item_id": "m2", "delta": "Answer"},
+        ]
+        assert _feed(events) == ["Answer"]
+
+    def test_whole_items_are_joined_like_extract_agent_text(self):
+        first, second = _message("First agent", "m1"), _message("Second agent", "m2")
+        assert "".join(_feed([
+            {"type": "response.output_item.done", "item": first},
+            {"type": "response.output_item.done", "item": second},
+        ])) == extract_agent_text([first, second])
+
+    def test_chat_completion_and_agent_chunks(self):
+        assert _feed([{"choices": [{"delta": {"content": "A"}}]}, {"choices": [{"delta": {}}]}]) == ["A"]
+        assert _feed([{"delta": {"role": "assistant", "content": "B"}}]) == ["B"]
+
+    def test_complete_body(self):
+        body = {"output": [{"type": "function_call", "name": "t"}, _message("Done")]}
+        assert _feed([body]) == [extract_agent_text(body)]
+
+    def test_error_event_raises(self):
+        with pytest.raises(RuntimeError, match="rate limited"):
+            AgentStreamParser().feed({"type": "error", "message": "rate limited"})
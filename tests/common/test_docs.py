@@ -0,0 +1,121 @@
+"""Tests for the in-memory project documentation index."""
+import os
+
+import pytest
+
+from innovation_factory.backend.docs import DocsIndex, parse, snippet
+
+PUMPS = """# Heat Pumps (pumps)
+
+## Purpose
+
+Heat pump monitoring for households.
+
+## Data Model
+
+Key tables: `vh_households`, `vh_energy_devices`.
+
+```python
+# not a heading
+```
+"""
+
+FUEL = """# Fuel Cockpit
+
+## Purpose
+
+Fuel and non-fuel sales for stations. Pump prices are compared with competitors.
+"""
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    (tmp_path / "pumps.md").write_text(PUMPS, encoding="utf-8")
+    (tmp_path / "fuel.md").write_text(FUEL, encoding="utf-8")
+    return tmp_path
+
+
+def touch(path, content: str) -> None:
+    """Rewrite ``path`` with a strictly newer mtime, even on coarse filesystems."""
+    mtime = path.stat().st_mtime_ns
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+class TestParse:
+    def test_title_headings_and_sections(self):
+        doc = parse("pumps", PUMPS)
+        assert doc.title == "Heat Pumps (pumps)"
+        assert doc.headings == ("Heat Pumps (pumps)", "Purpose", "Data Model")
+        assert doc.sections[2].text.startswith("Key tables: vh_households, vh_energy_devices.")
+
+    def test_title_falls_back_to_slug(self):
+        assert parse("notes", "just text").title == "notes"
+
+    def test_snippet_centres_on_the_match(self):
+        text = " ".join(f"word{i}" for i in range(100)) + " needle " + " ".join(f"tail{i}" for i in range(100))
+        cut = snippet(text, {"needle"}, width=60)
+        assert "needle" in cut
+        assert cut.startswith("…") and cut.endswith("…")
+        assert len(cut) <= 62
+
+
+class TestDocsIndex:
+    def test_serves_docs_from_memory(self, docs_dir):
+        index = DocsIndex(docs_dir, reload_interval=3600)
+        assert index.slugs() == ["fuel", "pumps"]
+        (docs_dir / "fuel.md").unlink()
+        doc = index.get("fuel")
+        assert doc is not None and doc.title == "Fuel Cockpit"
+        assert index.reloads == 1
+
+    def test_ranking(self, docs_dir):
+        hits = DocsIndex(docs_dir).search("heat pump")
+        assert hits[0].slug == "pumps"
+        assert ("pumps", "Purpose") in [(h.slug, h.heading) for h in hits]
+        assert hits[0].title == "Heat Pumps (pumps)"
+        assert {h.slug for h in hits} == {"pumps", "fuel"}
+        assert [h.score for h in hits] == sorted((h.score for h in hits), reverse=True)
+
+    def test_prefix_matches(self, docs_dir):
+        index = DocsIndex(docs_dir)
+        assert [h.slug for h in index.search("competit")] == ["fuel"]
+        assert index.search("vh_energy")[0].heading == "Data Model"
+        assert index.search("nothing matches") == []
+
+    def test_filter_and_limit(self, docs_dir):
+        index = DocsIndex(docs_dir)
+        assert {h.slug for h in index.search("purpose", slug="fuel")} == {"fuel"}
+        assert len(index.search("purpose", limit=1)) == 1
+
+    def test_reloads_changed_files(self, docs_dir):
+        index = DocsIndex(docs_dir, reload_interval=0)
+        assert index.search("hydrogen") == []
+        touch(docs_dir / "fuel.md", FUEL + "\nHydrogen is planned.\n")
+        (docs_dir / "pumps.md").unlink()
+        assert [h.slug for h in index.search("hydrogen")] == ["fuel"]
+        assert index.slugs() == ["fuel"]
+        assert index.reloads == 2
+
+    def test_missing_directory(self, tmp_path):
+        index = DocsIndex(tmp_path / "missing")
+        assert index.slugs() == []
+        assert index.search("anything") == []
+
+
+class TestSearchEndpoint:
+    def test_search_project_docs(self, client):
+        resp = client.get("/api/docs/search", params={"q": "heat pump", "limit": 3})
+        assert resp.status_code == 200
+        hits = resp.json()
+        assert 0 < len(hits) <= 3
+        assert hits[0]["slug"] == "vi-home-one"
+        assert set(hits[0]) == {"slug", "title", "heading", "snippet", "score"}
+
+    def test_query_is_required(self, client):
+        assert client.get("/api/docs/search").status_code == 422
+
+    def test_doc_content_from_index(self, client):
+        resp = client.get("/api/docs/projects/vi-home-one")
+        assert resp.status_code == 200
+        assert resp.json()["title"] == "ViDistrictOne (vi-home-one)"
@@ -0,0 +1,93 @@
+"""Tests for streamed, non-blocking idea generation."""
+import json
+
+import pytest
+
+from innovation_factory.backend.routers import ideas
+from innovation_factory.backend.serving_stub import LatencyProfile
+
+FAST = LatencyProfile(first_token_ms=0, token_ms=0, tokens=30, jitter=0)
+
+
+@pytest.fixture
+def generator(client, serving_endpoint, monkeypatch):
+    """Point the idea generator at a stub serving endpoint with ``profile``."""
+
+    def use(profile: LatencyProfile) -> None:
+        monkeypatch.setitem(client.app.state.runtime.__dict__, "ws", serving_endpoint(profile))
+
+    return use
+
+
+def start_generation(client) -> int:
+    session_id = client.post("/api/ideas/sessions").json()["id"]
+    client.post(f"/api/ideas/sessions/{session_id}/chat", json={"content": "StreamCorp"})
+    return session_id
+
+
+def stream_events(client, session_id: int) -> list:
+    events = []
+    with client.stream(
+        "POST",
+        f"/api/ideas/sessions/{session_id}/chat",
+        json={"content": "An energy dashboard"},
+        headers={"Accept": "text/event-stream"},
+    ) as resp:
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        for line in resp.iter_lines():
+            if line.startswith("data: "):
+                data = line[6:]
+                events.append(data if data == "[DONE]" else json.loads(data))
+    return events
+
+
+class TestStreamedGeneration:
+    def test_tokens_are_streamed_and_persisted(self, client, generator):
+        generator(FAST)
+        session_id = start_generation(client)
+        events = stream_events(client, session_id)
+
+        deltas = [e["text"] for e in events if isinstance(e, dict) and e["type"] == "delta"]
+        assert len(deltas) == FAST.tokens
+        done = events[-2]
+        assert events[-1] == "[DONE]"
+        assert done["type"] == "done"
+        assert done["generated_prompt"] == "".join(deltas)
+        assert done["generated_prompt"].startswith("Stub answer to: Generate a detailed project idea")
+
+        session = client.get(f"/api/ideas/sessions/{session_id}").json()
+        assert session["status"] == "completed"
+        assert session["generated_prompt"] == done["generated_prompt"]
+        messages = client.get(f"/api/ideas/sessions/{session_id}/messages").json()
+        assert done["generated_prompt"] in messages[-1]["content"]
+
+    def test_slow_first_token_falls_back(self, client, generator, monkeypatch):
+        generator(LatencyProfile(first_token_ms=2000, token_ms=0, tokens=5, jitter=0))
+        monkeypatch.setattr(ideas, "IDEA_FIRST_TOKEN_TIMEOUT", 0.05)
+        events = stream_events(client, start_generation(client))
+        assert [e["type"] for e in events[:-1]] == ["delta", "done"]
+        assert events[-2]["generated_prompt"].startswith('Build a full-stack web application for "StreamCorp"')
+
+    def test_timeout_mid_stream_resets_to_the_template(self, client, generator, monkeypatch):
+        generator(LatencyProfile(first_token_ms=0, token_ms=50, tokens=100, jitter=0))
+        monkeypatch.setattr(ideas, "IDEA_GENERATOR_TIMEOUT", 0.2)
+        events = stream_events(client, start_generation(client))
+        types = [e["type"] for e in events[:-1]]
+        assert "reset" in types
+        reset = types.index("reset")
+        assert reset > 0 and set(types[:reset]) == {"delta"}
+        assert "TimeoutError" in events[reset]["reason"]
+        assert events[-2]["generated_prompt"] == events[reset + 1]["text"]
+
+    def test_endpoint_errors_fall_back(self, client, generator):
+        generator(LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, error_rate=1.0))
+        events = stream_events(client, start_generation(client))
+        assert events[-2]["generated_prompt"].startswith("Build a full-stack web application")
+
+    def test_json_response_without_event_stream(self, client, generator):
+        generator(FAST)
+        session_id = start_generation(client)
+        resp = client.post(f"/api/ideas/sessions/{session_id}/chat", json={"content": "A dashboard"})
+        data = resp.json()
+        assert data["status"] == "completed"
+        assert data["generated_prompt"].startswith("Stub answer to:")
@@ -0,0 +1,183 @@
+"""Tests for the background job runner and the /api/jobs endpoints."""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from innovation_factory.backend.jobs import JOB_QUEUED_STALE_SECONDS, JobRunner, job, jobs, kinds
+from innovation_factory.backend.locks import process_lock
+from innovation_factory.backend.models import Job, JobStatus
+
+release = threading.Event()
+
+
+@pytest.fixture
+def test_kinds():
+    release.clear()
+
+    @job("test:count", "Counts to n")
+    def count(ctx, n: int = 3) -> dict:
+        for i in range(n):
+            ctx.progress(i / n, f"step {i}")
+        return {"counted": n}
+
+    @job("test:fail", "Always fails")
+    def fail(ctx) -> None:
+        raise RuntimeError("boom")
+
+    @job("test:block", "Waits for the test", exclusive=True)
+    def block(ctx) -> dict:
+        ctx.progress(0.5, "waiting")
+        release.wait(10)
+        return {}
+
+    yield
+    release.set()
+    for name in ("test:count", "test:fail", "test:block"):
+        kinds.pop(name, None)
+
+
+@pytest.fixture
+def dev_mode(client, monkeypatch):
+    """Let dev-only job kinds run, as under ``apx dev``."""
+    monkeypatch.setitem(client.app.state.runtime.__dict__, "_dev_db_port", 5432)
+
+
+def wait_for(client, job_id: int, statuses=("succeeded", "failed"), timeout: float = 10) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        body = client.get(f"/api/jobs/{job_id}").json()
+        if body["status"] in statuses:
+            return body
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} still {body['status']}")
+
+
+class TestJobEndpoints:
+    def test_job_runs_to_completion(self, client, test_kinds):
+        resp = client.post("/api/jobs", json={"kind": "test:count", "params": {"n": 4}})
+        assert resp.status_code == 202
+        assert resp.json()["status"] == "queued"
+        done = wait_for(client, resp.json()["id"])
+        assert done["status"] == "succeeded"
+        assert done["progress"] == 1.0
+        assert done["result"] == {"counted": 4}
+        assert done["started_at"] and done["finished_at"] and done["worker"]
+
+    def test_failure_is_recorded(self, client, test_kinds):
+        job_id = client.post("/api/jobs", json={"kind": "test:fail"}).json()["id"]
+        done = wait_for(client, job_id)
+        assert done["status"] == "failed"
+        assert done["error"] == "RuntimeError: boom"
+
+    def test_bad_params_fail_the_job(self, client, test_kinds):
+        job_id = client.post("/api/jobs", json={"kind": "test:count", "params": {"m": 1}}).json()["id"]
+        assert wait_for(client, job_id)["error"].startswith("TypeError")
+
+    def test_exclusive_kinds_run_once(self, client, test_kinds):
+        job_id = client.post("/api/jobs", json={"kind": "test:block"}).json()["id"]
+        running = wait_for(client, job_id, statuses=("running",))
+        assert running["message"] == "waiting"
+        assert client.post("/api/jobs", json={"kind": "test:block"}).status_code == 409
+        release.set()
+        assert wait_for(client, job_id)["status"] == "succeeded"
+
+    def test_unknown_kind(self, client):
+        assert client.post("/api/jobs", json={"kind": "nope"}).status_code == 404
+        assert client.get("/api/jobs/999999").status_code == 404
+
+    def test_list_and_kinds(self, client, test_kinds):
+        job_id = client.post("/api/jobs", json={"kind": "test:count"}).json()["id"]
+        wait_for(client, job_id)
+        listed = client.get("/api/jobs", params={"kind": "test:count", "status": "succeeded"}).json()
+        assert listed[0]["id"] == job_id
+        assert {j["kind"] for j in listed} == {"test:count"}
+        names = {k["name"]: k for k in client.get("/api/jobs/kinds").json()}
+        assert names["seed"]["exclusive"] is True
+        assert names["seed"]["dev_only"] is True
+        assert "at:detect-anomalies" in names
+
+    def test_dev_only_kinds_are_refused(self, client):
+        for kind in ("seed", "at:detect-anomalies"):
+            resp = client.post("/api/jobs", json={"kind": kind})
+            assert resp.status_code == 403
+            assert "local dev" in resp.json()["detail"]
+        assert client.post("/api/seed").json()["status"] == "skipped"
+
+    def test_anomaly_detection_job(self, client, dev_mode):
+        job_id = client.post("/api/jobs", json={"kind": "at:detect-anomalies"}).json()["id"]
+        done = wait_for(client, job_id, timeout=30)
+        assert done["status"] == "succeeded", done["error"]
+        assert done["result"]["created"] >= 0
+
+    def test_seed_endpoint_submits_a_job(self, client):
+        body = client.post("/api/seed").json()
+        if body["status"] == "skipped":
+            pytest.skip("seeding is only exposed in local dev mode")
+        assert body["status"] in ("started", "already_started")
+
+
+class TestJobRunner:
+    def test_queue_is_bounded(self, client, test_kinds):
+        runtime = client.app.state.runtime
+        runner = JobRunner(workers=1, queue_size=0)
+        runner.submit(runtime, "test:block")
+        with pytest.raises(HTTPException) as exc:
+            runner.submit(runtime, "test:count")
+        assert exc.value.status_code == 503
+        release.set()
+        runner.shutdown(runtime)
+
+    def test_stale_running_job_is_failed(self, client, test_kinds):
+        runtime = client.app.state.runtime
+        with runtime.get_session() as db:
+            stale = Job(kind="test:block", status=JobStatus.running, worker="gone:1")
+            db.add(stale)
+            db.commit()
+            db.refresh(stale)
+        release.set()
+        fresh = jobs.submit(runtime, "test:block")
+        with runtime.get_session() as db:
+            assert db.get(Job, stale.id).status == JobStatus.failed
+        assert fresh.id is not None
+        assert wait_for(client, fresh.id)["status"] == "succeeded"
+
+    def test_stale_queued_job_is_failed(self, client, test_kinds):
+        runtime = client.app.state.runtime
+        created_at = datetime.now(timezone.utc) - timedelta(seconds=JOB_QUEUED_STALE_SECONDS + 1)
+        with runtime.get_session() as db:
+            live = Job(kind="test:block", worker="busy:1")
+            db.add(live)
+            db.commit()
+            live_id = live.id
+        # Another worker's recently queued job still blocks the kind
+        with pytest.raises(HTTPException) as exc:
+            jobs.submit(runtime, "test:block")
+        assert exc.value.status_code == 409
+
+        with runtime.get_session() as db:
+            live = db.get(Job, live_id)
+            assert live is not None
+            live.created_at = created_at
+            db.add(live)
+            db.commit()
+        release.set()
+        fresh = jobs.submit(runtime, "test:block")
+        with runtime.get_session() as db:
+            lost = db.get(Job, live_id)
+            assert lost is not None and lost.status == JobStatus.failed
+            assert lost.error == "Worker stopped before the job started"
+        assert fresh.id is not None
+        assert wait_for(client, fresh.id)["status"] == "succeeded"
+
+    def test_lock_held_elsewhere_fails_the_job(self, client, test_kinds):
+        runtime = client.app.state.runtime
+        with process_lock(runtime.engine, "job:test:block", blocking=False) as acquired:
+            assert acquired
+            job_id = jobs.submit(runtime, "test:block").id
+            assert job_id is not None
+            done = wait_for(client, job_id)
+        assert done["status"] == "failed"
+        assert "another worker" in done["error"]
@@ -46,3 +46,44 @@ class TestProjectNotFound:
     def test_get_nonexistent_returns_404(self, client, endpoint):
         resp = client.get(endpoint)
         assert resp.status_code in (404, 422)
+
+
+class TestProjectRegistry:
+    def test_registry_covers_all_projects(self):
+        from innovation_factory.backend.projects.registry import PROJECTS
+
+        assert {p.slug for p in PROJECTS} == set(PROJECT_LIST_ENDPOINTS)
+
+    def test_enabled_projects_filter(self, monkeypatch):
+        from innovation_factory.backend.projects.registry import enabled_projects
+
+        monkeypatch.setenv("ENABLED_PROJECTS", "bsh-home-connect, vi-home-one")
+        assert [p.slug for p in enabled_projects()] == ["vi-home-one", "bsh-home-connect"]
+
+    def test_seeders_resolve(self):
+        from innovation_factory.backend.projects.registry import PROJECTS
+
+        for project in PROJECTS:
+            assert callable(project.load_seeder())
+
+    def test_seed_lists_only_enabled_projects(self, monkeypatch):
+        from sqlmodel import Session, SQLModel, create_engine, select
+
+        from innovation_factory.backend.models import Project
+        from innovation_factory.backend.projects.registry import ProjectSpec, load_all_models
+        from innovation_factory.backend.seed import seed_database
+
+        load_all_models()
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        monkeypatch.setenv("ENABLED_PROJECTS", "mol-asm-cockpit")
+        monkeypatch.setattr(ProjectSpec, "load_seeder", lambda self: lambda session: None)
+        with Session(engine) as session:
+            seed_database(session)
+            assert [p.slug for p in session.exec(select(Project))] == ["mol-asm-cockpit"]
+
+    def test_startup_profile(self, client):
+        resp = client.get("/api/debug/startup")
+        assert resp.status_code == 200
+        phases = {p["phase"] for p in resp.json()["phases"]}
+        assert "lifespan:initialize_models" in phases
@@ -0,0 +1,113 @@
+"""Tests for declarative response caching and tag invalidation."""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from innovation_factory.backend import response_cache
+from innovation_factory.backend.cache import caches
+from innovation_factory.backend.response_cache import (
+    FileTagVersions,
+    LocalTagVersions,
+    cached,
+    invalidate,
+    invalidate_all,
+    invalidates,
+)
+from innovation_factory.backend.route_metrics import RouteMetrics, merge_snapshots, render_prometheus
+
+
+class ItemOut(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(response_cache, "tag_versions", LocalTagVersions())
+    calls: list[str] = []
+    app = FastAPI()
+
+    class Db:
+        """Stands in for a session dependency; never part of the key."""
+
+    def get_db():
+        return Db()
+
+    @app.get("/items", response_model=list[ItemOut])
+    @cached("test_listItems", tags=["items"])
+    def list_items(db: Db = Depends(get_db), prefix: str = ""):
+        calls.append(prefix)
+        return [ItemOut(id=1, name=f"{prefix}one", created_at=datetime(2025, 1, 1, tzinfo=timezone.utc))]
+
+    @app.get("/other")
+    @cached("test_getOther", tags=["other"])
+    async def get_other():
+        calls.append("other")
+        return {"ok": True}
+
+    @app.post("/items")
+    @invalidates("items")
+    def create_item():
+        return {"created": True}
+
+    app.state.calls = calls
+    yield app
+    for name in ("response:test_listItems", "response:test_getOther"):
+        caches.pop(name, None)
+
+
+class TestResponseCache:
+    def test_hits_skip_the_handler(self, app):
+        client = TestClient(app)
+        first = client.get("/items").json()
+        assert client.get("/items").json() == first
+        assert first[0]["created_at"] == "2025-01-01T00:00:00Z"
+        assert app.state.calls == [""]
+        assert caches["response:test_listItems"].stats()["hits"] == 1
+
+    def test_query_parameters_are_part_of_the_key(self, app):
+        client = TestClient(app)
+        client.get("/items", params={"prefix": "a"})
+        client.get("/items", params={"prefix": "b"})
+        client.get("/items", params={"prefix": "a"})
+        assert app.state.calls == ["a", "b"]
+
+    def test_write_handler_invalidates_its_tags_only(self, app):
+        client = TestClient(app)
+        client.get("/items")
+        client.get("/other")
+        client.post("/items")
+        client.get("/items")
+        client.get("/other")
+        assert app.state.calls == ["", "other", ""]
+
+    def test_invalidate_all(self, app):
+        client = TestClient(app)
+        client.get("/other")
+        invalidate_all()
+        client.get("/other")
+        assert app.state.calls == ["other", "other"]
+
+    def test_file_versions_are_shared_between_workers(self, tmp_path, monkeypatch):
+        worker_a, worker_b = FileTagVersions(tmp_path), FileTagVersions(tmp_path)
+        before = worker_b.get(("items", "other"))
+        assert before == (0, 0)
+
+        monkeypatch.setattr(response_cache, "tag_versions", worker_a)
+        invalidate("items")
+        invalidate("items")
+        after = worker_b.get(("items", "other"))
+        assert after[0] > before[0] and after[1] == 0
+
+    def test_cache_counters_are_exported(self, app):
+        client = TestClient(app)
+        client.get("/items")
+        client.get("/items")
+        text = render_prometheus(merge_snapshots([RouteMetrics().snapshot()]))
+        assert 'cache_hits_total{cache="response:test_listItems"} 1' in text
+        assert 'cache_misses_total{cache="response:test_listItems"} 1' in text
+        assert 'cache_entries{cache="response:test_listItems"} 1' in text
@@ -0,0 +1,74 @@
+"""Tests for per-route metrics and their Prometheus export."""
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from innovation_factory.backend.route_metrics import (
+    RouteMetrics,
+    RouteMetricsMiddleware,
+    merge_snapshots,
+    render_prometheus,
+)
+
+
+def _app(metrics: RouteMetrics) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/items/{item_id}", operation_id="getItem")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/api/stream", operation_id="streamItems")
+    async def stream_items():
+        async def events():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+                await asyncio.sleep(0.01)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    app.add_middleware(RouteMetricsMiddleware, metrics=metrics)  # type: ignore[invalid-argument-type]
+    return app
+
+
+class TestRouteMetrics:
+    def test_requests_are_keyed_by_operation_id(self):
+        metrics = RouteMetrics()
+        client = TestClient(_app(metrics))
+        client.get("/api/items/1")
+        client.get("/api/items/2")
+        client.get("/api/nope")
+        assert metrics.requests[("getItem", "GET", "200")] == 2
+        assert metrics.requests[("unmatched", "GET", "404")] == 1
+        assert metrics.latency["getItem"].count == 2
+        assert metrics.in_flight["getItem"] == 0
+
+    def test_streaming_is_measured_separately(self):
+        metrics = RouteMetrics()
+        client = TestClient(_app(metrics))
+        resp = client.get("/api/stream")
+        assert resp.text.count("data:") == 3
+        assert "streamItems" not in metrics.latency
+        assert metrics.sse_ttfb["streamItems"].count == 1
+        assert metrics.sse_duration["streamItems"].sum >= metrics.sse_ttfb["streamItems"].sum
+
+    def test_worker_snapshots_are_merged(self):
+        first, second = RouteMetrics(), RouteMetrics()
+        TestClient(_app(first)).get("/api/items/1")
+        TestClient(_app(second)).get("/api/items/2")
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+        text = render_prometheus(merged)
+        assert "app_workers 2" in text
+        assert 'http_requests_total{operation="getItem",method="GET",status="200"} 2' in text
+        assert 'http_request_duration_seconds_count{operation="getItem"} 2' in text
+
+
+class TestMetricsEndpoint:
+    def test_prometheus_endpoint(self, client):
+        client.get("/api/projects")
+        resp = client.get("/api/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert 'http_requests_total{operation="listProjects",method="GET",status="200"}' in resp.text
@@ -0,0 +1,175 @@
+"""Unit tests for runtime helpers (no live connection required)."""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, exc
+from sqlalchemy.pool import NullPool
+
+from innovation_factory.backend.config import AppConfig
+from innovation_factory.backend.locks import process_lock
+from innovation_factory.backend.pool import MonitoredQueuePool, PoolMonitor
+from innovation_factory.backend.runtime import LakebaseCredentialManager, Runtime
+from innovation_factory.backend.schema import schema_fingerprint
+
+
+class _FakePostgres:
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.gate: threading.Event | None = None
+
+    def generate_database_credential(self, endpoint: str):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("control plane unavailable")
+        return SimpleNamespace(token=f"token-{self.calls}", expire_time=None)
+
+
+def _manager(fail: bool = False) -> tuple[LakebaseCredentialManager, _FakePostgres]:
+    postgres = _FakePostgres(fail=fail)
+    ws = SimpleNamespace(postgres=postgres)
+    return LakebaseCredentialManager(ws, "projects/p/branches/b/endpoints/e"), postgres  # type: ignore[arg-type]
+
+
+class TestLakebaseCredentialManager:
+    def test_token_is_cached_across_connections(self):
+        manager, postgres = _manager()
+        try:
+            tokens = {manager.get_token() for _ in range(20)}
+        finally:
+            manager.stop()
+        assert tokens == {"token-1"}
+        assert postgres.calls == 1
+        assert manager.stats()["hits"] == 19
+        assert manager.stats()["refreshes"] == 1
+
+    def test_expired_token_is_refreshed(self):
+        manager, postgres = _manager()
+        try:
+            manager.get_token()
+            manager._expires_at = time.time() - 1
+            assert manager.get_token() == "token-2"
+        finally:
+            manager.stop()
+        assert postgres.calls == 2
+
+    def test_refresh_does_not_block_cached_token(self):
+        manager, postgres = _manager()
+        try:
+            manager.get_token()
+            postgres.gate = threading.Event()
+            refresher = threading.Thread(target=manager.refresh)
+            refresher.start()
+            # The refresh is stuck in the control-plane call; the cached token is still served
+            assert manager.get_token() == "token-1"
+            postgres.gate.set()
+            refresher.join(5)
+            assert manager.get_token() == "token-2"
+        finally:
+            manager.stop()
+
+    def test_failures_are_counted(self):
+        manager, _ = _manager(fail=True)
+        with pytest.raises(RuntimeError):
+            manager.get_token()
+        assert manager.stats()["failures"] == 1
+
+
+class TestPoolMonitor:
+    def _engine(self):
+        engine = create_engine(
+            "sqlite://",
+            poolclass=MonitoredQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        engine.pool.monitor = PoolMonitor()  # type: ignore[attr-defined]
+        return engine
+
+    def test_checkouts_are_timed(self):
+        engine = self._engine()
+        for _ in range(3):
+            with engine.connect():
+                pass
+        stats = engine.pool.monitor.snapshot(engine.pool)
+        assert stats["wait_seconds"]["count"] == 3
+        assert stats["checked_out"] == 0
+        assert stats["size"] == 1
+
+    def test_exhausted_pool_counts_timeouts(self):
+        engine = self._engine()
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            stats = engine.pool.monitor.snapshot(engine.pool)
+        assert stats["timeouts"] == 1
+        assert stats["checked_out"] == 1
+
+    def test_monitor_survives_dispose(self):
+        engine = self._engine()
+        monitor = engine.pool.monitor
+        engine.dispose()
+        assert engine.pool.monitor is monitor
+
+
+class TestSchemaFingerprint:
+    def _metadata(self, *extra_columns):
+        metadata = MetaData()
+        Table("things", metadata, Column("id", Integer, primary_key=True), *extra_columns)
+        return metadata
+
+    def test_fingerprint_is_stable(self):
+        assert schema_fingerprint(self._metadata()) == schema_fingerprint(self._metadata())
+
+    def test_fingerprint_changes_with_columns(self):
+        assert schema_fingerprint(self._metadata()) != schema_fingerprint(
+            self._metadata(Column("name", String))
+        )
+
+    def test_second_worker_skips_ddl(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'boot.db'}")
+        assert Runtime(AppConfig()).initialize_models() is True
+        assert Runtime(AppConfig()).initialize_models() is False
+
+
+class TestProcessLock:
+    def test_lock_is_exclusive(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'lock.db'}")
+        with process_lock(engine, "test") as first:
+            assert first
+            with process_lock(engine, "test", blocking=False) as second:
+                assert not second
+        with process_lock(engine, "test", blocking=False) as third:
+            assert third
+
+    def test_pglite_lock_needs_no_connection(self, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        monkeypatch.delenv("PGHOST", raising=False)
+        monkeypatch.setenv("APX_DEV_DB_PORT", "1")
+        monkeypatch.setenv("APX_DEV_DB_PWD", "dev")
+        engine = Runtime(AppConfig()).engine
+        assert engine.dialect.name == "postgresql" and isinstance(engine.pool, NullPool)
+        # Nothing listens on port 1: an advisory lock would fail to connect
+        with process_lock(engine, "test") as first:
+            assert first
+            with process_lock(engine, "test", blocking=False) as second:
+                assert not second
+
+
+class TestInMemoryDatabase:
+    def test_async_routes_see_the_tables(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        from innovation_factory.backend.app import app
+
+        monkeypatch.setenv("DATABASE_URL", "sqlite://")
+        assert not app.dependency_overrides
+        with TestClient(app) as client:
+            session_id = client.post("/api/ideas/sessions").json()["id"]
+            resp = client.post(f"/api/ideas/sessions/{session_id}/chat", json={"content": "Acme"})
+        assert resp.status_code == 200
@@ -0,0 +1,98 @@
+"""Tests for the trusted-construction JSON path for database rows."""
+import json
+from datetime import date
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlmodel import col, select
+
+from innovation_factory.backend.projects.adtech_intelligence.models import (
+    AtAdvertiser,
+    AtCampaign,
+    AtCampaignOut,
+    CampaignType,
+)
+from innovation_factory.backend.projects.mol_asm_cockpit.models import FuelType, MacFuelSaleOut, MacStation
+from innovation_factory.backend.projects.vi_home_one.models import (
+    DeviceType,
+    VhEnergyDevice,
+    VhEnergyDeviceOut,
+    VhHouseholdCockpitOut,
+)
+from innovation_factory.backend.serialization import RowSerializer, row_type
+
+
+@pytest.fixture
+def campaign(session):
+    advertiser = AtAdvertiser(
+        name="Serializer GmbH", industry="Retail", contact_name="Kontakt", contact_email="kontakt@serializer.de"
+    )
+    session.add(advertiser)
+    session.flush()
+    campaign = AtCampaign(
+        advertiser_id=advertiser.id, name="Spring Sale", campaign_type=CampaignType.online, budget=5000,
+        start_date=date(2025, 3, 1), end_date=date(2025, 4, 1), target_regions=["Bayern"],
+    )
+    session.add(campaign)
+    session.flush()
+    return campaign
+
+
+class TestRowSerializer:
+    def test_nested_models_become_typed_dicts(self):
+        hints = row_type(VhHouseholdCockpitOut).__annotations__
+        assert hints["household"].__name__ == "VhHouseholdOutRow"
+        assert hints["devices"].__args__[0].__name__ == "VhEnergyDeviceOutRow"
+
+    def test_matches_the_validated_path(self, session, campaign):
+        campaigns = RowSerializer(AtCampaignOut)
+        stmt = (
+            campaigns.select(AtCampaign, advertiser=AtAdvertiser)
+            .outerjoin(AtAdvertiser, col(AtAdvertiser.id) == col(AtCampaign.advertiser_id))
+            .where(AtCampaign.id == campaign.id)
+        )
+        fast = json.loads(bytes(campaigns.list_response(session.exec(stmt)).body))
+
+        session.expire_all()  # compare with what the database returns, not the pending objects
+        orm = session.exec(select(AtCampaign).where(AtCampaign.id == campaign.id)).all()
+        validated = TypeAdapter(list[AtCampaignOut]).validate_python(orm, from_attributes=True)
+        assert fast == jsonable_encoder(validated)
+        assert fast[0]["advertiser"]["name"] == "Serializer GmbH"
+        assert fast[0]["target_regions"] == ["Bayern"]
+
+    def test_unmatched_outer_join_is_none(self, session, campaign):
+        campaigns = RowSerializer(AtCampaignOut)
+        stmt = (
+            campaigns.select(AtCampaign, advertiser=AtAdvertiser)
+            .outerjoin(AtAdvertiser, col(AtAdvertiser.id) == -1)
+            .where(AtCampaign.id == campaign.id)
+        )
+        assert campaigns.rows(session.exec(stmt))[0]["advertiser"] is None
+
+    def test_fields_without_columns_take_their_defaults(self, session, campaign):
+        campaigns = RowSerializer(AtCampaignOut)
+        rows = campaigns.rows(session.exec(campaigns.select(AtCampaign).where(AtCampaign.id == campaign.id)))
+        assert rows[0]["advertiser"] is None
+        assert rows[0]["spent"] == 0.0
+
+    def test_required_fields_need_columns(self):
+        with pytest.raises(ValueError, match="fuel_type"):
+            RowSerializer(MacFuelSaleOut).select(MacStation)
+
+    def test_from_entity(self):
+        device = VhEnergyDevice(
+            id=1, household_id=2, device_type=DeviceType.pv_system, brand="Viessmann", model="Vitovolt",
+            capacity_kw=9.5, installation_date=date(2024, 5, 1),
+        )
+        out = RowSerializer(VhEnergyDeviceOut)
+        body = json.loads(out.json(out.from_entity(device)))
+        assert body == jsonable_encoder(VhEnergyDeviceOut.model_validate(device, from_attributes=True))
+
+    def test_floats_stay_floats(self):
+        out = RowSerializer(MacFuelSaleOut)
+        row = {
+            "id": 1, "station_id": 1, "sale_date": date(2025, 1, 1), "fuel_type": FuelType.diesel,
+            "volume_liters": 10, "revenue": 0, "unit_price": 1.5, "margin": 0,
+        }
+        assert b'"revenue":0.0' in out.list_json([row])
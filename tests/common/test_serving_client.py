@@ -0,0 +1,140 @@
+"""Tests for the pooled serving-endpoint client (retries, limits, circuit breaker)."""
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from innovation_factory.backend.serving_stub import LatencyProfile
+from innovation_factory.backend.services import serving_client
+from innovation_factory.backend.services.databricks_agents import extract_agent_text
+from innovation_factory.backend.services.serving_client import (
+    CircuitBreaker,
+    ServingClient,
+    ServingUnavailableError,
+)
+
+INSTANT = LatencyProfile(first_token_ms=0, token_ms=0, tokens=10, jitter=0)
+BODY = {"input": [{"role": "user", "content": "Any anomalies today?"}]}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(serving_client, "BACKOFF_BASE", 0.0)
+
+
+class TestServingClient:
+    async def test_invoke_reuses_connections(self, serving_endpoint):
+        ws = serving_endpoint(INSTANT)
+        client = ServingClient()
+        for _ in range(5):
+            result = await client.invoke(ws, "mas", BODY)
+            assert extract_agent_text(result).startswith("Stub answer to: Any anomalies today?")
+        assert len(client.http._transport._pool.connections) == 1  # type: ignore[attr-defined]
+        assert client.stats()["endpoints"]["mas"]["requests"] == 5
+        await client.aclose()
+
+    async def test_retries_transient_errors(self, serving_endpoint):
+        ws = serving_endpoint(LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, fail_first=2))
+        client = ServingClient(retries=2)
+        await client.invoke(ws, "mas", BODY)
+        stats = client.stats()["endpoints"]["mas"]
+        assert (stats["requests"], stats["retries"], stats["statuses"]) == (3, 2, {503: 2, 200: 1})
+        assert ws.stats.requests["mas"] == 3
+
+    async def test_gives_up_after_retries(self, serving_endpoint):
+        ws = serving_endpoint(LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, error_rate=1.0))
+        with pytest.raises(httpx.HTTPStatusError) as exc:
+            await ServingClient(retries=1).invoke(ws, "mas", BODY)
+        assert exc.value.response.status_code == 503
+
+    async def test_circuit_opens_and_recovers(self, serving_endpoint):
+        ws = serving_endpoint(LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, fail_first=2))
+        client = ServingClient(retries=0, breaker_threshold=2, breaker_cooldown=0.1)
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.invoke(ws, "mas", BODY)
+        with pytest.raises(ServingUnavailableError):
+            await client.invoke(ws, "mas", BODY)
+        assert ws.stats.requests["mas"] == 2  # failed fast, without a request
+        assert client.stats()["endpoints"]["mas"]["circuit"] == "open"
+
+        await asyncio.sleep(0.15)
+        await client.invoke(ws, "mas", BODY)
+        assert client.stats()["endpoints"]["mas"]["circuit"] == "closed"
+
+    async def test_concurrency_is_bounded_per_endpoint(self, serving_endpoint):
+        slow = LatencyProfile(first_token_ms=100, token_ms=0, tokens=5, jitter=0)
+        ws = serving_endpoint(INSTANT, endpoints={"ka": slow})
+        client = ServingClient(concurrency=2)
+        await asyncio.gather(*(client.invoke(ws, "ka", BODY) for _ in range(6)))
+        assert ws.stats.max_in_flight == 2
+        assert client.stats()["endpoints"]["ka"]["max_in_flight"] == 2
+
+    async def test_saturated_endpoint_is_rejected(self, serving_endpoint):
+        ws = serving_endpoint(LatencyProfile(first_token_ms=300, token_ms=0, tokens=5, jitter=0))
+        client = ServingClient(concurrency=1, queue_timeout=0.05)
+        results = await asyncio.gather(
+            client.invoke(ws, "ka", BODY), client.invoke(ws, "ka", BODY), return_exceptions=True
+        )
+        assert sum(isinstance(r, ServingUnavailableError) for r in results) == 1
+        assert client.stats()["endpoints"]["ka"]["rejected"] == 1
+
+    async def test_stream(self, serving_endpoint):
+        ws = serving_endpoint(INSTANT)
+        client = ServingClient()
+        async with client.stream(ws, "mas", {**BODY, "stream": True}) as response:
+            lines = [line async for line in response.aiter_lines() if line.startswith("data:")]
+        assert lines[-1] == "data: [DONE]"
+        assert len(lines) == INSTANT.tokens + 2  # deltas, output_item.done, [DONE]
+
+
+class TestEventLoops:
+    async def test_client_of_a_running_loop_is_closed(self):
+        client = ServingClient()
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever)
+        thread.start()
+        try:
+            stale = asyncio.run_coroutine_threadsafe(_bound_http(client), other).result(5)
+            assert client.http is not stale
+            for _ in range(100):
+                if stale.is_closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert stale.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(5)
+            other.close()
+            await client.aclose()
+
+    def test_client_of_a_stopped_loop_is_dropped(self, caplog):
+        client = ServingClient()
+        stale = asyncio.run(_bound_http(client))
+        current = asyncio.run(_bound_http(client))
+        assert current is not stale
+        assert "stopped event loop" in caplog.text
+        asyncio.run(client.aclose())
+
+
+async def _bound_http(client: ServingClient) -> httpx.AsyncClient:
+    return client.http
+
+
+class TestCircuitBreaker:
+    def test_half_open_allows_one_trial(self, monkeypatch):
+        breaker = CircuitBreaker(threshold=1, cooldown=10)
+        breaker.failure()
+        assert breaker.state == "open" and not breaker.allow()
+        assert breaker.opened_at is not None
+        now = breaker.opened_at + 10
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.failure()  # the trial failed: open for another cooldown
+        assert breaker.state == "open" and not breaker.allow()
+        breaker.success()
+        assert breaker.state == "closed" and breaker.allow()
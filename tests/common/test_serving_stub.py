@@ -0,0 +1,69 @@
+"""Tests for the stub serving endpoint and the event loop lag monitor."""
+import asyncio
+import json
+import time
+
+import httpx
+
+from innovation_factory.backend.loop_lag import LoopLagMonitor
+from innovation_factory.backend.serving_stub import PROFILES, LatencyProfile, create_app
+from innovation_factory.backend.services.databricks_agents import extract_agent_text
+
+URL = "/serving-endpoints/test-agent/invocations"
+
+
+def _client(**kwargs) -> httpx.AsyncClient:
+    app = create_app(PROFILES["instant"], seed=1, **kwargs)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stub")
+
+
+class TestServingStub:
+    async def test_agent_bricks_response(self):
+        async with _client() as client:
+            response = await client.post(URL, json={"input": [{"role": "user", "content": "Why is it cold?"}]})
+        assert response.status_code == 200
+        assert extract_agent_text(response.json()).startswith("Stub answer to: Why is it cold?")
+
+    async def test_chat_completion_response(self):
+        async with _client() as client:
+            response = await client.post(URL, json={"messages": [{"role": "user", "content": "Hi"}]})
+        assert response.json()["choices"][0]["message"]["content"].startswith("Stub answer to: Hi")
+
+    async def test_streams_token_deltas(self):
+        async with _client() as client:
+            response = await client.post(
+                URL, json={"input": [{"role": "user", "content": "Hi"}], "stream": True}
+            )
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == "[DONE]"
+        deltas = [json.loads(e)["delta"] for e in events[:-1] if json.loads(e)["type"].endswith(".delta")]
+        assert len(deltas) == PROFILES["instant"].tokens
+        done = json.loads(events[-2])
+        assert extract_agent_text([done["item"]]) == "".join(deltas)
+
+    async def test_error_rate_and_stats(self):
+        failing = LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, error_rate=1.0)
+        async with _client(endpoints={"test-agent": failing}) as client:
+            response = await client.post(URL, json={"input": []})
+            stats = (await client.get("/stub/stats")).json()
+        assert response.status_code == 503
+        assert stats == {"requests": {"test-agent": 1}, "errors": 1, "in_flight": 0, "max_in_flight": 1}
+
+
+class TestLoopLagMonitor:
+    async def test_records_blocking_calls(self):
+        monitor = LoopLagMonitor(interval=0.01)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.05)
+        time.sleep(0.1)  # blocks the loop, like a synchronous SDK call in an async route
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        stats = monitor.stats()
+        assert stats["lag_seconds"]["count"] > 0
+        assert stats["max_lag_seconds"] >= 0.05
+        assert stats["lag_p99_seconds"] <= stats["max_lag_seconds"]
+
+    def test_stats_before_sampling(self):
+        assert LoopLagMonitor().stats()["lag_p99_seconds"] is None
@@ -0,0 +1,50 @@
+"""Tests for per-request SQL statement accounting."""
+from sqlmodel import select
+
+from innovation_factory.backend import sql_stats
+from innovation_factory.backend.models import Project
+from innovation_factory.backend.response_cache import invalidate
+
+
+class TestQueryCapture:
+    def test_statements_are_counted(self, session):
+        with sql_stats.capture() as stats:
+            session.exec(select(Project)).all()
+            session.exec(select(Project)).all()
+        assert stats.statements == 2
+        assert stats.db_seconds >= 0
+        assert stats.repeated_shapes(threshold=2) == {}
+
+    def test_repeated_shape_is_flagged(self, session):
+        with sql_stats.capture() as stats:
+            for project_id in range(5):
+                session.exec(select(Project).where(Project.id == project_id)).all()
+        flagged = stats.repeated_shapes(threshold=3)
+        assert list(flagged.values()) == [5]
+
+
+class TestRequestStats:
+    def test_server_timing_header(self, client):
+        invalidate("projects")  # a cache hit would run no query
+        resp = client.get("/api/projects")
+        assert resp.status_code == 200
+        assert resp.headers["server-timing"].startswith("db;dur=")
+        assert resp.headers["server-timing"].endswith('desc="1 queries"')
+
+    def test_async_route_is_counted(self, client):
+        session_id = client.post("/api/ideas/sessions").json()["id"]
+        resp = client.post(
+            f"/api/ideas/sessions/{session_id}/chat", json={"content": "Acme"}
+        )
+        assert resp.status_code == 200
+        assert not resp.headers["server-timing"].endswith('desc="0 queries"')
+
+    def test_debug_table(self, client):
+        sql_stats.table.clear()
+        invalidate("projects")
+        client.get("/api/projects")
+        resp = client.get("/api/debug/sql")
+        assert resp.status_code == 200
+        row = resp.json()["operations"]["listProjects"]
+        assert row["requests"] == 1
+        assert row["statements"] == 1
@@ -0,0 +1,127 @@
+"""Tests for in-memory, precompressed serving of the SPA bundle."""
+import gzip
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from innovation_factory.backend.static import (
+    IMMUTABLE,
+    REVALIDATE,
+    SpaStaticFiles,
+    accepted_encodings,
+    is_hashed,
+    precompress,
+)
+from innovation_factory.backend.utils import add_not_found_handler
+
+INDEX = "<!doctype html><html><body><div id=root></div>" + "<!-- padding -->" * 100 + "</body></html>"
+BUNDLE = "export const answer = 42;\n" * 200
+
+
+@pytest.fixture
+def dist(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text(INDEX)
+    (tmp_path / "assets" / "index-BvX3k9aZ.js").write_text(BUNDLE)
+    (tmp_path / "favicon.png").write_bytes(b"\x89PNG" + bytes(2000))
+    return tmp_path
+
+
+def make_client(dist) -> tuple[TestClient, SpaStaticFiles]:
+    app = FastAPI()
+    ui = SpaStaticFiles(directory=dist, html=True)
+    ui.load()
+    app.mount("/", ui)
+    add_not_found_handler(app, ui)
+    return TestClient(app), ui
+
+
+class TestHelpers:
+    def test_hashed_names(self):
+        assert is_hashed("assets/index-BvX3k9aZ.js")
+        assert is_hashed("assets/vendor-a_b-C1d2.css")
+        assert not is_hashed("index.html")
+        assert not is_hashed("favicon-32x32.png")
+
+    def test_accept_encoding(self):
+        assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+        assert accepted_encodings("br;q=0, gzip;q=0.5") == {"gzip"}
+        assert {"br", "gzip"} <= accepted_encodings("*")
+        assert accepted_encodings("") == set()
+
+
+class TestSpaStaticFiles:
+    def test_compressed_and_immutable(self, dist):
+        client, _ = make_client(dist)
+        resp = client.get("/assets/index-BvX3k9aZ.js", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["cache-control"] == IMMUTABLE
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert resp.text == BUNDLE  # decoded by the client
+        assert int(resp.headers["content-length"]) < len(BUNDLE)
+
+    def test_identity_when_not_accepted(self, dist):
+        client, _ = make_client(dist)
+        resp = client.get("/assets/index-BvX3k9aZ.js", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert resp.text == BUNDLE
+
+    def test_served_from_memory(self, dist):
+        client, _ = make_client(dist)
+        (dist / "index.html").unlink()
+        (dist / "assets" / "index-BvX3k9aZ.js").unlink()
+        assert client.get("/").text == INDEX
+        assert client.get("/assets/index-BvX3k9aZ.js").text == BUNDLE
+
+    def test_index_revalidates(self, dist):
+        client, _ = make_client(dist)
+        resp = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["cache-control"] == REVALIDATE
+        assert resp.headers["content-type"] == "text/html; charset=utf-8"
+        etag = resp.headers["etag"]
+        again = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert again.status_code == 304
+        # A different encoding is a different representation
+        assert client.get("/", headers={"Accept-Encoding": "identity", "If-None-Match": etag}).status_code == 200
+
+    def test_spa_deep_link(self, dist):
+        client, _ = make_client(dist)
+        resp = client.get("/projects/vi-home-one/cockpit", headers={"Accept": "text/html"})
+        assert resp.status_code == 200
+        assert resp.text == INDEX
+        assert client.get("/missing.js").status_code == 404
+
+    def test_small_and_binary_files_stay_uncompressed(self, dist):
+        _, ui = make_client(dist)
+        assert set(ui.assets["favicon.png"].bodies) == {"identity"}
+        assert "gzip" in ui.assets["index.html"].bodies
+
+    def test_head(self, dist):
+        client, _ = make_client(dist)
+        resp = client.head("/assets/index-BvX3k9aZ.js", headers={"Accept-Encoding": "identity"})
+        assert resp.status_code == 200
+        assert resp.headers["content-length"] == str(len(BUNDLE))
+        assert resp.content == b""
+
+
+class TestPrecompress:
+    def test_sidecars_are_used(self, dist):
+        assert precompress(dist) >= 2
+        sidecar = dist / "assets" / "index-BvX3k9aZ.js.gz"
+        assert gzip.decompress(sidecar.read_bytes()).decode() == BUNDLE
+        _, ui = make_client(dist)
+        assert ui.assets["assets/index-BvX3k9aZ.js"].bodies["gzip"] == sidecar.read_bytes()
+        assert "assets/index-BvX3k9aZ.js.gz" not in ui.assets
+
+    def test_stale_sidecars_are_ignored(self, dist):
+        precompress(dist)
+        source = dist / "assets" / "index-BvX3k9aZ.js"
+        source.write_text(BUNDLE + "// changed\n")
+        mtime = (dist / "assets" / "index-BvX3k9aZ.js.gz").stat().st_mtime_ns + 10**9
+        os.utime(source, ns=(mtime, mtime))
+        _, ui = make_client(dist)
+        body = ui.assets["assets/index-BvX3k9aZ.js"].bodies["gzip"]
+        assert gzip.decompress(body).decode().endswith("// changed\n")
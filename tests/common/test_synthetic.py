@@ -0,0 +1,53 @@
+"""Tests for the scale-factor synthetic data generators."""
+from datetime import date
+
+import pytest
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, col, create_engine, select
+
+from innovation_factory.backend import models  # noqa: F401
+from innovation_factory.backend.projects.registry import load_all_models
+from innovation_factory.backend.synthetic import rows
+
+np = pytest.importorskip("numpy")
+
+from innovation_factory.backend.projects.adtech_intelligence import synthetic as at_synthetic  # noqa: E402
+from innovation_factory.backend.projects.vi_home_one import synthetic as vh_synthetic  # noqa: E402
+from innovation_factory.backend.projects.vi_home_one.models import VhEnergyReading, VhHousehold  # noqa: E402
+
+
+def _fresh_session() -> Session:
+    load_all_models()
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    return Session(engine)
+
+
+def _readings(session: Session) -> list[tuple]:
+    return [
+        (r.household_id, r.timestamp, r.pv_generation_kwh, r.battery_level_kwh, r.total_consumption_kwh)
+        for r in session.exec(select(VhEnergyReading).order_by(col(VhEnergyReading.id)))
+    ]
+
+
+class TestSyntheticData:
+    def test_rows_repeats_scalars(self):
+        assert list(rows(np.array([1, 2]), "x", [True, False])) == [(1, "x", True), (2, "x", False)]
+
+    def test_generation_is_deterministic(self, monkeypatch):
+        monkeypatch.setattr(vh_synthetic, "DAYS", 2)
+        results = []
+        for _ in range(2):
+            with _fresh_session() as session:
+                vh_synthetic.generate(session, scale=0.001, seed=7, end=date(2025, 6, 1))
+                session.commit()
+                results.append(_readings(session))
+                households = session.exec(select(func.count()).select_from(VhHousehold)).one()
+
+        assert households == 10
+        assert len(results[0]) == 10 * 2 * 24
+        assert results[0] == results[1]
+
+    def test_requires_base_seed(self):
+        with _fresh_session() as session, pytest.raises(RuntimeError, match="seed"):
+            at_synthetic.generate(session, scale=0.001)
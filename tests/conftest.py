@@ -1,16 +1,25 @@
 """Shared test fixtures for Innovation Factory."""
 import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Force local dev mode for testing
 os.environ.pop("PGHOST", None)
 os.environ.pop("ENDPOINT_NAME", None)
 # Use shared in-memory SQLite so app and fixtures use the same DB
 os.environ["DATABASE_URL"] = "sqlite:///file:test_shared?mode=memory&cache=shared"
+# Keep per-worker metric snapshots out of the shared temp directory
+os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="innovation-factory-metrics-")
 
 
 @pytest.fixture(scope="session")
@@ -31,13 +40,24 @@ def engine():
 
     # Import all models so they're registered with SQLModel.metadata
     import innovation_factory.backend.models  # noqa: F401
-    import innovation_factory.backend.projects.vi_home_one.models  # noqa: F401
-    import innovation_factory.backend.projects.bsh_home_connect.models  # noqa: F401
-    import innovation_factory.backend.projects.adtech_intelligence.models  # noqa: F401
-    import innovation_factory.backend.projects.mol_asm_cockpit.models  # noqa: F401
+    from innovation_factory.backend.projects.registry import load_all_models
+
+    load_all_models()
 
     SQLModel.metadata.create_all(engine)
-    return engine
+    from innovation_factory.backend.sql_stats import instrument_engine
+    return instrument_engine(engine)
+
+
+@pytest.fixture(scope="session")
+def async_engine(engine):
+    """Async engine on the same SQLite database (aiosqlite)."""
+    from innovation_factory.backend.sql_stats import instrument_engine
+
+    url = os.environ["DATABASE_URL"].replace("sqlite://", "sqlite+aiosqlite://", 1)
+    async_engine = create_async_engine(url)
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
 
 
 @pytest.fixture
@@ -49,18 +69,60 @@ def session(engine):
 
 
 @pytest.fixture
-def client(engine):
+def client(engine, async_engine):
     """Create a FastAPI test client with in-memory DB."""
     from innovation_factory.backend.app import app
-    from innovation_factory.backend.dependencies import get_session
+    from innovation_factory.backend.dependencies import get_async_session, get_session
 
     def override_get_session():
         with Session(engine) as session:
             yield session
 
+    async def override_get_async_session():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
 
     with TestClient(app) as c:
         yield c
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def serving_endpoint(monkeypatch):
+    """Start the stub serving endpoint (``serving_stub``) under uvicorn.
+
+    Call with a ``LatencyProfile`` (and optional per-endpoint profiles); returns
+    a stand-in for the ``WorkspaceClient`` pointing at the stub, with the stub's
+    request counters as ``.stats``. Uvicorn rather than ``httpx.ASGITransport``,
+    which buffers whole responses and so would hide streaming behaviour.
+    """
+    import uvicorn
+
+    from innovation_factory.backend import serving_stub
+    from innovation_factory.backend.services import databricks_agents
+    from innovation_factory.backend.services.agent_cache import agent_cache
+    from innovation_factory.backend.services.serving_client import ServingClient
+
+    # A fresh pooled client and no cached answers, so tests do not see each other's calls
+    monkeypatch.setattr(databricks_agents, "serving", ServingClient(retries=1))
+    agent_cache.answers.clear()
+    servers = []
+
+    def start(profile, endpoints=None) -> SimpleNamespace:
+        app = serving_stub.create_app(profile, endpoints, seed=1)
+        server = uvicorn.Server(uvicorn.Config(app, port=0, log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+        servers.append(server)
+        while not server.started:
+            time.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        config = SimpleNamespace(host=f"http://127.0.0.1:{port}", authenticate=lambda: {})
+        return SimpleNamespace(config=config, stats=app.state.stats)
+
+    yield start
+    for server in servers:
+        server.should_exit = True
@@ -40,7 +40,7 @@ class TestDatabricksConnection:
 class TestServingEndpoints:
     """Test Agent Bricks serving endpoint connectivity."""
 
-    def test_mas_endpoint_reachable(self):
+    async def test_mas_endpoint_reachable(self):
         from innovation_factory.backend.services.databricks_agents import (
             query_agent_endpoint,
         )
@@ -51,13 +51,13 @@ class TestServingEndpoints:
             pytest.skip("ADTECH_MAS_ENDPOINT_NAME not set")
         assert endpoint is not None
         ws = WorkspaceClient()
-        result = query_agent_endpoint(
+        result = await query_agent_endpoint(
             ws, endpoint, [{"role": "user", "content": "Hello, are you available?"}]
         )
         assert result is not None
         assert "output" in result or "choices" in result
 
-    def test_ka_endpoint_reachable(self):
+    async def test_ka_endpoint_reachable(self):
         from innovation_factory.backend.services.databricks_agents import (
             query_agent_endpoint,
         )
@@ -68,7 +68,7 @@ class TestServingEndpoints:
             pytest.skip("ADTECH_ISSUE_RESOLUTION_KA_ENDPOINT not set")
         assert endpoint is not None
         ws = WorkspaceClient()
-        result = query_agent_endpoint(
+        result = await query_agent_endpoint(
             ws,
             endpoint,
             [{"role": "user", "content": "What types of issues can you help with?"}],
@@ -1,4 +1,6 @@
 """AdTech Intelligence specific tests."""
+import json
+
 import pytest
 from datetime import date
 
@@ -8,6 +10,8 @@ from innovation_factory.backend.projects.adtech_intelligence.models import (
     CampaignStatus,
     CampaignType,
 )
+from innovation_factory.backend.projects.adtech_intelligence.services import chat_service
+from innovation_factory.backend.serving_stub import LatencyProfile
 
 
 class TestAdTechModels:
@@ -63,3 +67,48 @@ class TestAdTechAPI:
         assert resp.status_code == 200
         data = resp.json()
         assert "dashboard_embed_url" in data or "workspace_url" in data
+
+
+class TestAdTechChat:
+    @pytest.fixture
+    def agents(self, client, serving_endpoint, monkeypatch):
+        monkeypatch.setattr(chat_service, "MAS_ENDPOINT_NAME", "at-mas")
+        monkeypatch.setattr(chat_service, "ISSUE_RESOLUTION_KA_ENDPOINT", "at-ka")
+
+        def use(profile: LatencyProfile) -> None:
+            monkeypatch.setitem(client.app.state.runtime.__dict__, "ws", serving_endpoint(profile))
+
+        return use
+
+    def chat(self, client, path: str, message: str, headers: dict | None = None) -> list[dict]:
+        resp = client.post(f"/api/projects/adtech-intelligence/{path}", json={"message": message}, headers=headers)
+        return [json.loads(line[6:]) for line in resp.text.splitlines() if line.startswith("data: ")]
+
+    def test_mas_answer_is_streamed(self, client, agents):
+        agents(LatencyProfile(first_token_ms=0, token_ms=1, tokens=12, jitter=0))
+        chunks = self.chat(client, "mas-chat", "Which campaigns underdeliver?")
+        assert len(chunks) == 13 and chunks[-1] == {"content": "", "done": True}
+        assert chunks[0]["session_id"] and chunks[0]["sources"][0]["type"] == "mas"
+        answer = "".join(c["content"] for c in chunks)
+        assert answer.startswith("Stub answer to: Which campaigns underdeliver?")
+
+        history = client.get(f"/api/projects/adtech-intelligence/chat/sessions/{chunks[0]['session_id']}").json()
+        assert history["messages"][-1]["content"] == answer
+
+    def test_repeated_question_is_answered_from_cache(self, client, agents):
+        agents(LatencyProfile(first_token_ms=0, token_ms=0, tokens=6, jitter=0))
+        stub = client.app.state.runtime.ws.stats
+        first = self.chat(client, "mas-chat", "Top campaigns this week?")
+        again = self.chat(client, "mas-chat", "top campaigns this week")
+        assert stub.requests == {"at-mas": 1}
+        assert len(again) == 2  # the whole answer in one chunk, then done
+        assert again[0]["content"] == "".join(c["content"] for c in first)
+
+        self.chat(client, "mas-chat", "Top campaigns this week?", headers={"Cache-Control": "no-cache"})
+        assert stub.requests == {"at-mas": 2}
+
+    def test_ka_endpoint_failure(self, client, agents):
+        agents(LatencyProfile(first_token_ms=0, token_ms=0, tokens=5, error_rate=1.0))
+        chunks = self.chat(client, "chat", "Placement is dark")
+        assert chunks[0]["sources"] == [{"type": "error", "source": "System"}]
+        assert "couldn't reach the Issue Resolution Knowledge Base" in chunks[0]["content"]
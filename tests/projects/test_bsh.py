@@ -44,3 +44,46 @@ class TestBshAPI:
             "/api/projects/bsh-home-connect/knowledge/search?query=dishwasher"
         )
         assert resp.status_code == 200
+
+
+class TestBshIdentity:
+    def test_identity_cache_invalidated_on_create(self, client):
+        from innovation_factory.backend.projects.bsh_home_connect.routers import users
+
+        users._identity_cache.clear()
+        resp = client.get("/api/projects/bsh-home-connect/customers/me")
+        assert resp.status_code == 200
+        customer_id = resp.json()["id"]
+        # Resolved on the next request and then served from the cache
+        client.get("/api/projects/bsh-home-connect/tickets")
+        cached = users._identity_cache.get("local-dev-user")
+        assert cached is not None
+        assert cached[0] == customer_id
+
+        resp = client.get("/api/projects/bsh-home-connect/technicians/me")
+        assert resp.status_code == 200
+        # Creating the technician row drops the stale entry
+        assert users._identity_cache.get("local-dev-user") is None
+
+    def test_missing_customer_is_not_cached(self, session):
+        from types import SimpleNamespace
+
+        from innovation_factory.backend.projects.bsh_home_connect.models import BshCustomer, UserRole
+        from innovation_factory.backend.projects.bsh_home_connect.routers import users
+
+        user = SimpleNamespace(id="other-worker-user", emails=None, name=None)
+        ws = SimpleNamespace(current_user=SimpleNamespace(me=lambda: user))
+        assert users.get_bsh_identity(ws, session).role == UserRole.technician  # type: ignore[arg-type]
+
+        # Another worker creates the customer row; the next request must see it
+        session.add(BshCustomer(databricks_user_id=user.id, email="o@example.com", first_name="O", last_name="W"))
+        session.flush()
+        identity = users.get_bsh_identity(ws, session)  # type: ignore[arg-type]
+        assert identity.role == UserRole.customer
+        assert users._identity_cache.get(user.id) == (identity.customer_id, None)
+
+    def test_customer_role_from_identity(self, client):
+        client.get("/api/projects/bsh-home-connect/customers/me")
+        resp = client.get("/api/projects/bsh-home-connect/customers/me/devices")
+        assert resp.status_code == 200
+        assert isinstance(resp.json(), list)
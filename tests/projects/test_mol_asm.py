@@ -1,5 +1,8 @@
 """MOL ASM Cockpit specific tests."""
+import json
+
 import pytest
+from innovation_factory.backend import sql_stats
 from innovation_factory.backend.projects.mol_asm_cockpit.models import (
     MacRegion,
     MacStation,
@@ -8,6 +11,8 @@ from innovation_factory.backend.projects.mol_asm_cockpit.models import (
     MacIssueStatus,
     StationType,
 )
+from innovation_factory.backend.projects.mol_asm_cockpit.services import chat_service
+from innovation_factory.backend.serving_stub import LatencyProfile
 
 
 class TestMolAsmModels:
@@ -50,3 +55,43 @@ class TestMolAsmAPI:
     def test_dashboard_embed(self, client):
         resp = client.get("/api/projects/mol-asm-cockpit/dashboard/embed")
         assert resp.status_code == 200
+
+
+class TestMolAsmChat:
+    URL = "/api/projects/mol-asm-cockpit/chat/send"
+
+    def test_mock_answer_without_endpoint(self, client, monkeypatch):
+        monkeypatch.setattr(chat_service, "MAS_ENDPOINT_NAME", "")
+        resp = client.post(self.URL, json={"message": "Why is my station down?"})
+        assert resp.status_code == 200
+        assert "performance decline" in resp.json()["content"]
+
+    def test_answer_is_streamed(self, client, serving_endpoint, monkeypatch):
+        monkeypatch.setattr(chat_service, "MAS_ENDPOINT_NAME", "mac-mas")
+        profile = LatencyProfile(first_token_ms=0, token_ms=1, tokens=8, jitter=0)
+        monkeypatch.setitem(client.app.state.runtime.__dict__, "ws", serving_endpoint(profile))
+
+        resp = client.post(self.URL, json={"message": "Fuel margin upside?"}, headers={"Accept": "text/event-stream"})
+        lines = [line[6:] for line in resp.text.splitlines() if line.startswith("data: ")]
+        assert lines[-1] == "[DONE]"
+        chunks = [json.loads(line) for line in lines[:-1]]
+        assert [c["done"] for c in chunks] == [False] * 8 + [True]
+        answer = "".join(c["content"] for c in chunks)
+        assert answer.startswith("Stub answer to: Fuel margin upside?")
+
+        history = client.get(f"/api/projects/mol-asm-cockpit/chat/history/{chunks[-1]['session_id']}").json()
+        assert [m["content"] for m in history["messages"]] == ["Fuel margin upside?", answer]
+        assert history["messages"][-1]["id"] == chunks[-1]["id"]
+
+    def test_agent_time_is_reported_next_to_db_time(self, client, serving_endpoint, monkeypatch):
+        monkeypatch.setattr(chat_service, "MAS_ENDPOINT_NAME", "mac-mas")
+        profile = LatencyProfile(first_token_ms=0, token_ms=0, tokens=4, jitter=0)
+        monkeypatch.setitem(client.app.state.runtime.__dict__, "ws", serving_endpoint(profile))
+        sql_stats.table.clear()
+
+        resp = client.post(self.URL, json={"message": "Fuel margin upside?"})
+        assert resp.status_code == 200
+        assert 'agent;dur=' in resp.headers["server-timing"]
+        assert resp.headers["server-timing"].endswith('desc="1 calls"')
+        row = client.get("/api/debug/sql").json()["operations"]["mac_sendChatMessage"]
+        assert row["agent_calls"] == 1 and row["statements"] > 0